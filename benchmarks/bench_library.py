@@ -0,0 +1,17 @@
+"""Time to load the libraries of pipes and concepts, which every process pays on startup."""
+
+from benchmarks.benchmark_context import BenchmarkContext
+from benchmarks.benchmark_models import BenchmarkResult, BenchmarkUnit, time_iterations
+from pipelex.hub import get_library_manager
+
+
+async def bench_library_load(context: BenchmarkContext) -> list[BenchmarkResult]:
+    library_manager = get_library_manager()
+
+    async def reload_libraries():
+        # only the benchmark bundles are scanned on top of the pipelex package, not the current directory
+        library_manager.reset()
+        library_manager.load_libraries(library_dirs=[context.work_dir])
+
+    timing = await time_iterations(func=reload_libraries, nb_iterations=min(context.config.nb_iterations, 5))
+    return [BenchmarkResult(name="library_load", value=timing.median, unit=BenchmarkUnit.SECONDS, timing=timing)]
@@ -0,0 +1,40 @@
+"""Cost of copying the working memory, which pipe controllers do to isolate the runs of their branches."""
+
+from benchmarks.benchmark_context import BenchmarkContext
+from benchmarks.benchmark_models import BenchmarkResult, BenchmarkUnit, time_iterations
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+
+# Each stuff holds a text of this size, roughly a page
+BENCH_STUFF_TEXT_SIZE = 2_000
+
+
+def _make_working_memory(nb_stuffs: int) -> WorkingMemory:
+    working_memory = WorkingMemoryFactory.make_empty()
+    text = "x" * BENCH_STUFF_TEXT_SIZE
+    for stuff_index in range(nb_stuffs):
+        stuff_name = f"stuff_{stuff_index}"
+        working_memory.add_new_stuff(name=stuff_name, stuff=StuffFactory.make_from_str(str_value=text, name=stuff_name))
+    return working_memory
+
+
+async def bench_memory_copy(context: BenchmarkContext) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    for nb_stuffs in context.config.memory_sizes:
+        working_memory = _make_working_memory(nb_stuffs=nb_stuffs)
+
+        async def copy_working_memory(working_memory: WorkingMemory = working_memory):
+            working_memory.make_deep_copy()
+
+        timing = await time_iterations(func=copy_working_memory, nb_iterations=context.config.nb_iterations)
+        results.append(
+            BenchmarkResult(
+                name="memory_copy",
+                params={"nb_stuffs": nb_stuffs, "stuff_text_size": BENCH_STUFF_TEXT_SIZE},
+                value=timing.median,
+                unit=BenchmarkUnit.SECONDS,
+                timing=timing,
+            )
+        )
+    return results
@@ -0,0 +1,187 @@
+"""Framework overhead of each pipe type, PipeBatch scaling and PipeParallel fan-out, with the mock inference workers."""
+
+import time
+
+from benchmarks.benchmark_context import BenchmarkContext
+from benchmarks.benchmark_models import BenchmarkResult, BenchmarkUnit, TimingStats, time_iterations
+from benchmarks.mock_workers import MockWorkerSettings
+from pipelex.client.protocol import PipelineInputs
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipeline.execute import execute_pipeline
+
+BENCH_PIPES_BUNDLE = """domain = "bench_pipes"
+description = "Pipes measured by the benchmarks"
+
+[concept.BenchIdea]
+description = "An idea"
+
+[concept.BenchIdea.structure]
+title = "The title of the idea"
+summary = "A summary of the idea"
+
+[pipe.bench_llm_text]
+type = "PipeLLM"
+description = "Generate a text"
+inputs = { topic = "Text" }
+output = "Text"
+prompt = "Write a sentence about @topic"
+
+[pipe.bench_llm_object]
+type = "PipeLLM"
+description = "Generate a structured object"
+inputs = { topic = "Text" }
+output = "BenchIdea"
+prompt = "Come up with an idea about @topic"
+
+[pipe.bench_compose]
+type = "PipeCompose"
+description = "Render a template"
+inputs = { topic = "Text" }
+output = "Text"
+template = "The topic is: $topic"
+
+[pipe.bench_img_gen]
+type = "PipeImgGen"
+description = "Generate an image"
+output = "Image"
+model = "gpt-image-1"
+img_gen_prompt = "A lighthouse at dawn"
+
+[pipe.bench_extract]
+type = "PipeExtract"
+description = "Extract the pages of a document"
+inputs = { document = "PDF" }
+output = "Page[]"
+model = "pypdfium2-extract-text"
+
+[pipe.bench_sequence]
+type = "PipeSequence"
+description = "Chain five text generations"
+inputs = { topic = "Text" }
+output = "Text"
+steps = [
+    { pipe = "bench_llm_text", result = "topic" },
+    { pipe = "bench_llm_text", result = "topic" },
+    { pipe = "bench_llm_text", result = "topic" },
+    { pipe = "bench_llm_text", result = "topic" },
+    { pipe = "bench_llm_text", result = "topic" },
+]
+
+[pipe.bench_batch]
+type = "PipeBatch"
+description = "Generate a text for each topic"
+inputs = { topics = "Text[]" }
+output = "Text[]"
+branch_pipe_code = "bench_llm_text"
+input_list_name = "topics"
+input_item_name = "topic"
+"""
+
+BENCH_TOPIC = "lighthouses"
+BENCH_PDF_URL = "https://example.com/benchmark.pdf"
+
+# Pipes measured for their framework overhead, with the inputs they need
+OVERHEAD_PIPE_CODES: list[str] = [
+    "bench_compose",
+    "bench_llm_text",
+    "bench_llm_object",
+    "bench_img_gen",
+    "bench_extract",
+    "bench_sequence",
+]
+
+
+def _make_fan_out_bundle(width: int) -> str:
+    parallels = ",\n".join(f'    {{ pipe = "bench_llm_text", result = "branch_{branch_index}" }}' for branch_index in range(width))
+    return f"""domain = "bench_fan_out_{width}"
+description = "PipeParallel with {width} branches"
+
+[pipe.bench_fan_out_{width}]
+type = "PipeParallel"
+description = "Run {width} text generations in parallel"
+inputs = {{ topic = "Text" }}
+output = "Text"
+add_each_output = true
+parallels = [
+{parallels},
+]
+"""
+
+
+async def _run_pipe(pipe_code: str, inputs: PipelineInputs | None = None):
+    if pipe_code == "bench_extract":
+        working_memory = WorkingMemoryFactory.make_from_pdf(pdf_url=BENCH_PDF_URL, name="document")
+        await execute_pipeline(pipe_code=pipe_code, inputs=working_memory, pipe_run_mode=PipeRunMode.LIVE)
+        return
+    await execute_pipeline(pipe_code=pipe_code, inputs=inputs, pipe_run_mode=PipeRunMode.LIVE)
+
+
+async def bench_pipe_overhead(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """With instant mock workers, the whole duration of a pipe run is framework overhead."""
+    context.set_mock_worker_settings(settings=MockWorkerSettings())
+    results: list[BenchmarkResult] = []
+    for pipe_code in OVERHEAD_PIPE_CODES:
+        inputs: PipelineInputs | None = None if pipe_code in {"bench_img_gen", "bench_extract"} else {"topic": BENCH_TOPIC}
+
+        async def run_pipe(pipe_code: str = pipe_code, inputs: PipelineInputs | None = inputs):
+            await _run_pipe(pipe_code=pipe_code, inputs=inputs)
+
+        timing = await time_iterations(func=run_pipe, nb_iterations=context.config.nb_iterations)
+        results.append(
+            BenchmarkResult(
+                name="pipe_overhead",
+                params={"pipe": pipe_code},
+                value=timing.median,
+                unit=BenchmarkUnit.SECONDS,
+                timing=timing,
+            )
+        )
+    return results
+
+
+async def bench_batch_scaling(context: BenchmarkContext) -> list[BenchmarkResult]:
+    context.set_mock_worker_settings(settings=MockWorkerSettings())
+    results: list[BenchmarkResult] = []
+    for nb_items in context.config.batch_sizes:
+        topics = [f"{BENCH_TOPIC} #{item_index}" for item_index in range(nb_items)]
+        start_time = time.perf_counter()
+        await _run_pipe(pipe_code="bench_batch", inputs={"topics": topics})
+        duration = time.perf_counter() - start_time
+        timing = TimingStats.make_from_durations(durations=[duration])
+        results.append(
+            BenchmarkResult(name="batch_scaling.duration", params={"nb_items": nb_items}, value=duration, unit=BenchmarkUnit.SECONDS, timing=timing)
+        )
+        results.append(
+            BenchmarkResult(
+                name="batch_scaling.throughput",
+                params={"nb_items": nb_items},
+                value=nb_items / duration,
+                unit=BenchmarkUnit.ITEMS_PER_SECOND,
+            )
+        )
+    return results
+
+
+async def bench_parallel_fan_out(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """With a fixed mock latency, the branches of an ideal PipeParallel would all complete within that latency."""
+    llm_latency = context.config.fan_out_llm_latency
+    context.set_mock_worker_settings(settings=MockWorkerSettings(llm_latency=llm_latency))
+    results: list[BenchmarkResult] = []
+    for width in context.config.fan_out_widths:
+        context.load_bundle(bundle_name=f"bench_fan_out_{width}", plx_content=_make_fan_out_bundle(width=width))
+
+        async def run_fan_out(width: int = width):
+            await _run_pipe(pipe_code=f"bench_fan_out_{width}", inputs={"topic": BENCH_TOPIC})
+
+        timing = await time_iterations(func=run_fan_out, nb_iterations=context.config.nb_iterations)
+        params = {"width": width, "llm_latency": llm_latency}
+        results.append(
+            BenchmarkResult(name="parallel_fan_out.duration", params=params, value=timing.median, unit=BenchmarkUnit.SECONDS, timing=timing)
+        )
+        if llm_latency > 0:
+            results.append(
+                BenchmarkResult(name="parallel_fan_out.efficiency", params=params, value=llm_latency / timing.median, unit=BenchmarkUnit.RATIO)
+            )
+    context.set_mock_worker_settings(settings=MockWorkerSettings())
+    return results
@@ -0,0 +1,35 @@
+"""Throughput of template rendering, as done for every prompt and every PipeCompose."""
+
+import time
+
+from benchmarks.benchmark_context import BenchmarkContext
+from benchmarks.benchmark_models import BenchmarkResult, BenchmarkUnit, TimingStats
+from pipelex.cogt.templating.template_category import TemplateCategory
+from pipelex.cogt.templating.template_rendering import render_template
+
+BENCH_TEMPLATE = """Write a summary of the following document about $topic:
+
+@document
+
+{% for keyword in keywords %}- {{ keyword }}
+{% endfor %}"""
+
+BENCH_TEMPLATE_CONTEXT = {
+    "topic": "lighthouses",
+    "document": "Lighthouses guide ships along dangerous coasts. " * 50,
+    "keywords": [f"keyword {keyword_index}" for keyword_index in range(20)],
+}
+
+
+async def bench_template_render(context: BenchmarkContext) -> list[BenchmarkResult]:
+    nb_renders = context.config.nb_template_renders
+    durations: list[float] = []
+    for _ in range(nb_renders):
+        start_time = time.perf_counter()
+        await render_template(template=BENCH_TEMPLATE, category=TemplateCategory.LLM_PROMPT, context=BENCH_TEMPLATE_CONTEXT)
+        durations.append(time.perf_counter() - start_time)
+    timing = TimingStats.make_from_durations(durations=durations)
+    return [
+        BenchmarkResult(name="template_render.duration", value=timing.median, unit=BenchmarkUnit.SECONDS, timing=timing),
+        BenchmarkResult(name="template_render.throughput", value=nb_renders / timing.total, unit=BenchmarkUnit.ITEMS_PER_SECOND),
+    ]
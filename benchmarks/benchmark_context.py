@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from benchmarks.mock_workers import MockInferenceManager, MockWorkerSettings
+from pipelex.hub import get_library_manager
+
+
+class BenchmarkConfig(BaseModel):
+    nb_iterations: int = Field(default=20, ge=1)
+    batch_sizes: list[int] = Field(default_factory=lambda: [10, 100, 1_000, 10_000, 100_000])
+    fan_out_widths: list[int] = Field(default_factory=lambda: [2, 8, 32, 128])
+    # Latency of the mock LLM for the fan-out benchmark, so that running branches concurrently makes a difference
+    fan_out_llm_latency: float = Field(default=0.05, ge=0)
+    memory_sizes: list[int] = Field(default_factory=lambda: [10, 100, 1_000, 10_000])
+    nb_template_renders: int = Field(default=1_000, ge=1)
+
+    @classmethod
+    def make_quick(cls) -> "BenchmarkConfig":
+        """Smaller sizes, to run in CI on every commit."""
+        return cls(
+            nb_iterations=5,
+            batch_sizes=[10, 100, 1_000],
+            fan_out_widths=[2, 8, 32],
+            memory_sizes=[10, 100, 1_000],
+            nb_template_renders=200,
+        )
+
+
+class BenchmarkContext:
+    def __init__(self, config: BenchmarkConfig, inference_manager: MockInferenceManager, work_dir: Path):
+        self.config = config
+        self.inference_manager = inference_manager
+        self.work_dir = work_dir
+
+    def load_bundle(self, bundle_name: str, plx_content: str) -> Path:
+        plx_path = self.work_dir / f"{bundle_name}.plx"
+        plx_path.write_text(plx_content, encoding="utf-8")
+        get_library_manager().reload_bundle(plx_path=plx_path)
+        return plx_path
+
+    def set_mock_worker_settings(self, settings: MockWorkerSettings):
+        self.inference_manager.set_settings(settings=settings)
@@ -0,0 +1,94 @@
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from pipelex.tools.typing.pydantic_utils import empty_list_factory_of
+from pipelex.types import StrEnum
+
+
+class BenchmarkUnit(StrEnum):
+    SECONDS = "s"
+    ITEMS_PER_SECOND = "items/s"
+    BYTES = "bytes"
+    RATIO = "ratio"
+
+    @property
+    def is_higher_better(self) -> bool:
+        match self:
+            case BenchmarkUnit.SECONDS | BenchmarkUnit.BYTES:
+                return False
+            case BenchmarkUnit.ITEMS_PER_SECOND | BenchmarkUnit.RATIO:
+                return True
+
+
+class TimingStats(BaseModel):
+    nb_iterations: int
+    total: float
+    mean: float
+    median: float
+    min: float
+    max: float
+    stdev: float
+
+    @classmethod
+    def make_from_durations(cls, durations: list[float]) -> "TimingStats":
+        return cls(
+            nb_iterations=len(durations),
+            total=sum(durations),
+            mean=statistics.fmean(durations),
+            median=statistics.median(durations),
+            min=min(durations),
+            max=max(durations),
+            stdev=statistics.stdev(durations) if len(durations) > 1 else 0.0,
+        )
+
+
+class BenchmarkResult(BaseModel):
+    """One measured value: its key, made of the benchmark name and params, identifies it across runs."""
+
+    name: str
+    params: dict[str, Any] = Field(default_factory=dict)
+    value: float
+    unit: BenchmarkUnit
+    timing: TimingStats | None = None
+
+    @property
+    def key(self) -> str:
+        if not self.params:
+            return self.name
+        params_str = ",".join(f"{param_name}={param_value}" for param_name, param_value in sorted(self.params.items()))
+        return f"{self.name}[{params_str}]"
+
+
+class BenchmarkEnvironment(BaseModel):
+    pipelex_version: str
+    python_version: str
+    platform: str
+    git_commit: str | None
+    config: dict[str, Any]
+
+
+class BenchmarkReport(BaseModel):
+    started_at: str
+    duration: float
+    environment: BenchmarkEnvironment
+    peak_rss_bytes: int | None
+    results: list[BenchmarkResult] = Field(default_factory=empty_list_factory_of(BenchmarkResult))
+
+    def get_results_by_key(self) -> dict[str, BenchmarkResult]:
+        return {result.key: result for result in self.results}
+
+
+async def time_iterations(func: Callable[[], Awaitable[Any]], nb_iterations: int, nb_warmup_iterations: int = 1) -> TimingStats:
+    """Time each call of func with perf_counter, after warmup calls which are not timed."""
+    for _ in range(nb_warmup_iterations):
+        await func()
+    durations: list[float] = []
+    for _ in range(nb_iterations):
+        start_time = time.perf_counter()
+        await func()
+        durations.append(time.perf_counter() - start_time)
+    return TimingStats.make_from_durations(durations=durations)
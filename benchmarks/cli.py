@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from benchmarks.benchmark_context import BenchmarkConfig
+from benchmarks.benchmark_models import BenchmarkReport
+from benchmarks.compare_benchmarks import compare_reports
+from benchmarks.run_benchmarks import BENCHMARK_GROUPS, run_benchmarks
+from pipelex.tools.misc.file_utils import ensure_directory_for_file_path, load_text_from_path, save_text_to_path
+
+DEFAULT_RESULTS_DIR = "benchmarks/results"
+# Relative change above which a result is reported as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+app = typer.Typer(help="Benchmarks of the Pipelex execution engine, with mock inference workers", no_args_is_help=True)
+console = Console()
+
+
+def _parse_sizes(sizes_str: str) -> list[int]:
+    return [int(size.strip()) for size in sizes_str.split(",") if size.strip()]
+
+
+def _parse_group_names(only: list[str]) -> list[str]:
+    # --only can be repeated and each value can also be comma-separated
+    return [group_name.strip() for only_value in only for group_name in only_value.split(",") if group_name.strip()]
+
+
+@app.command("run")
+def run_cmd(
+    output: Annotated[str | None, typer.Option("--output", "-o", help="Path of the JSON report, by default in benchmarks/results")] = None,
+    quick: Annotated[bool, typer.Option("--quick", help="Run smaller sizes, e.g. for CI")] = False,
+    only: Annotated[
+        list[str] | None, typer.Option("--only", help=f"Benchmark groups to run, repeated or comma-separated, among: {', '.join(BENCHMARK_GROUPS)}")
+    ] = None,
+    nb_iterations: Annotated[int | None, typer.Option("--nb-iterations", help="Number of timed iterations per benchmark")] = None,
+    batch_sizes: Annotated[str | None, typer.Option("--batch-sizes", help="Comma-separated numbers of items for PipeBatch scaling")] = None,
+) -> None:
+    """Run the benchmarks and write their results to a JSON report."""
+    config = BenchmarkConfig.make_quick() if quick else BenchmarkConfig()
+    if nb_iterations is not None:
+        config.nb_iterations = nb_iterations
+    if batch_sizes is not None:
+        config.batch_sizes = _parse_sizes(batch_sizes)
+    group_names = _parse_group_names(only=only) if only else list(BENCHMARK_GROUPS)
+    if unknown_group_names := [group_name for group_name in group_names if group_name not in BENCHMARK_GROUPS]:
+        console.print(f"[red]Unknown benchmark groups: {', '.join(unknown_group_names)}[/red]")
+        raise typer.Exit(code=1)
+
+    report = asyncio.run(run_benchmarks(config=config, group_names=group_names))
+
+    output_path = output or f"{DEFAULT_RESULTS_DIR}/benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    ensure_directory_for_file_path(file_path=output_path)
+    save_text_to_path(text=report.model_dump_json(indent=2), path=output_path)
+
+    table = Table(title=f"Benchmarks ({report.duration:.1f}s)")
+    table.add_column("Benchmark")
+    table.add_column("Value", justify="right")
+    table.add_column("Unit")
+    for result in report.results:
+        table.add_row(escape(result.key), f"{result.value:.6g}", result.unit)
+    console.print(table)
+    console.print(f"Report written to [cyan]{output_path}[/cyan]")
+
+
+@app.command("compare")
+def compare_cmd(
+    baseline_path: Annotated[str, typer.Argument(help="JSON report of the reference run, e.g. from the main branch")],
+    current_path: Annotated[str, typer.Argument(help="JSON report of the run to check")],
+    threshold: Annotated[
+        float, typer.Option("--threshold", help="Relative change above which a result is a regression, e.g. 0.2 for 20%")
+    ] = DEFAULT_REGRESSION_THRESHOLD,
+) -> None:
+    """Compare two JSON reports and exit with an error code if any result regressed beyond the threshold."""
+    baseline = BenchmarkReport.model_validate_json(load_text_from_path(path=baseline_path))
+    current = BenchmarkReport.model_validate_json(load_text_from_path(path=current_path))
+    comparisons = compare_reports(baseline=baseline, current=current)
+
+    table = Table(title=f"Benchmarks compared with {baseline.environment.git_commit or baseline_path}")
+    table.add_column("Benchmark")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    regressions = [comparison for comparison in comparisons if comparison.is_regression(threshold=threshold)]
+    for comparison in comparisons:
+        change_str = f"{comparison.relative_change:+.1%}"
+        if comparison.is_regression(threshold=threshold):
+            change_str = f"[red]{change_str}[/red]"
+        table.add_row(escape(comparison.key), f"{comparison.baseline.value:.6g}", f"{comparison.current.value:.6g}", change_str)
+    console.print(table)
+
+    if regressions:
+        console.print(f"[red]{len(regressions)} benchmarks regressed by more than {threshold:.0%}[/red]")
+        raise typer.Exit(code=1)
+    console.print(f"No regression beyond {threshold:.0%} over {len(comparisons)} benchmarks")
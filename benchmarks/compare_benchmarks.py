@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+
+from benchmarks.benchmark_models import BenchmarkReport, BenchmarkResult
+
+
+class BenchmarkComparison(BaseModel):
+    key: str
+    baseline: BenchmarkResult
+    current: BenchmarkResult
+
+    @property
+    def relative_change(self) -> float:
+        """Relative change of the value, positive when the current run is worse than the baseline."""
+        if self.baseline.value == 0:
+            return 0.0
+        change = (self.current.value - self.baseline.value) / self.baseline.value
+        return -change if self.current.unit.is_higher_better else change
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.relative_change > threshold
+
+
+def compare_reports(baseline: BenchmarkReport, current: BenchmarkReport) -> list[BenchmarkComparison]:
+    """Pair the results found in both reports, the others cannot be compared."""
+    baseline_results = baseline.get_results_by_key()
+    return [
+        BenchmarkComparison(key=result.key, baseline=baseline_results[result.key], current=result)
+        for result in current.results
+        if result.key in baseline_results
+    ]
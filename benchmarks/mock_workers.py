@@ -0,0 +1,201 @@
+"""Deterministic inference workers with a configurable latency, so the benchmarks measure Pipelex itself.
+
+The MockInferenceManager plugs the mock workers in place of the real ones for every model handle,
+so pipes go through the whole content generation, job and reporting code path, without any network call.
+"""
+
+import asyncio
+
+from polyfactory.factories.pydantic_factory import ModelFactory
+from pydantic import BaseModel, Field
+from typing_extensions import override
+
+from pipelex.cogt.extract.extract_job import ExtractJob
+from pipelex.cogt.extract.extract_output import ExtractOutput, Page
+from pipelex.cogt.extract.extract_worker_abstract import ExtractWorkerAbstract
+from pipelex.cogt.image.generated_image import GeneratedImage
+from pipelex.cogt.img_gen.img_gen_job import ImgGenJob
+from pipelex.cogt.img_gen.img_gen_worker_abstract import ImgGenWorkerAbstract
+from pipelex.cogt.inference.inference_manager import InferenceManager
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.config import get_config
+from pipelex.hub import get_models_manager, get_report_delegate
+from pipelex.reporting.reporting_protocol import ReportingProtocol
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+# Rough ratio used to derive token counts from prompt and answer lengths
+MOCK_NB_CHARS_PER_TOKEN = 4
+MOCK_RANDOM_SEED = 42
+
+
+class MockWorkerSettings(BaseModel):
+    """Latency of each mock inference call, in seconds, and size of the mock outputs."""
+
+    llm_latency: float = Field(default=0.0, ge=0)
+    img_gen_latency: float = Field(default=0.0, ge=0)
+    extract_latency: float = Field(default=0.0, ge=0)
+    nb_extract_pages: int = Field(default=3, ge=1)
+
+
+def _build_mock_object(schema: type[BaseModelTypeVar]) -> BaseModelTypeVar:
+    object_factory = ModelFactory.create_factory(model=schema, __allow_none_optionals__=False)
+    # reseeding before each build makes the generated objects identical from one run to the next
+    object_factory.seed_random(MOCK_RANDOM_SEED)
+    return object_factory.build(factory_use_construct=True)
+
+
+class MockLLMWorker(LLMWorkerInternalAbstract):
+    def __init__(
+        self,
+        inference_model: InferenceModelSpec,
+        latency: float,
+        reporting_delegate: ReportingProtocol | None = None,
+    ):
+        super().__init__(inference_model=inference_model, reporting_delegate=reporting_delegate)
+        self.latency = latency
+
+    @property
+    @override
+    def is_gen_object_supported(self) -> bool:
+        return True
+
+    def _report_nb_tokens(self, llm_job: LLMJob, nb_output_chars: int):
+        if llm_tokens_usage := llm_job.job_report.llm_tokens_usage:
+            nb_prompt_chars = len(llm_job.llm_prompt.user_text or "") + len(llm_job.llm_prompt.system_text or "")
+            llm_tokens_usage.nb_tokens_by_category = {
+                TokenCategory.INPUT: nb_prompt_chars // MOCK_NB_CHARS_PER_TOKEN,
+                TokenCategory.OUTPUT: nb_output_chars // MOCK_NB_CHARS_PER_TOKEN,
+            }
+
+    @override
+    async def _gen_text(
+        self,
+        llm_job: LLMJob,
+    ) -> str:
+        await asyncio.sleep(self.latency)
+        generated_text = f"Mock answer from {self.inference_model.name} to a prompt of {len(llm_job.llm_prompt.user_text or '')} characters"
+        self._report_nb_tokens(llm_job=llm_job, nb_output_chars=len(generated_text))
+        return generated_text
+
+    @override
+    async def _gen_object(
+        self,
+        llm_job: LLMJob,
+        schema: type[BaseModelTypeVar],
+    ) -> BaseModelTypeVar:
+        await asyncio.sleep(self.latency)
+        generated_object = _build_mock_object(schema=schema)
+        self._report_nb_tokens(llm_job=llm_job, nb_output_chars=len(generated_object.model_dump_json()))
+        return generated_object
+
+
+class MockImgGenWorker(ImgGenWorkerAbstract):
+    def __init__(
+        self,
+        inference_model: InferenceModelSpec,
+        latency: float,
+        reporting_delegate: ReportingProtocol | None = None,
+    ):
+        super().__init__(inference_model=inference_model, reporting_delegate=reporting_delegate)
+        self.latency = latency
+
+    def _make_image(self, image_index: int) -> GeneratedImage:
+        image_urls = get_config().pipelex.dry_run_config.image_urls
+        return GeneratedImage(url=image_urls[image_index % len(image_urls)], width=1024, height=1024)
+
+    @override
+    async def _gen_image(
+        self,
+        img_gen_job: ImgGenJob,
+    ) -> GeneratedImage:
+        await asyncio.sleep(self.latency)
+        return self._make_image(image_index=0)
+
+    @override
+    async def _gen_image_list(
+        self,
+        img_gen_job: ImgGenJob,
+        nb_images: int,
+    ) -> list[GeneratedImage]:
+        await asyncio.sleep(self.latency)
+        return [self._make_image(image_index=image_index) for image_index in range(nb_images)]
+
+
+class MockExtractWorker(ExtractWorkerAbstract):
+    def __init__(
+        self,
+        inference_model: InferenceModelSpec,
+        latency: float,
+        nb_pages: int,
+        reporting_delegate: ReportingProtocol | None = None,
+    ):
+        super().__init__(extra_config={}, inference_model=inference_model, reporting_delegate=reporting_delegate)
+        self.latency = latency
+        self.nb_pages = nb_pages
+
+    @override
+    async def _extract_pages(
+        self,
+        extract_job: ExtractJob,
+    ) -> ExtractOutput:
+        await asyncio.sleep(self.latency)
+        return ExtractOutput(pages={page_index: Page(text=f"Mock text of page {page_index}") for page_index in range(1, self.nb_pages + 1)})
+
+
+class MockInferenceManager(InferenceManager):
+    """Inference manager setting up mock workers instead of the real ones, for any model handle."""
+
+    def __init__(self, settings: MockWorkerSettings | None = None):
+        super().__init__()
+        self.settings = settings or MockWorkerSettings()
+
+    @override
+    def _setup_one_internal_llm_worker(
+        self,
+        inference_model: InferenceModelSpec,
+        llm_handle: str,
+    ) -> LLMWorkerInternalAbstract:
+        llm_worker = MockLLMWorker(inference_model=inference_model, latency=self.settings.llm_latency, reporting_delegate=get_report_delegate())
+        self.llm_workers[llm_handle] = llm_worker
+        return llm_worker
+
+    @override
+    def _setup_one_img_gen_worker(self, img_gen_handle: str) -> ImgGenWorkerAbstract:
+        inference_model = get_models_manager().get_inference_model(model_handle=img_gen_handle)
+        img_gen_worker = MockImgGenWorker(
+            inference_model=inference_model, latency=self.settings.img_gen_latency, reporting_delegate=get_report_delegate()
+        )
+        self.img_gen_workers[img_gen_handle] = img_gen_worker
+        return img_gen_worker
+
+    @override
+    def _setup_one_extract_worker(
+        self,
+        inference_model: InferenceModelSpec,
+        extract_handle: str,
+    ) -> ExtractWorkerAbstract:
+        extract_worker = MockExtractWorker(
+            inference_model=inference_model,
+            latency=self.settings.extract_latency,
+            nb_pages=self.settings.nb_extract_pages,
+            reporting_delegate=get_report_delegate(),
+        )
+        self.extract_workers[extract_handle] = extract_worker
+        return extract_worker
+
+    def set_settings(self, settings: MockWorkerSettings):
+        """Change the settings of the workers already set up and of the next ones."""
+        self.settings = settings
+        for llm_worker in self.llm_workers.values():
+            if isinstance(llm_worker, MockLLMWorker):
+                llm_worker.latency = settings.llm_latency
+        for img_gen_worker in self.img_gen_workers.values():
+            if isinstance(img_gen_worker, MockImgGenWorker):
+                img_gen_worker.latency = settings.img_gen_latency
+        for extract_worker in self.extract_workers.values():
+            if isinstance(extract_worker, MockExtractWorker):
+                extract_worker.latency = settings.extract_latency
+                extract_worker.nb_pages = settings.nb_extract_pages
@@ -0,0 +1,116 @@
+import contextlib
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from pathlib import Path
+
+from typing_extensions import override
+
+from benchmarks.bench_library import bench_library_load
+from benchmarks.bench_memory import bench_memory_copy
+from benchmarks.bench_pipes import BENCH_PIPES_BUNDLE, bench_batch_scaling, bench_parallel_fan_out, bench_pipe_overhead
+from benchmarks.bench_templates import bench_template_render
+from benchmarks.benchmark_context import BenchmarkConfig, BenchmarkContext
+from benchmarks.benchmark_models import BenchmarkEnvironment, BenchmarkReport, BenchmarkResult, BenchmarkUnit
+from benchmarks.mock_workers import MockInferenceManager
+from pipelex import log
+from pipelex.config import get_config
+from pipelex.pipelex import Pipelex
+from pipelex.system.runtime import IntegrationMode
+from pipelex.tools.misc.package_utils import get_package_version
+from pipelex.tools.secrets.env_secrets_provider import EnvSecretsProvider
+
+BenchmarkGroup = Callable[[BenchmarkContext], Awaitable[list[BenchmarkResult]]]
+
+BENCHMARK_GROUPS: dict[str, BenchmarkGroup] = {
+    "pipe_overhead": bench_pipe_overhead,
+    "batch_scaling": bench_batch_scaling,
+    "parallel_fan_out": bench_parallel_fan_out,
+    "memory_copy": bench_memory_copy,
+    "template_render": bench_template_render,
+    "library_load": bench_library_load,
+}
+
+PLACEHOLDER_SECRET = "benchmark-placeholder"
+
+
+class PlaceholderSecretsProvider(EnvSecretsProvider):
+    """The mock workers never call the inference backends, so their credentials may be missing."""
+
+    @override
+    def get_required_secret(self, secret_id: str) -> str:
+        return self.get_optional_secret(secret_id=secret_id) or PLACEHOLDER_SECRET
+
+
+def get_peak_rss_bytes() -> int | None:
+    try:
+        import resource  # noqa: PLC0415 - not available on Windows
+    except ImportError:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS but in kilobytes on Linux
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def get_git_commit() -> str | None:
+    try:
+        completed_process = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)  # noqa: S607
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed_process.stdout.strip()
+
+
+def _disable_console_logging() -> None:
+    """Each log call inspects the call stack, even below the log level, which would dominate the measures."""
+    log_config = get_config().pipelex.log_config
+    log.reset()
+    log.configure(log_config=log_config.model_copy(update={"is_console_logging_enabled": False}))
+
+
+async def run_benchmarks(config: BenchmarkConfig, group_names: list[str]) -> BenchmarkReport:
+    started_at = datetime.now()
+    start_time = time.perf_counter()
+    inference_manager = MockInferenceManager()
+    pipelex_instance = Pipelex.make(
+        integration_mode=IntegrationMode.PYTHON,
+        secrets_provider=PlaceholderSecretsProvider(),
+        inference_manager=inference_manager,
+    )
+    _disable_console_logging()
+    results: list[BenchmarkResult] = []
+    try:
+        with (
+            tempfile.TemporaryDirectory(prefix="pipelex_benchmarks_") as work_dir,
+            open(os.devnull, "w", encoding="utf-8") as devnull,
+        ):
+            context = BenchmarkContext(config=config, inference_manager=inference_manager, work_dir=Path(work_dir))
+            context.load_bundle(bundle_name="bench_pipes", plx_content=BENCH_PIPES_BUNDLE)
+            for group_name in group_names:
+                print(f"Running benchmark group '{group_name}'", file=sys.stderr)
+                # pipe operators pretty-print their outputs, writing them to a terminal would also skew the measures
+                with contextlib.redirect_stdout(devnull):
+                    results.extend(await BENCHMARK_GROUPS[group_name](context))
+                # the peak RSS only grows, recording it after each group shows which one raised it
+                if (peak_rss_bytes := get_peak_rss_bytes()) is not None:
+                    results.append(BenchmarkResult(name="peak_rss", params={"after": group_name}, value=peak_rss_bytes, unit=BenchmarkUnit.BYTES))
+    finally:
+        pipelex_instance.teardown()
+
+    return BenchmarkReport(
+        started_at=started_at.isoformat(),
+        duration=time.perf_counter() - start_time,
+        environment=BenchmarkEnvironment(
+            pipelex_version=get_package_version(),
+            python_version=platform.python_version(),
+            platform=platform.platform(),
+            git_commit=get_git_commit(),
+            config=config.model_dump(),
+        ),
+        peak_rss_bytes=get_peak_rss_bytes(),
+        results=results,
+    )
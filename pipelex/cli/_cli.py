@@ -13,6 +13,7 @@ from pipelex.cli.commands.kit_cmd import kit_app
 from pipelex.cli.commands.run_cmd import run_cmd
 from pipelex.cli.commands.show_cmd import show_app
 from pipelex.cli.commands.validate_cmd import validate_cmd
+from pipelex.cli.commands.worker_cmd import worker_cmd
 from pipelex.tools.misc.package_utils import get_package_version
 
 
@@ -20,7 +21,7 @@ class PipelexCLI(TyperGroup):
     @override
     def list_commands(self, ctx: Context) -> list[str]:
         # List the commands in the proper order because natural ordering doesn't work between Typer groups and commands
-        return ["init", "doctor", "kit", "build", "validate", "run", "show"]
+        return ["init", "doctor", "kit", "build", "validate", "run", "worker", "show"]
 
     @override
     def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
@@ -96,4 +97,5 @@ app.command(name="validate", help="Validate pipes: static validation for syntax
     validate_cmd
 )
 app.command(name="run", help="Run a pipe, optionally providing a specific bundle file (.plx)")(run_cmd)
+app.command(name="worker", help="Run offloaded PipeBatch and PipeParallel branches from a filesystem branch queue")(worker_cmd)
 app.add_typer(show_app, name="show", help="Show configuration, pipes, and list AI models")
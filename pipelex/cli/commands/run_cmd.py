@@ -53,6 +53,10 @@ def run_cmd(
         bool,
         typer.Option("--no-pretty-print", help="Skip pretty printing the main_stuff"),
     ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="Profile the run with the sampling profiler, and save flamegraphs of the CPU cost of each pipe"),
+    ] = False,
 ) -> None:
     """Execute a pipeline from a specific bundle file (or not), specifying its pipe code or not.
     If the bundle is provided, it will run its main pipe unless you specify a pipe code.
@@ -65,6 +69,7 @@ def run_cmd(
         pipelex run --pipe my_pipe --inputs data.json
         pipelex run my_bundle.plx --inputs data.json
         pipelex run my_pipe --output results.json --no-pretty-print
+        pipelex run my_pipe --profile
     """
     # Validate mutual exclusivity
     provided_options = sum([target is not None, pipe is not None, bundle is not None])
@@ -112,7 +117,7 @@ def run_cmd(
 
     async def run_pipeline(pipe_code: str | None = None, bundle_path: str | None = None):
         # Initialize Pipelex
-        Pipelex.make(integration_mode=IntegrationMode.CLI)
+        Pipelex.make(integration_mode=IntegrationMode.CLI, force_enable_profiling=profile)
         source_description: str
         if bundle_path:
             try:
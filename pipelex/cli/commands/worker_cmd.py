@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Annotated
+
+import typer
+
+from pipelex import log
+from pipelex.config import get_config
+from pipelex.pipelex import Pipelex
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorNoOp
+from pipelex.pipeline.branch_executor.branch_worker import load_worker_bundles, run_branch_queue_worker
+from pipelex.system.runtime import IntegrationMode
+
+
+def worker_cmd(
+    queue_dir: Annotated[
+        str | None,
+        typer.Option("--queue-dir", help="Directory of the branch queue, defaults to the queue_dir of the branch executor config"),
+    ] = None,
+    bundle: Annotated[
+        list[str] | None,
+        typer.Option("--bundle", help="Bundle file path (.plx) of offloaded pipes, besides the worker bundles of the config, can be repeated"),
+    ] = None,
+    max_jobs: Annotated[
+        int | None,
+        typer.Option("--max-jobs", help="Stop after running this number of jobs, by default the worker runs until interrupted"),
+    ] = None,
+) -> None:
+    """Run the offloaded PipeBatch and PipeParallel branches queued in a filesystem branch queue.
+
+    Start one worker per core on each host sharing the queue directory with the hosts running the pipelines,
+    which use the branch executor of type "filesystem_queue".
+
+    Examples:
+        pipelex worker
+        pipelex worker --queue-dir /mnt/shared/branch_queue --bundle my_bundle.plx
+    """
+    # The worker runs the branches itself, it doesn't offload them again
+    Pipelex.make(integration_mode=IntegrationMode.CLI, branch_executor=BranchExecutorNoOp())
+    branch_executor_config = get_config().pipelex.branch_executor_config
+    load_worker_bundles(bundle_paths=[*branch_executor_config.worker_bundle_paths, *(bundle or [])])
+    applied_queue_dir = queue_dir or branch_executor_config.queue_dir
+    log.info(f"Branch worker waiting for jobs in '{applied_queue_dir}'")
+    try:
+        nb_jobs = asyncio.run(
+            run_branch_queue_worker(
+                queue_dir=applied_queue_dir,
+                poll_interval=branch_executor_config.queue_poll_interval,
+                max_nb_jobs=max_jobs,
+            )
+        )
+    except KeyboardInterrupt:
+        typer.echo("Branch worker stopped")
+        return
+    typer.echo(f"Branch worker stopped after running {nb_jobs} job(s)")
@@ -32,10 +32,13 @@ from pipelex.cogt.templating.templating_style import TemplatingStyle
 from pipelex.config import get_config
 from pipelex.pipeline.job_metadata import JobMetadata
 from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+from pipelex.tracing.span import SpanKind
+from pipelex.tracing.tracing_utils import traced
 
 
 class ContentGenerator(ContentGeneratorProtocol):
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     @update_job_metadata
     async def make_llm_text(
         self,
@@ -56,6 +59,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return generated_text
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     @update_job_metadata
     async def make_object_direct(
         self,
@@ -79,6 +83,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return cast("BaseModelTypeVar", obj)
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     @update_job_metadata
     async def make_text_then_object(
         self,
@@ -126,6 +131,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return cast("BaseModelTypeVar", obj)
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     @update_job_metadata
     async def make_object_list_direct(
         self,
@@ -149,6 +155,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return cast("list[BaseModelTypeVar]", obj_list)
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     @update_job_metadata
     async def make_text_then_object_list(
         self,
@@ -195,6 +202,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return cast("list[BaseModelTypeVar]", obj_list)
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     @update_job_metadata
     async def make_single_image(
         self,
@@ -218,6 +226,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return generated_image
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     @update_job_metadata
     async def make_image_list(
         self,
@@ -242,6 +251,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return generated_image_list
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     async def make_templated_text(
         self,
         context: dict[str, Any],
@@ -258,6 +268,7 @@ class ContentGenerator(ContentGeneratorProtocol):
         return await templating_gen_text(templating_assignment=templating_assignment)
 
     @override
+    @traced(kind=SpanKind.CONTENT_GENERATION)
     async def make_extract_pages(
         self,
         job_metadata: JobMetadata,
@@ -1,7 +1,9 @@
 from pipelex.cogt.content_generation.assignment_models import ExtractAssignment
 from pipelex.cogt.extract.extract_job_factory import ExtractJobFactory
 from pipelex.cogt.extract.extract_output import ExtractOutput
-from pipelex.hub import get_extract_worker
+from pipelex.hub import get_extract_worker, get_metrics, get_tracer
+from pipelex.pipeline.job_metadata import JobCategory
+from pipelex.tracing.span import SpanAttribute, SpanKind
 
 
 async def extract_gen_pages(extract_assignment: ExtractAssignment) -> ExtractOutput:
@@ -12,4 +14,14 @@ async def extract_gen_pages(extract_assignment: ExtractAssignment) -> ExtractOut
         extract_job_config=extract_assignment.extract_job_config,
         job_metadata=extract_assignment.job_metadata,
     )
-    return await extract_worker.extract_pages(extract_job=extract_job)
+    with (
+        get_tracer().start_span(
+            name=f"{extract_worker.__class__.__name__}.extract_pages",
+            kind=SpanKind.WORKER,
+            attributes={SpanAttribute.MODEL_HANDLE: extract_assignment.extract_handle},
+        ),
+        get_metrics().track_inference(job_category=JobCategory.EXTRACT_JOB, model_handle=extract_assignment.extract_handle),
+    ):
+        extract_output = await extract_worker.extract_pages(extract_job=extract_job)
+    get_metrics().record_inference_job(model_handle=extract_assignment.extract_handle, inference_job=extract_job)
+    return extract_output
@@ -2,7 +2,9 @@ from pipelex import log
 from pipelex.cogt.content_generation.assignment_models import ImgGenAssignment
 from pipelex.cogt.image.generated_image import GeneratedImage
 from pipelex.cogt.img_gen.img_gen_job_factory import ImgGenJobFactory
-from pipelex.hub import get_img_gen_worker
+from pipelex.hub import get_img_gen_worker, get_metrics, get_tracer
+from pipelex.pipeline.job_metadata import JobCategory
+from pipelex.tracing.span import SpanAttribute, SpanKind
 
 
 async def img_gen_single_image(img_gen_assignment: ImgGenAssignment) -> GeneratedImage:
@@ -13,7 +15,16 @@ async def img_gen_single_image(img_gen_assignment: ImgGenAssignment) -> Generate
         img_gen_job_config=img_gen_assignment.img_gen_job_config,
         job_metadata=img_gen_assignment.job_metadata,
     )
-    generated_image = await img_gen_worker.gen_image(img_gen_job=img_gen_job)
+    with (
+        get_tracer().start_span(
+            name=f"{img_gen_worker.__class__.__name__}.gen_image",
+            kind=SpanKind.WORKER,
+            attributes={SpanAttribute.MODEL_HANDLE: img_gen_assignment.img_gen_handle},
+        ),
+        get_metrics().track_inference(job_category=JobCategory.IMG_GEN_JOB, model_handle=img_gen_assignment.img_gen_handle),
+    ):
+        generated_image = await img_gen_worker.gen_image(img_gen_job=img_gen_job)
+    get_metrics().record_inference_job(model_handle=img_gen_assignment.img_gen_handle, inference_job=img_gen_job)
     log.verbose(f"generated_image:\n{generated_image}")
     return generated_image
 
@@ -26,10 +37,19 @@ async def img_gen_image_list(img_gen_assignment: ImgGenAssignment) -> list[Gener
         img_gen_job_config=img_gen_assignment.img_gen_job_config,
         job_metadata=img_gen_assignment.job_metadata,
     )
-    generated_image_list = await img_gen_worker.gen_image_list(
-        img_gen_job=img_gen_job,
-        nb_images=img_gen_assignment.nb_images,
-    )
+    with (
+        get_tracer().start_span(
+            name=f"{img_gen_worker.__class__.__name__}.gen_image_list",
+            kind=SpanKind.WORKER,
+            attributes={SpanAttribute.MODEL_HANDLE: img_gen_assignment.img_gen_handle},
+        ),
+        get_metrics().track_inference(job_category=JobCategory.IMG_GEN_JOB, model_handle=img_gen_assignment.img_gen_handle),
+    ):
+        generated_image_list = await img_gen_worker.gen_image_list(
+            img_gen_job=img_gen_job,
+            nb_images=img_gen_assignment.nb_images,
+        )
+    get_metrics().record_inference_job(model_handle=img_gen_assignment.img_gen_handle, inference_job=img_gen_job)
     log.verbose(f"generated_image_list:\n{generated_image_list}")
     return generated_image_list
 
@@ -4,8 +4,23 @@ from pydantic import BaseModel
 
 from pipelex import log
 from pipelex.cogt.content_generation.assignment_models import LLMAssignment, ObjectAssignment
+from pipelex.cogt.llm.llm_job import LLMJob
 from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
-from pipelex.hub import get_class_registry, get_llm_worker
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.hub import get_class_registry, get_llm_worker, get_metrics, get_tracer
+from pipelex.pipeline.job_metadata import JobCategory
+from pipelex.tracing.span import Span, SpanAttribute, SpanKind
+
+
+def _set_llm_job_span_attributes(span: Span, llm_job: LLMJob):
+    llm_tokens_usage = llm_job.job_report.llm_tokens_usage
+    if not span.is_recording or llm_tokens_usage is None:
+        return
+    span.set_attribute(key=SpanAttribute.MODEL_NAME, value=llm_tokens_usage.inference_model_name)
+    for token_category, nb_tokens in llm_tokens_usage.nb_tokens_by_category.items():
+        span.set_attribute(key=SpanAttribute.for_nb_tokens(token_category=token_category), value=nb_tokens)
+    nb_tokens_input_cached = llm_tokens_usage.nb_tokens_by_category.get(TokenCategory.INPUT_CACHED, 0)
+    span.set_attribute(key=SpanAttribute.IS_CACHE_HIT, value=nb_tokens_input_cached > 0)
 
 
 async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
@@ -15,7 +30,17 @@ async def llm_gen_text(llm_assignment: LLMAssignment) -> str:
         llm_prompt=llm_assignment.llm_prompt,
         llm_job_params=llm_assignment.llm_job_params,
     )
-    generated_text = await llm_worker.gen_text(llm_job=llm_job)
+    with (
+        get_tracer().start_span(
+            name=f"{llm_worker.__class__.__name__}.gen_text",
+            kind=SpanKind.WORKER,
+            attributes={SpanAttribute.MODEL_HANDLE: llm_assignment.llm_handle},
+        ) as span,
+        get_metrics().track_inference(job_category=JobCategory.LLM_JOB, model_handle=llm_assignment.llm_handle),
+    ):
+        generated_text = await llm_worker.gen_text(llm_job=llm_job)
+        _set_llm_job_span_attributes(span=span, llm_job=llm_job)
+    get_metrics().record_inference_job(model_handle=llm_assignment.llm_handle, inference_job=llm_job)
     log.verbose(generated_text, title="llm_gen_text")
     return generated_text
 
@@ -30,10 +55,20 @@ async def llm_gen_object(object_assignment: ObjectAssignment) -> BaseModel:
     )
     content_class_name = object_assignment.object_class_name
     content_class = get_class_registry().get_required_base_model(name=content_class_name)
-    generated_object: BaseModel = await llm_worker.gen_object(
-        llm_job=llm_job,
-        schema=content_class,
-    )
+    with (
+        get_tracer().start_span(
+            name=f"{llm_worker.__class__.__name__}.gen_object",
+            kind=SpanKind.WORKER,
+            attributes={SpanAttribute.MODEL_HANDLE: llm_assignment.llm_handle},
+        ) as span,
+        get_metrics().track_inference(job_category=JobCategory.LLM_JOB, model_handle=llm_assignment.llm_handle),
+    ):
+        generated_object: BaseModel = await llm_worker.gen_object(
+            llm_job=llm_job,
+            schema=content_class,
+        )
+        _set_llm_job_span_attributes(span=span, llm_job=llm_job)
+    get_metrics().record_inference_job(model_handle=llm_assignment.llm_handle, inference_job=llm_job)
     return generated_object
 
 
@@ -59,9 +94,19 @@ async def llm_gen_object_list(object_assignment: ObjectAssignment) -> list[BaseM
     else:
         ListSchema.__doc__ = f"A list of {item_class_name}."
 
-    wrapped_list: ListSchema = await llm_worker.gen_object(
-        llm_job=llm_job,
-        schema=ListSchema,
-    )
+    with (
+        get_tracer().start_span(
+            name=f"{llm_worker.__class__.__name__}.gen_object",
+            kind=SpanKind.WORKER,
+            attributes={SpanAttribute.MODEL_HANDLE: llm_assignment.llm_handle},
+        ) as span,
+        get_metrics().track_inference(job_category=JobCategory.LLM_JOB, model_handle=llm_assignment.llm_handle),
+    ):
+        wrapped_list: ListSchema = await llm_worker.gen_object(
+            llm_job=llm_job,
+            schema=ListSchema,
+        )
+        _set_llm_job_span_attributes(span=span, llm_job=llm_job)
+    get_metrics().record_inference_job(model_handle=llm_assignment.llm_handle, inference_job=llm_job)
     generated_list: list[BaseModel] = cast("list[BaseModel]", wrapped_list.items)  # pyright: ignore[reportUnknownMemberType]
     return generated_list
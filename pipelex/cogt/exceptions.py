@@ -26,6 +26,13 @@ class ReportingManagerError(CogtError):
     pass
 
 
+class RunBudgetExceededError(CogtError):
+    def __init__(self, message: str, pipeline_run_id: str, pipe_code: str | None = None):
+        self.pipeline_run_id = pipeline_run_id
+        self.pipe_code = pipe_code
+        super().__init__(message)
+
+
 class SdkTypeError(CogtError):
     pass
 
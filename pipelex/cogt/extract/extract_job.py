@@ -4,7 +4,10 @@ from typing_extensions import override
 
 from pipelex.cogt.extract.extract_input import ExtractInput
 from pipelex.cogt.extract.extract_job_components import ExtractJobConfig, ExtractJobParams, ExtractJobReport
+from pipelex.cogt.extract.extract_output import ExtractOutput
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.usage.unit_report import UnitCategory, UnitUsage
 
 
 class ExtractJob(InferenceJobAbstract):
@@ -17,12 +20,26 @@ class ExtractJob(InferenceJobAbstract):
     def validate_before_execution(self):
         pass
 
-    def extract_job_before_start(self):
+    def extract_job_before_start(self, inference_model: InferenceModelSpec):
         # Reset metadata
         self.job_metadata.started_at = datetime.now()
 
         # Reset outputs
         self.job_report = ExtractJobReport()
 
-    def extract_job_after_complete(self):
+        # Reset info
+        self.job_report.unit_usage = UnitUsage(
+            job_metadata=self.job_metadata,
+            inference_model_name=inference_model.name,
+            unit_costs=inference_model.costs,
+            inference_model_id=inference_model.model_id,
+            nb_units_by_category={},
+            queue_wait_duration=self.queue_wait_duration,
+        )
+
+    def extract_job_after_complete(self, extract_output: ExtractOutput):
         self.job_metadata.completed_at = datetime.now()
+
+        if unit_usage := self.job_report.unit_usage:
+            unit_usage.nb_units_by_category[UnitCategory.PAGE] = len(extract_output.pages)
+            unit_usage.nb_bytes = extract_output.nb_bytes
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 
+from pipelex.cogt.usage.unit_report import UnitUsage
 from pipelex.system.configuration.config_model import ConfigModel
 
 
@@ -33,4 +34,4 @@ class ExtractJobConfig(ConfigModel):
 
 
 class ExtractJobReport(ConfigModel):
-    pass
+    unit_usage: UnitUsage | None = None
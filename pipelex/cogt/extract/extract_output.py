@@ -1,7 +1,7 @@
 from pydantic import Field
 
 from pipelex import log
-from pipelex.tools.misc.base_64_utils import save_base_64_str_to_binary_file
+from pipelex.tools.misc.base_64_utils import get_base_64_str_decoded_size, save_base_64_str_to_binary_file
 from pipelex.tools.misc.file_utils import ensure_directory_exists, save_text_to_path
 from pipelex.tools.typing.pydantic_utils import CustomBaseModel, empty_list_factory_of
 
@@ -11,6 +11,10 @@ class ExtractedImage(CustomBaseModel):
     base_64: str | None = None
     caption: str | None = None
 
+    @property
+    def nb_bytes(self) -> int:
+        return get_base_64_str_decoded_size(self.base_64) if self.base_64 else 0
+
     def save_to_directory(self, directory: str):
         ensure_directory_exists(directory)
         log.verbose(f"Saving image to directory: {directory}")
@@ -32,6 +36,14 @@ class Page(CustomBaseModel):
     extracted_images: list[ExtractedImageFromPage] = Field(default_factory=empty_list_factory_of(ExtractedImageFromPage))
     page_view: ExtractedImageFromPage | None = None
 
+    @property
+    def nb_bytes(self) -> int:
+        nb_bytes = len(self.text.encode("utf-8")) if self.text else 0
+        nb_bytes += sum(image.nb_bytes for image in self.extracted_images)
+        if self.page_view:
+            nb_bytes += self.page_view.nb_bytes
+        return nb_bytes
+
     def save_to_directory(self, directory: str, page_text_file_name: str):
         ensure_directory_exists(directory)
         log.verbose(f"Saving page to directory: {directory}")
@@ -51,6 +63,11 @@ class ExtractOutput(CustomBaseModel):
     def concatenated_text(self) -> str:
         return "\n".join([page.text for page in self.pages.values() if page.text])
 
+    @property
+    def nb_bytes(self) -> int:
+        """Size of the extracted text, encoded in UTF-8, and of the extracted images."""
+        return sum(page.nb_bytes for page in self.pages.values())
+
     def save_to_directory(self, directory: str, page_text_file_name: str):
         ensure_directory_exists(directory)
         full_text = self.concatenated_text
@@ -8,6 +8,7 @@ from pipelex.cogt.extract.extract_job import ExtractJob
 from pipelex.cogt.extract.extract_output import ExtractOutput
 from pipelex.cogt.inference.inference_worker_abstract import InferenceWorkerAbstract
 from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.usage.unit_report import UnitCategory
 from pipelex.pipeline.job_metadata import UnitJobId
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 
@@ -36,6 +37,20 @@ class ExtractWorkerAbstract(InferenceWorkerAbstract):
         # This can be overridden by subclasses for specific checks
         pass
 
+    async def _reserve_budget(self, extract_job: ExtractJob):
+        if self.reporting_delegate:
+            # the number of pages of the document is only known once extracted
+            await self.reporting_delegate.reserve_unit_budget(
+                inference_job=extract_job,
+                unit_costs=self.inference_model.costs,
+                unit_category=UnitCategory.PAGE,
+                nb_units=None,
+            )
+
+    def _release_budget(self, extract_job: ExtractJob):
+        if self.reporting_delegate:
+            self.reporting_delegate.release_budget(inference_job=extract_job)
+
     async def extract_pages(
         self,
         extract_job: ExtractJob,
@@ -52,14 +67,21 @@ class ExtractWorkerAbstract(InferenceWorkerAbstract):
         # metadata
         extract_job.job_metadata.unit_job_id = UnitJobId.EXTRACT_PAGES
 
+        # Reserve the estimated usage of the job in the budget of its run, this raises if the job could exceed it
+        await self._reserve_budget(extract_job=extract_job)
+
         # Prepare job
-        extract_job.extract_job_before_start()
+        extract_job.extract_job_before_start(inference_model=self.inference_model)
 
         # Execute job
-        result = await self._extract_pages(extract_job=extract_job)
+        try:
+            result = await self._extract_pages(extract_job=extract_job)
+        except BaseException:
+            self._release_budget(extract_job=extract_job)
+            raise
 
         # Report job
-        extract_job.extract_job_after_complete()
+        extract_job.extract_job_after_complete(extract_output=result)
         if self.reporting_delegate:
             self.reporting_delegate.report_inference_job(inference_job=extract_job)
 
@@ -2,9 +2,13 @@ from datetime import datetime
 
 from typing_extensions import override
 
+from pipelex.cogt.image.generated_image import GeneratedImage
 from pipelex.cogt.img_gen.img_gen_job_components import ImgGenJobConfig, ImgGenJobParams, ImgGenJobReport
 from pipelex.cogt.img_gen.img_gen_prompt import ImgGenPrompt
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.usage.unit_report import UnitCategory, UnitUsage
+from pipelex.tools.misc.base_64_utils import get_base_64_str_decoded_size
 
 
 class ImgGenJob(InferenceJobAbstract):
@@ -17,12 +21,29 @@ class ImgGenJob(InferenceJobAbstract):
     def validate_before_execution(self):
         self.img_gen_prompt.validate_before_execution()
 
-    def img_gen_job_before_start(self):
+    def img_gen_job_before_start(self, inference_model: InferenceModelSpec):
         # Reset metadata
         self.job_metadata.started_at = datetime.now()
 
         # Reset outputs
         self.job_report = ImgGenJobReport()
 
-    def img_gen_job_after_complete(self):
+        # Reset info
+        self.job_report.unit_usage = UnitUsage(
+            job_metadata=self.job_metadata,
+            inference_model_name=inference_model.name,
+            unit_costs=inference_model.costs,
+            inference_model_id=inference_model.model_id,
+            nb_units_by_category={},
+            queue_wait_duration=self.queue_wait_duration,
+        )
+
+    def img_gen_job_after_complete(self, generated_images: list[GeneratedImage]):
         self.job_metadata.completed_at = datetime.now()
+
+        if unit_usage := self.job_report.unit_usage:
+            unit_usage.nb_units_by_category[UnitCategory.IMAGE] = len(generated_images)
+            # only images returned inline as data URLs are transferred with the response
+            unit_usage.nb_bytes = sum(
+                get_base_64_str_decoded_size(generated_image.url) for generated_image in generated_images if generated_image.url.startswith("data:")
+            )
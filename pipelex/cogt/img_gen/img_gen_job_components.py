@@ -2,6 +2,7 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from pipelex.cogt.usage.unit_report import UnitUsage
 from pipelex.system.configuration.config_model import ConfigModel
 from pipelex.types import StrEnum
 
@@ -91,4 +92,4 @@ class ImgGenJobConfig(ConfigModel):
 
 
 class ImgGenJobReport(ConfigModel):
-    pass
+    unit_usage: UnitUsage | None = None
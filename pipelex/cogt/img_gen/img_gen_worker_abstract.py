@@ -7,6 +7,7 @@ from pipelex.cogt.image.generated_image import GeneratedImage
 from pipelex.cogt.img_gen.img_gen_job import ImgGenJob
 from pipelex.cogt.inference.inference_worker_abstract import InferenceWorkerAbstract
 from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.usage.unit_report import UnitCategory
 from pipelex.pipeline.job_metadata import UnitJobId
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 
@@ -33,6 +34,19 @@ class ImgGenWorkerAbstract(InferenceWorkerAbstract):
         # This can be overridden by subclasses for specific checks
         pass
 
+    async def _reserve_budget(self, img_gen_job: ImgGenJob, nb_images: int):
+        if self.reporting_delegate:
+            await self.reporting_delegate.reserve_unit_budget(
+                inference_job=img_gen_job,
+                unit_costs=self.inference_model.costs,
+                unit_category=UnitCategory.IMAGE,
+                nb_units=nb_images,
+            )
+
+    def _release_budget(self, img_gen_job: ImgGenJob):
+        if self.reporting_delegate:
+            self.reporting_delegate.release_budget(inference_job=img_gen_job)
+
     async def gen_image(
         self,
         img_gen_job: ImgGenJob,
@@ -48,14 +62,21 @@ class ImgGenWorkerAbstract(InferenceWorkerAbstract):
         # metadata
         img_gen_job.job_metadata.unit_job_id = UnitJobId.IMG_GEN_TEXT_TO_IMAGE
 
+        # Reserve the estimated usage of the job in the budget of its run, this raises if the job could exceed it
+        await self._reserve_budget(img_gen_job=img_gen_job, nb_images=1)
+
         # Prepare job
-        img_gen_job.img_gen_job_before_start()
+        img_gen_job.img_gen_job_before_start(inference_model=self.inference_model)
 
         # Execute job
-        result = await self._gen_image(img_gen_job=img_gen_job)
+        try:
+            result = await self._gen_image(img_gen_job=img_gen_job)
+        except BaseException:
+            self._release_budget(img_gen_job=img_gen_job)
+            raise
 
         # Report job
-        img_gen_job.img_gen_job_after_complete()
+        img_gen_job.img_gen_job_after_complete(generated_images=[result])
         if self.reporting_delegate:
             self.reporting_delegate.report_inference_job(inference_job=img_gen_job)
 
@@ -84,14 +105,21 @@ class ImgGenWorkerAbstract(InferenceWorkerAbstract):
         # metadata
         img_gen_job.job_metadata.unit_job_id = UnitJobId.IMG_GEN_TEXT_TO_IMAGE
 
+        # Reserve the estimated usage of the job in the budget of its run, this raises if the job could exceed it
+        await self._reserve_budget(img_gen_job=img_gen_job, nb_images=nb_images)
+
         # Prepare job
-        img_gen_job.img_gen_job_before_start()
+        img_gen_job.img_gen_job_before_start(inference_model=self.inference_model)
 
         # Execute job
-        result = await self._gen_image_list(img_gen_job=img_gen_job, nb_images=nb_images)
+        try:
+            result = await self._gen_image_list(img_gen_job=img_gen_job, nb_images=nb_images)
+        except BaseException:
+            self._release_budget(img_gen_job=img_gen_job)
+            raise
 
         # Report job
-        img_gen_job.img_gen_job_after_complete()
+        img_gen_job.img_gen_job_after_complete(generated_images=result)
         if self.reporting_delegate:
             self.reporting_delegate.report_inference_job(inference_job=img_gen_job)
 
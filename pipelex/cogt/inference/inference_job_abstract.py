@@ -1,12 +1,25 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from pipelex.pipeline.job_metadata import JobMetadata
 
 
 class InferenceJobAbstract(ABC, BaseModel):
     job_metadata: JobMetadata
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    @property
+    def queue_wait_duration(self) -> float | None:
+        """Time in seconds between the creation of the job and the start of its execution by a worker.
+
+        Jobs are created right before being dispatched, so this is mostly the wait for the reservations of the jobs
+        in flight to settle in the budget of the run, and stays close to 0 for runs without a budget.
+        """
+        if self.job_metadata.started_at is None or self.job_metadata.started_at < self.created_at:
+            return None
+        return (self.job_metadata.started_at - self.created_at).total_seconds()
 
     @abstractmethod
     def validate_before_execution(self):
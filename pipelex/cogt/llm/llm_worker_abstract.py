@@ -52,6 +52,18 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
         # Verify feasibility
         self._check_can_perform_job(llm_job=llm_job)
 
+        # Reserve the estimated usage of the job in the budget of its run, this raises if the job could exceed it
+        await self._reserve_budget(llm_job=llm_job)
+
+    async def _reserve_budget(self, llm_job: LLMJob):
+        # This can be overridden by subclasses that know the costs and max tokens of their model
+        if self.reporting_delegate:
+            await self.reporting_delegate.reserve_budget(llm_job=llm_job, unit_costs={}, model_max_tokens=None)
+
+    def _release_budget(self, llm_job: LLMJob):
+        if self.reporting_delegate:
+            self.reporting_delegate.release_budget(inference_job=llm_job)
+
     async def _after_job(
         self,
         llm_job: LLMJob,
@@ -78,7 +90,11 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
 
         await self._before_job(llm_job=llm_job)
 
-        result = await self._gen_text(llm_job=llm_job)
+        try:
+            result = await self._gen_text(llm_job=llm_job)
+        except BaseException:
+            self._release_budget(llm_job=llm_job)
+            raise
 
         await self._after_job(llm_job=llm_job, result=result)
 
@@ -105,7 +121,11 @@ class LLMWorkerAbstract(InferenceWorkerAbstract, ABC):
         await self._before_job(llm_job=llm_job)
 
         # Execute job
-        result = await self._gen_object(llm_job=llm_job, schema=schema)
+        try:
+            result = await self._gen_object(llm_job=llm_job, schema=schema)
+        except BaseException:
+            self._release_budget(llm_job=llm_job)
+            raise
 
         # Cleanup result
         if hasattr(result, "_raw_response"):
@@ -70,6 +70,15 @@ class LLMWorkerInternalAbstract(LLMWorkerAbstract):
         # This can be overridden by subclasses for specific checks
         self._check_vision_support(llm_job=llm_job)
 
+    @override
+    async def _reserve_budget(self, llm_job: LLMJob):
+        if self.reporting_delegate:
+            await self.reporting_delegate.reserve_budget(
+                llm_job=llm_job,
+                unit_costs=self.inference_model.costs,
+                model_max_tokens=self.inference_model.max_tokens,
+            )
+
     def _check_vision_support(self, llm_job: LLMJob):
         if llm_job.llm_prompt.user_images:
             if not self.inference_model.is_vision_supported:
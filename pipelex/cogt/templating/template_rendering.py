@@ -3,7 +3,9 @@ from typing import Any
 from pipelex.cogt.templating.template_category import TemplateCategory
 from pipelex.cogt.templating.template_preprocessor import preprocess_template
 from pipelex.cogt.templating.templating_style import TemplatingStyle
+from pipelex.hub import get_tracer
 from pipelex.tools.jinja2.jinja2_rendering import render_jinja2
+from pipelex.tracing.span import SpanAttribute, SpanKind
 
 
 async def render_template(
@@ -12,10 +14,11 @@ async def render_template(
     context: dict[str, Any],
     templating_style: TemplatingStyle | None = None,
 ) -> str:
-    template_source = preprocess_template(template)
-    return await render_jinja2(
-        template_source=template_source,
-        template_category=category,
-        temlating_context=context,
-        templating_style=templating_style,
-    )
+    with get_tracer().start_span(name="render_template", kind=SpanKind.TEMPLATE, attributes={SpanAttribute.TEMPLATE_CATEGORY: category}):
+        template_source = preprocess_template(template)
+        return await render_jinja2(
+            template_source=template_source,
+            template_category=category,
+            temlating_context=context,
+            templating_style=templating_style,
+        )
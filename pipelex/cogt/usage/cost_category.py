@@ -12,6 +12,8 @@ class CostCategory(StrEnum):
     OUTPUT_REASONING = "output_reasoning"
     OUTPUT_ACCEPTED_PREDICTION = "output_accepted_prediction"
     OUTPUT_REJECTED_PREDICTION = "output_rejected_prediction"
+    IMAGE = "image"  # per generated image
+    PAGE = "page"  # per extracted page
 
 
 CostsByCategoryDict = dict[CostCategory, float]
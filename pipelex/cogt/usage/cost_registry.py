@@ -8,10 +8,14 @@ from rich.table import Table
 
 from pipelex import log
 from pipelex.cogt.exceptions import CostRegistryError
-from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokenCostReportField, LLMTokensUsage
+from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokensUsage
 from pipelex.cogt.usage.cost_category import CostCategory, CostsByCategoryDict
 from pipelex.cogt.usage.costs_per_token import model_cost_per_token
+from pipelex.cogt.usage.costs_per_unit import model_cost_per_unit
+from pipelex.cogt.usage.latency_histogram import LATENCY_QUANTILES
 from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.cogt.usage.unit_report import UnitCategory, UnitCostReport, UnitUsage
+from pipelex.cogt.usage.usage_registry import USAGE_TOTAL_NAME, ModelUsage, UsageRegistry
 from pipelex.tools.typing.pydantic_utils import empty_list_factory_of
 
 CostRegistryRoot = list[LLMTokenCostReport]
@@ -37,68 +41,70 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         cost_report_file_path: str | None = None,
     ):
         if not llm_tokens_usages:
-            if pipeline_run_id != "untitled":
-                log.warning(f"No report to generate for pipeline '{pipeline_run_id}'")
-            else:
-                log.verbose(f"No report to generate for pipeline '{pipeline_run_id}'")
+            cls._log_no_report(pipeline_run_id=pipeline_run_id)
             return
         cost_registry = CostRegistry()
         for llm_tokens_usage in llm_tokens_usages:
             cost_report = cls.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
             cost_registry.root.append(cost_report)
 
-        records = cost_registry.to_records()
-
-        # Calculate total costs overall
-        total_nb_tokens_input_cached = sum(record[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED] for record in records)
-        total_nb_tokens_input_non_cached = sum(record[LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED] for record in records)
-        total_nb_tokens_input_joined = sum(record[LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED] for record in records)
-        total_nb_tokens_output = sum(record[LLMTokenCostReportField.NB_TOKENS_OUTPUT] for record in records)
-        total_cost_input_cached = sum(record[LLMTokenCostReportField.COST_INPUT_CACHED] for record in records)
-        total_cost_input_non_cached = sum(record[LLMTokenCostReportField.COST_INPUT_NON_CACHED] for record in records)
-        total_cost_input_joined = sum(record[LLMTokenCostReportField.COST_INPUT_JOINED] for record in records)
-        total_cost_output = sum(record[LLMTokenCostReportField.COST_OUTPUT] for record in records)
-        total_cost = cls.compute_total_cost(
-            input_non_cached_cost=total_cost_input_non_cached,
-            input_cached_cost=total_cost_input_cached,
-            output_cost=total_cost_output,
+        usage_registry = UsageRegistry.make_from_cost_reports(cost_reports=cost_registry.root)
+        cls.print_usage_table(pipeline_run_id=pipeline_run_id, usage_registry=usage_registry, unit_scale=unit_scale)
+
+        if cost_report_file_path:
+            cls.save_to_csv(cost_registry.to_records(), cost_report_file_path)
+
+    @classmethod
+    def generate_report_from_usage_registry(
+        cls,
+        pipeline_run_id: str,
+        usage_registry: UsageRegistry,
+        unit_scale: float,
+        cost_report_file_path: str | None = None,
+    ):
+        """Generate the report of usage that was aggregated as the jobs completed, the file gets one row per model."""
+        if usage_registry.is_empty:
+            cls._log_no_report(pipeline_run_id=pipeline_run_id)
+            return
+        cls.print_usage_table(pipeline_run_id=pipeline_run_id, usage_registry=usage_registry, unit_scale=unit_scale)
+
+        if cost_report_file_path:
+            cls.save_to_csv(usage_registry.to_records(), cost_report_file_path)
+
+    @classmethod
+    def _log_no_report(cls, pipeline_run_id: str):
+        if pipeline_run_id != "untitled":
+            log.warning(f"No report to generate for pipeline '{pipeline_run_id}'")
+        else:
+            log.verbose(f"No report to generate for pipeline '{pipeline_run_id}'")
+
+    @classmethod
+    def _add_usage_row(cls, table: Table, name: str, model_usage: ModelUsage, unit_scale: float, style: str | None = None):
+        total_cost = model_usage.get_total_cost()
+        table.add_row(
+            name,
+            f"{model_usage.get_nb_tokens(TokenCategory.INPUT_CACHED):,}",
+            f"{model_usage.get_nb_tokens(TokenCategory.INPUT_NON_CACHED):,}",
+            f"{model_usage.get_nb_tokens(TokenCategory.INPUT_JOINED):,}",
+            f"{model_usage.get_nb_tokens(TokenCategory.OUTPUT):,}",
+            f"{model_usage.get_cost(CostCategory.INPUT_CACHED) / unit_scale:.4f}",
+            f"{model_usage.get_cost(CostCategory.INPUT_NON_CACHED) / unit_scale:.4f}",
+            f"{model_usage.get_cost(CostCategory.INPUT_JOINED) / unit_scale:.4f}",
+            f"{model_usage.get_cost(CostCategory.OUTPUT) / unit_scale:.4f}",
+            f"{(model_usage.get_cost(CostCategory.IMAGE) + model_usage.get_cost(CostCategory.PAGE)) / unit_scale:.4f}",
+            f"{total_cost / unit_scale:.4f}",
+            style=style,
+            end_section=style is not None,
         )
 
-        # Calculate costs per LLM model - group by LLM name
-        grouped_by_llm: dict[str, dict[str, float]] = {}
-        for record in records:
-            llm_name = record[LLMTokenCostReportField.LLM_NAME]
-            if llm_name not in grouped_by_llm:
-                grouped_by_llm[llm_name] = {
-                    LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED: 0,
-                    LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED: 0,
-                    LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED: 0,
-                    LLMTokenCostReportField.NB_TOKENS_OUTPUT: 0,
-                    LLMTokenCostReportField.COST_INPUT_CACHED: 0.0,
-                    LLMTokenCostReportField.COST_INPUT_NON_CACHED: 0.0,
-                    LLMTokenCostReportField.COST_INPUT_JOINED: 0.0,
-                    LLMTokenCostReportField.COST_OUTPUT: 0.0,
-                }
-
-            # Aggregate values
-            for field in [
-                LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED,
-                LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED,
-                LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED,
-                LLMTokenCostReportField.NB_TOKENS_OUTPUT,
-                LLMTokenCostReportField.COST_INPUT_CACHED,
-                LLMTokenCostReportField.COST_INPUT_NON_CACHED,
-                LLMTokenCostReportField.COST_INPUT_JOINED,
-                LLMTokenCostReportField.COST_OUTPUT,
-            ]:
-                grouped_by_llm[llm_name][field] += record[field]
-
-        if not grouped_by_llm:
+    @classmethod
+    def print_usage_table(cls, pipeline_run_id: str, usage_registry: UsageRegistry, unit_scale: float):
+        if usage_registry.is_empty:
             msg = "Empty report aggregation by LLM name"
             raise CostRegistryError(msg)
 
         console = Console()
-        title = "Costs by LLM model"
+        title = "Costs by model"
         title += f" for pipeline '{pipeline_run_id}'"
         table = Table(title=title, box=box.ROUNDED)
 
@@ -117,49 +123,57 @@ class CostRegistry(RootModel[CostRegistryRoot]):
         table.add_column(f"Input Non Cached Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Input Joined Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Output Cost ({scale_str}$)", justify="right", style="yellow")
+        table.add_column(f"Images & Pages Cost ({scale_str}$)", justify="right", style="yellow")
         table.add_column(f"Total Cost ({scale_str}$)", justify="right", style="bold yellow")
 
         # Add rows for each LLM model
-        for llm_name, aggregated_data in grouped_by_llm.items():
-            row_total_cost = cls.compute_total_cost(
-                input_non_cached_cost=aggregated_data[LLMTokenCostReportField.COST_INPUT_NON_CACHED],
-                input_cached_cost=aggregated_data[LLMTokenCostReportField.COST_INPUT_CACHED],
-                output_cost=aggregated_data[LLMTokenCostReportField.COST_OUTPUT],
-            )
-            table.add_row(
-                llm_name,
-                f"{int(aggregated_data[LLMTokenCostReportField.NB_TOKENS_INPUT_CACHED]):,}",
-                f"{int(aggregated_data[LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED]):,}",
-                f"{int(aggregated_data[LLMTokenCostReportField.NB_TOKENS_INPUT_JOINED]):,}",
-                f"{int(aggregated_data[LLMTokenCostReportField.NB_TOKENS_OUTPUT]):,}",
-                f"{aggregated_data[LLMTokenCostReportField.COST_INPUT_CACHED] / unit_scale:.4f}",
-                f"{aggregated_data[LLMTokenCostReportField.COST_INPUT_NON_CACHED] / unit_scale:.4f}",
-                f"{aggregated_data[LLMTokenCostReportField.COST_INPUT_JOINED] / unit_scale:.4f}",
-                f"{aggregated_data[LLMTokenCostReportField.COST_OUTPUT] / unit_scale:.4f}",
-                f"{row_total_cost / unit_scale:.4f}",
-            )
+        for llm_name, model_usage in usage_registry.usages_by_model.items():
+            cls._add_usage_row(table=table, name=llm_name, model_usage=model_usage, unit_scale=unit_scale)
 
         # add total row
-        footer_style = "bold"
+        total_usage = usage_registry.get_total_usage()
+        cls._add_usage_row(table=table, name=USAGE_TOTAL_NAME, model_usage=total_usage, unit_scale=unit_scale, style="bold")
+
+        if total_usage.duration_histogram.nb_samples or total_usage.queue_wait_histogram.nb_samples:
+            console.print(table, cls._make_latency_table(pipeline_run_id=pipeline_run_id, usage_registry=usage_registry, total_usage=total_usage))
+        else:
+            console.print(table)
+
+    @staticmethod
+    def _format_duration(duration: float | None) -> str:
+        return "-" if duration is None else f"{duration:.2f}"
+
+    @classmethod
+    def _add_latency_row(cls, table: Table, name: str, model_usage: ModelUsage, style: str | None = None):
+        duration_histogram = model_usage.duration_histogram
         table.add_row(
-            "Total",
-            f"{total_nb_tokens_input_cached:,}",
-            f"{total_nb_tokens_input_non_cached:,}",
-            f"{total_nb_tokens_input_joined:,}",
-            f"{total_nb_tokens_output:,}",
-            f"{total_cost_input_cached / unit_scale:.4f}",
-            f"{total_cost_input_non_cached / unit_scale:.4f}",
-            f"{total_cost_input_joined / unit_scale:.4f}",
-            f"{total_cost_output / unit_scale:.4f}",
-            f"{total_cost / unit_scale:.4f}",
-            style=footer_style,
-            end_section=True,
+            name,
+            f"{model_usage.nb_calls:,}",
+            f"{model_usage.get_nb_units(UnitCategory.IMAGE):,}",
+            f"{model_usage.get_nb_units(UnitCategory.PAGE):,}",
+            f"{model_usage.nb_bytes / 1_000_000:.2f}",
+            *(cls._format_duration(duration_histogram.get_quantile(quantile)) for quantile in LATENCY_QUANTILES.values()),
+            cls._format_duration(model_usage.queue_wait_histogram.get_quantile(LATENCY_QUANTILES["p95"])),
+            style=style,
+            end_section=style is not None,
         )
 
-        console.print(table)
+    @classmethod
+    def _make_latency_table(cls, pipeline_run_id: str, usage_registry: UsageRegistry, total_usage: ModelUsage) -> Table:
+        table = Table(title=f"Calls and latencies by model for pipeline '{pipeline_run_id}'", box=box.ROUNDED)
+        table.add_column("Model", style="cyan")
+        table.add_column("Calls", justify="right", style="green")
+        table.add_column("Images", justify="right", style="green")
+        table.add_column("Pages", justify="right", style="green")
+        table.add_column("Data (MB)", justify="right", style="green")
+        for quantile_name in LATENCY_QUANTILES:
+            table.add_column(f"Duration {quantile_name} (s)", justify="right", style="magenta")
+        table.add_column("Queue Wait p95 (s)", justify="right", style="magenta")
 
-        if cost_report_file_path:
-            cls.save_to_csv(records, cost_report_file_path)
+        for model_name, model_usage in usage_registry.usages_by_model.items():
+            cls._add_latency_row(table=table, name=model_name, model_usage=model_usage)
+        cls._add_latency_row(table=table, name=USAGE_TOTAL_NAME, model_usage=total_usage, style="bold")
+        return table
 
     @staticmethod
     def save_to_csv(records: list[dict[str, Any]], file_path: str) -> None:
@@ -201,6 +215,27 @@ class CostRegistry(RootModel[CostRegistryRoot]):
             costs_by_token_category=costs_by_token_category,
         )
 
+    @classmethod
+    def compute_unit_cost_report(cls, unit_usage: UnitUsage) -> UnitCostReport:
+        costs_by_unit_category: CostsByCategoryDict = {}
+        for unit_category, nb_units in unit_usage.nb_units_by_category.items():
+            if nb_units and unit_category.to_cost_category not in unit_usage.unit_costs:
+                log.warning(
+                    f"Model '{unit_usage.inference_model_name}' has no '{unit_category.to_cost_category}' cost, "
+                    f"its {nb_units} {unit_category}(s) are counted as free"
+                )
+            cost_per_unit = model_cost_per_unit(costs=unit_usage.unit_costs, unit_category=unit_category)
+            costs_by_unit_category[unit_category.to_cost_category] = cost_per_unit * nb_units
+        return UnitCostReport(
+            job_metadata=unit_usage.job_metadata,
+            inference_model_name=unit_usage.inference_model_name,
+            inference_model_id=unit_usage.inference_model_id,
+            nb_units_by_category=unit_usage.nb_units_by_category,
+            costs_by_unit_category=costs_by_unit_category,
+            nb_bytes=unit_usage.nb_bytes,
+            queue_wait_duration=unit_usage.queue_wait_duration,
+        )
+
     @classmethod
     def complete_cost_report(cls, llm_tokens_usage: LLMTokensUsage) -> LLMTokenCostReport:
         cost_report = cls.compute_cost_report(llm_tokens_usage=llm_tokens_usage)
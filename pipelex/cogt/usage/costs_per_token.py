@@ -29,3 +29,6 @@ def model_cost_per_token(costs: CostsByCategoryDict, cost_category: CostCategory
                 return cost_per_million_tokens / 1000000
             else:
                 return 0.0
+        case CostCategory.IMAGE | CostCategory.PAGE:
+            # these are billed per unit, see model_cost_per_unit
+            return 0.0
@@ -0,0 +1,7 @@
+from pipelex.cogt.usage.cost_category import CostsByCategoryDict
+from pipelex.cogt.usage.unit_report import UnitCategory
+
+
+def model_cost_per_unit(costs: CostsByCategoryDict, unit_category: UnitCategory) -> float:
+    # costs per unit are in USD per image or per page, declared as the image or page cost of the model
+    return costs.get(unit_category.to_cost_category, 0.0)
@@ -0,0 +1,81 @@
+import math
+
+from pydantic import BaseModel, Field
+
+# Relative width of the buckets: a quantile is overestimated by at most 10% of the true duration
+LATENCY_HISTOGRAM_GROWTH_FACTOR = 1.1
+# Durations below this threshold, in seconds, all fall in the first bucket
+LATENCY_HISTOGRAM_MIN_DURATION = 0.001
+
+# Quantiles reported for each histogram, by name
+LATENCY_QUANTILES: dict[str, float] = {"p50": 0.5, "p95": 0.95, "p99": 0.99}
+
+_LOG_GROWTH_FACTOR = math.log(LATENCY_HISTOGRAM_GROWTH_FACTOR)
+
+CountsByBucketDict = dict[int, int]
+
+
+class LatencyHistogram(BaseModel):
+    """Histogram of durations in seconds, with log-spaced buckets.
+
+    Recording a duration is constant time and the number of buckets only grows with the log of the range of durations,
+    so histograms can be kept per model for a whole run and merged to estimate quantiles such as p50, p95 or p99.
+    """
+
+    nb_samples: int = 0
+    total_duration: float = 0.0
+    min_duration: float | None = None
+    max_duration: float | None = None
+    counts_by_bucket: CountsByBucketDict = Field(default_factory=CountsByBucketDict)
+
+    @staticmethod
+    def _bucket_index(duration: float) -> int:
+        if duration <= LATENCY_HISTOGRAM_MIN_DURATION:
+            return 0
+        return math.ceil(math.log(duration / LATENCY_HISTOGRAM_MIN_DURATION) / _LOG_GROWTH_FACTOR)
+
+    @staticmethod
+    def _bucket_upper_bound(bucket_index: int) -> float:
+        return LATENCY_HISTOGRAM_MIN_DURATION * LATENCY_HISTOGRAM_GROWTH_FACTOR**bucket_index
+
+    @property
+    def mean_duration(self) -> float | None:
+        if not self.nb_samples:
+            return None
+        return self.total_duration / self.nb_samples
+
+    def record(self, duration: float):
+        duration = max(duration, 0.0)
+        self.nb_samples += 1
+        self.total_duration += duration
+        self.min_duration = duration if self.min_duration is None else min(self.min_duration, duration)
+        self.max_duration = duration if self.max_duration is None else max(self.max_duration, duration)
+        bucket_index = self._bucket_index(duration)
+        self.counts_by_bucket[bucket_index] = self.counts_by_bucket.get(bucket_index, 0) + 1
+
+    def merge(self, other: "LatencyHistogram"):
+        if not other.nb_samples:
+            return
+        self.nb_samples += other.nb_samples
+        self.total_duration += other.total_duration
+        if other.min_duration is not None:
+            self.min_duration = other.min_duration if self.min_duration is None else min(self.min_duration, other.min_duration)
+        if other.max_duration is not None:
+            self.max_duration = other.max_duration if self.max_duration is None else max(self.max_duration, other.max_duration)
+        for bucket_index, count in other.counts_by_bucket.items():
+            self.counts_by_bucket[bucket_index] = self.counts_by_bucket.get(bucket_index, 0) + count
+
+    def get_quantile(self, quantile: float) -> float | None:
+        """Estimate the duration below which the given fraction of the samples fall, e.g. 0.95 for p95.
+
+        The estimate is the upper bound of the bucket holding that sample, clamped to the observed min and max.
+        """
+        if not self.nb_samples or self.min_duration is None or self.max_duration is None:
+            return None
+        rank = max(1, math.ceil(quantile * self.nb_samples))
+        cumulated_count = 0
+        for bucket_index in sorted(self.counts_by_bucket):
+            cumulated_count += self.counts_by_bucket[bucket_index]
+            if cumulated_count >= rank:
+                return min(max(self._bucket_upper_bound(bucket_index), self.min_duration), self.max_duration)
+        return self.max_duration
@@ -0,0 +1,70 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+from pipelex.cogt.llm.llm_report import LLMTokenCostReportField
+from pipelex.cogt.usage.cost_category import CostCategory, CostsByCategoryDict
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.types import StrEnum
+
+
+class UnitCategory(StrEnum):
+    IMAGE = "image"
+    PAGE = "page"
+
+    @property
+    def to_cost_category(self) -> CostCategory:
+        return CostCategory(self)
+
+
+NbUnitsByCategoryDict = dict[UnitCategory, int]
+
+
+class UnitCostReportField(StrEnum):
+    NB_BYTES = "nb_bytes"
+    DURATION = "duration"
+    QUEUE_WAIT_DURATION = "queue_wait_duration"
+
+    @staticmethod
+    def report_field_for_nb_units_by_category(unit_category: UnitCategory) -> str:
+        return f"nb_{unit_category}s"
+
+
+class UnitUsage(BaseModel):
+    """Usage of an inference job billed per unit, e.g. per generated image or per extracted page."""
+
+    job_metadata: JobMetadata
+    inference_model_name: str
+    unit_costs: CostsByCategoryDict
+    inference_model_id: str
+    nb_units_by_category: NbUnitsByCategoryDict
+    nb_bytes: int = 0
+    queue_wait_duration: float | None = None
+
+
+class UnitCostReport(BaseModel):
+    job_metadata: JobMetadata
+    inference_model_name: str
+    inference_model_id: str
+
+    nb_units_by_category: NbUnitsByCategoryDict
+    costs_by_unit_category: CostsByCategoryDict
+    nb_bytes: int
+    queue_wait_duration: float | None
+
+    def as_flat_dictionary(self) -> dict[str, Any]:
+        the_dict: dict[str, Any] = self.job_metadata.model_dump(serialize_as_any=True)
+        the_dict.update(
+            {
+                LLMTokenCostReportField.LLM_NAME: self.inference_model_name,
+                LLMTokenCostReportField.PLATFORM_LLM_ID: self.inference_model_id,
+                UnitCostReportField.NB_BYTES: self.nb_bytes,
+                UnitCostReportField.DURATION: self.job_metadata.duration,
+                UnitCostReportField.QUEUE_WAIT_DURATION: self.queue_wait_duration,
+            }
+        )
+        for unit_category, nb_units in self.nb_units_by_category.items():
+            the_dict[UnitCostReportField.report_field_for_nb_units_by_category(unit_category)] = nb_units
+        for cost_category, cost in self.costs_by_unit_category.items():
+            the_dict[LLMTokenCostReportField.report_field_for_cost_by_category(cost_category)] = cost
+        return the_dict
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import csv
+from typing import Any, TextIO
+
+from pipelex.cogt.llm.llm_report import LLMTokenCostReportField
+from pipelex.cogt.usage.cost_category import CostCategory
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.cogt.usage.unit_report import UnitCategory, UnitCostReportField
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.misc.file_utils import ensure_path, get_incremental_file_path
+
+
+def _make_usage_record_fieldnames() -> list[str]:
+    fieldnames: list[str] = list(JobMetadata.model_fields.keys())
+    fieldnames.extend([LLMTokenCostReportField.LLM_NAME, LLMTokenCostReportField.PLATFORM_LLM_ID])
+    fieldnames.extend(LLMTokenCostReportField.report_field_for_nb_tokens_by_category(token_category) for token_category in TokenCategory)
+    fieldnames.extend(UnitCostReportField.report_field_for_nb_units_by_category(unit_category) for unit_category in UnitCategory)
+    fieldnames.extend([UnitCostReportField.NB_BYTES, UnitCostReportField.DURATION, UnitCostReportField.QUEUE_WAIT_DURATION])
+    fieldnames.extend(LLMTokenCostReportField.report_field_for_cost_by_category(cost_category) for cost_category in CostCategory)
+    return fieldnames
+
+
+class RotatingCsvUsageRecordSink:
+    """Streams the flat record of each inference job to CSV files, starting a new file every max_rows_per_file rows.
+
+    The columns are fixed, covering every token and cost category, so records can be written as they come
+    without knowing in advance which categories the models will report.
+    """
+
+    def __init__(self, dir_path: str, base_name: str, max_rows_per_file: int):
+        self.dir_path = dir_path
+        self.base_name = base_name
+        self.max_rows_per_file = max_rows_per_file
+        self.fieldnames = _make_usage_record_fieldnames()
+        self.file_paths: list[str] = []
+        self._file: TextIO | None = None
+        self._writer: csv.DictWriter[str] | None = None
+        self._nb_rows_in_file = 0
+
+    def _open_new_file(self) -> csv.DictWriter[str]:
+        self.close()
+        ensure_path(self.dir_path)
+        file_path = get_incremental_file_path(base_path=self.dir_path, base_name=self.base_name, extension="csv")
+        self._file = open(file_path, "w", newline="", encoding="utf-8")  # noqa: SIM115
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction="ignore")
+        self._writer.writeheader()
+        self._nb_rows_in_file = 0
+        self.file_paths.append(file_path)
+        return self._writer
+
+    def write_record(self, record: dict[str, Any]):
+        writer = self._writer
+        if writer is None or self._nb_rows_in_file >= self.max_rows_per_file:
+            writer = self._open_new_file()
+        writer.writerow(record)
+        self._nb_rows_in_file += 1
+
+    def flush(self):
+        if self._file:
+            self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+        self._file = None
+        self._writer = None
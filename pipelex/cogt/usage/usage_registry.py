@@ -0,0 +1,152 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokenCostReportField
+from pipelex.cogt.usage.cost_category import CostCategory, CostsByCategoryDict
+from pipelex.cogt.usage.latency_histogram import LATENCY_QUANTILES, LatencyHistogram
+from pipelex.cogt.usage.token_category import NbTokensByCategoryDict, TokenCategory
+from pipelex.cogt.usage.unit_report import NbUnitsByCategoryDict, UnitCategory, UnitCostReport, UnitCostReportField
+
+USAGE_TOTAL_NAME = "Total"
+USAGE_NB_CALLS_FIELD = "nb_calls"
+
+# Cost categories that add up to the total cost: input joined is the sum of the cached and non-cached ones
+TOTAL_COST_CATEGORIES = (
+    CostCategory.INPUT_NON_CACHED,
+    CostCategory.INPUT_CACHED,
+    CostCategory.OUTPUT,
+    CostCategory.IMAGE,
+    CostCategory.PAGE,
+)
+
+
+class ModelUsage(BaseModel):
+    """Running totals of the token counts, unit counts, costs and latencies of the calls to one model."""
+
+    inference_model_name: str
+    nb_calls: int = 0
+    nb_tokens_by_category: NbTokensByCategoryDict = Field(default_factory=NbTokensByCategoryDict)
+    nb_units_by_category: NbUnitsByCategoryDict = Field(default_factory=NbUnitsByCategoryDict)
+    nb_bytes: int = 0
+    costs_by_category: CostsByCategoryDict = Field(default_factory=CostsByCategoryDict)
+    duration_histogram: LatencyHistogram = Field(default_factory=LatencyHistogram)
+    queue_wait_histogram: LatencyHistogram = Field(default_factory=LatencyHistogram)
+
+    def _add_costs(self, costs_by_category: CostsByCategoryDict):
+        for cost_category, cost in costs_by_category.items():
+            self.costs_by_category[cost_category] = self.costs_by_category.get(cost_category, 0.0) + cost
+
+    def _record_latencies(self, duration: float | None, queue_wait_duration: float | None):
+        if duration is not None:
+            self.duration_histogram.record(duration)
+        if queue_wait_duration is not None:
+            self.queue_wait_histogram.record(queue_wait_duration)
+
+    def add_cost_report(self, cost_report: LLMTokenCostReport, queue_wait_duration: float | None = None):
+        self.nb_calls += 1
+        for token_category, nb_tokens in cost_report.nb_tokens_by_category.items():
+            self.nb_tokens_by_category[token_category] = self.nb_tokens_by_category.get(token_category, 0) + nb_tokens
+        self._add_costs(costs_by_category=cost_report.costs_by_token_category)
+        self._record_latencies(duration=cost_report.job_metadata.duration, queue_wait_duration=queue_wait_duration)
+
+    def add_unit_cost_report(self, unit_cost_report: UnitCostReport):
+        self.nb_calls += 1
+        for unit_category, nb_units in unit_cost_report.nb_units_by_category.items():
+            self.nb_units_by_category[unit_category] = self.nb_units_by_category.get(unit_category, 0) + nb_units
+        self.nb_bytes += unit_cost_report.nb_bytes
+        self._add_costs(costs_by_category=unit_cost_report.costs_by_unit_category)
+        self._record_latencies(duration=unit_cost_report.job_metadata.duration, queue_wait_duration=unit_cost_report.queue_wait_duration)
+
+    def add_model_usage(self, model_usage: "ModelUsage"):
+        self.nb_calls += model_usage.nb_calls
+        for token_category, nb_tokens in model_usage.nb_tokens_by_category.items():
+            self.nb_tokens_by_category[token_category] = self.nb_tokens_by_category.get(token_category, 0) + nb_tokens
+        for unit_category, nb_units in model_usage.nb_units_by_category.items():
+            self.nb_units_by_category[unit_category] = self.nb_units_by_category.get(unit_category, 0) + nb_units
+        self.nb_bytes += model_usage.nb_bytes
+        self._add_costs(costs_by_category=model_usage.costs_by_category)
+        self.duration_histogram.merge(model_usage.duration_histogram)
+        self.queue_wait_histogram.merge(model_usage.queue_wait_histogram)
+
+    def get_nb_tokens(self, token_category: TokenCategory) -> int:
+        return self.nb_tokens_by_category.get(token_category, 0)
+
+    def get_nb_units(self, unit_category: UnitCategory) -> int:
+        return self.nb_units_by_category.get(unit_category, 0)
+
+    def get_cost(self, cost_category: CostCategory) -> float:
+        return self.costs_by_category.get(cost_category, 0.0)
+
+    def get_total_cost(self) -> float:
+        return sum(self.get_cost(cost_category) for cost_category in TOTAL_COST_CATEGORIES)
+
+    def as_flat_dictionary(self) -> dict[str, Any]:
+        the_dict: dict[str, Any] = {
+            LLMTokenCostReportField.LLM_NAME: self.inference_model_name,
+            USAGE_NB_CALLS_FIELD: self.nb_calls,
+        }
+        for token_category, nb_tokens in self.nb_tokens_by_category.items():
+            the_dict[LLMTokenCostReportField.report_field_for_nb_tokens_by_category(token_category)] = nb_tokens
+        for unit_category, nb_units in self.nb_units_by_category.items():
+            the_dict[UnitCostReportField.report_field_for_nb_units_by_category(unit_category)] = nb_units
+        if self.nb_bytes:
+            the_dict[UnitCostReportField.NB_BYTES] = self.nb_bytes
+        for cost_category, cost in self.costs_by_category.items():
+            the_dict[LLMTokenCostReportField.report_field_for_cost_by_category(cost_category)] = cost
+        for quantile_name, quantile in LATENCY_QUANTILES.items():
+            if self.duration_histogram.nb_samples:
+                the_dict[f"{UnitCostReportField.DURATION}_{quantile_name}"] = self.duration_histogram.get_quantile(quantile)
+            if self.queue_wait_histogram.nb_samples:
+                the_dict[f"{UnitCostReportField.QUEUE_WAIT_DURATION}_{quantile_name}"] = self.queue_wait_histogram.get_quantile(quantile)
+        return the_dict
+
+
+class UsageRegistry(BaseModel):
+    """Usage of a pipeline run, aggregated by model as each inference job completes.
+
+    Each cost report is folded into the running totals of its model in constant time and then dropped,
+    so the memory used doesn't grow with the number of calls, only with the number of models.
+    """
+
+    usages_by_model: dict[str, ModelUsage] = Field(default_factory=dict)
+
+    @classmethod
+    def make_from_cost_reports(cls, cost_reports: list[LLMTokenCostReport]) -> "UsageRegistry":
+        usage_registry = UsageRegistry()
+        for cost_report in cost_reports:
+            usage_registry.add_cost_report(cost_report=cost_report)
+        return usage_registry
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.usages_by_model
+
+    def _get_or_create_model_usage(self, model_name: str) -> ModelUsage:
+        model_usage = self.usages_by_model.get(model_name)
+        if model_usage is None:
+            model_usage = ModelUsage(inference_model_name=model_name)
+            self.usages_by_model[model_name] = model_usage
+        return model_usage
+
+    def add_cost_report(self, cost_report: LLMTokenCostReport, queue_wait_duration: float | None = None):
+        model_usage = self._get_or_create_model_usage(model_name=cost_report.inference_model_name)
+        model_usage.add_cost_report(cost_report=cost_report, queue_wait_duration=queue_wait_duration)
+
+    def add_unit_cost_report(self, unit_cost_report: UnitCostReport):
+        model_usage = self._get_or_create_model_usage(model_name=unit_cost_report.inference_model_name)
+        model_usage.add_unit_cost_report(unit_cost_report=unit_cost_report)
+
+    def add_usage_registry(self, usage_registry: "UsageRegistry"):
+        for model_name, model_usage in usage_registry.usages_by_model.items():
+            self._get_or_create_model_usage(model_name=model_name).add_model_usage(model_usage=model_usage)
+
+    def get_total_usage(self) -> ModelUsage:
+        total_usage = ModelUsage(inference_model_name=USAGE_TOTAL_NAME)
+        for model_usage in self.usages_by_model.values():
+            total_usage.add_model_usage(model_usage=model_usage)
+        return total_usage
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Convert the usage of each model to a flat dictionary."""
+        return [model_usage.as_flat_dictionary() for model_usage in self.usages_by_model.values()]
@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Annotated, cast
 
 import shortuuid
 from pydantic import Field, field_validator
@@ -9,11 +9,17 @@ from pipelex.cogt.templating.templating_style import TemplatingStyle
 from pipelex.exceptions import PipelexConfigError, StaticValidationErrorType
 from pipelex.hub import get_required_config
 from pipelex.language.plx_config import PlxConfig
+from pipelex.metrics.metrics_config import MetricsConfig
+from pipelex.pipeline.branch_executor.branch_executor_config import BranchExecutorConfig
+from pipelex.pipeline.checkpoint.checkpoint_config import CheckpointConfig
 from pipelex.pipeline.track.tracker_config import TrackerConfig
+from pipelex.profiling.profiling_config import ProfilingConfig
+from pipelex.reporting.budget_config import BudgetConfig
 from pipelex.system.configuration.config_model import ConfigModel
 from pipelex.system.configuration.config_root import ConfigRoot
 from pipelex.tools.aws.aws_config import AwsConfig
 from pipelex.tools.log.log_config import LogConfig
+from pipelex.tracing.tracing_config import TracingConfig
 from pipelex.types import StrEnum
 
 
@@ -40,8 +46,23 @@ class StaticValidationConfig(ConfigModel):
         )
 
 
+class ConditionSpeculationConfig(ConfigModel):
+    nb_tracked_outcomes: int = Field(gt=0)
+    min_tracked_outcomes: int = Field(gt=0)
+    min_branch_probability: float = Field(ge=0, le=1)
+
+
 class PipeRunConfig(ConfigModel):
     pipe_stack_limit: int
+    run_timeout: float | None = Field(default=None, gt=0)
+    pipe_timeouts: dict[str, Annotated[float, Field(gt=0)]] = Field(default_factory=dict)
+    condition_speculation_config: ConditionSpeculationConfig
+
+
+class RunLifecycleConfig(ConfigModel):
+    abandoned_run_ttl: float = Field(gt=0)
+    abandoned_runs_sweep_interval: float = Field(gt=0)
+    nb_completed_runs_kept: int = Field(ge=0)
 
 
 class DryRunConfig(ConfigModel):
@@ -78,6 +99,11 @@ class PromptingConfig(ConfigModel):
 class FeatureConfig(ConfigModel):
     is_pipeline_tracking_enabled: bool
     is_reporting_enabled: bool
+    is_tracing_enabled: bool
+    is_metrics_enabled: bool
+    is_profiling_enabled: bool
+    is_checkpointing_enabled: bool
+    is_pipe_run_deduplication_enabled: bool
 
 
 class ReportingConfig(ConfigModel):
@@ -87,6 +113,13 @@ class ReportingConfig(ConfigModel):
     cost_report_base_name: str
     cost_report_extension: str
     cost_report_unit_scale: float
+    is_stream_usage_records_enabled: bool
+    usage_records_dir_path: str
+    usage_records_base_name: str
+    usage_records_max_rows_per_file: int
+    is_memory_accounting_enabled: bool
+    memory_report_nb_top_consumers: int
+    budget_config: BudgetConfig
 
 
 class ObserverConfig(ConfigModel):
@@ -104,6 +137,12 @@ class ScanConfig(ConfigModel):
         return frozenset(value)
 
 
+class LibraryConfig(ConfigModel):
+    is_parallel_parsing_enabled: bool
+    parallel_parsing_min_files: int
+    parallel_parsing_max_workers: int | None = None
+
+
 class Pipelex(ConfigModel):
     feature_config: FeatureConfig
     log_config: LogConfig
@@ -117,9 +156,16 @@ class Pipelex(ConfigModel):
 
     dry_run_config: DryRunConfig
     pipe_run_config: PipeRunConfig
+    run_lifecycle_config: RunLifecycleConfig
     reporting_config: ReportingConfig
+    tracing_config: TracingConfig
+    metrics_config: MetricsConfig
+    profiling_config: ProfilingConfig
+    checkpoint_config: CheckpointConfig
+    branch_executor_config: BranchExecutorConfig
     observer_config: ObserverConfig
     scan_config: ScanConfig
+    library_config: LibraryConfig
 
 
 class MigrationConfig(ConfigModel):
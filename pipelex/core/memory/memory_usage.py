@@ -0,0 +1,87 @@
+from collections.abc import Iterable
+
+from pydantic import BaseModel
+
+from pipelex.core.stuffs.list_content import ListContent
+from pipelex.core.stuffs.stuff import Stuff
+
+
+class StuffMemoryUsage(BaseModel):
+    stuff_code: str
+    stuff_name: str | None
+    concept_code: str
+    content_class: str
+    size: int
+    nb_items: int | None = None
+
+    @classmethod
+    def make_from_stuff(cls, stuff: Stuff) -> "StuffMemoryUsage":
+        content = stuff.content
+        nb_items: int | None = None
+        if isinstance(content, ListContent):
+            nb_items = content.nb_items  # pyright: ignore[reportUnknownMemberType]
+        return cls(
+            stuff_code=stuff.stuff_code,
+            stuff_name=stuff.stuff_name,
+            concept_code=stuff.concept.code,
+            content_class=stuff.content.__class__.__name__,
+            size=stuff.estimate_retained_size(),
+            nb_items=nb_items,
+        )
+
+
+class PipeMemoryPeak(BaseModel):
+    pipe_code: str
+    peak_size: int = 0
+    peak_nb_stuffs: int = 0
+    nb_runs: int = 0
+
+
+class RunMemoryUsage:
+    """Memory retained by the working memories of a pipeline run, as measured at the end of each pipe run.
+
+    The size of each stuff is estimated once and cached by stuff code: stuffs are not modified once created,
+    and the copies of a working memory made by the controllers share their stuff codes.
+    """
+
+    def __init__(self, pipeline_run_id: str):
+        self.pipeline_run_id = pipeline_run_id
+        self.stuff_usages: dict[str, StuffMemoryUsage] = {}
+        self.pipe_peaks: dict[str, PipeMemoryPeak] = {}
+        self.peak_size = 0
+        self.peak_pipe_code: str | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.pipe_peaks
+
+    def _get_stuff_usage(self, stuff: Stuff) -> StuffMemoryUsage:
+        stuff_usage = self.stuff_usages.get(stuff.stuff_code)
+        if stuff_usage is None:
+            stuff_usage = StuffMemoryUsage.make_from_stuff(stuff=stuff)
+            self.stuff_usages[stuff.stuff_code] = stuff_usage
+        return stuff_usage
+
+    def record_stuffs(self, pipe_code: str, stuffs: Iterable[Stuff]) -> int:
+        """Record the stuffs of a working memory at the end of a pipe run, and return their total size."""
+        nb_stuffs = 0
+        working_memory_size = 0
+        for stuff in stuffs:
+            working_memory_size += self._get_stuff_usage(stuff=stuff).size
+            nb_stuffs += 1
+
+        pipe_peak = self.pipe_peaks.setdefault(pipe_code, PipeMemoryPeak(pipe_code=pipe_code))
+        pipe_peak.nb_runs += 1
+        if working_memory_size > pipe_peak.peak_size:
+            pipe_peak.peak_size = working_memory_size
+            pipe_peak.peak_nb_stuffs = nb_stuffs
+        if working_memory_size > self.peak_size:
+            self.peak_size = working_memory_size
+            self.peak_pipe_code = pipe_code
+        return working_memory_size
+
+    def get_top_stuffs(self, nb_stuffs: int) -> list[StuffMemoryUsage]:
+        return sorted(self.stuff_usages.values(), key=lambda stuff_usage: stuff_usage.size, reverse=True)[:nb_stuffs]
+
+    def get_top_pipes(self, nb_pipes: int) -> list[PipeMemoryPeak]:
+        return sorted(self.pipe_peaks.values(), key=lambda pipe_peak: pipe_peak.peak_size, reverse=True)[:nb_pipes]
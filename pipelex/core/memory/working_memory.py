@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field, model_validator
 from typing_extensions import override
 
 from pipelex import log, pretty_print
+from pipelex.core.memory.memory_usage import StuffMemoryUsage
 from pipelex.core.stuffs.html_content import HtmlContent
 from pipelex.core.stuffs.image_content import ImageContent
 from pipelex.core.stuffs.list_content import ListContent
@@ -68,6 +69,15 @@ class WorkingMemory(BaseModel, ContextProviderAbstract):
     def make_deep_copy(self) -> Self:
         return self.model_copy(deep=True)
 
+    def make_shallow_copy(self) -> Self:
+        """Copy the stuff dict and the aliases but share the stuffs, which are not modified once created."""
+        return self.model_copy(update={"root": dict(self.root), "aliases": dict(self.aliases)})
+
+    def estimate_memory_usage(self) -> list[StuffMemoryUsage]:
+        """Estimate the memory retained by each stuff, largest first."""
+        stuff_usages = [StuffMemoryUsage.make_from_stuff(stuff=stuff) for stuff in self.root.values()]
+        return sorted(stuff_usages, key=lambda stuff_usage: stuff_usage.size, reverse=True)
+
     def get_optional_stuff(self, name: str) -> Stuff | None:
         if named_stuff := self.root.get(name):
             return named_stuff
@@ -23,6 +23,7 @@ class PipeAbstract(ABC, BaseModel):
     description: str | None = None
     inputs: InputRequirements = Field(default_factory=InputRequirements)
     output: Concept
+    timeout: float | None = Field(default=None, gt=0)
 
     @property
     def pipe_type(self) -> str:
@@ -56,9 +57,11 @@ class PipeAbstract(ABC, BaseModel):
     def needed_inputs(self, visited_pipes: set[str] | None = None) -> InputRequirements:
         """Return the inputs that are needed for the pipe to run.
 
+        Controllers get the needed inputs of their sub-pipes from the pipe library, which memoizes them and stops at the
+        pipes calling themselves.
+
         Args:
-            visited_pipes: Set of pipe codes currently being processed to prevent infinite recursion.
-                          If None, starts recursion detection with an empty set.
+            visited_pipes: Set of pipe codes already being processed, for which no inputs are returned.
 
         Returns:
             InputRequirements containing all needed inputs for this pipe
@@ -91,6 +94,8 @@ class PipeAbstract(ABC, BaseModel):
         pass
 
     def monitor_pipe_stack(self, pipe_run_params: PipeRunParams):
+        if pipe_run_params.pipe_stack_depth <= pipe_run_params.pipe_stack_limit:
+            return
         pipe_stack = pipe_run_params.pipe_stack
         limit = pipe_run_params.pipe_stack_limit
         if len(pipe_stack) > limit:
@@ -82,6 +82,8 @@ class PipeBlueprint(BaseModel):
     description: str | None = None
     inputs: dict[str, str] | None = None
     output: str
+    # Max duration of a run of the pipe, in seconds, including its sub-pipes
+    timeout: float | None = Field(default=None, gt=0)
 
     @property
     def pipe_dependencies(self) -> set[str]:
@@ -0,0 +1,76 @@
+from collections.abc import Iterable
+
+from pipelex import log
+from pipelex.core.pipes.input_requirements import InputRequirements
+from pipelex.core.pipes.input_requirements_factory import InputRequirementsFactory
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.exceptions import PipelexException
+
+
+class PipeDependencyIndex:
+    """Memoized input requirements and required variables, per pipe code.
+
+    Controllers compute needed_inputs() from the needed inputs of their sub-pipes, which they get from the pipe library,
+    so each entry is computed once from the entries of its dependencies. The results only change when a pipe or one of
+    its dependencies changes, so the pipe library keeps them here and invalidates the entries of the dependency closure
+    of the pipes that were added, removed or reloaded.
+    """
+
+    def __init__(self):
+        self._needed_inputs: dict[str, InputRequirements] = {}
+        self._required_variables: dict[str, frozenset[str]] = {}
+        # The pipes whose needed inputs are being computed, innermost last, to stop at the pipes calling themselves
+        self._pipe_codes_in_progress: list[str] = []
+        self._pipe_codes_in_cycles: set[str] = set()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._needed_inputs and not self._required_variables
+
+    def get_needed_inputs(self, pipe: PipeAbstract) -> InputRequirements:
+        if (needed_inputs := self._needed_inputs.get(pipe.code)) is not None:
+            return needed_inputs
+        if pipe.code in self._pipe_codes_in_progress:
+            # A pipe calling itself adds no inputs to its own, and the pipes of the cycle are not memoized,
+            # as their needed inputs then depend on which one the computation started from
+            self._pipe_codes_in_cycles.update(self._pipe_codes_in_progress[self._pipe_codes_in_progress.index(pipe.code) :])
+            return InputRequirementsFactory.make_empty()
+        self._pipe_codes_in_progress.append(pipe.code)
+        try:
+            needed_inputs = pipe.needed_inputs()
+        finally:
+            self._pipe_codes_in_progress.pop()
+            is_in_cycle = pipe.code in self._pipe_codes_in_cycles
+            self._pipe_codes_in_cycles.discard(pipe.code)
+        if not is_in_cycle:
+            self._needed_inputs[pipe.code] = needed_inputs
+        return needed_inputs
+
+    def get_required_variables(self, pipe: PipeAbstract) -> frozenset[str]:
+        if (required_variables := self._required_variables.get(pipe.code)) is None:
+            required_variables = frozenset(pipe.required_variables())
+            self._required_variables[pipe.code] = required_variables
+        return required_variables
+
+    def build(self, pipes: list[PipeAbstract]) -> None:
+        """Precompute the entries of the given pipes, ordered with dependencies first so that they are indexed on their own.
+
+        Pipes that can't be indexed are skipped, their errors will surface when they are actually run.
+        """
+        for pipe in pipes:
+            try:
+                self.get_needed_inputs(pipe=pipe)
+                self.get_required_variables(pipe=pipe)
+            except PipelexException as exc:
+                log.verbose(f"Could not index dependencies of pipe '{pipe.code}': {exc}")
+
+    def invalidate(self, pipe_codes: Iterable[str]) -> None:
+        for pipe_code in pipe_codes:
+            self._needed_inputs.pop(pipe_code, None)
+            self._required_variables.pop(pipe_code, None)
+
+    def clear(self) -> None:
+        self._needed_inputs = {}
+        self._required_variables = {}
+        self._pipe_codes_in_progress = []
+        self._pipe_codes_in_cycles = set()
@@ -1,12 +1,14 @@
 from itertools import groupby
 
-from pydantic import RootModel
+from pydantic import PrivateAttr, RootModel
 from rich import box
 from rich.table import Table
 from typing_extensions import override
 
 from pipelex import pretty_print
+from pipelex.core.pipes.input_requirements import InputRequirements
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.core.pipes.pipe_dependency_index import PipeDependencyIndex
 from pipelex.core.pipes.pipe_library_abstract import PipeLibraryAbstract
 from pipelex.exceptions import ConceptError, ConceptLibraryConceptNotFoundError, PipeLibraryError, PipeLibraryPipeNotFoundError
 from pipelex.hub import get_concept_library
@@ -16,10 +18,16 @@ PipeLibraryRoot = dict[str, PipeAbstract]
 
 
 class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
+    _dependency_index: PipeDependencyIndex = PrivateAttr(default_factory=PipeDependencyIndex)
+
     @override
     def validate_with_libraries(self):
+        self.validate_pipes_with_libraries(pipes=self.get_pipes())
+
+    @override
+    def validate_pipes_with_libraries(self, pipes: list[PipeAbstract]):
         concept_library = get_concept_library()
-        for pipe in self.root.values():
+        for pipe in pipes:
             pipe.validate_output()
             try:
                 for concept in pipe.concept_dependencies():
@@ -39,8 +47,7 @@ class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
     def make_empty(cls) -> Self:
         return cls(root={})
 
-    @override
-    def add_new_pipe(self, pipe: PipeAbstract):
+    def _check_pipe_is_new(self, pipe: PipeAbstract):
         if pipe.code in self.root:
             msg = (
                 f"Pipe '{pipe.code}' already exists in the library. You might be running the same pipe twice in the same pipeline."
@@ -48,12 +55,24 @@ class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
                 "Or consider adding for good in the library and call it by its code."
             )
             raise PipeLibraryError(msg)
+
+    @override
+    def add_new_pipe(self, pipe: PipeAbstract):
+        self._check_pipe_is_new(pipe=pipe)
+        self.invalidate_dependency_index(pipe_codes={pipe.code})
         self.root[pipe.code] = pipe
 
     @override
     def add_pipes(self, pipes: list[PipeAbstract]):
-        for pipe in pipes:
-            self.add_new_pipe(pipe=pipe)
+        # The dependency index is invalidated once for all the pipes, as each invalidation scans the whole library
+        added_pipe_codes: set[str] = set()
+        try:
+            for pipe in pipes:
+                self._check_pipe_is_new(pipe=pipe)
+                self.root[pipe.code] = pipe
+                added_pipe_codes.add(pipe.code)
+        finally:
+            self.invalidate_dependency_index(pipe_codes=added_pipe_codes)
 
     @override
     def get_optional_pipe(self, pipe_code: str) -> PipeAbstract | None:
@@ -80,12 +99,78 @@ class PipeLibrary(RootModel[PipeLibraryRoot], PipeLibraryAbstract):
         # TODO: We should create a separate library, that copies the original one, and then removes the pipes from it
         # Then run the dry run + validation to see if removing those pipe has not broken any other pipe.
         # If validated, it should update the real library.
+        self.invalidate_dependency_index(pipe_codes=set(pipe_codes))
         for pipe_code in pipe_codes:
             if pipe_code in self.root:
                 del self.root[pipe_code]
 
+    @override
+    def get_dependent_pipes(self, pipe_codes: set[str], concept_strings: set[str] | None = None) -> list[PipeAbstract]:
+        """Get the pipes whose dependency closure touches the given pipe codes or concept strings.
+
+        The result includes the given pipes themselves (if they are in the library) and every pipe
+        that depends on them, directly or transitively. Pipes that directly use one of the given concepts
+        are also included, together with their own dependents.
+        """
+        dependents_by_pipe_code: dict[str, set[str]] = {}
+        for pipe in self.root.values():
+            for dependency_code in pipe.pipe_dependencies():
+                dependents_by_pipe_code.setdefault(dependency_code, set()).add(pipe.code)
+
+        to_visit: list[str] = list(pipe_codes)
+        if concept_strings:
+            for pipe in self.root.values():
+                if any(concept.concept_string in concept_strings for concept in pipe.concept_dependencies()):
+                    to_visit.append(pipe.code)
+
+        affected_codes: set[str] = set()
+        while to_visit:
+            pipe_code = to_visit.pop()
+            if pipe_code in affected_codes:
+                continue
+            affected_codes.add(pipe_code)
+            to_visit.extend(dependents_by_pipe_code.get(pipe_code, set()))
+
+        return [pipe for pipe_code, pipe in self.root.items() if pipe_code in affected_codes]
+
+    @override
+    def get_needed_inputs(self, pipe: PipeAbstract) -> InputRequirements:
+        """Get the needed inputs of a pipe, memoized for the pipes that belong to the library."""
+        if self.root.get(pipe.code) is not pipe:
+            return pipe.needed_inputs()
+        return self._dependency_index.get_needed_inputs(pipe=pipe)
+
+    @override
+    def get_required_variables(self, pipe: PipeAbstract) -> set[str]:
+        """Get the required variables of a pipe, memoized for the pipes that belong to the library."""
+        if self.root.get(pipe.code) is not pipe:
+            return pipe.required_variables()
+        return set(self._dependency_index.get_required_variables(pipe=pipe))
+
+    @override
+    def build_dependency_index(self, ordered_pipe_codes: list[str] | None = None) -> None:
+        """Precompute the memoized needed inputs and required variables of the pipes.
+
+        Args:
+            ordered_pipe_codes: Pipe codes with dependencies first, pipes missing from it are indexed last
+        """
+        ordered_codes = [pipe_code for pipe_code in ordered_pipe_codes or [] if pipe_code in self.root]
+        indexed_codes = set(ordered_codes)
+        ordered_codes.extend(pipe_code for pipe_code in self.root if pipe_code not in indexed_codes)
+        self._dependency_index.build(pipes=[self.root[pipe_code] for pipe_code in ordered_codes])
+
+    @override
+    def invalidate_dependency_index(self, pipe_codes: set[str], concept_strings: set[str] | None = None) -> None:
+        """Drop the memoized entries of the given pipes and of every pipe whose dependency closure touches them."""
+        if self._dependency_index.is_empty:
+            return
+        affected_codes = set(pipe_codes)
+        affected_codes.update(pipe.code for pipe in self.get_dependent_pipes(pipe_codes=pipe_codes, concept_strings=concept_strings))
+        self._dependency_index.invalidate(pipe_codes=affected_codes)
+
     @override
     def teardown(self) -> None:
+        self._dependency_index.clear()
         self.root = {}
 
     @override
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from pipelex.core.pipes.input_requirements import InputRequirements
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
 
 
@@ -8,6 +9,14 @@ class PipeLibraryAbstract(ABC):
     def validate_with_libraries(self) -> None:
         pass
 
+    @abstractmethod
+    def validate_pipes_with_libraries(self, pipes: list[PipeAbstract]) -> None:
+        pass
+
+    @abstractmethod
+    def get_dependent_pipes(self, pipe_codes: set[str], concept_strings: set[str] | None = None) -> list[PipeAbstract]:
+        pass
+
     @abstractmethod
     def get_required_pipe(self, pipe_code: str) -> PipeAbstract:
         pass
@@ -27,6 +36,22 @@ class PipeLibraryAbstract(ABC):
     def remove_pipes_by_codes(self, pipe_codes: list[str]) -> None:
         pass
 
+    @abstractmethod
+    def get_needed_inputs(self, pipe: PipeAbstract) -> InputRequirements:
+        pass
+
+    @abstractmethod
+    def get_required_variables(self, pipe: PipeAbstract) -> set[str]:
+        pass
+
+    @abstractmethod
+    def build_dependency_index(self, ordered_pipe_codes: list[str] | None = None) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate_dependency_index(self, pipe_codes: set[str], concept_strings: set[str] | None = None) -> None:
+        pass
+
     @abstractmethod
     def teardown(self) -> None:
         pass
@@ -0,0 +1,106 @@
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, Generic, TypeVar, cast, overload
+
+from typing_extensions import override
+
+from pipelex.core.stuffs.stuff_content import StuffContent, StuffContentType
+from pipelex.exceptions import StuffContentTypeError
+from pipelex.types import Self
+
+ItemType = TypeVar("ItemType", bound=StuffContent)
+
+
+class ColumnarItems(Sequence[StuffContentType], Generic[StuffContentType]):
+    """Read-only sequence of items of a single class, stored as one column of field values per field.
+
+    A large homogeneous list is kept as a few Python lists instead of one pydantic model per item.
+    Items are materialized with model_construct only when accessed: the field values were validated when the columns
+    were built, so no validation runs again. Materialized items are fresh objects on each access, but they share
+    their field values with the columns, so they must be treated as read-only. The columns are never mutated,
+    so copies (including deep copies) share them.
+    """
+
+    __slots__ = ("_columns", "_item_class", "_nb_items")
+
+    def __init__(self, item_class: type[StuffContentType], columns: dict[str, list[Any]], nb_items: int):
+        self._item_class = item_class
+        self._columns = columns
+        self._nb_items = nb_items
+
+    @property
+    def item_class(self) -> type[StuffContentType]:
+        return self._item_class
+
+    @property
+    def columns(self) -> Mapping[str, Sequence[Any]]:
+        return self._columns
+
+    @classmethod
+    def make_from_items(cls, item_class: type[ItemType], items: Iterable[ItemType]) -> "ColumnarItems[ItemType]":
+        field_names = list(item_class.model_fields.keys())
+        columns: dict[str, list[Any]] = {field_name: [] for field_name in field_names}
+        nb_items = 0
+        for item in items:
+            if type(item) is not item_class or item.model_extra:
+                msg = f"Columnar items must all be exactly of class '{item_class.__name__}' without extra fields, got a '{type(item).__name__}'"
+                raise StuffContentTypeError(message=msg, expected_type=item_class.__name__, actual_type=type(item).__name__)
+            for field_name in field_names:
+                columns[field_name].append(getattr(item, field_name))
+            nb_items += 1
+        return ColumnarItems(item_class=item_class, columns=columns, nb_items=nb_items)
+
+    @classmethod
+    def make_from_records(cls, item_class: type[ItemType], records: Iterable[Mapping[str, Any]]) -> "ColumnarItems[ItemType]":
+        """Validate each record against the item class and store its field values, without keeping the models."""
+        return ColumnarItems.make_from_items(item_class=item_class, items=(item_class.model_validate(record) for record in records))
+
+    def _materialize(self, index: int) -> StuffContentType:
+        item_values = {field_name: column[index] for field_name, column in self._columns.items()}
+        # mypy types model_construct() as returning the bound class StuffContent, rather than the item class
+        return cast("StuffContentType", self._item_class.model_construct(**item_values))  # pyright: ignore[reportUnnecessaryCast]
+
+    @override
+    def __len__(self) -> int:
+        return self._nb_items
+
+    @overload
+    def __getitem__(self, index: int) -> StuffContentType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[StuffContentType]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> StuffContentType | list[StuffContentType]:
+        if isinstance(index, slice):
+            return [self._materialize(item_index) for item_index in range(*index.indices(self._nb_items))]
+        if index < 0:
+            index += self._nb_items
+        if not 0 <= index < self._nb_items:
+            msg = f"ColumnarItems index {index} out of range for {self._nb_items} items"
+            raise IndexError(msg)
+        return self._materialize(index)
+
+    @override
+    def __iter__(self) -> Iterator[StuffContentType]:
+        for index in range(self._nb_items):
+            yield self._materialize(index)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        other_sequence: Sequence[Any] = other  # pyright: ignore[reportUnknownVariableType]
+        return len(other_sequence) == self._nb_items and all(item == other_item for item, other_item in zip(self, other_sequence, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Self:
+        # The columns are never mutated, so copies can share them
+        return self
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._item_class.__name__} x {self._nb_items})"
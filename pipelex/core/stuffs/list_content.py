@@ -1,15 +1,46 @@
+from collections.abc import Iterable, Mapping
 from typing import Any, Generic
 
 from json2html import json2html
+from pydantic import SerializerFunctionWrapHandler, field_serializer
 from typing_extensions import override
 
 from pipelex.cogt.templating.templating_style import TextFormat
+from pipelex.core.stuffs.columnar_items import ColumnarItems
 from pipelex.core.stuffs.stuff_content import StuffContent, StuffContentType
+from pipelex.types import Self
 
 
 class ListContent(StuffContent, Generic[StuffContentType]):
     items: list[StuffContentType]
 
+    @classmethod
+    def make_columnar(cls, item_class: type[StuffContentType], records: Iterable[Mapping[str, Any]]) -> Self:
+        """Make a compact ListContent from records (e.g. dicts) that all validate as item_class.
+
+        The items are stored column by column and materialized as models only when accessed, see ColumnarItems.
+        """
+        columnar_items = ColumnarItems.make_from_records(item_class=item_class, records=records)
+        return cls(items=[]).model_copy(update={"items": columnar_items})
+
+    @property
+    def is_columnar(self) -> bool:
+        return isinstance(self.items, ColumnarItems)
+
+    def compacted(self) -> Self:
+        """Get a columnar copy of this ListContent, whose items must all be of the same class."""
+        if self.is_columnar or not self.items:
+            return self
+        item_class = type(self.items[0])
+        columnar_items = ColumnarItems.make_from_items(item_class=item_class, items=self.items)
+        return self.model_copy(update={"items": columnar_items})
+
+    def materialized(self) -> Self:
+        """Get this ListContent in its normal form, with a list of item models."""
+        if not self.is_columnar:
+            return self
+        return self.model_copy(update={"items": list(self.items)})
+
     @property
     def nb_items(self) -> int:
         return len(self.items)
@@ -45,8 +76,19 @@ class ListContent(StuffContent, Generic[StuffContentType]):
         else:
             return None
 
+    @field_serializer("items", mode="wrap")
+    def serialize_items(self, items: list[StuffContentType], handler: SerializerFunctionWrapHandler) -> Any:
+        # Columnar items are serialized as the list of their item models, like the normal form
+        if isinstance(items, ColumnarItems):
+            return handler(list(items))
+        return handler(items)
+
+    def __json_encode__(self) -> dict[str, Any]:
+        """Encode for kajson, which encodes the fields of a model: columnar items are encoded as the list of their item models."""
+        return {**self.__dict__, "items": list(self.items)}
+
     @override
-    def model_dump(self, *args: Any, **kwargs: Any):
+    def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         obj_dict = super().model_dump(*args, **kwargs)
         obj_dict["items"] = [item.model_dump(*args, **kwargs) for item in self.items]
         return obj_dict
@@ -16,6 +16,7 @@ from pipelex.core.stuffs.stuff_content import StuffContent, StuffContentType
 from pipelex.core.stuffs.text_and_images_content import TextAndImagesContent
 from pipelex.core.stuffs.text_content import TextContent
 from pipelex.exceptions import StuffArtefactReservedFieldError, StuffContentTypeError, StuffContentValidationError
+from pipelex.tools.misc.memory_size_utils import get_deep_size
 from pipelex.tools.misc.string_utils import pascal_case_to_snake_case
 from pipelex.tools.typing.pydantic_utils import CustomBaseModel, format_pydantic_validation_error
 
@@ -77,6 +78,13 @@ Forbidden fields are: 'stuff_name', 'content_class', 'concept_code', 'stuff_code
     def __str__(self) -> str:
         return f"{self.title}\n{self.content.rendered_json()}"
 
+    def estimate_retained_size(self) -> int:
+        """Estimate the bytes retained by this stuff, including nested list items and inline base64 data.
+
+        The concept is not counted: it belongs to the concept library.
+        """
+        return get_deep_size(self, seen={id(self.concept)})
+
     @property
     def is_list(self) -> bool:
         return isinstance(self.content, ListContent)
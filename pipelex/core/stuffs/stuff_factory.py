@@ -18,6 +18,9 @@ from pipelex.exceptions import PipelexException
 from pipelex.hub import get_class_registry, get_concept_library, get_native_concept, get_required_concept
 from pipelex.tools.typing.pydantic_utils import format_pydantic_validation_error
 
+# Lists of records at least this long, given as inputs, are stored column by column rather than as a list of item models
+COLUMNAR_LIST_MIN_NB_ITEMS = 1000
+
 
 class StuffFactoryError(PipelexException):
     pass
@@ -182,8 +185,8 @@ class StuffFactory:
                     )
                     raise StuffFactoryError(msg)
 
-                # Check all items are of the same type
-                for item in list_content.items:
+                # Check all items are of the same type, columnar lists are homogeneous by construction
+                for item in [] if list_content.is_columnar else list_content.items:
                     if not isinstance(item, type(first_item)):
                         msg = (
                             f"Trying to create a Stuff '{name}' from a ListContent of '{type(first_item).__name__}' "
@@ -464,6 +467,23 @@ class StuffFactory:
                         )
                         raise StuffFactoryError(msg)
 
+                # Large lists of records of a structure class are stored column by column, see ColumnarItems
+                the_structure_class = get_class_registry().get_class(name=concept.structure_class_name)
+                if (
+                    len(list_content_2) >= COLUMNAR_LIST_MIN_NB_ITEMS
+                    and isinstance(the_structure_class, type)
+                    and issubclass(the_structure_class, StuffContent)
+                ):
+                    return cls.make_stuff(
+                        concept=concept,
+                        content=ListContent[StuffContent].make_columnar(
+                            item_class=the_structure_class,
+                            records=cast("list[dict[str, Any]]", list_content_2),
+                        ),
+                        name=name,
+                        code=code,
+                    )
+
                 # Create StuffContent objects from dicts
                 stuff_items: list[StuffContent] = []
                 for item_dict in list_content_2:
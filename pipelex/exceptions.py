@@ -18,6 +18,7 @@ from pipelex.tools.misc.context_provider_abstract import ContextProviderExceptio
 
 if TYPE_CHECKING:
     from pipelex.cogt.templating.template_category import TemplateCategory
+    from pipelex.cogt.usage.usage_registry import ModelUsage
     from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 
 
@@ -290,6 +291,13 @@ class PipeRunError(PipelexException):
     pass
 
 
+class PipeRunTimeoutError(PipeRunError):
+    def __init__(self, message: str, pipe_code: str, timeout: float):
+        self.pipe_code = pipe_code
+        self.timeout = timeout
+        super().__init__(message)
+
+
 class DryRunError(PipeRunError):
     """Raised when a dry run fails due to missing inputs or other validation issues."""
 
@@ -440,6 +448,24 @@ class PipelineManagerNotFoundError(PipelexException):
     pass
 
 
+class PipelineCheckpointError(PipelexException):
+    pass
+
+
+class BranchExecutorError(PipelexException):
+    pass
+
+
+class PipelineCancelledError(PipelexException):
+    """Raised by a pipeline run cancelled by cancel_pipeline or by its run timeout, with its usage up to the cancellation."""
+
+    def __init__(self, message: str, pipeline_run_id: str, reason: str, partial_usage: ModelUsage | None = None):
+        self.pipeline_run_id = pipeline_run_id
+        self.reason = reason
+        self.partial_usage = partial_usage
+        super().__init__(message)
+
+
 class PipeInputSpecError(PipelexException):
     pass
 
@@ -466,3 +492,7 @@ class PipelineInputError(Exception):
 
 class PipeExecutionError(PipelexException):
     pass
+
+
+class MetricsRegistryError(PipelexException):
+    pass
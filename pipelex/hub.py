@@ -20,18 +20,23 @@ from pipelex.core.domains.domain_library_abstract import DomainLibraryAbstract
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.core.pipes.pipe_library_abstract import PipeLibraryAbstract
 from pipelex.libraries.library_manager_abstract import LibraryManagerAbstract
+from pipelex.metrics.metrics_protocol import MetricsNoOp, MetricsProtocol
 from pipelex.observer.observer_protocol import ObserverProtocol
 from pipelex.pipe_run.pipe_router_protocol import PipeRouterProtocol
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorNoOp, BranchExecutorProtocol
+from pipelex.pipeline.checkpoint.checkpoint_store_protocol import CheckpointStoreNoOp, CheckpointStoreProtocol
 from pipelex.pipeline.pipeline import Pipeline
 from pipelex.pipeline.pipeline_manager_abstract import PipelineManagerAbstract
 from pipelex.pipeline.track.pipeline_tracker_protocol import PipelineTrackerProtocol
 from pipelex.plugins.plugin_manager import PluginManager
+from pipelex.profiling.profiler_protocol import ProfilerNoOp, ProfilerProtocol
 from pipelex.reporting.reporting_protocol import ReportingProtocol
 from pipelex.system.configuration.config_loader import config_manager
 from pipelex.system.configuration.config_root import ConfigRoot
 from pipelex.system.telemetry.telemetry_manager import TelemetryManagerAbstract
 from pipelex.tools.secrets.secrets_provider_abstract import SecretsProviderAbstract
 from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
+from pipelex.tracing.tracer_protocol import TracerNoOp, TracerProtocol
 
 
 class PipelexHub:
@@ -49,6 +54,9 @@ class PipelexHub:
         self._class_registry: ClassRegistryAbstract | None = None
         self._storage_provider: StorageProviderAbstract | None = None
         self._telemetry_manager: TelemetryManagerAbstract | None = None
+        self._tracer: TracerProtocol = TracerNoOp()
+        self._metrics: MetricsProtocol = MetricsNoOp()
+        self._profiler: ProfilerProtocol = ProfilerNoOp()
 
         # cogt
         self._models_manager: ModelManagerAbstract | None = None
@@ -62,6 +70,8 @@ class PipelexHub:
         self._concept_library: ConceptLibraryAbstract | None = None
         self._pipe_library: PipeLibraryAbstract | None = None
         self._pipe_router: PipeRouterProtocol | None = None
+        self._checkpoint_store: CheckpointStoreProtocol = CheckpointStoreNoOp()
+        self._branch_executor: BranchExecutorProtocol = BranchExecutorNoOp()
         self._library_manager: LibraryManagerAbstract | None = None
 
         # pipeline
@@ -122,6 +132,15 @@ class PipelexHub:
     def set_telemetry_manager(self, telemetry_manager: TelemetryManagerAbstract):
         self._telemetry_manager = telemetry_manager
 
+    def set_tracer(self, tracer: TracerProtocol):
+        self._tracer = tracer
+
+    def set_metrics(self, metrics: MetricsProtocol):
+        self._metrics = metrics
+
+    def set_profiler(self, profiler: ProfilerProtocol):
+        self._profiler = profiler
+
     # cogt
 
     def set_models_manager(self, models_manager: ModelManagerAbstract):
@@ -159,6 +178,12 @@ class PipelexHub:
     def set_pipeline_manager(self, pipeline_manager: PipelineManagerAbstract):
         self._pipeline_manager = pipeline_manager
 
+    def set_checkpoint_store(self, checkpoint_store: CheckpointStoreProtocol):
+        self._checkpoint_store = checkpoint_store
+
+    def set_branch_executor(self, branch_executor: BranchExecutorProtocol):
+        self._branch_executor = branch_executor
+
     def set_library_manager(self, library_manager: LibraryManagerAbstract):
         self._library_manager = library_manager
 
@@ -212,6 +237,15 @@ class PipelexHub:
             raise RuntimeError(msg)
         return self._telemetry_manager
 
+    def get_tracer(self) -> TracerProtocol:
+        return self._tracer
+
+    def get_metrics(self) -> MetricsProtocol:
+        return self._metrics
+
+    def get_profiler(self) -> ProfilerProtocol:
+        return self._profiler
+
     # cogt
 
     def get_required_models_manager(self) -> ModelManagerAbstract:
@@ -276,6 +310,12 @@ class PipelexHub:
             raise RuntimeError(msg)
         return self._pipeline_manager
 
+    def get_checkpoint_store(self) -> CheckpointStoreProtocol:
+        return self._checkpoint_store
+
+    def get_branch_executor(self) -> BranchExecutorProtocol:
+        return self._branch_executor
+
     def get_required_library_manager(self) -> LibraryManagerAbstract:
         if self._library_manager is None:
             msg = "Library manager is not set. You must initialize Pipelex first."
@@ -366,6 +406,18 @@ def get_report_delegate() -> ReportingProtocol:
     return get_pipelex_hub().get_report_delegate()
 
 
+def get_tracer() -> TracerProtocol:
+    return get_pipelex_hub().get_tracer()
+
+
+def get_metrics() -> MetricsProtocol:
+    return get_pipelex_hub().get_metrics()
+
+
+def get_profiler() -> ProfilerProtocol:
+    return get_pipelex_hub().get_profiler()
+
+
 def get_content_generator() -> ContentGeneratorProtocol:
     return get_pipelex_hub().get_required_content_generator()
 
@@ -421,6 +473,14 @@ def get_pipeline_manager() -> PipelineManagerAbstract:
     return get_pipelex_hub().get_required_pipeline_manager()
 
 
+def get_checkpoint_store() -> CheckpointStoreProtocol:
+    return get_pipelex_hub().get_checkpoint_store()
+
+
+def get_branch_executor() -> BranchExecutorProtocol:
+    return get_pipelex_hub().get_branch_executor()
+
+
 def get_pipeline(pipeline_run_id: str) -> Pipeline:
     return get_pipeline_manager().get_pipeline(pipeline_run_id=pipeline_run_id)
 
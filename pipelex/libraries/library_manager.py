@@ -6,7 +6,9 @@ from typing_extensions import override
 
 from pipelex import log
 from pipelex.builder.validation_error_data import PipeDefinitionErrorData
-from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
+from pipelex.config import get_config
+from pipelex.core.bundles.pipe_sorter import sort_pipes_by_dependencies
+from pipelex.core.bundles.pipelex_bundle_blueprint import PipeBlueprintUnion, PipelexBundleBlueprint
 from pipelex.core.concepts.concept import Concept
 from pipelex.core.concepts.concept_factory import ConceptFactory
 from pipelex.core.concepts.concept_library import ConceptLibrary
@@ -14,7 +16,7 @@ from pipelex.core.domains.domain import Domain
 from pipelex.core.domains.domain_blueprint import DomainBlueprint
 from pipelex.core.domains.domain_factory import DomainFactory
 from pipelex.core.domains.domain_library import DomainLibrary
-from pipelex.core.interpreter import PipelexInterpreter
+from pipelex.core.interpreter import PipelexInterpreter, PLXDecodeError
 from pipelex.core.pipe_errors import PipeDefinitionError
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.core.pipes.pipe_factory import PipeFactory
@@ -31,14 +33,17 @@ from pipelex.exceptions import (
     LibraryLoadingError,
     PipeLibraryError,
     PipeLoadingError,
+    StaticValidationError,
 )
 from pipelex.libraries.library_manager_abstract import LibraryManagerAbstract
 from pipelex.libraries.library_utils import (
     find_plx_files_in_dir,
     get_pipelex_package_dir_for_imports,
     get_pipelex_plx_files_from_package,
+    parse_plx_files_in_process_pool,
 )
 from pipelex.system.configuration.config_loader import config_manager
+from pipelex.system.exceptions import RootException
 from pipelex.system.registries.class_registry_utils import ClassRegistryUtils
 from pipelex.system.registries.func_registry_utils import FuncRegistryUtils
 from pipelex.types import StrEnum
@@ -74,6 +79,7 @@ class LibraryManager(LibraryManagerAbstract):
         self.concept_library = concept_library
         self.pipe_library = pipe_library
         self.loaded_plx_paths: list[str] = []
+        self.loaded_blueprints: dict[str, PipelexBundleBlueprint] = {}
 
     @override
     def validate_libraries(self):
@@ -82,6 +88,21 @@ class LibraryManager(LibraryManagerAbstract):
         self.concept_library.validate_with_libraries()
         self.pipe_library.validate_with_libraries()
         self.domain_library.validate_with_libraries()
+        self._build_pipe_dependency_index()
+
+    def _build_pipe_dependency_index(self) -> None:
+        """Precompute the needed inputs and required variables of the loaded pipes, dependencies first."""
+        pipe_blueprints: dict[str, PipeBlueprintUnion] = {}
+        for blueprint in self.loaded_blueprints.values():
+            if blueprint.pipe:
+                pipe_blueprints.update(blueprint.pipe)
+        try:
+            sorted_pipe_codes = [pipe_code for pipe_code, _ in sort_pipes_by_dependencies(pipe_blueprints)]
+        except PipeDefinitionError as exc:
+            log.verbose(f"Could not sort pipes by dependencies, indexing them in library order: {exc}")
+            sorted_pipe_codes = []
+        # The sort puts controllers before their dependencies, we index dependencies first
+        self.pipe_library.build_dependency_index(ordered_pipe_codes=list(reversed(sorted_pipe_codes)))
 
     @override
     def setup(self) -> None:
@@ -89,6 +110,7 @@ class LibraryManager(LibraryManagerAbstract):
 
     @override
     def teardown(self) -> None:
+        self.loaded_blueprints = {}
         self.pipe_library.teardown()
         self.concept_library.teardown()
         self.domain_library.teardown()
@@ -200,6 +222,177 @@ class LibraryManager(LibraryManagerAbstract):
 
         self.domain_library.remove_domain_by_code(domain_code=blueprint.domain)
 
+    @override
+    def get_loaded_bundle_paths(self) -> list[Path]:
+        return [Path(bundle_key) for bundle_key in self.loaded_blueprints]
+
+    @override
+    def reload_bundle(self, plx_path: Path) -> list[PipeAbstract]:
+        """Reload a single PLX bundle without reloading the whole library.
+
+        The loaded version of the bundle is removed with remove_from_blueprint and the new one is loaded
+        with load_from_blueprint, working on fresh copies of the library dicts. Only the pipes whose dependency
+        closure touches the change are re-validated. None of this yields to the event loop, so concurrent runs
+        never observe an intermediate state, and in-flight runs keep the pipe objects they already hold.
+        If anything fails, the previous library state is restored and a LibraryLoadingError is raised.
+
+        Args:
+            plx_path: Path to the PLX file to (re)load. It may be a bundle that was not loaded before.
+
+        Returns:
+            The pipes loaded from the new version of the bundle
+
+        """
+        bundle_key = self._make_bundle_key(plx_path)
+        try:
+            new_blueprint = self._parse_plx_file(plx_file_path=plx_path)
+        except PLXDecodeError as decode_error:
+            msg = f"Could not decode PLX bundle '{plx_path}': {decode_error}"
+            raise LibraryLoadingError(msg) from decode_error
+
+        new_pipes = self._swap_bundle(
+            bundle_key=bundle_key,
+            old_blueprint=self.loaded_blueprints.get(bundle_key),
+            new_blueprint=new_blueprint,
+        )
+
+        self.loaded_blueprints[bundle_key] = new_blueprint
+        if str(plx_path) not in self.loaded_plx_paths:
+            self.loaded_plx_paths.append(str(plx_path))
+        log.verbose(f"Reloaded PLX bundle '{plx_path}' with {len(new_pipes)} pipes")
+        return new_pipes
+
+    @override
+    def unload_bundle(self, plx_path: Path) -> None:
+        """Unload a single PLX bundle, e.g. because its file was deleted.
+
+        The remaining pipes that depended on the unloaded bundle are re-validated,
+        and the bundle is only unloaded if they remain valid.
+        """
+        bundle_key = self._make_bundle_key(plx_path)
+        old_blueprint = self.loaded_blueprints.get(bundle_key)
+        if old_blueprint is None:
+            log.verbose(f"PLX bundle '{plx_path}' is not loaded, nothing to unload")
+            return
+
+        self._swap_bundle(bundle_key=bundle_key, old_blueprint=old_blueprint, new_blueprint=None)
+
+        del self.loaded_blueprints[bundle_key]
+        if str(plx_path) in self.loaded_plx_paths:
+            self.loaded_plx_paths.remove(str(plx_path))
+        log.verbose(f"Unloaded PLX bundle '{plx_path}'")
+
+    def _swap_bundle(
+        self,
+        bundle_key: str,
+        old_blueprint: PipelexBundleBlueprint | None,
+        new_blueprint: PipelexBundleBlueprint | None,
+    ) -> list[PipeAbstract]:
+        previous_domain_root = self.domain_library.root
+        previous_concept_root = self.concept_library.root
+        previous_pipe_root = self.pipe_library.root
+
+        # Pipe factories and validation go through the hub, which holds our libraries,
+        # so we work on fresh copies of the dicts in place and restore the previous ones on failure.
+        self.domain_library.root = dict(previous_domain_root)
+        self.concept_library.root = dict(previous_concept_root)
+        self.pipe_library.root = dict(previous_pipe_root)
+
+        changed_pipe_codes: set[str] = set()
+        changed_concept_strings: set[str] = set()
+        new_pipes: list[PipeAbstract] = []
+        try:
+            if old_blueprint is not None:
+                changed_pipe_codes |= self._get_blueprint_pipe_codes(old_blueprint)
+                changed_concept_strings |= self._get_blueprint_concept_strings(old_blueprint)
+                self.remove_from_blueprint(blueprint=old_blueprint)
+                # remove_from_blueprint drops the whole domain, so put it back if other loaded bundles still declare it
+                other_blueprints = [blueprint for key, blueprint in self.loaded_blueprints.items() if key != bundle_key]
+                if any(blueprint.domain == old_blueprint.domain for blueprint in other_blueprints) and (
+                    shared_domain := previous_domain_root.get(old_blueprint.domain)
+                ):
+                    self.domain_library.add_domain(domain=shared_domain)
+            if new_blueprint is not None:
+                changed_pipe_codes |= self._get_blueprint_pipe_codes(new_blueprint)
+                changed_concept_strings |= self._get_blueprint_concept_strings(new_blueprint)
+                new_pipes = self.load_from_blueprint(blueprint=new_blueprint)
+
+            self.concept_library.validate_with_libraries()
+            pipes_to_validate = self.pipe_library.get_dependent_pipes(
+                pipe_codes=changed_pipe_codes,
+                concept_strings=changed_concept_strings,
+            )
+            log.verbose(f"Re-validating {len(pipes_to_validate)} pipes affected by the change of '{bundle_key}'")
+            self.pipe_library.validate_pipes_with_libraries(pipes=pipes_to_validate)
+            self.pipe_library.invalidate_dependency_index(pipe_codes=changed_pipe_codes, concept_strings=changed_concept_strings)
+        except (RootException, StaticValidationError, ValidationError) as exc:
+            self.domain_library.root = previous_domain_root
+            self.concept_library.root = previous_concept_root
+            self.pipe_library.root = previous_pipe_root
+            self.pipe_library.invalidate_dependency_index(pipe_codes=changed_pipe_codes, concept_strings=changed_concept_strings)
+            msg = f"Could not apply the change of PLX bundle '{bundle_key}', the previous version is kept: {exc}"
+            raise LibraryLoadingError(msg) from exc
+        return new_pipes
+
+    @staticmethod
+    def _get_blueprint_pipe_codes(blueprint: PipelexBundleBlueprint) -> set[str]:
+        return set(blueprint.pipe.keys()) if blueprint.pipe else set()
+
+    @staticmethod
+    def _get_blueprint_concept_strings(blueprint: PipelexBundleBlueprint) -> set[str]:
+        if not blueprint.concept:
+            return set()
+        return {
+            ConceptFactory.make_concept_string_with_domain(domain=blueprint.domain, concept_code=concept_code) for concept_code in blueprint.concept
+        }
+
+    @staticmethod
+    def _make_bundle_key(plx_path: Path) -> str:
+        try:
+            return str(plx_path.resolve())
+        except (OSError, RuntimeError):
+            return str(plx_path)
+
+    def _parse_plx_files(self, plx_file_paths: list[Path]) -> list[PipelexBundleBlueprint]:
+        """Parse PLX files into blueprints, in the same order as the given paths.
+
+        When enabled in the library config, parsing and blueprint validation run in a process pool.
+        Any file that fails in a worker is parsed again here, so that errors are raised exactly as in sequential mode.
+        """
+        library_config = get_config().pipelex.library_config
+        parsed_blueprints: list[PipelexBundleBlueprint | None] = [None] * len(plx_file_paths)
+        if library_config.is_parallel_parsing_enabled and len(plx_file_paths) >= library_config.parallel_parsing_min_files:
+            parsed_blueprints = parse_plx_files_in_process_pool(
+                plx_file_paths=plx_file_paths,
+                max_workers=library_config.parallel_parsing_max_workers,
+            )
+
+        blueprints: list[PipelexBundleBlueprint] = []
+        for plx_file_path, parsed_blueprint in zip(plx_file_paths, parsed_blueprints, strict=True):
+            if parsed_blueprint is None:
+                blueprint = self._parse_plx_file(plx_file_path=plx_file_path)
+            else:
+                blueprint = parsed_blueprint
+                blueprint.source = str(plx_file_path)
+            blueprints.append(blueprint)
+        return blueprints
+
+    def _parse_plx_file(self, plx_file_path: Path) -> PipelexBundleBlueprint:
+        try:
+            blueprint = PipelexInterpreter(file_path=plx_file_path).make_pipelex_bundle_blueprint()
+        except FileNotFoundError as file_not_found_error:
+            msg = f"Could not find PLX blueprint at '{plx_file_path}'"
+            raise LibraryLoadingError(msg) from file_not_found_error
+        except PipeDefinitionError as pipe_def_error:
+            msg = f"Could not load PLX blueprint from '{plx_file_path}': {pipe_def_error}"
+            raise LibraryLoadingError(msg) from pipe_def_error
+        except ValidationError as validation_error:
+            validation_error_msg = report_validation_error(category="plx", validation_error=validation_error)
+            msg = f"Could not load PLX blueprint from '{plx_file_path}' because of: {validation_error_msg}"
+            raise LibraryLoadingError(msg) from validation_error
+        blueprint.source = str(plx_file_path)
+        return blueprint
+
     def _load_domain_from_blueprint(self, blueprint: PipelexBundleBlueprint) -> Domain:
         return DomainFactory.make_from_blueprint(
             blueprint=DomainBlueprint(
@@ -335,22 +528,9 @@ class LibraryManager(LibraryManagerAbstract):
         log.verbose(f"Auto-registered {num_registered} StructuredContent classes from loaded modules")
 
         # Parse all blueprints first
-        blueprints: list[PipelexBundleBlueprint] = []
-        for plx_file_path in valid_plx_paths:
-            try:
-                blueprint = PipelexInterpreter(file_path=plx_file_path).make_pipelex_bundle_blueprint()
-            except FileNotFoundError as file_not_found_error:
-                msg = f"Could not find PLX blueprint at '{plx_file_path}'"
-                raise LibraryLoadingError(msg) from file_not_found_error
-            except PipeDefinitionError as pipe_def_error:
-                msg = f"Could not load PLX blueprint from '{plx_file_path}': {pipe_def_error}"
-                raise LibraryLoadingError(msg) from pipe_def_error
-            except ValidationError as validation_error:
-                validation_error_msg = report_validation_error(category="plx", validation_error=validation_error)
-                msg = f"Could not load PLX blueprint from '{plx_file_path}' because of: {validation_error_msg}"
-                raise LibraryLoadingError(msg) from validation_error
-            blueprint.source = str(plx_file_path)
-            blueprints.append(blueprint)
+        blueprints = self._parse_plx_files(plx_file_paths=valid_plx_paths)
+        for plx_file_path, blueprint in zip(valid_plx_paths, blueprints, strict=True):
+            self.loaded_blueprints[self._make_bundle_key(plx_file_path)] = blueprint
 
         self.loaded_plx_paths.extend([str(plx_file_path) for plx_file_path in valid_plx_paths])
 
@@ -37,3 +37,15 @@ class LibraryManagerAbstract(ABC):
     @abstractmethod
     def remove_from_blueprint(self, blueprint: PipelexBundleBlueprint) -> None:
         pass
+
+    @abstractmethod
+    def get_loaded_bundle_paths(self) -> list[Path]:
+        pass
+
+    @abstractmethod
+    def reload_bundle(self, plx_path: Path) -> list[PipeAbstract]:
+        pass
+
+    @abstractmethod
+    def unload_bundle(self, plx_path: Path) -> None:
+        pass
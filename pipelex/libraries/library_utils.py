@@ -1,11 +1,14 @@
 """Utility functions for library management."""
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from importlib.abc import Traversable
 from importlib.resources import files
 from pathlib import Path
 
 from pipelex import log
 from pipelex.config import get_config
+from pipelex.core.bundles.pipelex_bundle_blueprint import PipelexBundleBlueprint
 from pipelex.core.interpreter import PipelexInterpreter
 from pipelex.tools.misc.file_utils import find_files_in_dir
 
@@ -89,3 +92,33 @@ def find_plx_files_in_dir(dir_path: str, pattern: str, is_recursive: bool) -> li
             filtered_files.append(file_path)
 
     return filtered_files
+
+
+def _parse_plx_file_or_none(plx_file_path: str) -> PipelexBundleBlueprint | None:
+    """Parse a PLX file in a worker process, returning None on any failure.
+
+    Exceptions are not sent back across the process boundary: the caller parses failed files
+    again in the main process, so that errors are raised with their full context.
+    """
+    try:
+        return PipelexInterpreter(file_path=Path(plx_file_path)).make_pipelex_bundle_blueprint()
+    except Exception:
+        return None
+
+
+def parse_plx_files_in_process_pool(plx_file_paths: list[Path], max_workers: int | None = None) -> list[PipelexBundleBlueprint | None]:
+    """Parse and validate PLX files into blueprints using a process pool.
+
+    Args:
+        plx_file_paths: Paths of the PLX files to parse
+        max_workers: Maximum number of worker processes, defaults to the number of CPUs
+
+    Returns:
+        The blueprints in the same order as the given paths, with None for the files that could not be parsed in a worker
+    """
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_parse_plx_file_or_none, [str(plx_file_path) for plx_file_path in plx_file_paths]))
+    except (BrokenProcessPool, OSError) as exc:
+        log.warning(f"Could not parse PLX files in a process pool, falling back to sequential parsing: {exc}")
+        return [None] * len(plx_file_paths)
@@ -0,0 +1,111 @@
+"""Polling file watcher that hot-reloads changed PLX bundles into the library."""
+
+import asyncio
+from pathlib import Path
+
+from pipelex import log
+from pipelex.core.interpreter import PipelexInterpreter
+from pipelex.exceptions import LibraryLoadingError
+from pipelex.libraries.library_manager_abstract import LibraryManagerAbstract
+from pipelex.libraries.library_utils import find_plx_files_in_dir
+
+FileSignature = tuple[int, int]
+
+
+class LibraryWatcher:
+    """Watch the loaded PLX bundles (and optionally directories for new ones) and reload them incrementally.
+
+    The watcher polls file modification times and sizes, so it needs no extra dependency.
+    Each changed bundle goes through LibraryManagerAbstract.reload_bundle, and deleted bundles go through unload_bundle.
+    A bundle that fails to reload keeps its previous version, so a half-saved file never breaks a running server.
+    """
+
+    def __init__(
+        self,
+        library_manager: LibraryManagerAbstract,
+        watched_dirs: list[Path] | None = None,
+        poll_interval: float = 1.0,
+    ):
+        self.library_manager = library_manager
+        self.watched_dirs = watched_dirs or []
+        self.poll_interval = poll_interval
+        self._signatures: dict[Path, FileSignature] = {}
+        self._task: asyncio.Task[None] | None = None
+        self.snapshot()
+
+    @staticmethod
+    def _get_signature(plx_path: Path) -> FileSignature | None:
+        try:
+            stat = plx_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _list_watched_paths(self) -> set[Path]:
+        watched_paths = set(self.library_manager.get_loaded_bundle_paths())
+        for dir_path in self.watched_dirs:
+            if not dir_path.exists():
+                continue
+            for plx_path in find_plx_files_in_dir(dir_path=str(dir_path), pattern="*.plx", is_recursive=True):
+                if PipelexInterpreter.is_pipelex_file(plx_path):
+                    watched_paths.add(plx_path.resolve())
+        return watched_paths
+
+    def snapshot(self) -> None:
+        """Record the current state of the watched files, so that only later changes trigger a reload."""
+        self._signatures = {}
+        for plx_path in self._list_watched_paths():
+            if signature := self._get_signature(plx_path):
+                self._signatures[plx_path] = signature
+
+    def check_for_changes(self) -> list[Path]:
+        """Reload the bundles that changed since the last check.
+
+        Returns:
+            The paths of the bundles that were successfully reloaded or unloaded
+
+        """
+        applied_paths: list[Path] = []
+        watched_paths = self._list_watched_paths() | set(self._signatures.keys())
+        for plx_path in sorted(watched_paths):
+            signature = self._get_signature(plx_path)
+            previous_signature = self._signatures.get(plx_path)
+            if signature == previous_signature:
+                continue
+            try:
+                if signature is None:
+                    log.info(f"PLX bundle '{plx_path}' was removed, unloading it")
+                    self.library_manager.unload_bundle(plx_path=plx_path)
+                else:
+                    log.info(f"PLX bundle '{plx_path}' changed, reloading it")
+                    self.library_manager.reload_bundle(plx_path=plx_path)
+            except LibraryLoadingError as exc:
+                log.error(f"Hot-reload of '{plx_path}' failed, keeping the previous version: {exc}")
+            else:
+                applied_paths.append(plx_path)
+            # Record the signature even on failure, so that we retry only when the file changes again
+            if signature is None:
+                self._signatures.pop(plx_path, None)
+            else:
+                self._signatures[plx_path] = signature
+        return applied_paths
+
+    async def watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            self.check_for_changes()
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self.watch())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from pipelex.system.configuration.config_model import ConfigModel
+
+
+class MetricsConfig(ConfigModel):
+    is_http_endpoint_enabled: bool
+    http_host: str
+    http_port: int = Field(ge=0, le=65535)
+    latency_buckets: list[float]
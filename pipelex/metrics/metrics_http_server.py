@@ -0,0 +1,67 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from typing_extensions import override
+
+from pipelex import log
+from pipelex.metrics.metrics_registry import MetricsRegistry
+
+PROMETHEUS_TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_HTTP_PATH = "/metrics"
+
+
+def _make_handler_class(registry: MetricsRegistry) -> type[BaseHTTPRequestHandler]:
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != METRICS_HTTP_PATH:
+                self.send_error(404)
+                return
+            body = registry.render_prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_TEXT_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        @override
+        def log_message(self, format: str, *args: Any) -> None:
+            # scrapes are too frequent to be logged
+            pass
+
+    return MetricsRequestHandler
+
+
+class MetricsHttpServer:
+    """Lightweight HTTP endpoint serving the metrics in the Prometheus text format on /metrics, from a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{METRICS_HTTP_PATH}"
+
+    def start(self):
+        if self._server:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_handler_class(registry=self.registry))
+        self._server.daemon_threads = True
+        # the actual port, in case port 0 was given to let the OS pick one
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="pipelex-metrics-http", daemon=True)
+        self._thread.start()
+        log.verbose(f"Serving metrics on {self.url}")
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread:
+            self._thread.join()
+        self._server = None
+        self._thread = None
@@ -0,0 +1,55 @@
+from contextlib import AbstractContextManager, nullcontext
+from typing import Protocol
+
+from typing_extensions import override
+
+from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.pipeline.job_metadata import JobCategory
+
+
+class MetricsProtocol(Protocol):
+    @property
+    def is_enabled(self) -> bool: ...
+
+    def track_pipe_run(self, pipe_type: str) -> AbstractContextManager[None]: ...
+
+    def track_inference(self, job_category: JobCategory, model_handle: str) -> AbstractContextManager[None]: ...
+
+    def record_inference_job(self, model_handle: str, inference_job: InferenceJobAbstract) -> None: ...
+
+    def render_prometheus_text(self) -> str: ...
+
+    def setup(self) -> None: ...
+
+    def teardown(self) -> None: ...
+
+
+class MetricsNoOp(MetricsProtocol):
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return False
+
+    @override
+    def track_pipe_run(self, pipe_type: str) -> AbstractContextManager[None]:
+        return nullcontext()
+
+    @override
+    def track_inference(self, job_category: JobCategory, model_handle: str) -> AbstractContextManager[None]:
+        return nullcontext()
+
+    @override
+    def record_inference_job(self, model_handle: str, inference_job: InferenceJobAbstract) -> None:
+        pass
+
+    @override
+    def render_prometheus_text(self) -> str:
+        return ""
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
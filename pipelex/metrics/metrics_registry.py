@@ -0,0 +1,222 @@
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import TypeVar, cast
+
+from pydantic import BaseModel
+from typing_extensions import override
+
+from pipelex.exceptions import MetricsRegistryError
+from pipelex.types import StrEnum
+
+# Label values of one series, sorted by label name
+MetricLabels = tuple[tuple[str, str], ...]
+
+DEFAULT_LATENCY_BUCKETS: list[float] = [0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0]
+
+
+class MetricType(StrEnum):
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+
+class MetricSample(BaseModel):
+    """Update of one series, as handed over to the listeners of the registry."""
+
+    name: str
+    metric_type: MetricType
+    labels: dict[str, str]
+    value: float
+
+
+MetricsListener = Callable[[MetricSample], None]
+
+
+def _make_labels(labels: dict[str, str] | None) -> MetricLabels:
+    if not labels:
+        return ()
+    return tuple(sorted(labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: MetricLabels, extra_label: tuple[str, str] | None = None) -> str:
+    all_labels = [*labels, extra_label] if extra_label else list(labels)
+    if not all_labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in all_labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class MetricAbstract(ABC):
+    metric_type: MetricType
+
+    def __init__(self, registry: "MetricsRegistry", name: str, description: str):
+        self._registry = registry
+        self.name = name
+        self.description = description
+
+    def _notify(self, labels: MetricLabels, value: float):
+        if not self._registry.listeners:
+            return
+        self._registry.notify(sample=MetricSample(name=self.name, metric_type=self.metric_type, labels=dict(labels), value=value))
+
+    @abstractmethod
+    def render_lines(self) -> list[str]:
+        pass
+
+
+class Counter(MetricAbstract):
+    metric_type = MetricType.COUNTER
+
+    def __init__(self, registry: "MetricsRegistry", name: str, description: str):
+        super().__init__(registry=registry, name=name, description=description)
+        self._values: dict[MetricLabels, float] = {}
+
+    def inc(self, labels: dict[str, str] | None = None, amount: float = 1.0):
+        series = _make_labels(labels)
+        with self._registry.lock:
+            value = self._values.get(series, 0.0) + amount
+            self._values[series] = value
+        self._notify(labels=series, value=value)
+
+    def get_value(self, labels: dict[str, str] | None = None) -> float:
+        return self._values.get(_make_labels(labels), 0.0)
+
+    @override
+    def render_lines(self) -> list[str]:
+        return [f"{self.name}{_format_labels(series)} {_format_value(value)}" for series, value in self._values.items()]
+
+
+class Gauge(Counter):
+    metric_type = MetricType.GAUGE
+
+    def dec(self, labels: dict[str, str] | None = None, amount: float = 1.0):
+        self.inc(labels=labels, amount=-amount)
+
+    def set(self, value: float, labels: dict[str, str] | None = None):
+        series = _make_labels(labels)
+        with self._registry.lock:
+            self._values[series] = value
+        self._notify(labels=series, value=value)
+
+
+class _HistogramSeries:
+    def __init__(self, nb_buckets: int):
+        self.bucket_counts = [0] * nb_buckets
+        self.count = 0
+        self.total = 0.0
+
+
+class Histogram(MetricAbstract):
+    """Histogram with cumulative buckets, as in the Prometheus exposition format."""
+
+    metric_type = MetricType.HISTOGRAM
+
+    def __init__(self, registry: "MetricsRegistry", name: str, description: str, buckets: list[float]):
+        super().__init__(registry=registry, name=name, description=description)
+        self.buckets = sorted(buckets)
+        self._series: dict[MetricLabels, _HistogramSeries] = {}
+
+    def observe(self, value: float, labels: dict[str, str] | None = None):
+        series_labels = _make_labels(labels)
+        with self._registry.lock:
+            series = self._series.get(series_labels)
+            if series is None:
+                series = _HistogramSeries(nb_buckets=len(self.buckets))
+                self._series[series_labels] = series
+            for bucket_index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    series.bucket_counts[bucket_index] += 1
+            series.count += 1
+            series.total += value
+        self._notify(labels=series_labels, value=value)
+
+    def get_count(self, labels: dict[str, str] | None = None) -> int:
+        series = self._series.get(_make_labels(labels))
+        return series.count if series else 0
+
+    @override
+    def render_lines(self) -> list[str]:
+        lines: list[str] = []
+        for series_labels, series in self._series.items():
+            for upper_bound, bucket_count in zip(self.buckets, series.bucket_counts, strict=True):
+                lines.append(f"{self.name}_bucket{_format_labels(series_labels, extra_label=('le', _format_value(upper_bound)))} {bucket_count}")
+            lines.append(f"{self.name}_bucket{_format_labels(series_labels, extra_label=('le', '+Inf'))} {series.count}")
+            lines.append(f"{self.name}_sum{_format_labels(series_labels)} {_format_value(series.total)}")
+            lines.append(f"{self.name}_count{_format_labels(series_labels)} {series.count}")
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound=MetricAbstract)
+
+
+class MetricsRegistry:
+    """In-process registry of counters, gauges and histograms, with labelled series.
+
+    Metrics can be scraped in the Prometheus text format, e.g. by the MetricsHttpServer, and each update is also
+    handed over to the listeners, so an app can forward the metrics to its own exporter.
+    Updates are guarded by a lock since the registry can be read from the thread of the HTTP endpoint.
+    """
+
+    def __init__(self, listeners: list[MetricsListener] | None = None):
+        self.lock = threading.Lock()
+        self.listeners: list[MetricsListener] = listeners or []
+        self._metrics: dict[str, MetricAbstract] = {}
+
+    def add_listener(self, listener: MetricsListener):
+        self.listeners.append(listener)
+
+    def notify(self, sample: MetricSample):
+        for listener in self.listeners:
+            listener(sample)
+
+    def _get_existing_metric(self, name: str, metric_class: type[MetricT]) -> MetricT | None:
+        metric = self._metrics.get(name)
+        if metric is None:
+            return None
+        if type(metric) is not metric_class:
+            msg = f"Metric '{name}' is already registered as a {metric.metric_type}"
+            raise MetricsRegistryError(msg)
+        return cast("MetricT", metric)
+
+    def counter(self, name: str, description: str) -> Counter:
+        if metric := self._get_existing_metric(name=name, metric_class=Counter):
+            return metric
+        metric = Counter(registry=self, name=name, description=description)
+        self._metrics[name] = metric
+        return metric
+
+    def gauge(self, name: str, description: str) -> Gauge:
+        if metric := self._get_existing_metric(name=name, metric_class=Gauge):
+            return metric
+        metric = Gauge(registry=self, name=name, description=description)
+        self._metrics[name] = metric
+        return metric
+
+    def histogram(self, name: str, description: str, buckets: list[float] | None = None) -> Histogram:
+        if metric := self._get_existing_metric(name=name, metric_class=Histogram):
+            return metric
+        metric = Histogram(registry=self, name=name, description=description, buckets=buckets or DEFAULT_LATENCY_BUCKETS)
+        self._metrics[name] = metric
+        return metric
+
+    def render_prometheus_text(self) -> str:
+        lines: list[str] = []
+        with self.lock:
+            for metric in self._metrics.values():
+                lines.append(f"# HELP {metric.name} {metric.description}")
+                lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+                lines.extend(metric.render_lines())
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,139 @@
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from typing_extensions import override
+
+from pipelex.cogt.extract.extract_job import ExtractJob
+from pipelex.cogt.img_gen.img_gen_job import ImgGenJob
+from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.cogt.usage.unit_report import UnitUsage
+from pipelex.metrics.metrics_config import MetricsConfig
+from pipelex.metrics.metrics_http_server import MetricsHttpServer
+from pipelex.metrics.metrics_protocol import MetricsProtocol
+from pipelex.metrics.metrics_registry import DEFAULT_LATENCY_BUCKETS, MetricsRegistry
+from pipelex.pipeline.job_metadata import JobCategory
+from pipelex.types import StrEnum
+
+
+class MetricStatus(StrEnum):
+    SUCCESS = "success"
+    ERROR = "error"
+
+
+class PipelexMetrics(MetricsProtocol):
+    """Live metrics of the pipe runs and inference calls of this process.
+
+    Pipelex dispatches inference calls directly, without a queue of its own, so the calls in flight per model are the queue depth
+    seen by the providers, and the time between the creation of each job and its start is recorded as queue wait.
+    The cache hit ratio is pipelex_llm_cache_hits_total divided by the LLM calls of pipelex_inference_calls_total.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry | None = None,
+        latency_buckets: list[float] | None = None,
+        http_server_address: tuple[str, int] | None = None,
+    ):
+        self.registry = registry or MetricsRegistry()
+        buckets = latency_buckets or DEFAULT_LATENCY_BUCKETS
+        self.http_server: MetricsHttpServer | None = None
+        if http_server_address:
+            host, port = http_server_address
+            self.http_server = MetricsHttpServer(registry=self.registry, host=host, port=port)
+
+        self.pipes_in_flight = self.registry.gauge("pipelex_pipes_in_flight", "Pipe runs in progress")
+        self.pipe_runs = self.registry.counter("pipelex_pipe_runs_total", "Finished pipe runs")
+        self.pipe_duration = self.registry.histogram("pipelex_pipe_duration_seconds", "Duration of pipe runs", buckets=buckets)
+        self.inference_calls_in_flight = self.registry.gauge("pipelex_inference_calls_in_flight", "Inference calls in progress")
+        self.inference_calls = self.registry.counter("pipelex_inference_calls_total", "Finished inference calls")
+        self.inference_duration = self.registry.histogram("pipelex_inference_duration_seconds", "Duration of inference calls", buckets=buckets)
+        self.inference_queue_wait = self.registry.histogram(
+            "pipelex_inference_queue_wait_seconds",
+            "Time between the creation of inference jobs and their start",
+            buckets=buckets,
+        )
+        self.llm_tokens = self.registry.counter("pipelex_llm_tokens_total", "Tokens used by LLM calls")
+        self.llm_cache_hits = self.registry.counter("pipelex_llm_cache_hits_total", "LLM calls with cached input tokens")
+        self.inference_units = self.registry.counter("pipelex_inference_units_total", "Images generated and pages extracted")
+
+    @classmethod
+    def make_from_config(cls, metrics_config: MetricsConfig) -> "PipelexMetrics":
+        http_server_address: tuple[str, int] | None = None
+        if metrics_config.is_http_endpoint_enabled:
+            http_server_address = (metrics_config.http_host, metrics_config.http_port)
+        return cls(latency_buckets=metrics_config.latency_buckets, http_server_address=http_server_address)
+
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return True
+
+    @override
+    @contextmanager
+    def track_pipe_run(self, pipe_type: str) -> Generator[None, None, None]:
+        labels = {"pipe_type": pipe_type}
+        self.pipes_in_flight.inc(labels=labels)
+        started_at = time.perf_counter()
+        status = MetricStatus.ERROR
+        try:
+            yield
+            status = MetricStatus.SUCCESS
+        finally:
+            self.pipes_in_flight.dec(labels=labels)
+            self.pipe_duration.observe(time.perf_counter() - started_at, labels=labels)
+            self.pipe_runs.inc(labels={**labels, "status": status})
+
+    @override
+    @contextmanager
+    def track_inference(self, job_category: JobCategory, model_handle: str) -> Generator[None, None, None]:
+        labels = {"job_category": job_category, "model": model_handle}
+        self.inference_calls_in_flight.inc(labels=labels)
+        started_at = time.perf_counter()
+        status = MetricStatus.ERROR
+        try:
+            yield
+            status = MetricStatus.SUCCESS
+        finally:
+            self.inference_calls_in_flight.dec(labels=labels)
+            self.inference_duration.observe(time.perf_counter() - started_at, labels=labels)
+            self.inference_calls.inc(labels={**labels, "status": status})
+
+    def _record_unit_usage(self, model_handle: str, unit_usage: UnitUsage | None):
+        if unit_usage is None:
+            return
+        for unit_category, nb_units in unit_usage.nb_units_by_category.items():
+            self.inference_units.inc(labels={"model": model_handle, "unit": unit_category}, amount=nb_units)
+
+    @override
+    def record_inference_job(self, model_handle: str, inference_job: InferenceJobAbstract) -> None:
+        job_category = inference_job.job_metadata.job_category
+        if (queue_wait_duration := inference_job.queue_wait_duration) is not None and job_category:
+            self.inference_queue_wait.observe(queue_wait_duration, labels={"job_category": job_category, "model": model_handle})
+
+        if isinstance(inference_job, LLMJob):
+            llm_tokens_usage = inference_job.job_report.llm_tokens_usage
+            if llm_tokens_usage is None:
+                return
+            for token_category, nb_tokens in llm_tokens_usage.nb_tokens_by_category.items():
+                self.llm_tokens.inc(labels={"model": model_handle, "category": token_category}, amount=nb_tokens)
+            if llm_tokens_usage.nb_tokens_by_category.get(TokenCategory.INPUT_CACHED, 0) > 0:
+                self.llm_cache_hits.inc(labels={"model": model_handle})
+        elif isinstance(inference_job, (ImgGenJob, ExtractJob)):
+            self._record_unit_usage(model_handle=model_handle, unit_usage=inference_job.job_report.unit_usage)
+
+    @override
+    def render_prometheus_text(self) -> str:
+        return self.registry.render_prometheus_text()
+
+    @override
+    def setup(self) -> None:
+        if self.http_server:
+            self.http_server.start()
+
+    @override
+    def teardown(self) -> None:
+        if self.http_server:
+            self.http_server.stop()
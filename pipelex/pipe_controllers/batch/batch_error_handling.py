@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from typing import Any, TypeVar
+
+from pipelex import log
+from pipelex.cogt.exceptions import RunBudgetExceededError
+from pipelex.core.stuffs.structured_content import StructuredContent
+from pipelex.exceptions import PipelineCancelledError
+
+BatchItemResultType = TypeVar("BatchItemResultType")
+
+# Errors that abort the whole run: they are never retried nor collected
+RUN_ABORTING_ERRORS: tuple[type[Exception], ...] = (RunBudgetExceededError, PipelineCancelledError)
+
+
+class BatchItemError(StructuredContent):
+    item_index: int
+    error_type: str
+    error_message: str
+    nb_attempts: int
+
+
+def make_batch_errors_stuff_name(output_name: str | None) -> str:
+    """Return the name of the stuff listing the failed items of a batch, next to its output list."""
+    return f"{output_name}_errors" if output_name else "batch_errors"
+
+
+async def run_batch_item_with_retries(
+    run_item_attempt: Callable[[], Awaitable[BatchItemResultType]],
+    item_index: int,
+    nb_retries: int,
+    retry_delay: float,
+) -> BatchItemResultType:
+    """Run an item of a batch, running it again after an exponential backoff each time it fails, up to nb_retries times."""
+    attempt_index = 0
+    while True:
+        try:
+            return await run_item_attempt()
+        except RUN_ABORTING_ERRORS:
+            raise
+        except Exception as exc:
+            if attempt_index >= nb_retries:
+                raise
+            delay = retry_delay * 2**attempt_index
+            attempt_index += 1
+            log.warning(f"Batch item {item_index} failed with {type(exc).__name__}: {exc}. Retry {attempt_index}/{nb_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+async def collect_batch_item_error(
+    item_run: Awaitable[BatchItemResultType],
+    item_index: int,
+    nb_attempts: int,
+) -> BatchItemResultType | BatchItemError:
+    """Run an item of a batch, returning its error instead of raising it."""
+    try:
+        return await item_run
+    except RUN_ABORTING_ERRORS:
+        raise
+    except Exception as exc:
+        log.error(f"Batch item {item_index} failed after {nb_attempts} attempt(s) with {type(exc).__name__}: {exc}")
+        return BatchItemError(
+            item_index=item_index,
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+            nb_attempts=nb_attempts,
+        )
+
+
+async def gather_batch_items(item_runs: Sequence[Coroutine[Any, Any, BatchItemResultType]]) -> list[BatchItemResultType]:
+    """Run the items of a batch concurrently, and return their results in order.
+
+    If an item fails, the items still running are cancelled, and awaited so that none of them keeps running after the batch failed.
+    """
+    item_tasks = [asyncio.create_task(item_run) for item_run in item_runs]
+    try:
+        return await asyncio.gather(*item_tasks)
+    except BaseException:
+        for item_task in item_tasks:
+            item_task.cancel()
+        await asyncio.gather(*item_tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,118 @@
+import asyncio
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pydantic import BaseModel
+
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.types import StrEnum
+
+
+class BatchStreamOrder(StrEnum):
+    # Items are yielded as soon as they complete
+    COMPLETION = "completion"
+    # Items are yielded in the order of the input list, the items completed ahead of their turn being held back
+    INPUT = "input"
+
+
+class BatchItemOutput(BaseModel):
+    item_index: int
+    stuff: Stuff
+
+
+class BatchItemStream:
+    """Hands over the outputs of the items of a PipeBatch to a consumer, as they complete.
+
+    In input order, at most max_reordered_items items are run ahead of the next item to yield: the other items wait
+    for their turn before they start, so the items held back never exceed that bound, even with a slow consumer.
+    """
+
+    def __init__(self, pipe_code: str, stream_order: BatchStreamOrder, max_reordered_items: int):
+        if max_reordered_items < 1:
+            msg = f"max_reordered_items must be at least 1, got {max_reordered_items}"
+            raise ValueError(msg)
+        self.pipe_code = pipe_code
+        self.stream_order = stream_order
+        self.max_reordered_items = max_reordered_items
+        # The output of each completed item not yet yielded, None for a failed item, which is skipped
+        self._completed_items: dict[int, BatchItemOutput | None] = {}
+        self._completion_order: deque[int] = deque()
+        self._next_item_index = 0
+        self._is_closed = False
+        self._changed = asyncio.Event()
+
+    def _notify_change(self):
+        # The waiters hold the event that was current when they started waiting, so replacing it never loses a wake up
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def is_streamed_batch(self, pipe_code: str, batch_path: tuple[int, ...]) -> bool:
+        """Whether the items of this batch are streamed: those of the pipe being executed, not of a nested batch of the same pipe."""
+        return pipe_code == self.pipe_code and not batch_path
+
+    async def wait_for_turn(self, item_index: int):
+        """Wait until an item can start without exceeding the reordering bound."""
+        if self.stream_order != BatchStreamOrder.INPUT:
+            return
+        while item_index >= self._next_item_index + self.max_reordered_items and not self._is_closed:
+            await self._changed.wait()
+
+    def add_item(self, item_index: int, stuff: Stuff | None):
+        """Add the output of a completed item, or None if it failed."""
+        self._completed_items[item_index] = BatchItemOutput(item_index=item_index, stuff=stuff) if stuff else None
+        if self.stream_order == BatchStreamOrder.COMPLETION:
+            self._completion_order.append(item_index)
+        self._notify_change()
+
+    def close(self):
+        self._is_closed = True
+        self._notify_change()
+
+    def _pop_next_item_index(self) -> int | None:
+        match self.stream_order:
+            case BatchStreamOrder.COMPLETION:
+                return self._completion_order.popleft() if self._completion_order else None
+            case BatchStreamOrder.INPUT:
+                if self._next_item_index not in self._completed_items:
+                    if not self._is_closed or not self._completed_items:
+                        return None
+                    # Some items never ran, e.g. beyond the tracker's limit on the number of items
+                    self._next_item_index = min(self._completed_items)
+                item_index = self._next_item_index
+                self._next_item_index += 1
+                self._notify_change()
+                return item_index
+
+    def __aiter__(self) -> "BatchItemStream":
+        return self
+
+    async def __anext__(self) -> BatchItemOutput:
+        while True:
+            item_index = self._pop_next_item_index()
+            if item_index is not None:
+                if batch_item_output := self._completed_items.pop(item_index):
+                    return batch_item_output
+                continue
+            if self._is_closed:
+                raise StopAsyncIteration
+            await self._changed.wait()
+
+
+# The stream of the running pipeline is a context variable, so that it is seen by the PipeBatch it streams,
+# however deep in the pipeline, and only within that pipeline's task
+_current_batch_item_stream: ContextVar[BatchItemStream | None] = ContextVar("pipelex_current_batch_item_stream", default=None)
+
+
+def get_current_batch_item_stream() -> BatchItemStream | None:
+    return _current_batch_item_stream.get()
+
+
+@contextmanager
+def set_current_batch_item_stream(batch_item_stream: BatchItemStream) -> Generator[None, None, None]:
+    token = _current_batch_item_stream.set(batch_item_stream)
+    try:
+        yield
+    finally:
+        _current_batch_item_stream.reset(token)
@@ -1,13 +1,16 @@
-import asyncio
 from typing import TYPE_CHECKING, Any, Literal, cast
 
 import shortuuid
 from pydantic import model_validator
 from typing_extensions import override
 
+from pipelex import log
 from pipelex.config import get_config
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
 from pipelex.core.memory.working_memory import MAIN_STUFF_NAME, WorkingMemory
 from pipelex.core.pipes.input_requirements import InputRequirements
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.core.pipes.pipe_output import PipeOutput
 from pipelex.core.stuffs.list_content import ListContent
 from pipelex.core.stuffs.stuff_factory import StuffFactory
@@ -17,10 +20,24 @@ from pipelex.exceptions import (
     PipeRunInputsError,
     WorkingMemoryStuffNotFoundError,
 )
-from pipelex.hub import get_pipeline_tracker, get_required_pipe
+from pipelex.hub import get_pipe_library, get_pipeline_tracker, get_required_pipe
+from pipelex.pipe_controllers.batch.batch_error_handling import (
+    BatchItemError,
+    collect_batch_item_error,
+    gather_batch_items,
+    make_batch_errors_stuff_name,
+    run_batch_item_with_retries,
+)
+from pipelex.pipe_controllers.batch.batch_item_stream import BatchItemStream, get_current_batch_item_stream
 from pipelex.pipe_controllers.pipe_controller import PipeController
+from pipelex.pipe_operators.llm.llm_call_packing import pack_llm_calls
+from pipelex.pipe_run.batch_error_mode import BatchErrorMode
 from pipelex.pipe_run.pipe_run_params import BatchParams, PipeRunMode, PipeRunParams
+from pipelex.pipeline.branch_executor.branch_offloading import run_branch_pipe
+from pipelex.pipeline.checkpoint.checkpoint_models import StuffCheckpoint
+from pipelex.pipeline.checkpoint.checkpointing import is_checkpointing_active, load_checkpoint, make_checkpoint_key, save_checkpoint
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.track.step_timing import StepTiming, run_timed_step
 from pipelex.types import Self
 
 if TYPE_CHECKING:
@@ -145,16 +162,15 @@ class PipeBatch(PipeController):
 
         # TODO: Make commented code work when inputing images named "a.b.c"
         sub_pipe = get_required_pipe(pipe_code=self.branch_pipe_code)
+        required_variables = get_pipe_library().get_required_variables(pipe=sub_pipe)
         nb_history_items_limit = get_config().pipelex.tracker_config.applied_nb_items_limit
         batch_output_stuff_code = shortuuid.uuid()
-        tasks: list[Coroutine[Any, Any, PipeOutput]] = []
+        tasks: list[Coroutine[Any, Any, PipeOutput | BatchItemError]] = []
         item_stuffs: list[Stuff] = []
         required_stuff_lists: list[list[Stuff]] = []
-        branch_output_item_codes: list[str] = []
 
         for branch_index, item in enumerate(input_content.items):
             branch_output_item_code = f"{batch_output_stuff_code}-branch-{branch_index}"
-            branch_output_item_codes.append(branch_output_item_code)
             if nb_history_items_limit and branch_index >= nb_history_items_limit:
                 break
             branch_input_item_code = f"{input_stuff_code}-branch-{branch_index}"
@@ -168,13 +184,15 @@ class PipeBatch(PipeController):
             branch_memory = working_memory.make_deep_copy()
             branch_memory.set_new_main_stuff(stuff=item_input_stuff, name=input_item_stuff_name)
 
-            required_variables = sub_pipe.required_variables()
             required_stuffs = branch_memory.get_existing_stuffs(names=required_variables)
             required_stuffs = [required_stuff for required_stuff in required_stuffs if required_stuff.stuff_code != input_stuff_code]
             required_stuff_lists.append(required_stuffs)
-            branch_pipe_run_params = pipe_run_params.deep_copy_with_final_stuff_code(final_stuff_code=branch_output_item_code)
+            branch_pipe_run_params = pipe_run_params.make_branch_params_with_final_stuff_code(
+                final_stuff_code=branch_output_item_code,
+                batch_index=branch_index,
+            )
 
-            task: Coroutine[Any, Any, PipeOutput]
+            task: Coroutine[Any, Any, PipeOutput | BatchItemError]
             if pipe_run_params.run_mode == PipeRunMode.DRY:
                 branch_pipe_run_params.run_mode = PipeRunMode.DRY
                 task = sub_pipe.run_pipe(
@@ -184,23 +202,49 @@ class PipeBatch(PipeController):
                     pipe_run_params=branch_pipe_run_params,
                 )
             else:
-                task = sub_pipe.run_pipe(
+                task = self._run_branch(
+                    sub_pipe=sub_pipe,
+                    branch_index=branch_index,
                     job_metadata=job_metadata,
-                    working_memory=branch_memory,
+                    branch_memory=branch_memory,
                     output_name=f"Batch result {branch_index + 1} of {output_name}",
-                    pipe_run_params=branch_pipe_run_params,
+                    pipe_run_params=pipe_run_params,
+                    branch_pipe_run_params=branch_pipe_run_params,
+                    batch_params=batch_params,
                 )
+                if batch_params.error_mode == BatchErrorMode.COLLECT_ERRORS:
+                    task = collect_batch_item_error(
+                        item_run=task,
+                        item_index=branch_index,
+                        nb_attempts=batch_params.nb_item_retries + 1,
+                    )
             tasks.append(task)
 
-        pipe_outputs = await asyncio.gather(*tasks)
-
+        item_runs = [run_timed_step(step=task, pipe_stack=pipe_run_params.pipe_stack) for task in tasks]
+        batch_item_stream = get_current_batch_item_stream()
+        if batch_item_stream and batch_item_stream.is_streamed_batch(pipe_code=self.code, batch_path=pipe_run_params.batch_path):
+            item_runs = [
+                self._run_streamed_item(batch_item_stream=batch_item_stream, branch_index=branch_index, item_run=item_run)
+                for branch_index, item_run in enumerate(item_runs)
+            ]
+        with pack_llm_calls(pack_size=batch_params.llm_pack_size if pipe_run_params.run_mode == PipeRunMode.LIVE else None):
+            timed_item_results = await gather_batch_items(item_runs=item_runs)
+
+        succeeded_branch_indexes: list[int] = []
         output_items: list[StuffContent] = []
         output_stuffs: list[Stuff] = []
+        step_timings: list[StepTiming] = []
+        batch_item_errors: list[BatchItemError] = []
         output_stuff_code = shortuuid.uuid()[:5]
-        for pipe_output in pipe_outputs:
-            branch_output_stuff = pipe_output.main_stuff
+        for branch_index, (item_result, step_timing) in enumerate(timed_item_results):
+            if isinstance(item_result, BatchItemError):
+                batch_item_errors.append(item_result)
+                continue
+            branch_output_stuff = item_result.main_stuff
+            succeeded_branch_indexes.append(branch_index)
             output_stuffs.append(branch_output_stuff)
             output_items.append(branch_output_stuff.content)
+            step_timings.append(step_timing)
 
         list_content: ListContent[StuffContent] = ListContent(items=output_items)
         output_stuff = StuffFactory.make_stuff(
@@ -211,11 +255,9 @@ class PipeBatch(PipeController):
         )
 
         method_name = "dry_run_pipe" if pipe_run_params.run_mode == PipeRunMode.DRY else "run_pipe"
-        for branch_index, (
-            required_stuff_list,
-            item_input_stuff,
-            item_output_stuff,
-        ) in enumerate(zip(required_stuff_lists, item_stuffs, output_stuffs, strict=False)):
+        for branch_index, item_output_stuff, step_timing in zip(succeeded_branch_indexes, output_stuffs, step_timings, strict=True):
+            required_stuff_list = required_stuff_lists[branch_index]
+            item_input_stuff = item_stuffs[branch_index]
             get_pipeline_tracker().add_batch_step(
                 from_stuff=input_stuff,
                 to_stuff=item_input_stuff,
@@ -232,10 +274,10 @@ class PipeBatch(PipeController):
                     comment=f"PipeBatch.{method_name}() on required_stuff_list",
                     as_item_index=branch_index,
                     is_with_edge=(required_stuff.stuff_name != MAIN_STUFF_NAME),
+                    step_timing=step_timing,
                 )
 
-        for branch_index, branch_output_stuff in enumerate(output_stuffs):
-            branch_output_item_code = branch_output_item_codes[branch_index]
+        for branch_output_stuff in output_stuffs:
             get_pipeline_tracker().add_aggregate_step(
                 from_stuff=branch_output_stuff,
                 to_stuff=output_stuff,
@@ -243,6 +285,19 @@ class PipeBatch(PipeController):
                 comment=f"PipeBatch.{method_name}() on branch_index of batch",
             )
 
+        if batch_params.error_mode == BatchErrorMode.COLLECT_ERRORS and pipe_run_params.run_mode == PipeRunMode.LIVE:
+            errors_stuff_name = make_batch_errors_stuff_name(output_name=output_name)
+            errors_stuff = StuffFactory.make_stuff(
+                concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.ANYTHING),
+                content=ListContent[BatchItemError](items=batch_item_errors),
+                name=errors_stuff_name,
+            )
+            working_memory.add_new_stuff(name=errors_stuff_name, stuff=errors_stuff)
+            if batch_item_errors:
+                log.warning(
+                    f"PipeBatch '{self.code}' completed {len(output_stuffs)} of {len(tasks)} items, failed items are in '{errors_stuff_name}'"
+                )
+
         working_memory.set_new_main_stuff(
             stuff=output_stuff,
             name=output_name,
@@ -253,6 +308,75 @@ class PipeBatch(PipeController):
             pipeline_run_id=job_metadata.pipeline_run_id,
         )
 
+    async def _run_branch(
+        self,
+        sub_pipe: PipeAbstract,
+        branch_index: int,
+        job_metadata: JobMetadata,
+        branch_memory: WorkingMemory,
+        output_name: str,
+        pipe_run_params: PipeRunParams,
+        branch_pipe_run_params: PipeRunParams,
+        batch_params: BatchParams,
+    ) -> PipeOutput:
+        """Run the branch of an item, or restore its output if it already completed in a previous attempt of this pipeline run.
+
+        A failing branch is run again up to nb_item_retries times, each time on a fresh copy of its working memory.
+        With offload_branches, the branch runs on the branch executor, e.g. in a worker process.
+        """
+        checkpoint_key: str | None = None
+        if is_checkpointing_active(pipe_run_params=pipe_run_params):
+            checkpoint_key = make_checkpoint_key(pipe_run_params=pipe_run_params, step_name=f"item-{branch_index}")
+            if pipe_run_params.is_resumed and (
+                checkpoint := load_checkpoint(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
+                    checkpoint_key=checkpoint_key,
+                    checkpoint_class=StuffCheckpoint,
+                )
+            ):
+                branch_memory.set_new_main_stuff(stuff=checkpoint.make_stuff())
+                return PipeOutput(working_memory=branch_memory, pipeline_run_id=job_metadata.pipeline_run_id)
+
+        async def run_branch_attempt() -> PipeOutput:
+            return await run_branch_pipe(
+                sub_pipe=sub_pipe,
+                job_metadata=job_metadata,
+                working_memory=branch_memory.make_deep_copy() if batch_params.nb_item_retries else branch_memory,
+                output_name=output_name,
+                pipe_run_params=branch_pipe_run_params.make_branch_params(),
+                is_offloaded=batch_params.offload_branches,
+            )
+
+        pipe_output = await run_batch_item_with_retries(
+            run_item_attempt=run_branch_attempt,
+            item_index=branch_index,
+            nb_retries=batch_params.nb_item_retries,
+            retry_delay=batch_params.item_retry_delay,
+        )
+        if checkpoint_key:
+            save_checkpoint(
+                pipeline_run_id=job_metadata.pipeline_run_id,
+                checkpoint_key=checkpoint_key,
+                checkpoint=StuffCheckpoint.make_from_stuff(stuff=pipe_output.main_stuff),
+            )
+        return pipe_output
+
+    async def _run_streamed_item(
+        self,
+        batch_item_stream: BatchItemStream,
+        branch_index: int,
+        item_run: "Coroutine[Any, Any, tuple[PipeOutput | BatchItemError, StepTiming]]",
+    ) -> tuple[PipeOutput | BatchItemError, StepTiming]:
+        """Run an item once its turn has come, and hand its output over to the stream as soon as it completes."""
+        try:
+            await batch_item_stream.wait_for_turn(item_index=branch_index)
+        except BaseException:
+            item_run.close()
+            raise
+        item_result, step_timing = await item_run
+        batch_item_stream.add_item(item_index=branch_index, stuff=item_result.main_stuff if isinstance(item_result, PipeOutput) else None)
+        return item_result, step_timing
+
     @override
     async def _run_controller_pipe(
         self,
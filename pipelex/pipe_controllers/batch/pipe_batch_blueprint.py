@@ -3,6 +3,7 @@ from typing import Literal
 from typing_extensions import override
 
 from pipelex.core.pipes.pipe_blueprint import PipeBlueprint
+from pipelex.pipe_run.batch_error_mode import BatchErrorMode
 
 
 class PipeBatchBlueprint(PipeBlueprint):
@@ -11,6 +12,11 @@ class PipeBatchBlueprint(PipeBlueprint):
     branch_pipe_code: str
     input_list_name: str
     input_item_name: str
+    error_mode: BatchErrorMode | None = None
+    nb_item_retries: int | None = None
+    item_retry_delay: float | None = None
+    llm_pack_size: int | None = None
+    offload_branches: bool | None = None
 
     @property
     @override
@@ -32,6 +32,7 @@ class PipeBatchFactory(PipeFactoryProtocol[PipeBatchBlueprint, PipeBatch]):
             domain=domain,
             code=pipe_code,
             description=blueprint.description,
+            timeout=blueprint.timeout,
             inputs=InputRequirementsFactory.make_from_blueprint(
                 domain=domain,
                 blueprint=blueprint.inputs or {},
@@ -47,5 +48,10 @@ class PipeBatchFactory(PipeFactoryProtocol[PipeBatchBlueprint, PipeBatch]):
             batch_params=BatchParams.make_batch_params(
                 input_list_name=blueprint.input_list_name,
                 input_item_name=blueprint.input_item_name,
+                error_mode=blueprint.error_mode,
+                nb_item_retries=blueprint.nb_item_retries,
+                item_retry_delay=blueprint.item_retry_delay,
+                llm_pack_size=blueprint.llm_pack_size,
+                offload_branches=blueprint.offload_branches,
             ),
         )
@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from pipelex import log
+from pipelex.core.memory.working_memory import MAIN_STUFF_NAME, WorkingMemory
+from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.pipeline.track.step_timing import StepTiming
+
+# Strong references to the cancelled branches until they are done, so that they are not garbage collected
+_cancelled_branch_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _discard_cancelled_branch_task(task: "asyncio.Task[Any]"):
+    _cancelled_branch_tasks.discard(task)
+    # a branch failing before it was cancelled must not be reported as an unretrieved exception
+    if not task.cancelled():
+        task.exception()
+
+
+def merge_branch_memory(working_memory: WorkingMemory, base_memory: WorkingMemory, branch_memory: WorkingMemory):
+    """Merge into the working memory the stuffs and aliases that a branch added to its copy of the base memory."""
+    for name, stuff in branch_memory.root.items():
+        if name == MAIN_STUFF_NAME or base_memory.root.get(name) is stuff:
+            continue
+        working_memory.set_stuff(name=name, stuff=stuff)
+    for alias, target in branch_memory.aliases.items():
+        if alias != MAIN_STUFF_NAME and base_memory.aliases.get(alias) != target and target in working_memory.root:
+            working_memory.aliases[alias] = target
+    if main_stuff_target := branch_memory.aliases.get(MAIN_STUFF_NAME):
+        working_memory.remove_main_stuff()
+        working_memory.set_alias(alias=MAIN_STUFF_NAME, target=main_stuff_target)
+    elif main_stuff := branch_memory.root.get(MAIN_STUFF_NAME):
+        working_memory.remove_alias_to_main_stuff()
+        working_memory.set_stuff(name=MAIN_STUFF_NAME, stuff=main_stuff)
+
+
+class SpeculativeBranch:
+    def __init__(self, pipe_code: str, read_stuff_names: set[str], task: "asyncio.Task[tuple[PipeOutput, StepTiming]]"):
+        self.pipe_code = pipe_code
+        self.read_stuff_names = read_stuff_names
+        self.task = task
+
+
+class ConditionSpeculation:
+    """The likely branches of a PipeCondition, started before its expression can be evaluated.
+
+    Each branch runs on its own shallow copy of the base memory, the working memory when the branches started: it only
+    sees the stuffs present then, and the stuffs it adds stay out of the working memory unless the condition chooses it.
+    Once the expression is evaluated, the chosen branch is claimed and the other ones are cancelled.
+    """
+
+    def __init__(self, condition_code: str, base_memory: WorkingMemory, branches: dict[str, SpeculativeBranch]):
+        self.condition_code = condition_code
+        self.base_memory = base_memory
+        self.branches = branches
+        self.is_claimed = False
+
+    def cancel(self):
+        """Cancel the branches that were not claimed."""
+        for branch in self.branches.values():
+            branch.task.cancel()
+            _cancelled_branch_tasks.add(branch.task)
+            branch.task.add_done_callback(_discard_cancelled_branch_task)
+        self.branches.clear()
+
+    async def claim(self, chosen_pipe_code: str, working_memory: WorkingMemory) -> tuple[PipeOutput, StepTiming] | None:
+        """Cancel the branches that were not chosen, and return the output of the chosen one, merged into the working memory.
+
+        Returns None if the chosen branch was not started, or if a stuff it read changed since it started, e.g. set again
+        by the step before the condition: the chosen pipe must then run as usual.
+        """
+        self.is_claimed = True
+        chosen_branch = self.branches.pop(chosen_pipe_code, None)
+        self.cancel()
+        if chosen_branch is None:
+            log.verbose(f"PipeCondition '{self.condition_code}': branch '{chosen_pipe_code}' was not started early")
+            return None
+        if any(working_memory.get_optional_stuff(name) is not self.base_memory.get_optional_stuff(name) for name in chosen_branch.read_stuff_names):
+            self.branches[chosen_pipe_code] = chosen_branch
+            self.cancel()
+            log.verbose(f"PipeCondition '{self.condition_code}': the inputs of branch '{chosen_pipe_code}' changed since it started early")
+            return None
+
+        log.verbose(f"PipeCondition '{self.condition_code}': using branch '{chosen_pipe_code}' started early")
+        branch_output, step_timing = await chosen_branch.task
+        merge_branch_memory(working_memory=working_memory, base_memory=self.base_memory, branch_memory=branch_output.working_memory)
+        return PipeOutput(working_memory=working_memory, pipeline_run_id=branch_output.pipeline_run_id), step_timing
+
+
+# The speculation started for the PipeCondition of the next step of a sequence is a context variable, so that the condition
+# finds it when it runs, without it being passed through the pipes in between
+_pending_condition_speculation: ContextVar[ConditionSpeculation | None] = ContextVar("pipelex_pending_condition_speculation", default=None)
+
+
+def take_pending_condition_speculation(condition_code: str) -> ConditionSpeculation | None:
+    """Take the speculation started for a PipeCondition about to run, if any."""
+    condition_speculation = _pending_condition_speculation.get()
+    if condition_speculation is None or condition_speculation.is_claimed or condition_speculation.condition_code != condition_code:
+        return None
+    return condition_speculation
+
+
+@contextmanager
+def set_pending_condition_speculation(condition_speculation: ConditionSpeculation | None) -> Generator[None, None, None]:
+    """Hand a speculation to the PipeCondition run within this context, and cancel the branches it didn't claim."""
+    if condition_speculation is None:
+        yield
+        return
+    token = _pending_condition_speculation.set(condition_speculation)
+    try:
+        yield
+    finally:
+        _pending_condition_speculation.reset(token)
+        condition_speculation.cancel()
@@ -1,7 +1,9 @@
+import asyncio
+from collections import Counter, deque
 from typing import Literal
 
 import shortuuid
-from pydantic import model_validator
+from pydantic import PrivateAttr, model_validator
 from typing_extensions import override
 
 from pipelex import log
@@ -24,13 +26,16 @@ from pipelex.exceptions import (
     StaticValidationErrorType,
     WorkingMemoryStuffNotFoundError,
 )
-from pipelex.hub import get_content_generator, get_optional_pipe, get_pipe_router, get_pipeline_tracker, get_required_pipe
+from pipelex.hub import get_content_generator, get_optional_pipe, get_pipe_library, get_pipe_router, get_pipeline_tracker, get_required_pipe
+from pipelex.pipe_controllers.condition.condition_speculation import ConditionSpeculation, SpeculativeBranch, take_pending_condition_speculation
 from pipelex.pipe_controllers.condition.pipe_condition_details import PipeConditionDetails
 from pipelex.pipe_controllers.condition.special_outcome import SpecialOutcome
 from pipelex.pipe_controllers.pipe_controller import PipeController
+from pipelex.pipe_run.pipe_job import PipeJob
 from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
 from pipelex.pipe_run.pipe_run_params import PipeRunParams
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.track.step_timing import StepTiming, run_timed_step
 from pipelex.tools.jinja2.jinja2_errors import Jinja2DetectVariablesError
 from pipelex.tools.jinja2.jinja2_required_variables import detect_jinja2_required_variables
 from pipelex.tools.typing.validation_utils import has_exactly_one_among_attributes_from_list
@@ -46,6 +51,12 @@ class PipeCondition(PipeController):
     outcome_map: ConditionOutcomeMap
     default_outcome: str | SpecialOutcome
     add_alias_from_expression_to: str | None = None
+    # Number of likely branches started early, along with the step before the condition in a sequence
+    speculative_branches: int | None = None
+    # Prior probabilities of the branches by pipe code, until enough outcomes are tracked
+    branch_priors: dict[str, float] | None = None
+
+    _recent_outcomes: deque[str] | None = PrivateAttr(default=None)
 
     @property
     def mapped_pipe_codes(self) -> set[str]:
@@ -82,6 +93,20 @@ class PipeCondition(PipeController):
             raise PipeDefinitionError(message=msg, domain_code=self.domain, pipe_code=self.code, description=self.description)
         return self
 
+    @model_validator(mode="after")
+    def validate_speculation(self) -> Self:
+        if self.speculative_branches is not None and self.speculative_branches < 1:
+            msg = f"PipeCondition '{self.code}' must have speculative_branches of at least 1, got {self.speculative_branches}"
+            raise PipeDefinitionError(message=msg, domain_code=self.domain, pipe_code=self.code, description=self.description)
+        for pipe_code, prior in (self.branch_priors or {}).items():
+            if pipe_code not in self.mapped_pipe_codes:
+                msg = f"PipeCondition '{self.code}' has a prior for '{pipe_code}', which is not one of its outcome pipes"
+                raise PipeDefinitionError(message=msg, domain_code=self.domain, pipe_code=self.code, description=self.description)
+            if prior < 0:
+                msg = f"PipeCondition '{self.code}' has a negative prior for '{pipe_code}': {prior}"
+                raise PipeDefinitionError(message=msg, domain_code=self.domain, pipe_code=self.code, description=self.description)
+        return self
+
     def _make_pipe_condition_details(self, evaluated_expression: str, chosen_pipe_code: str) -> PipeConditionDetails:
         return PipeConditionDetails(
             code=shortuuid.uuid()[:5],
@@ -130,16 +155,10 @@ class PipeCondition(PipeController):
 
     @override
     def needed_inputs(self, visited_pipes: set[str] | None = None) -> InputRequirements:
-        if visited_pipes is None:
-            visited_pipes = set()
-
         # If we've already visited this pipe, stop recursion
-        if self.code in visited_pipes:
+        if visited_pipes and self.code in visited_pipes:
             return InputRequirementsFactory.make_empty()
 
-        # Add this pipe to visited set for recursive calls
-        visited_pipes_with_current = visited_pipes | {self.code}
-
         needed_inputs = InputRequirementsFactory.make_empty()
 
         # 1. Add the variables from the expression/expression_template
@@ -162,8 +181,8 @@ class PipeCondition(PipeController):
         # 2. Add the inputs needed by all possible target pipes
         for pipe_code in self.mapped_pipe_codes:
             pipe = get_required_pipe(pipe_code=pipe_code)
-            # Use the centralized recursion detection
-            pipe_needed_inputs = pipe.needed_inputs(visited_pipes_with_current)
+            # The library memoizes the needed inputs of the target pipe and stops at the pipes calling themselves
+            pipe_needed_inputs = get_pipe_library().get_needed_inputs(pipe=pipe)
 
             for input_name, requirement in pipe_needed_inputs.items:
                 needed_inputs.add_requirement(variable_name=input_name, concept=requirement.concept)
@@ -233,6 +252,86 @@ class PipeCondition(PipeController):
     def pipe_dependencies(self) -> set[str]:
         return self.mapped_pipe_codes
 
+    #########################################################################################
+    # Speculation
+    #########################################################################################
+
+    def record_outcome(self, outcome: str):
+        """Track an outcome of this condition, to estimate the probability of its branches."""
+        if self._recent_outcomes is None:
+            self._recent_outcomes = deque(maxlen=get_config().pipelex.pipe_run_config.condition_speculation_config.nb_tracked_outcomes)
+        self._recent_outcomes.append(outcome)
+
+    def estimate_branch_probabilities(self) -> dict[str, float]:
+        """Estimate the probability of each outcome, from the recent outcomes of this condition, or else from its branch priors."""
+        speculation_config = get_config().pipelex.pipe_run_config.condition_speculation_config
+        if self._recent_outcomes and len(self._recent_outcomes) >= speculation_config.min_tracked_outcomes:
+            nb_outcomes = len(self._recent_outcomes)
+            return {outcome: nb_occurrences / nb_outcomes for outcome, nb_occurrences in Counter(self._recent_outcomes).items()}
+        total_prior = sum((self.branch_priors or {}).values())
+        if not self.branch_priors or total_prior <= 0:
+            return {}
+        return {pipe_code: prior / total_prior for pipe_code, prior in self.branch_priors.items()}
+
+    def get_likely_branch_codes(self) -> list[str]:
+        """Return the codes of the branches to start early, the most likely first."""
+        if not self.speculative_branches:
+            return []
+        min_branch_probability = get_config().pipelex.pipe_run_config.condition_speculation_config.min_branch_probability
+        branch_probabilities = {
+            outcome: probability
+            for outcome, probability in self.estimate_branch_probabilities().items()
+            if outcome in self.mapped_pipe_codes and probability >= min_branch_probability
+        }
+        likely_branch_codes = sorted(branch_probabilities, key=lambda pipe_code: branch_probabilities[pipe_code], reverse=True)
+        return likely_branch_codes[: self.speculative_branches]
+
+    def start_speculative_branches(
+        self,
+        job_metadata: JobMetadata,
+        working_memory: WorkingMemory,
+        pipe_run_params: PipeRunParams,
+        output_name: str | None = None,
+    ) -> ConditionSpeculation | None:
+        """Start the likely branches of this condition, before its expression can be evaluated.
+
+        The pipe_run_params are those the condition will be run with. A branch is only started if the stuffs it requires
+        are already in the working memory. Returns None if no branch was started.
+        """
+        likely_branch_codes = self.get_likely_branch_codes()
+        if not likely_branch_codes:
+            return None
+        base_memory = working_memory.make_shallow_copy()
+        condition_run_params = pipe_run_params.make_branch_params()
+        condition_run_params.push_pipe_to_stack(pipe_code=self.code)
+        branches: dict[str, SpeculativeBranch] = {}
+        for pipe_code in likely_branch_codes:
+            branch_pipe = get_required_pipe(pipe_code=pipe_code)
+            read_stuff_names = set(get_pipe_library().get_needed_inputs(pipe=branch_pipe).required_names)
+            if any(base_memory.get_optional_stuff(name) is None for name in read_stuff_names):
+                continue
+            branch_task = asyncio.create_task(
+                self._run_speculative_branch(
+                    pipe_job=PipeJobFactory.make_pipe_job(
+                        pipe=branch_pipe,
+                        job_metadata=job_metadata,
+                        working_memory=base_memory.make_shallow_copy(),
+                        pipe_run_params=condition_run_params.make_branch_params(),
+                        output_name=output_name,
+                    ),
+                )
+            )
+            branches[pipe_code] = SpeculativeBranch(pipe_code=pipe_code, read_stuff_names=read_stuff_names, task=branch_task)
+        if not branches:
+            return None
+        log.verbose(f"PipeCondition '{self.code}': started branches {list(branches)} early")
+        return ConditionSpeculation(condition_code=self.code, base_memory=base_memory, branches=branches)
+
+    @staticmethod
+    async def _run_speculative_branch(pipe_job: PipeJob) -> tuple[PipeOutput, StepTiming]:
+        # The pipe router run is only made once the task starts, so a stale branch cancelled before it starts leaves no coroutine behind
+        return await run_timed_step(step=get_pipe_router().run(pipe_job=pipe_job), pipe_stack=pipe_job.pipe_run_params.pipe_stack)
+
     async def _evaluate_expression(
         self,
         working_memory: WorkingMemory,
@@ -287,10 +386,14 @@ class PipeCondition(PipeController):
         # TODO: restore pipe_layer feature
         # pipe_run_params.push_pipe_code(pipe_code=pipe_code)
 
+        condition_speculation = take_pending_condition_speculation(condition_code=self.code) if self.speculative_branches else None
+
         evaluated_expression = await self._evaluate_expression(working_memory=working_memory)
 
         # Select the outcome based on the evaluated expression
         outcome = self.outcome_map.get(evaluated_expression, self.default_outcome)
+        if self.speculative_branches:
+            self.record_outcome(outcome=outcome)
 
         # Handle continue case
         if SpecialOutcome.is_continue(outcome):
@@ -310,7 +413,7 @@ class PipeCondition(PipeController):
         )
 
         # Get required variables and validate they exist in working memory
-        required_variables = chosen_pipe.required_variables()
+        required_variables = get_pipe_library().get_required_variables(pipe=chosen_pipe)
         required_stuff_names = {required_variable for required_variable in required_variables if not required_variable.startswith("_")}
         try:
             required_stuffs = working_memory.get_stuffs(names=required_stuff_names)
@@ -331,17 +434,26 @@ class PipeCondition(PipeController):
                 comment="PipeCondition required for condition",
             )
 
-        # Execute the chosen pipe
+        # Execute the chosen pipe, unless it was started early
         log.verbose(f"Chosen pipe: {chosen_pipe.code}")
-        pipe_output = await get_pipe_router().run(
-            pipe_job=PipeJobFactory.make_pipe_job(
-                pipe=chosen_pipe,
-                job_metadata=job_metadata,
-                working_memory=working_memory,
-                pipe_run_params=pipe_run_params,
-                output_name=output_name,
-            ),
-        )
+        speculative_result: tuple[PipeOutput, StepTiming] | None = None
+        if condition_speculation:
+            speculative_result = await condition_speculation.claim(chosen_pipe_code=chosen_pipe.code, working_memory=working_memory)
+        if speculative_result:
+            pipe_output, step_timing = speculative_result
+        else:
+            pipe_output, step_timing = await run_timed_step(
+                step=get_pipe_router().run(
+                    pipe_job=PipeJobFactory.make_pipe_job(
+                        pipe=chosen_pipe,
+                        job_metadata=job_metadata,
+                        working_memory=working_memory,
+                        pipe_run_params=pipe_run_params,
+                        output_name=output_name,
+                    ),
+                ),
+                pipe_stack=pipe_run_params.pipe_stack,
+            )
 
         # Track choice step
         get_pipeline_tracker().add_choice_step(
@@ -349,6 +461,7 @@ class PipeCondition(PipeController):
             to_stuff=pipe_output.main_stuff,
             pipe_layer=pipe_run_params.pipe_layers,
             comment="PipeCondition chosen pipe",
+            step_timing=step_timing,
         )
         return pipe_output
 
@@ -366,7 +479,7 @@ class PipeCondition(PipeController):
         log.verbose(f"PipeCondition: dry run controller pipe: {self.code}")
 
         # 1. Validate that all required inputs are present in the working memory
-        needed_inputs = self.needed_inputs()
+        needed_inputs = get_pipe_library().get_needed_inputs(pipe=self)
         missing_input_names: list[str] = []
 
         for named_input_requirement in needed_inputs.named_input_requirements:
@@ -17,6 +17,8 @@ class PipeConditionBlueprint(PipeBlueprint):
     outcomes: OutcomeMap = Field(default_factory=OutcomeMap)
     default_outcome: str | SpecialOutcome
     add_alias_from_expression_to: str | None = None
+    speculative_branches: int | None = None
+    branch_priors: dict[str, float] | None = None
 
     @property
     @override
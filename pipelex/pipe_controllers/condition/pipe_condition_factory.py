@@ -31,6 +31,7 @@ class PipeConditionFactory(PipeFactoryProtocol[PipeConditionBlueprint, PipeCondi
             domain=domain,
             code=pipe_code,
             description=blueprint.description,
+            timeout=blueprint.timeout,
             inputs=InputRequirementsFactory.make_from_blueprint(
                 domain=domain,
                 blueprint=blueprint.inputs or {},
@@ -47,4 +48,6 @@ class PipeConditionFactory(PipeFactoryProtocol[PipeConditionBlueprint, PipeCondi
             outcome_map=blueprint.outcomes,
             default_outcome=blueprint.default_outcome,
             add_alias_from_expression_to=blueprint.add_alias_from_expression_to,
+            speculative_branches=blueprint.speculative_branches,
+            branch_priors=blueprint.branch_priors,
         )
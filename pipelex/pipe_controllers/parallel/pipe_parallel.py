@@ -21,7 +21,7 @@ from pipelex.exceptions import (
     StaticValidationError,
     StaticValidationErrorType,
 )
-from pipelex.hub import get_pipeline_tracker, get_required_pipe
+from pipelex.hub import get_pipe_library, get_pipeline_tracker, get_required_pipe
 from pipelex.pipe_controllers.pipe_controller import PipeController
 from pipelex.pipe_controllers.sub_pipe import SubPipe
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
@@ -42,6 +42,8 @@ class PipeParallel(PipeController):
     parallel_sub_pipes: list[SubPipe]
     add_each_output: bool
     combined_output: Concept | None
+    # Whether the branches run on the branch executor, e.g. in worker processes, rather than on the event loop
+    offload_branches: bool = False
 
     @field_validator("parallel_sub_pipes", mode="before")
     @classmethod
@@ -66,22 +68,16 @@ class PipeParallel(PipeController):
 
     @override
     def needed_inputs(self, visited_pipes: set[str] | None = None) -> InputRequirements:
-        if visited_pipes is None:
-            visited_pipes = set()
-
         # If we've already visited this pipe, stop recursion
-        if self.code in visited_pipes:
+        if visited_pipes and self.code in visited_pipes:
             return InputRequirementsFactory.make_empty()
 
-        # Add this pipe to visited set for recursive calls
-        visited_pipes_with_current = visited_pipes | {self.code}
-
         needed_inputs = InputRequirementsFactory.make_empty()
 
         for sub_pipe in self.parallel_sub_pipes:
             pipe = get_required_pipe(pipe_code=sub_pipe.pipe_code)
-            # Use the centralized recursion detection
-            pipe_needed_inputs = pipe.needed_inputs(visited_pipes_with_current)
+            # The library memoizes the needed inputs of the sub-pipe and stops at the pipes calling themselves
+            pipe_needed_inputs = get_pipe_library().get_needed_inputs(pipe=pipe)
             if sub_pipe.batch_params:
                 try:
                     requirement = pipe_needed_inputs.get_required_input_requirement(variable_name=sub_pipe.batch_params.input_item_stuff_name)
@@ -196,7 +192,8 @@ class PipeParallel(PipeController):
                     calling_pipe_code=self.code,
                     job_metadata=job_metadata,
                     working_memory=working_memory.make_deep_copy(),
-                    sub_pipe_run_params=pipe_run_params.make_deep_copy(),
+                    sub_pipe_run_params=pipe_run_params.make_step_params(step_name=f"branch-{sub_pipe.output_name}"),
+                    is_offloaded=self.offload_branches,
                 ),
             )
 
@@ -267,7 +264,7 @@ class PipeParallel(PipeController):
             raise PipeRunParamsError(msg)
 
         # 1. Validate that all required inputs are present in the working memory
-        needed_inputs = self.needed_inputs()
+        needed_inputs = get_pipe_library().get_needed_inputs(pipe=self)
         missing_input_names: list[str] = []
         for named_input_requirement in needed_inputs.named_input_requirements:
             if not working_memory.get_optional_stuff(named_input_requirement.variable_name):
@@ -300,7 +297,7 @@ class PipeParallel(PipeController):
                     calling_pipe_code=self.code,
                     job_metadata=job_metadata,
                     working_memory=working_memory.make_deep_copy(),
-                    sub_pipe_run_params=pipe_run_params.make_deep_copy(),
+                    sub_pipe_run_params=pipe_run_params.make_step_params(step_name=f"branch-{sub_pipe.output_name}"),
                 ),
             )
 
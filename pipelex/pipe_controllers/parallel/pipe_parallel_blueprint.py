@@ -16,6 +16,7 @@ class PipeParallelBlueprint(PipeBlueprint):
     parallels: list[SubPipeBlueprint]
     add_each_output: bool = False
     combined_output: str | None = None
+    offload_branches: bool | None = None
 
     @property
     @override
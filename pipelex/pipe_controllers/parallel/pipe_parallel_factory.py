@@ -71,6 +71,7 @@ class PipeParallelFactory(PipeFactoryProtocol[PipeParallelBlueprint, PipeParalle
             domain=domain,
             code=pipe_code,
             description=blueprint.description,
+            timeout=blueprint.timeout,
             inputs=InputRequirementsFactory.make_from_blueprint(
                 domain=domain,
                 blueprint=blueprint.inputs or {},
@@ -85,4 +86,5 @@ class PipeParallelFactory(PipeFactoryProtocol[PipeParallelBlueprint, PipeParalle
             parallel_sub_pipes=parallel_sub_pipes,
             add_each_output=blueprint.add_each_output or False,
             combined_output=combined_output,
+            offload_branches=blueprint.offload_branches or False,
         )
@@ -8,9 +8,13 @@ from pipelex.core.memory.working_memory import WorkingMemory
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.core.pipes.pipe_output import PipeOutput
 from pipelex.exceptions import PipeRunInputsError, WorkingMemoryStuffNotFoundError
+from pipelex.hub import get_metrics, get_pipe_library, get_report_delegate
+from pipelex.pipe_run.pipe_run_cancellation import check_run_cancellation
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.pipe_run.pipe_run_params import PipeRunParams
+from pipelex.pipe_run.pipe_run_timeout import run_within_timeout
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tracing.tracing_utils import start_pipe_span
 
 
 class PipeController(PipeAbstract):
@@ -22,7 +26,7 @@ class PipeController(PipeAbstract):
 
     def _validate_inputs_in_memory(self, working_memory: WorkingMemory) -> None:
         missing_inputs: dict[str, str] = {}
-        for required_stuff_name, requirement in self.needed_inputs().items:
+        for required_stuff_name, requirement in get_pipe_library().get_needed_inputs(pipe=self).items:
             try:
                 working_memory.get_stuff(required_stuff_name)
             except WorkingMemoryStuffNotFoundError as exc:
@@ -45,41 +49,51 @@ class PipeController(PipeAbstract):
         pipe_run_params.push_pipe_to_stack(pipe_code=self.code)
         self.monitor_pipe_stack(pipe_run_params=pipe_run_params)
 
-        updated_metadata = JobMetadata(
-            pipe_job_ids=[self.code],
-        )
-        job_metadata.update(updated_metadata=updated_metadata)
+        job_metadata.add_pipe_job_id(pipe_job_id=self.code)
+        check_run_cancellation(pipeline_run_id=job_metadata.pipeline_run_id, pipe_code=self.code)
 
         # check we have the required inputs in the working memory
         self._validate_inputs_in_memory(working_memory=working_memory)
 
-        match pipe_run_params.run_mode:
-            case PipeRunMode.LIVE:
-                indent_level = len(pipe_run_params.pipe_stack) - 1
-                indent = "   " * indent_level
-                label = (
-                    f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} Running [blue]{self.class_name}[/blue] → [green]{self.code}[/green]"
-                )
-                log.info(f"{label} → [red]{self.output.code}[/red]")
-                pipe_output = await self._run_controller_pipe(
-                    job_metadata=job_metadata,
-                    working_memory=working_memory,
-                    pipe_run_params=pipe_run_params,
-                    output_name=output_name,
-                )
-            case PipeRunMode.DRY:
-                name = f"Dry running [blue]{self.class_name}[/blue]"
-                indent_level = len(pipe_run_params.pipe_stack) - 1
-                indent = "   " * indent_level
-                label = f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} {name}: [green]{self.code}[/green]"
-                log.info(f"{label} → [red]{self.output.code}[/red]")
-                pipe_output = await self._dry_run_controller_pipe(
-                    job_metadata=job_metadata,
-                    working_memory=working_memory,
-                    pipe_run_params=pipe_run_params,
-                    output_name=output_name,
-                )
+        with (
+            start_pipe_span(pipe_code=self.code, pipe_type=self.class_name, job_metadata=job_metadata, pipe_run_params=pipe_run_params),
+            get_metrics().track_pipe_run(pipe_type=self.class_name),
+        ):
+            match pipe_run_params.run_mode:
+                case PipeRunMode.LIVE:
+                    indent_level = pipe_run_params.pipe_stack_depth - 1
+                    indent = "   " * indent_level
+                    name = f"Running [blue]{self.class_name}[/blue]"
+                    label = f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} {name} → [green]{self.code}[/green]"
+                    log.info(f"{label} → [red]{self.output.code}[/red]")
+                    pipe_output = await run_within_timeout(
+                        pipe_code=self.code,
+                        pipe_timeout=self.timeout,
+                        pipe_run=self._run_controller_pipe(
+                            job_metadata=job_metadata,
+                            working_memory=working_memory,
+                            pipe_run_params=pipe_run_params,
+                            output_name=output_name,
+                        ),
+                    )
+                case PipeRunMode.DRY:
+                    name = f"Dry running [blue]{self.class_name}[/blue]"
+                    indent_level = pipe_run_params.pipe_stack_depth - 1
+                    indent = "   " * indent_level
+                    label = f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} {name}: [green]{self.code}[/green]"
+                    log.info(f"{label} → [red]{self.output.code}[/red]")
+                    pipe_output = await self._dry_run_controller_pipe(
+                        job_metadata=job_metadata,
+                        working_memory=working_memory,
+                        pipe_run_params=pipe_run_params,
+                        output_name=output_name,
+                    )
 
+        get_report_delegate().report_working_memory(
+            pipeline_run_id=job_metadata.pipeline_run_id,
+            pipe_code=self.code,
+            working_memory=pipe_output.working_memory,
+        )
         pipe_run_params.pop_pipe_from_stack(pipe_code=self.code)
         return pipe_output
 
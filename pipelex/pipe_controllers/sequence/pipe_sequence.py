@@ -1,11 +1,12 @@
+import asyncio
 from typing import Literal
 
-from pydantic import model_validator
+from pydantic import PrivateAttr, model_validator
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.config import StaticValidationReaction, get_config
-from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.memory.working_memory import MAIN_STUFF_NAME, WorkingMemory
 from pipelex.core.pipes.input_requirements import InputRequirements
 from pipelex.core.pipes.input_requirements_factory import InputRequirementsFactory
 from pipelex.core.pipes.pipe_output import PipeOutput
@@ -17,11 +18,22 @@ from pipelex.exceptions import (
     StaticValidationError,
     StaticValidationErrorType,
 )
-from pipelex.hub import get_concept_library, get_required_pipe
+from pipelex.hub import get_concept_library, get_pipe_library, get_required_pipe
+from pipelex.pipe_controllers.condition.condition_speculation import ConditionSpeculation, set_pending_condition_speculation
+from pipelex.pipe_controllers.condition.pipe_condition import PipeCondition
 from pipelex.pipe_controllers.parallel.pipe_parallel import PipeParallel
 from pipelex.pipe_controllers.pipe_controller import PipeController
+from pipelex.pipe_controllers.sequence.sequence_dataflow import (
+    get_critical_chain_length,
+    get_step_reads,
+    get_step_writes,
+    make_step_dependencies,
+)
 from pipelex.pipe_controllers.sub_pipe import SubPipe
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.pipe_run.pipe_run_params import PipeRunParams
+from pipelex.pipeline.checkpoint.checkpoint_models import WorkingMemoryCheckpoint
+from pipelex.pipeline.checkpoint.checkpointing import is_checkpointing_active, load_checkpoint, make_checkpoint_key, save_checkpoint
 from pipelex.pipeline.job_metadata import JobMetadata
 from pipelex.types import Self
 
@@ -29,26 +41,23 @@ from pipelex.types import Self
 class PipeSequence(PipeController):
     type: Literal["PipeSequence"] = "PipeSequence"
     sequential_sub_pipes: list[SubPipe]
+    parallelize_independent_steps: bool = False
+
+    _step_dependencies: list[frozenset[int]] | None = PrivateAttr(default=None)
 
     @override
     def needed_inputs(self, visited_pipes: set[str] | None = None) -> InputRequirements:
-        if visited_pipes is None:
-            visited_pipes = set()
-
         # If we've already visited this pipe, stop recursion
-        if self.code in visited_pipes:
+        if visited_pipes and self.code in visited_pipes:
             return InputRequirementsFactory.make_empty()
 
-        # Add this pipe to visited set for recursive calls
-        visited_pipes_with_current = visited_pipes | {self.code}
-
         needed_inputs = InputRequirementsFactory.make_empty()
         generated_outputs: set[str] = set()
 
         for sequential_sub_pipe in self.sequential_sub_pipes:
             sub_pipe = get_required_pipe(pipe_code=sequential_sub_pipe.pipe_code)
-            # Use the centralized recursion detection
-            sub_pipe_needed_inputs = sub_pipe.needed_inputs(visited_pipes_with_current)
+            # The library memoizes the needed inputs of the sub-pipe and stops at the pipes calling themselves
+            sub_pipe_needed_inputs = get_pipe_library().get_needed_inputs(pipe=sub_pipe)
 
             if isinstance(sub_pipe, PipeParallel) and sub_pipe.add_each_output:
                 for sub_parallel_pipe in sub_pipe.parallel_sub_pipes:
@@ -173,6 +182,25 @@ of sequence pipe '{self.code}' is not compatible with the output concept '{self.
         This is called after all pipes and concepts are available.
         """
         self._validate_inputs()
+        if self.parallelize_independent_steps:
+            self._step_dependencies = self._make_step_dependencies()
+
+    def _make_step_dependencies(self) -> list[frozenset[int]]:
+        step_dependencies = make_step_dependencies(
+            step_reads=[get_step_reads(sub_pipe=sub_pipe) for sub_pipe in self.sequential_sub_pipes],
+            step_writes=[get_step_writes(sub_pipe=sub_pipe) for sub_pipe in self.sequential_sub_pipes],
+            input_names=set(self.inputs.variables),
+        )
+        log.verbose(
+            f"PipeSequence '{self.code}' dataflow: {len(step_dependencies)} steps "
+            f"in a critical chain of {get_critical_chain_length(step_dependencies)} steps"
+        )
+        return step_dependencies
+
+    def _get_step_dependencies(self) -> list[frozenset[int]]:
+        if self._step_dependencies is None:
+            self._step_dependencies = self._make_step_dependencies()
+        return self._step_dependencies
 
     @override
     def pipe_dependencies(self) -> set[str]:
@@ -189,26 +217,178 @@ of sequence pipe '{self.code}' is not compatible with the output concept '{self.
         pipe_run_params.push_pipe_layer(pipe_code=self.code)
         self._validate_output_multiplicity_support(pipe_run_params)
 
-        evolving_memory = working_memory
-
-        for sub_pipe_index, sub_pipe in enumerate(self.sequential_sub_pipes):
-            # Only the last step should apply the final_stuff_code
-            if sub_pipe_index == len(self.sequential_sub_pipes) - 1:
-                sub_pipe_run_params = pipe_run_params.model_copy()
-            else:
-                sub_pipe_run_params = pipe_run_params.model_copy(update=({"final_stuff_code": None}))
-            pipe_output = await sub_pipe.run_pipe(
-                calling_pipe_code=self.code,
-                working_memory=evolving_memory,
+        if self.parallelize_independent_steps and len(self.sequential_sub_pipes) > 1:
+            await self._run_steps_in_dataflow(
                 job_metadata=job_metadata,
-                sub_pipe_run_params=sub_pipe_run_params,
+                working_memory=working_memory,
+                pipe_run_params=pipe_run_params,
+            )
+            return PipeOutput(
+                working_memory=working_memory,
+                pipeline_run_id=job_metadata.pipeline_run_id,
             )
-            evolving_memory = pipe_output.working_memory
+
+        evolving_memory = working_memory
+        condition_speculation: ConditionSpeculation | None = None
+        try:
+            for step_index in range(len(self.sequential_sub_pipes)):
+                pending_condition_speculation = condition_speculation
+                # The likely branches of a speculative PipeCondition start along with the step before it
+                condition_speculation = self._start_condition_speculation(
+                    step_index=step_index + 1,
+                    job_metadata=job_metadata,
+                    working_memory=evolving_memory,
+                    pipe_run_params=pipe_run_params,
+                )
+                with set_pending_condition_speculation(condition_speculation=pending_condition_speculation):
+                    evolving_memory = await self._run_step(
+                        step_index=step_index,
+                        job_metadata=job_metadata,
+                        working_memory=evolving_memory,
+                        pipe_run_params=pipe_run_params,
+                    )
+        finally:
+            if condition_speculation:
+                condition_speculation.cancel()
         return PipeOutput(
             working_memory=evolving_memory,
             pipeline_run_id=job_metadata.pipeline_run_id,
         )
 
+    def _make_step_run_params(self, step_index: int, pipe_run_params: PipeRunParams) -> PipeRunParams:
+        step_run_params = pipe_run_params.make_step_params(step_name=f"step-{step_index}")
+        # Only the last step should apply the final_stuff_code
+        if step_index < len(self.sequential_sub_pipes) - 1:
+            step_run_params.final_stuff_code = None
+        return step_run_params
+
+    def _start_condition_speculation(
+        self,
+        step_index: int,
+        job_metadata: JobMetadata,
+        working_memory: WorkingMemory,
+        pipe_run_params: PipeRunParams,
+    ) -> ConditionSpeculation | None:
+        """Start the likely branches of the step, if it is a speculative PipeCondition coming after another step."""
+        if step_index < 1 or step_index >= len(self.sequential_sub_pipes) or pipe_run_params.run_mode != PipeRunMode.LIVE:
+            return None
+        sub_pipe = self.sequential_sub_pipes[step_index]
+        pipe_condition = get_required_pipe(pipe_code=sub_pipe.pipe_code)
+        if sub_pipe.batch_params or not isinstance(pipe_condition, PipeCondition) or not pipe_condition.speculative_branches:
+            return None
+        condition_run_params = self._make_step_run_params(step_index=step_index, pipe_run_params=pipe_run_params)
+        if sub_pipe.output_multiplicity:
+            condition_run_params.output_multiplicity = sub_pipe.output_multiplicity
+        return pipe_condition.start_speculative_branches(
+            job_metadata=job_metadata,
+            working_memory=working_memory,
+            pipe_run_params=condition_run_params,
+            output_name=sub_pipe.output_name,
+        )
+
+    async def _run_step(
+        self,
+        step_index: int,
+        job_metadata: JobMetadata,
+        working_memory: WorkingMemory,
+        pipe_run_params: PipeRunParams,
+    ) -> WorkingMemory:
+        """Run a step, or replay its checkpoint if it already completed in a previous attempt of this pipeline run."""
+        sub_pipe_run_params = self._make_step_run_params(step_index=step_index, pipe_run_params=pipe_run_params)
+
+        checkpoint_key: str | None = None
+        if is_checkpointing_active(pipe_run_params=pipe_run_params):
+            checkpoint_key = make_checkpoint_key(pipe_run_params=pipe_run_params, step_name=f"step-{step_index}")
+            if pipe_run_params.is_resumed and (
+                checkpoint := load_checkpoint(
+                    pipeline_run_id=job_metadata.pipeline_run_id,
+                    checkpoint_key=checkpoint_key,
+                    checkpoint_class=WorkingMemoryCheckpoint,
+                )
+            ):
+                log.verbose(f"PipeSequence '{self.code}': step {step_index} restored from checkpoint '{checkpoint_key}'")
+                checkpoint.apply_to(working_memory=working_memory)
+                return working_memory
+
+        stuffs_before = dict(working_memory.root)
+        pipe_output = await self.sequential_sub_pipes[step_index].run_pipe(
+            calling_pipe_code=self.code,
+            working_memory=working_memory,
+            job_metadata=job_metadata,
+            sub_pipe_run_params=sub_pipe_run_params,
+        )
+        if checkpoint_key:
+            save_checkpoint(
+                pipeline_run_id=job_metadata.pipeline_run_id,
+                checkpoint_key=checkpoint_key,
+                checkpoint=WorkingMemoryCheckpoint.make_from_changes(stuffs_before=stuffs_before, working_memory=pipe_output.working_memory),
+            )
+        return pipe_output.working_memory
+
+    async def _run_steps_in_dataflow(
+        self,
+        job_metadata: JobMetadata,
+        working_memory: WorkingMemory,
+        pipe_run_params: PipeRunParams,
+    ) -> None:
+        """Run each step as soon as the steps it depends on are done, and merge their outputs into the working memory.
+
+        Each step runs on a shallow copy of the working memory taken when it starts. The stuffs it adds are merged back
+        unless a step declared after it already set the same name, so the working memory ends up as in a sequential run.
+        """
+        step_dependencies = self._get_step_dependencies()
+        last_step_index = len(self.sequential_sub_pipes) - 1
+        stuff_writers: dict[str, int] = {}
+        step_tasks: list[asyncio.Task[WorkingMemory]] = []
+
+        async def run_step(step_index: int) -> WorkingMemory:
+            # The likely branches of a speculative PipeCondition start while it waits for the steps it depends on
+            condition_speculation = (
+                self._start_condition_speculation(
+                    step_index=step_index,
+                    job_metadata=job_metadata,
+                    working_memory=working_memory,
+                    pipe_run_params=pipe_run_params,
+                )
+                if step_dependencies[step_index]
+                else None
+            )
+            with set_pending_condition_speculation(condition_speculation=condition_speculation):
+                await asyncio.gather(*(step_tasks[dependency] for dependency in step_dependencies[step_index]))
+                step_memory = await self._run_step(
+                    step_index=step_index,
+                    job_metadata=job_metadata,
+                    working_memory=working_memory.make_shallow_copy(),
+                    pipe_run_params=pipe_run_params,
+                )
+            for name, stuff in step_memory.root.items():
+                if name == MAIN_STUFF_NAME or working_memory.root.get(name) is stuff or stuff_writers.get(name, -1) > step_index:
+                    continue
+                working_memory.set_stuff(name=name, stuff=stuff)
+                stuff_writers[name] = step_index
+            for alias, target in step_memory.aliases.items():
+                if alias != MAIN_STUFF_NAME and target in working_memory.root:
+                    working_memory.aliases[alias] = target
+            return step_memory
+
+        for step_index in range(len(self.sequential_sub_pipes)):
+            step_tasks.append(asyncio.create_task(run_step(step_index=step_index)))
+        try:
+            step_memories = await asyncio.gather(*step_tasks)
+        except BaseException:
+            for step_task in step_tasks:
+                step_task.cancel()
+            raise
+
+        # The main stuff of the sequence is the main stuff of its last step
+        last_step_memory = step_memories[last_step_index]
+        if main_stuff_target := last_step_memory.aliases.get(MAIN_STUFF_NAME):
+            working_memory.remove_main_stuff()
+            working_memory.set_alias(alias=MAIN_STUFF_NAME, target=main_stuff_target)
+        elif main_stuff := last_step_memory.root.get(MAIN_STUFF_NAME):
+            working_memory.remove_alias_to_main_stuff()
+            working_memory.set_stuff(name=MAIN_STUFF_NAME, stuff=main_stuff)
+
     @override
     async def _dry_run_controller_pipe(
         self,
@@ -10,6 +10,7 @@ class PipeSequenceBlueprint(PipeBlueprint):
     type: Literal["PipeSequence"] = "PipeSequence"
     pipe_category: Literal["PipeController"] = "PipeController"
     steps: list[SubPipeBlueprint]
+    parallelize_independent_steps: bool = False
 
     @property
     @override
@@ -32,6 +32,7 @@ class PipeSequenceFactory(PipeFactoryProtocol[PipeSequenceBlueprint, PipeSequenc
             domain=domain,
             code=pipe_code,
             description=blueprint.description,
+            timeout=blueprint.timeout,
             inputs=InputRequirementsFactory.make_from_blueprint(
                 domain=domain,
                 blueprint=blueprint.inputs or {},
@@ -47,4 +48,5 @@ class PipeSequenceFactory(PipeFactoryProtocol[PipeSequenceBlueprint, PipeSequenc
                 SubPipeFactory.make_from_blueprint(blueprint=step, concept_codes_from_the_same_domain=concept_codes_from_the_same_domain)
                 for step in blueprint.steps
             ],
+            parallelize_independent_steps=blueprint.parallelize_independent_steps,
         )
@@ -0,0 +1,69 @@
+from collections.abc import Sequence
+
+from pipelex.hub import get_pipe_library, get_required_pipe
+from pipelex.pipe_controllers.parallel.pipe_parallel import PipeParallel
+from pipelex.pipe_controllers.sub_pipe import SubPipe
+
+
+def get_step_reads(sub_pipe: SubPipe) -> set[str]:
+    """Return the names of the stuffs that a step reads from the working memory."""
+    pipe = get_required_pipe(pipe_code=sub_pipe.pipe_code)
+    step_reads = set(get_pipe_library().get_needed_inputs(pipe=pipe).required_names)
+    if batch_params := sub_pipe.batch_params:
+        step_reads.discard(batch_params.input_item_stuff_name)
+        step_reads.add(batch_params.input_list_stuff_name)
+    return step_reads
+
+
+def get_step_writes(sub_pipe: SubPipe) -> set[str]:
+    """Return the names of the stuffs that a step is known to add to the working memory."""
+    step_writes: set[str] = set()
+    if sub_pipe.output_name:
+        step_writes.add(sub_pipe.output_name)
+    pipe = get_required_pipe(pipe_code=sub_pipe.pipe_code)
+    if isinstance(pipe, PipeParallel) and pipe.add_each_output:
+        step_writes.update(parallel_sub_pipe.output_name for parallel_sub_pipe in pipe.parallel_sub_pipes if parallel_sub_pipe.output_name)
+    return step_writes
+
+
+def make_step_dependencies(
+    step_reads: Sequence[set[str]],
+    step_writes: Sequence[set[str]],
+    input_names: set[str],
+) -> list[frozenset[int]]:
+    """Compute, for each step of a sequence, the indexes of the earlier steps it must wait for.
+
+    A step waits for the last earlier step that writes each name it reads, and for the earlier steps that read or write
+    a name it writes, so that every step sees the same stuffs as when the steps run one after another.
+    A step reading a name that is neither an input of the sequence nor written by an earlier step might read
+    a stuff added along the way by a nested pipe, so it waits for all the earlier steps.
+    """
+    step_dependencies: list[frozenset[int]] = []
+    last_writers: dict[str, int] = {}
+    readers: dict[str, list[int]] = {}
+    for step_index, (reads, writes) in enumerate(zip(step_reads, step_writes, strict=True)):
+        dependencies: set[int] = set()
+        for name in reads:
+            if (last_writer := last_writers.get(name)) is not None:
+                dependencies.add(last_writer)
+            elif name not in input_names:
+                dependencies.update(range(step_index))
+        for name in writes:
+            if (last_writer := last_writers.get(name)) is not None:
+                dependencies.add(last_writer)
+            dependencies.update(readers.get(name, []))
+        dependencies.discard(step_index)
+        step_dependencies.append(frozenset(dependencies))
+        for name in reads:
+            readers.setdefault(name, []).append(step_index)
+        for name in writes:
+            last_writers[name] = step_index
+    return step_dependencies
+
+
+def get_critical_chain_length(step_dependencies: Sequence[frozenset[int]]) -> int:
+    """Return the number of steps in the longest chain of dependent steps."""
+    chain_lengths: list[int] = []
+    for dependencies in step_dependencies:
+        chain_lengths.append(1 + max((chain_lengths[dependency] for dependency in dependencies), default=0))
+    return max(chain_lengths, default=0)
@@ -6,12 +6,14 @@ from pipelex.core.pipes.pipe_output import PipeOutput
 from pipelex.core.pipes.variable_multiplicity import VariableMultiplicity
 from pipelex.core.stuffs.list_content import ListContent
 from pipelex.exceptions import PipeInputError, PipeInputNotFoundError, WorkingMemoryStuffNotFoundError
-from pipelex.hub import get_pipeline_tracker, get_required_pipe
+from pipelex.hub import get_pipe_library, get_pipeline_tracker, get_required_pipe
 from pipelex.pipe_controllers.batch.pipe_batch_blueprint import PipeBatchBlueprint
 from pipelex.pipe_controllers.batch.pipe_batch_factory import PipeBatchFactory
 from pipelex.pipe_controllers.condition.pipe_condition import PipeCondition
 from pipelex.pipe_run.pipe_run_params import BatchParams, PipeRunParams
+from pipelex.pipeline.branch_executor.branch_offloading import run_branch_pipe
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.track.step_timing import run_timed_step
 
 
 class SubPipe(BaseModel):
@@ -27,8 +29,9 @@ class SubPipe(BaseModel):
         working_memory: WorkingMemory,
         job_metadata: JobMetadata,
         sub_pipe_run_params: PipeRunParams,
+        is_offloaded: bool = False,
     ) -> PipeOutput:
-        """Run or dry run a single operation self."""
+        """Run or dry run a single operation self, offloaded to the branch executor if is_offloaded, for a plain pipe."""
         if self.output_multiplicity:
             sub_pipe_run_params.output_multiplicity = self.output_multiplicity
         sub_pipe_run_params.batch_params = self.batch_params
@@ -64,6 +67,11 @@ class SubPipe(BaseModel):
                 output=sub_pipe.output.code,
                 input_list_name=batch_params.input_list_stuff_name,
                 input_item_name=batch_params.input_item_stuff_name,
+                error_mode=batch_params.error_mode,
+                nb_item_retries=batch_params.nb_item_retries,
+                item_retry_delay=batch_params.item_retry_delay,
+                llm_pack_size=batch_params.llm_pack_size,
+                offload_branches=batch_params.offload_branches,
                 inputs={
                     batch_params.input_list_stuff_name: item_stuff_requirement.concept.concept_string,
                 },
@@ -91,7 +99,7 @@ class SubPipe(BaseModel):
             )
         else:
             # Case 3: Normal processing
-            required_variables = sub_pipe.required_variables()
+            required_variables = get_pipe_library().get_required_variables(pipe=sub_pipe)
             required_stuff_names = {req_var for req_var in required_variables if not req_var.startswith("_")}
             try:
                 required_stuffs = working_memory.get_stuffs(names=required_stuff_names)
@@ -102,11 +110,16 @@ class SubPipe(BaseModel):
                 msg = f"Some required stuff(s) not found: {error_details}"
                 raise PipeInputError(message=msg, pipe_code=self.pipe_code, variable_name=exc.variable_name, concept_code=None) from exc
             log.verbose(required_stuffs, title=f"Required stuffs for {self.pipe_code}")
-            pipe_output = await sub_pipe.run_pipe(
-                job_metadata=job_metadata,
-                working_memory=working_memory,
-                pipe_run_params=sub_pipe_run_params,
-                output_name=self.output_name,
+            pipe_output, step_timing = await run_timed_step(
+                step=run_branch_pipe(
+                    sub_pipe=sub_pipe,
+                    job_metadata=job_metadata,
+                    working_memory=working_memory,
+                    pipe_run_params=sub_pipe_run_params,
+                    output_name=self.output_name,
+                    is_offloaded=is_offloaded,
+                ),
+                pipe_stack=sub_pipe_run_params.pipe_stack,
             )
             if new_output_stuff := pipe_output.working_memory.get_optional_main_stuff():
                 for stuff in required_stuffs:
@@ -116,5 +129,6 @@ class SubPipe(BaseModel):
                         pipe_code=self.pipe_code,
                         pipe_layer=sub_pipe_run_params.pipe_layers,
                         comment="SubPipe on required_stuff",
+                        step_timing=step_timing,
                     )
         return pipe_output
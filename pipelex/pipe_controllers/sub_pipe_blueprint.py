@@ -1,6 +1,7 @@
 from pydantic import BaseModel, ConfigDict, model_validator
 
 from pipelex.core.pipe_errors import PipeDefinitionError
+from pipelex.pipe_run.batch_error_mode import BatchErrorMode
 from pipelex.tools.typing.validation_utils import has_more_than_one_among_attributes_from_list
 from pipelex.types import Self
 
@@ -14,6 +15,11 @@ class SubPipeBlueprint(BaseModel):
     multiple_output: bool | None = None
     batch_over: str | None = None
     batch_as: str | None = None
+    batch_error_mode: BatchErrorMode | None = None
+    batch_nb_item_retries: int | None = None
+    batch_item_retry_delay: float | None = None
+    batch_llm_pack_size: int | None = None
+    batch_offload_branches: bool | None = None
 
     @model_validator(mode="after")
     def validate_multiple_output(self) -> Self:
@@ -32,4 +38,15 @@ class SubPipeBlueprint(BaseModel):
             msg = f"In pipe '{self.pipe}': When 'batch_as' is specified, 'batch_over' must also be provided"
             raise PipeDefinitionError(msg)
 
+        batch_options = [
+            self.batch_error_mode,
+            self.batch_nb_item_retries,
+            self.batch_item_retry_delay,
+            self.batch_llm_pack_size,
+            self.batch_offload_branches,
+        ]
+        if not self.batch_over and any(option is not None for option in batch_options):
+            msg = f"In pipe '{self.pipe}': The batch options can only be specified along with 'batch_over'"
+            raise PipeDefinitionError(msg)
+
         return self
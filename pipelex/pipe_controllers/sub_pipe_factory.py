@@ -21,6 +21,11 @@ class SubPipeFactory:
             batch_params = BatchParams.make_batch_params(
                 input_list_name=blueprint.batch_over,
                 input_item_name=blueprint.batch_as,
+                error_mode=blueprint.batch_error_mode,
+                nb_item_retries=blueprint.batch_nb_item_retries,
+                item_retry_delay=blueprint.batch_item_retry_delay,
+                llm_pack_size=blueprint.batch_llm_pack_size,
+                offload_branches=blueprint.batch_offload_branches,
             )
         else:
             batch_params = None
@@ -41,6 +41,7 @@ class PipeComposeFactory(PipeFactoryProtocol[PipeComposeBlueprint, PipeCompose])
             domain=domain,
             code=pipe_code,
             description=blueprint.description,
+            timeout=blueprint.timeout,
             inputs=InputRequirementsFactory.make_from_blueprint(
                 domain=domain,
                 blueprint=blueprint.inputs or {},
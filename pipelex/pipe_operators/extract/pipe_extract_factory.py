@@ -33,6 +33,7 @@ class PipeExtractFactory(PipeFactoryProtocol[PipeExtractBlueprint, PipeExtract])
             domain=domain,
             code=pipe_code,
             description=blueprint.description,
+            timeout=blueprint.timeout,
             output=get_required_concept(
                 concept_string=ConceptFactory.make_concept_string_with_domain(
                     domain=output_domain_and_code.domain,
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Literal, cast, get_type_hints
+from typing import ClassVar, Literal, cast, get_type_hints
 
 from pydantic import field_validator
 from typing_extensions import override
@@ -29,6 +29,8 @@ class PipeFuncOutput(PipeOutput):
 class PipeFunc(PipeOperator[PipeFuncOutput]):
     type: Literal["PipeFunc"] = "PipeFunc"
     function_name: str
+    # The function may have side effects, so it runs every time
+    is_deduplicable: ClassVar[bool] = False
 
     @field_validator("function_name", mode="before")
     @classmethod
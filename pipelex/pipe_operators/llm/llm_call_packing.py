@@ -0,0 +1,191 @@
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pipelex import log
+from pipelex.cogt.content_generation.content_generator_protocol import ContentGeneratorProtocol
+from pipelex.cogt.exceptions import LLMCompletionError
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_setting import LLMSetting
+from pipelex.core.stuffs.stuff_content import StuffContent
+from pipelex.pipeline.job_metadata import JobMetadata
+
+# How long a pack waits for more calls before it is sent with the calls it has
+DEFAULT_PACK_MAX_WAIT = 0.05
+
+
+def make_packed_llm_prompt(llm_prompts: list[LLMPrompt]) -> LLMPrompt:
+    """Make a single prompt asking for the result of each of the prompts of a pack, in order.
+
+    The prompts of a pack share their system text, which is sent once.
+    """
+    nb_tasks = len(llm_prompts)
+    packed_user_text = (
+        f"Perform the following {nb_tasks} independent tasks. Each task is complete on its own: don't let a task influence another.\n"
+        f"Return a list of exactly {nb_tasks} results, the result of each task at the same position as the task, in the same order.\n"
+    )
+    for task_index, llm_prompt in enumerate(llm_prompts):
+        packed_user_text += f"\n# Task {task_index + 1}\n\n{llm_prompt.user_text}\n"
+    return LLMPrompt(system_text=llm_prompts[0].system_text, user_text=packed_user_text)
+
+
+class _PackedCall:
+    def __init__(self, llm_prompt: LLMPrompt, future: "asyncio.Future[StuffContent | None]"):
+        self.llm_prompt = llm_prompt
+        self.future = future
+
+
+class _Pack:
+    def __init__(
+        self,
+        job_metadata: JobMetadata,
+        object_class: type[StuffContent],
+        llm_setting: LLMSetting,
+        content_generator: ContentGeneratorProtocol,
+    ):
+        self.job_metadata = job_metadata
+        self.object_class = object_class
+        self.llm_setting = llm_setting
+        self.content_generator = content_generator
+        self.packed_calls: list[_PackedCall] = []
+        self.flush_timer: asyncio.TimerHandle | None = None
+
+
+class LLMCallPacker:
+    """Packs the concurrent calls of a PipeLLM generating single objects into LLM calls generating a list of objects.
+
+    The calls that would send the same system text to the same LLM for the same output class are packed together,
+    up to pack_size calls, or fewer if no other call comes within max_wait seconds. Each pack is sent as a single
+    prompt listing its calls as numbered tasks, and asking for the list of their results.
+
+    If the LLM call of a pack fails or returns a list of the wrong length, the pack is not used: each of its calls
+    gets None, and runs on its own.
+    """
+
+    def __init__(self, pack_size: int, max_wait: float = DEFAULT_PACK_MAX_WAIT):
+        if pack_size < 1:
+            msg = f"pack_size must be at least 1, got {pack_size}"
+            raise ValueError(msg)
+        self.pack_size = pack_size
+        self.max_wait = max_wait
+        self._pending_packs: dict[str, _Pack] = {}
+        # Strong references to the running packs, so that they are not garbage collected
+        self._pack_tasks: set[asyncio.Task[None]] = set()
+        self.nb_packed_llm_calls = 0
+        self.nb_fallbacks = 0
+
+    @staticmethod
+    def can_pack(llm_prompt: LLMPrompt) -> bool:
+        return not llm_prompt.user_images
+
+    async def make_object_direct(
+        self,
+        pack_key: str,
+        job_metadata: JobMetadata,
+        object_class: type[StuffContent],
+        llm_setting: LLMSetting,
+        llm_prompt: LLMPrompt,
+        content_generator: ContentGeneratorProtocol,
+    ) -> StuffContent | None:
+        """Generate the object of a call within a pack, or return None if the call must run on its own."""
+        if self.pack_size < 2 or not self.can_pack(llm_prompt=llm_prompt):
+            return None
+        pack_key = f"{pack_key}|{object_class.__name__}|{llm_setting.model_dump_json()}|{llm_prompt.system_text}"
+        pack = self._pending_packs.get(pack_key)
+        if pack is None:
+            pack = _Pack(job_metadata=job_metadata, object_class=object_class, llm_setting=llm_setting, content_generator=content_generator)
+            self._pending_packs[pack_key] = pack
+            pack.flush_timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush_pack, pack_key, pack)
+        future: asyncio.Future[StuffContent | None] = asyncio.get_running_loop().create_future()
+        pack.packed_calls.append(_PackedCall(llm_prompt=llm_prompt, future=future))
+        if len(pack.packed_calls) >= self.pack_size:
+            self._flush_pack(pack_key=pack_key, pack=pack)
+        return await future
+
+    def _flush_pack(self, pack_key: str, pack: _Pack):
+        if self._pending_packs.get(pack_key) is not pack:
+            return
+        del self._pending_packs[pack_key]
+        if pack.flush_timer:
+            pack.flush_timer.cancel()
+        pack_task = asyncio.create_task(self._run_pack(pack=pack))
+        self._pack_tasks.add(pack_task)
+        pack_task.add_done_callback(self._pack_tasks.discard)
+
+    async def _run_pack(self, pack: _Pack):
+        # The calls cancelled while waiting for their pack are left out
+        packed_calls = [packed_call for packed_call in pack.packed_calls if not packed_call.future.done()]
+        if len(packed_calls) < 2:
+            # Nothing to gain from packing a single call
+            self._resolve_calls(packed_calls=packed_calls, generated_objects=None)
+            return
+        try:
+            generated_objects = await pack.content_generator.make_object_list_direct(
+                job_metadata=pack.job_metadata,
+                object_class=pack.object_class,
+                llm_setting_for_object_list=pack.llm_setting,
+                llm_prompt_for_object_list=make_packed_llm_prompt(llm_prompts=[packed_call.llm_prompt for packed_call in packed_calls]),
+                nb_items=len(packed_calls),
+            )
+        except LLMCompletionError as exc:
+            log.warning(f"Packed LLM call of {len(packed_calls)} '{pack.object_class.__name__}' failed, running them one by one: {exc}")
+            self._resolve_calls(packed_calls=packed_calls, generated_objects=None)
+            return
+        except BaseException as exc:
+            for packed_call in packed_calls:
+                if not packed_call.future.done():
+                    packed_call.future.set_exception(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return
+
+        if len(generated_objects) != len(packed_calls):
+            log.warning(
+                f"Packed LLM call of {len(packed_calls)} '{pack.object_class.__name__}' returned {len(generated_objects)} objects, "
+                "running them one by one"
+            )
+            self._resolve_calls(packed_calls=packed_calls, generated_objects=None)
+            return
+        self.nb_packed_llm_calls += 1
+        self._resolve_calls(packed_calls=packed_calls, generated_objects=generated_objects)
+
+    def close(self):
+        """Cancel the packs still pending or running, whose calls were cancelled, e.g. along with their pipeline run."""
+        for pack in self._pending_packs.values():
+            if pack.flush_timer:
+                pack.flush_timer.cancel()
+        self._pending_packs.clear()
+        for pack_task in list(self._pack_tasks):
+            pack_task.cancel()
+
+    def _resolve_calls(self, packed_calls: list[_PackedCall], generated_objects: list[StuffContent] | None):
+        if generated_objects is None:
+            self.nb_fallbacks += len(packed_calls)
+        for call_index, packed_call in enumerate(packed_calls):
+            if not packed_call.future.done():
+                packed_call.future.set_result(generated_objects[call_index] if generated_objects is not None else None)
+
+
+# The packer of the running batch is a context variable, so that it is seen by the PipeLLMs of all the branches of that batch,
+# which run as separate asyncio tasks, however deep in the branch pipe
+_current_llm_call_packer: ContextVar[LLMCallPacker | None] = ContextVar("pipelex_current_llm_call_packer", default=None)
+
+
+def get_current_llm_call_packer() -> LLMCallPacker | None:
+    return _current_llm_call_packer.get()
+
+
+@contextmanager
+def pack_llm_calls(pack_size: int | None) -> Generator[None, None, None]:
+    """Pack the LLM calls generating single objects within this context, by pack_size calls, if set."""
+    if not pack_size or pack_size < 2:
+        yield
+        return
+    llm_call_packer = LLMCallPacker(pack_size=pack_size)
+    token = _current_llm_call_packer.set(llm_call_packer)
+    try:
+        yield
+    finally:
+        _current_llm_call_packer.reset(token)
+        llm_call_packer.close()
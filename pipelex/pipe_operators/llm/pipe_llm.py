@@ -40,6 +40,7 @@ from pipelex.hub import (
     get_native_concept,
     get_required_concept,
 )
+from pipelex.pipe_operators.llm.llm_call_packing import get_current_llm_call_packer
 from pipelex.pipe_operators.llm.llm_prompt_blueprint import LLMPromptBlueprint
 from pipelex.pipe_operators.llm.pipe_llm_blueprint import StructuringMethod
 from pipelex.pipe_operators.pipe_operator import PipeOperator
@@ -423,12 +424,26 @@ class PipeLLM(PipeOperator[PipeLLMOutput]):
                 method_desc = "object_direct"
                 log.verbose(f"{task_desc} by {method_desc}, content_class={content_class.__name__}")
                 try:
-                    generated_object = await content_generator.make_object_direct(
-                        job_metadata=job_metadata,
-                        object_class=content_class,
-                        llm_prompt_for_object=llm_prompt_1,
-                        llm_setting_for_object=llm_setting_for_object,
-                    )
+                    packed_object: StuffContent | None = None
+                    if llm_call_packer := get_current_llm_call_packer():
+                        # Within a batch packing its LLM calls, the object may be generated along with those of other items
+                        packed_object = await llm_call_packer.make_object_direct(
+                            pack_key=self.code,
+                            job_metadata=job_metadata,
+                            object_class=content_class,
+                            llm_setting=llm_setting_for_object,
+                            llm_prompt=llm_prompt_1,
+                            content_generator=content_generator,
+                        )
+                    if packed_object is not None:
+                        generated_object = packed_object
+                    else:
+                        generated_object = await content_generator.make_object_direct(
+                            job_metadata=job_metadata,
+                            object_class=content_class,
+                            llm_prompt_for_object=llm_prompt_1,
+                            llm_setting_for_object=llm_setting_for_object,
+                        )
                 except LLMCompletionError as exc:
                     location = self._format_error_location(pipe_run_params=pipe_run_params)
                     msg = f"Error generating single object with direct method {location}: {exc}"
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Generic, Literal, TypeVar
+from typing import ClassVar, Generic, Literal, TypeVar
 
 from typing_extensions import override
 
@@ -7,16 +7,26 @@ from pipelex import log, pretty_print_md
 from pipelex.core.memory.working_memory import WorkingMemory
 from pipelex.core.pipes.pipe_abstract import PipeAbstract
 from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_factory import StuffFactory
 from pipelex.core.stuffs.text_content import TextContent
+from pipelex.hub import get_metrics, get_pipe_library, get_pipeline_tracker, get_report_delegate
+from pipelex.pipe_run.pipe_run_cancellation import check_run_cancellation
+from pipelex.pipe_run.pipe_run_dedup import get_current_pipe_run_deduplicator, make_pipe_run_dedup_key
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.pipe_run.pipe_run_params import PipeRunParams
+from pipelex.pipe_run.pipe_run_timeout import run_within_timeout
+from pipelex.pipe_run.pipe_stack_context import set_current_pipe_stack
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tracing.tracing_utils import start_pipe_span
 
 PipeOperatorOutputType = TypeVar("PipeOperatorOutputType", bound=PipeOutput)
 
 
 class PipeOperator(PipeAbstract, Generic[PipeOperatorOutputType]):
     pipe_category: Literal["PipeOperator"] = "PipeOperator"
+    # Whether the runs of this pipe on the same inputs can share one output, when pipe run deduplication is enabled
+    is_deduplicable: ClassVar[bool] = True
 
     @property
     def class_name(self) -> str:
@@ -34,50 +44,121 @@ class PipeOperator(PipeAbstract, Generic[PipeOperatorOutputType]):
         pipe_run_params.push_pipe_to_stack(pipe_code=self.code)
         self.monitor_pipe_stack(pipe_run_params=pipe_run_params)
 
-        updated_metadata = JobMetadata(
-            pipe_job_ids=[self.code],
-        )
-        job_metadata.update(updated_metadata=updated_metadata)
+        job_metadata.add_pipe_job_id(pipe_job_id=self.code)
+        check_run_cancellation(pipeline_run_id=job_metadata.pipeline_run_id, pipe_code=self.code)
 
-        match pipe_run_params.run_mode:
-            case PipeRunMode.LIVE:
-                if self.class_name not in ["PipeCompose", "PipeLLMPrompt"]:
-                    name = f"Running [cyan]{self.class_name}[/cyan]"
-                    indent_level = len(pipe_run_params.pipe_stack) - 1
+        with (
+            start_pipe_span(pipe_code=self.code, pipe_type=self.class_name, job_metadata=job_metadata, pipe_run_params=pipe_run_params),
+            get_metrics().track_pipe_run(pipe_type=self.class_name),
+            set_current_pipe_stack(pipe_stack=pipe_run_params.pipe_stack),
+        ):
+            match pipe_run_params.run_mode:
+                case PipeRunMode.LIVE:
+                    if self.class_name not in ["PipeCompose", "PipeLLMPrompt"]:
+                        name = f"Running [cyan]{self.class_name}[/cyan]"
+                        indent_level = pipe_run_params.pipe_stack_depth - 1
+                        indent = "   " * indent_level
+                        label = f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} {name} → [green]{self.code}[/green]"
+                        log.info(f"{label} → [red]{self.output.code}[/red]")
+                    pipe_output = await run_within_timeout(
+                        pipe_code=self.code,
+                        pipe_timeout=self.timeout,
+                        pipe_run=self._run_live_operator_pipe(
+                            job_metadata=job_metadata,
+                            working_memory=working_memory,
+                            pipe_run_params=pipe_run_params,
+                            output_name=output_name,
+                        ),
+                    )
+                    if isinstance(pipe_output.main_stuff.content, TextContent):
+                        print()
+                        pretty_print_md(pipe_output.main_stuff_as_str, title=f"PipeOutput of pipe {self.code}")
+                        print()
+                    else:
+                        print()
+                        pipe_output.main_stuff.pretty_print_stuff(title=f"PipeOutput of pipe {self.code}: {self.output.code}")
+                        print()
+                case PipeRunMode.DRY:
+                    name = f"Dry run [cyan]{self.class_name}[/cyan]"
+                    indent_level = pipe_run_params.pipe_stack_depth - 1
                     indent = "   " * indent_level
-                    label = f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} {name} → [green]{self.code}[/green]"
+                    label = f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} {name}: [green]{self.code}[/green]"
                     log.info(f"{label} → [red]{self.output.code}[/red]")
-                pipe_output = await self._run_operator_pipe(
-                    job_metadata=job_metadata,
-                    working_memory=working_memory,
-                    pipe_run_params=pipe_run_params,
-                    output_name=output_name,
-                )
-                if isinstance(pipe_output.main_stuff.content, TextContent):
-                    print()
-                    pretty_print_md(pipe_output.main_stuff_as_str, title=f"PipeOutput of pipe {self.code}")
-                    print()
-                else:
-                    print()
-                    pipe_output.main_stuff.pretty_print_stuff(title=f"PipeOutput of pipe {self.code}: {self.output.code}")
-                    print()
-            case PipeRunMode.DRY:
-                name = f"Dry run [cyan]{self.class_name}[/cyan]"
-                indent_level = len(pipe_run_params.pipe_stack) - 1
-                indent = "   " * indent_level
-                label = f"{indent}{'[yellow]↳[/yellow]' if indent_level > 0 else ''} {name}: [green]{self.code}[/green]"
-                log.info(f"{label} → [red]{self.output.code}[/red]")
-                pipe_output = await self._dry_run_operator_pipe(
-                    job_metadata=job_metadata,
-                    working_memory=working_memory,
-                    pipe_run_params=pipe_run_params,
-                    output_name=output_name,
-                )
+                    pipe_output = await self._dry_run_operator_pipe(
+                        job_metadata=job_metadata,
+                        working_memory=working_memory,
+                        pipe_run_params=pipe_run_params,
+                        output_name=output_name,
+                    )
 
+        get_report_delegate().report_working_memory(
+            pipeline_run_id=job_metadata.pipeline_run_id,
+            pipe_code=self.code,
+            working_memory=pipe_output.working_memory,
+        )
         pipe_run_params.pop_pipe_from_stack(pipe_code=self.code)
 
         return pipe_output
 
+    async def _run_live_operator_pipe(
+        self,
+        job_metadata: JobMetadata,
+        working_memory: WorkingMemory,
+        pipe_run_params: PipeRunParams,
+        output_name: str | None = None,
+    ) -> PipeOutput:
+        """Run the pipe, or, if pipe runs are deduplicated, share the output of its run on the same inputs."""
+        pipe_run_deduplicator = get_current_pipe_run_deduplicator()
+        if pipe_run_deduplicator is None or not self.is_deduplicable:
+            return await self._run_operator_pipe(
+                job_metadata=job_metadata,
+                working_memory=working_memory,
+                pipe_run_params=pipe_run_params,
+                output_name=output_name,
+            )
+
+        dedup_key = make_pipe_run_dedup_key(
+            pipe_code=self.code,
+            input_stuffs={
+                input_name: input_stuff
+                for input_name in get_pipe_library().get_needed_inputs(pipe=self).required_names
+                if (input_stuff := working_memory.get_optional_stuff(name=input_name))
+            },
+            pipe_run_params=pipe_run_params,
+        )
+        pipe_output: PipeOutput | None = None
+
+        async def run_pipe() -> Stuff:
+            nonlocal pipe_output
+            pipe_output = await self._run_operator_pipe(
+                job_metadata=job_metadata,
+                working_memory=working_memory,
+                pipe_run_params=pipe_run_params,
+                output_name=output_name,
+            )
+            return pipe_output.main_stuff
+
+        output_stuff = await pipe_run_deduplicator.run_once(dedup_key=dedup_key, run_pipe=run_pipe)
+        if pipe_output is not None:
+            return pipe_output
+
+        log.verbose(f"Pipe '{self.code}' shares the output of its earlier run on the same inputs")
+        shared_output_stuff = StuffFactory.make_stuff(
+            name=output_name,
+            concept=output_stuff.concept,
+            content=output_stuff.content,
+            code=pipe_run_params.final_stuff_code,
+        )
+        working_memory.set_new_main_stuff(stuff=shared_output_stuff, name=output_name)
+        get_pipeline_tracker().add_pipe_step(
+            from_stuff=output_stuff,
+            to_stuff=shared_output_stuff,
+            pipe_code=self.code,
+            comment="Shared output of an earlier run on the same inputs",
+            pipe_layer=pipe_run_params.pipe_layers,
+        )
+        return PipeOutput(working_memory=working_memory, pipeline_run_id=job_metadata.pipeline_run_id)
+
     @abstractmethod
     async def _run_operator_pipe(
         self,
@@ -0,0 +1,8 @@
+from pipelex.types import StrEnum
+
+
+class BatchErrorMode(StrEnum):
+    # The first failing item fails the batch, and the branches still running are cancelled
+    FAIL_FAST = "fail_fast"
+    # The failing items are left out of the output list, and listed in a companion stuff
+    COLLECT_ERRORS = "collect_errors"
@@ -0,0 +1,68 @@
+from collections.abc import Iterator
+from typing import Optional
+
+from typing_extensions import override
+
+from pipelex.types import Self
+
+
+class PipeCodeChain:
+    """Immutable linked list of pipe codes, used for the pipe stack and pipe layers of the run params.
+
+    Pushing returns a new chain that shares its tail with the current one, so branches of PipeBatch,
+    PipeParallel and PipeSequence derive their own stack in constant time instead of copying a list.
+    """
+
+    __slots__ = ("_depth", "_parent", "_pipe_code")
+
+    def __init__(self, pipe_code: str, parent: Optional["PipeCodeChain"] = None):
+        self._pipe_code = pipe_code
+        self._parent = parent
+        self._depth: int = parent.depth + 1 if parent else 1
+
+    @property
+    def pipe_code(self) -> str:
+        return self._pipe_code
+
+    @property
+    def parent(self) -> Optional["PipeCodeChain"]:
+        return self._parent
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def push(self, pipe_code: str) -> "PipeCodeChain":
+        return PipeCodeChain(pipe_code=pipe_code, parent=self)
+
+    @classmethod
+    def from_list(cls, pipe_codes: list[str]) -> Optional["PipeCodeChain"]:
+        """Make the chain of the pipe codes listed from the oldest to the most recent one, or None if there are none."""
+        chain: PipeCodeChain | None = None
+        for pipe_code in pipe_codes:
+            chain = PipeCodeChain(pipe_code=pipe_code, parent=chain)
+        return chain
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate from the most recent pipe code to the oldest one."""
+        chain: PipeCodeChain | None = self
+        while chain is not None:
+            yield chain.pipe_code
+            chain = chain.parent
+
+    def to_list(self) -> list[str]:
+        """List the pipe codes from the oldest to the most recent one."""
+        pipe_codes = list(self)
+        pipe_codes.reverse()
+        return pipe_codes
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, object]) -> Self:
+        # Immutable, so copies can share it
+        return self
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({'.'.join(self.to_list())})"
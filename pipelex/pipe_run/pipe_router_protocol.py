@@ -1,9 +1,11 @@
+import asyncio
 from typing import Protocol
 
 from pipelex.core.pipes.pipe_output import PipeOutput
-from pipelex.exceptions import DryRunMissingInputsError, PipeRouterError, PipeRunError
+from pipelex.exceptions import DryRunMissingInputsError, PipelineCancelledError, PipeRouterError, PipeRunError
 from pipelex.observer.observer_protocol import ObserverProtocol, PayloadKey, PayloadType
 from pipelex.pipe_run.pipe_job import PipeJob
+from pipelex.pipe_run.pipe_run_cancellation import get_current_cancellation_reason, make_pipeline_cancelled_error
 
 
 class PipeRouterProtocol(Protocol):
@@ -70,6 +72,17 @@ class PipeRouterProtocol(Protocol):
                 output_name=pipe_job.output_name,
                 pipe_stack=pipe_job.pipe_run_params.pipe_stack,
             ) from exc
+        except PipelineCancelledError as exc:
+            await self._after_failing_run(pipe_job, exc)
+            raise
+        except asyncio.CancelledError:
+            cancelled_error = make_pipeline_cancelled_error(
+                pipeline_run_id=pipe_job.job_metadata.pipeline_run_id,
+                reason=get_current_cancellation_reason(),
+                pipe_code=pipe_job.pipe.code,
+            )
+            await self._after_failing_run(pipe_job, cancelled_error)
+            raise
 
         await self._after_successful_run(pipe_job, pipe_output)
 
@@ -0,0 +1,86 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from pipelex.exceptions import PipelineCancelledError
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class CancellationToken:
+    """Cooperative cancellation of a pipeline run.
+
+    Cancelling the token cancels the tasks of the run attached to it, which tears down the pipes they run, their branches
+    and their inference calls in flight. The pipes starting afterwards, e.g. in tasks of their own, check the token and
+    raise a PipelineCancelledError.
+    """
+
+    def __init__(self):
+        self.reason: str | None = None
+        self._run_tasks: set[asyncio.Task[Any]] = set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.reason is not None
+
+    @property
+    def has_running_tasks(self) -> bool:
+        return bool(self._run_tasks)
+
+    def attach_task(self, task: "asyncio.Task[Any]"):
+        """Attach a task of the run, to cancel along with the run."""
+        if self.is_cancelled:
+            task.cancel(msg=self.reason)
+            return
+        self._run_tasks.add(task)
+        task.add_done_callback(self._run_tasks.discard)
+
+    def cancel(self, reason: str) -> bool:
+        """Cancel the run, returns False if it was already cancelled."""
+        if self.is_cancelled:
+            return False
+        self.reason = reason
+        for run_task in list(self._run_tasks):
+            run_task.cancel(msg=reason)
+        return True
+
+
+# The token of the running pipeline is a context variable, so that it is seen by all the pipes of that pipeline,
+# including the branches of PipeBatch and PipeParallel, which run as separate asyncio tasks
+_current_cancellation_token: ContextVar[CancellationToken | None] = ContextVar("pipelex_current_cancellation_token", default=None)
+
+
+def get_current_cancellation_token() -> CancellationToken | None:
+    return _current_cancellation_token.get()
+
+
+def get_current_cancellation_reason() -> str | None:
+    cancellation_token = _current_cancellation_token.get()
+    return cancellation_token.reason if cancellation_token is not None else None
+
+
+def make_pipeline_cancelled_error(pipeline_run_id: str, reason: str | None, pipe_code: str | None = None) -> PipelineCancelledError:
+    applied_reason = reason or "its task was cancelled"
+    location = f" in pipe '{pipe_code}'" if pipe_code else ""
+    return PipelineCancelledError(
+        message=f"Pipeline run '{pipeline_run_id}' was cancelled{location}: {applied_reason}",
+        pipeline_run_id=pipeline_run_id,
+        reason=applied_reason,
+    )
+
+
+def check_run_cancellation(pipeline_run_id: str, pipe_code: str):
+    """Raise a PipelineCancelledError if the current pipeline run was cancelled, before running a pipe."""
+    if (reason := get_current_cancellation_reason()) is not None:
+        raise make_pipeline_cancelled_error(pipeline_run_id=pipeline_run_id, reason=reason, pipe_code=pipe_code)
+
+
+@contextmanager
+def set_current_cancellation_token(cancellation_token: CancellationToken) -> Generator[None, None, None]:
+    token = _current_cancellation_token.set(cancellation_token)
+    try:
+        yield
+    finally:
+        _current_cancellation_token.reset(token)
@@ -0,0 +1,83 @@
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.pipe_run.pipe_run_params import PipeRunParams
+
+
+def make_pipe_run_dedup_key(pipe_code: str, input_stuffs: Mapping[str, Stuff], pipe_run_params: PipeRunParams) -> str:
+    """Make the key of a pipe run from the pipe code, its input stuffs by input name and the run params that shape its output."""
+    key_data = {
+        "pipe_code": pipe_code,
+        "inputs": sorted(
+            (input_name, input_stuff.concept.concept_string, input_stuff.content.model_dump_json(serialize_as_any=True))
+            for input_name, input_stuff in input_stuffs.items()
+        ),
+        "output_multiplicity": pipe_run_params.output_multiplicity,
+        "dynamic_output_concept_code": pipe_run_params.dynamic_output_concept_code,
+        "is_with_preliminary_text": pipe_run_params.is_with_preliminary_text,
+        "params": pipe_run_params.params,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class PipeRunDeduplicator:
+    """Shares the output of the pipe runs of a pipeline run that have the same key (singleflight).
+
+    The first run of a key runs the pipe, and the runs of the same key started meanwhile or afterwards wait for its output.
+    If it fails, it is not memoized: one of the waiting runs runs the pipe in turn.
+    """
+
+    def __init__(self):
+        # The future of each key is resolved with the output stuff, or with None if the run failed
+        self._pipe_runs: dict[str, asyncio.Future[Stuff | None]] = {}
+        self.nb_deduplicated_runs = 0
+
+    async def run_once(self, dedup_key: str, run_pipe: Callable[[], Awaitable[Stuff]]) -> Stuff:
+        """Run the pipe for a key, unless another run of that key already did, and return its output stuff."""
+        while True:
+            pipe_run_future = self._pipe_runs.get(dedup_key)
+            if pipe_run_future is None:
+                break
+            # Shielded, so that cancelling a waiting run doesn't cancel the run it waits for
+            shared_stuff = await asyncio.shield(pipe_run_future)
+            if shared_stuff is not None:
+                self.nb_deduplicated_runs += 1
+                return shared_stuff
+
+        pipe_run_future = asyncio.get_running_loop().create_future()
+        self._pipe_runs[dedup_key] = pipe_run_future
+        try:
+            output_stuff = await run_pipe()
+        except BaseException:
+            del self._pipe_runs[dedup_key]
+            pipe_run_future.set_result(None)
+            raise
+        pipe_run_future.set_result(output_stuff)
+        return output_stuff
+
+
+# The deduplicator of the running pipeline is a context variable, so that it is shared by all the pipes of that pipeline,
+# including the branches of PipeBatch and PipeParallel, which run as separate asyncio tasks, and by them only
+_current_pipe_run_deduplicator: ContextVar[PipeRunDeduplicator | None] = ContextVar("pipelex_current_pipe_run_deduplicator", default=None)
+
+
+def get_current_pipe_run_deduplicator() -> PipeRunDeduplicator | None:
+    return _current_pipe_run_deduplicator.get()
+
+
+@contextmanager
+def deduplicate_pipe_runs(is_enabled: bool) -> Generator[None, None, None]:
+    """Deduplicate the pipe runs within this context, if enabled."""
+    if not is_enabled:
+        yield
+        return
+    token = _current_pipe_run_deduplicator.set(PipeRunDeduplicator())
+    try:
+        yield
+    finally:
+        _current_pipe_run_deduplicator.reset(token)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, cast
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ModelWrapValidatorHandler, PrivateAttr, computed_field, field_validator, model_validator
 
 from pipelex import log
 from pipelex.core.memory.working_memory import BATCH_ITEM_STUFF_NAME, MAIN_STUFF_NAME
 from pipelex.core.pipes.variable_multiplicity import VariableMultiplicity, VariableMultiplicityResolution
+from pipelex.pipe_run.batch_error_mode import BatchErrorMode
+from pipelex.pipe_run.pipe_code_chain import PipeCodeChain
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.types import Self, StrEnum
 
@@ -109,16 +111,40 @@ def output_multiplicity_to_apply(
 class BatchParams(BaseModel):
     input_list_stuff_name: str
     input_item_stuff_name: str
+    error_mode: BatchErrorMode = BatchErrorMode.FAIL_FAST
+    nb_item_retries: int = Field(default=0, ge=0)
+    # Delay before the first retry of an item, in seconds, doubled before each further retry
+    item_retry_delay: float = Field(default=1.0, ge=0)
+    # How many items of the batch may share an LLM call, for the PipeLLMs generating a single object
+    llm_pack_size: int | None = Field(default=None, ge=1)
+    # Whether the branches of the items run on the branch executor, e.g. in worker processes, rather than on the event loop
+    offload_branches: bool = False
 
     @classmethod
     def make_batch_params(
         cls,
         input_list_name: str,
         input_item_name: str,
+        error_mode: BatchErrorMode | None = None,
+        nb_item_retries: int | None = None,
+        item_retry_delay: float | None = None,
+        llm_pack_size: int | None = None,
+        offload_branches: bool | None = None,
     ) -> BatchParams:
-        return BatchParams(
-            input_list_stuff_name=input_list_name,
-            input_item_stuff_name=input_item_name,
+        """Make batch params, with the defaults for the options left to None."""
+        batch_options: dict[str, Any] = {
+            "error_mode": error_mode,
+            "nb_item_retries": nb_item_retries,
+            "item_retry_delay": item_retry_delay,
+            "llm_pack_size": llm_pack_size,
+            "offload_branches": offload_branches,
+        }
+        return BatchParams.model_validate(
+            {
+                "input_list_stuff_name": input_list_name,
+                "input_item_stuff_name": input_item_name,
+                **{option_name: option for option_name, option in batch_options.items() if option is not None},
+            }
         )
 
     @classmethod
@@ -136,11 +162,51 @@ class PipeRunParams(BaseModel):
     output_multiplicity: VariableMultiplicity | None = None
     dynamic_output_concept_code: str | None = None
     batch_params: BatchParams | None = None
+    # Index of the PipeBatch branch being run, inherited by the nested pipes of that branch
+    batch_index: int | None = None
+    # Indexes of the nested PipeBatch branches being run, outermost first
+    batch_path: tuple[int, ...] = ()
+    # Names of the enclosing PipeSequence steps and PipeParallel branches being run, outermost first
+    step_path: tuple[str, ...] = ()
+    # Whether the run resumes a previous attempt of the pipeline run, whose checkpoints are then restored
+    is_resumed: bool = False
     params: dict[str, Any] = Field(default_factory=dict)
 
     pipe_stack_limit: int
-    pipe_stack: list[str] = Field(default_factory=list)
-    pipe_layers: list[str] = Field(default_factory=list)
+    # The pipe stack and pipe layers are immutable linked lists, shared between the params of a pipe and its branches.
+    # They are serialized and validated as the pipe_stack and pipe_layers lists.
+    _pipe_stack: PipeCodeChain | None = PrivateAttr(default=None)
+    _pipe_layers: PipeCodeChain | None = PrivateAttr(default=None)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def validate_pipe_code_chains(cls, value: Any, handler: ModelWrapValidatorHandler[Self]) -> Self:
+        pipe_run_params = handler(value)
+        if isinstance(value, dict):
+            values = cast("dict[str, Any]", value)
+            if pipe_stack := values.get("pipe_stack"):
+                pipe_run_params._pipe_stack = PipeCodeChain.from_list(pipe_codes=list(pipe_stack))  # noqa: SLF001
+            if pipe_layers := values.get("pipe_layers"):
+                pipe_run_params._pipe_layers = PipeCodeChain.from_list(pipe_codes=list(pipe_layers))  # noqa: SLF001
+        return pipe_run_params
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def pipe_stack(self) -> list[str]:
+        return self._pipe_stack.to_list() if self._pipe_stack else []
+
+    @property
+    def pipe_stack_depth(self) -> int:
+        return self._pipe_stack.depth if self._pipe_stack else 0
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def pipe_layers(self) -> list[str]:
+        return self._pipe_layers.to_list() if self._pipe_layers else []
+
+    def __json_encode__(self) -> dict[str, Any]:
+        """Encode for kajson, which otherwise encodes the fields of a model, and would leave out the pipe stack and pipe layers."""
+        return {field_name: getattr(self, field_name) for field_name in [*type(self).model_fields, "pipe_stack", "pipe_layers"]}
 
     @property
     def pipe_stack_str(self) -> str:
@@ -161,6 +227,25 @@ class PipeRunParams(BaseModel):
     def make_deep_copy(self) -> Self:
         return self.model_copy(deep=True)
 
+    def make_branch_params(self) -> Self:
+        """Derive the run params of a branch in constant time.
+
+        The pipe stack and pipe layers are immutable and shared, and so are the params dict and the batch params,
+        which are never mutated in place: pushing to the branch stack or changing its params doesn't affect this one.
+        """
+        return self.model_copy()
+
+    def make_step_params(self, step_name: str) -> Self:
+        """Derive the run params of a step or branch of a controller, whose name is appended to the step path."""
+        return self.model_copy(update={"step_path": (*self.step_path, step_name)})
+
+    def make_branch_params_with_final_stuff_code(self, final_stuff_code: str, batch_index: int | None = None) -> Self:
+        if batch_index is None:
+            return self.model_copy(update={"final_stuff_code": final_stuff_code})
+        return self.model_copy(
+            update={"final_stuff_code": final_stuff_code, "batch_index": batch_index, "batch_path": (*self.batch_path, batch_index)},
+        )
+
     def deep_copy_with_final_stuff_code(self, final_stuff_code: str) -> Self:
         return self.model_copy(deep=True, update={"final_stuff_code": final_stuff_code})
 
@@ -181,7 +266,8 @@ class PipeRunParams(BaseModel):
             new_run_params.output_multiplicity = applied_output_multiplicity
         elif isinstance(applied_output_multiplicity, int):
             new_run_params.output_multiplicity = False
-            new_run_params.params[PipeRunParamKey.NB_OUTPUT] = applied_output_multiplicity
+            # The params dict may be shared with other run params, so we don't mutate it in place
+            new_run_params.params = {**new_run_params.params, PipeRunParamKey.NB_OUTPUT: applied_output_multiplicity}
         if is_with_preliminary_text is not None:
             new_run_params.is_with_preliminary_text = is_with_preliminary_text
         return new_run_params
@@ -191,10 +277,14 @@ class PipeRunParams(BaseModel):
         return isinstance(self.output_multiplicity, int) and self.output_multiplicity > 1  # pyright: ignore[reportUnnecessaryIsInstance]
 
     def push_pipe_to_stack(self, pipe_code: str) -> None:
-        self.pipe_stack.append(pipe_code)
+        self._pipe_stack = PipeCodeChain(pipe_code=pipe_code, parent=self._pipe_stack)
 
     def pop_pipe_from_stack(self, pipe_code: str) -> None:
-        popped_pipe_code = self.pipe_stack.pop()
+        if self._pipe_stack is None:
+            msg = "pop from empty pipe stack"
+            raise IndexError(msg)
+        popped_pipe_code = self._pipe_stack.pipe_code
+        self._pipe_stack = self._pipe_stack.parent
         if popped_pipe_code != pipe_code:
             # raise PipeRunError(f"Pipe code '{pipe_code}' was not the last pipe in the stack, it was '{popped_pipe_code}'")
             log.error(f"Pipe code '{pipe_code}' was not the last pipe in the stack, it was '{popped_pipe_code}'")
@@ -202,9 +292,14 @@ class PipeRunParams(BaseModel):
             # (which should be copied instead)
 
     def push_pipe_layer(self, pipe_code: str) -> None:
-        if self.pipe_layers and self.pipe_layers[-1] == pipe_code:
+        if self._pipe_layers and self._pipe_layers.pipe_code == pipe_code:
             return
-        self.pipe_layers.append(pipe_code)
+        self._pipe_layers = PipeCodeChain(pipe_code=pipe_code, parent=self._pipe_layers)
 
     def pop_pipe_code(self) -> str:
-        return self.pipe_layers.pop()
+        if self._pipe_layers is None:
+            msg = "pop from empty pipe layers"
+            raise IndexError(msg)
+        popped_pipe_code = self._pipe_layers.pipe_code
+        self._pipe_layers = self._pipe_layers.parent
+        return popped_pipe_code
@@ -15,6 +15,7 @@ class PipeRunParamsFactory:
         dynamic_output_concept_code: str | None = None,
         batch_params: BatchParams | None = None,
         params: dict[str, Any] | None = None,
+        is_resumed: bool = False,
     ) -> PipeRunParams:
         pipe_stack_limit = pipe_stack_limit or get_config().pipelex.pipe_run_config.pipe_stack_limit
         return PipeRunParams(
@@ -24,4 +25,5 @@ class PipeRunParamsFactory:
             dynamic_output_concept_code=dynamic_output_concept_code,
             batch_params=batch_params,
             params=params or {},
+            is_resumed=is_resumed,
         )
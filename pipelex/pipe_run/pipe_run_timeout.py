@@ -0,0 +1,24 @@
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from pipelex.config import get_config
+from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.exceptions import PipeRunTimeoutError
+
+
+def get_applied_pipe_timeout(pipe_code: str, pipe_timeout: float | None) -> float | None:
+    """Return the max duration of the runs of a pipe: set by the pipe run config, or else by the pipe definition."""
+    return get_config().pipelex.pipe_run_config.pipe_timeouts.get(pipe_code, pipe_timeout)
+
+
+async def run_within_timeout(pipe_code: str, pipe_timeout: float | None, pipe_run: Coroutine[Any, Any, PipeOutput]) -> PipeOutput:
+    """Await the run of a pipe, cancelling it with a PipeRunTimeoutError if it lasts longer than its applied timeout."""
+    applied_timeout = get_applied_pipe_timeout(pipe_code=pipe_code, pipe_timeout=pipe_timeout)
+    if applied_timeout is None:
+        return await pipe_run
+    try:
+        return await asyncio.wait_for(pipe_run, timeout=applied_timeout)
+    except asyncio.TimeoutError as exc:  # noqa: UP041 - not an alias of TimeoutError before Python 3.11
+        msg = f"Pipe '{pipe_code}' timed out after {applied_timeout}s"
+        raise PipeRunTimeoutError(message=msg, pipe_code=pipe_code, timeout=applied_timeout) from exc
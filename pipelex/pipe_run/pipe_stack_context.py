@@ -0,0 +1,21 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The pipe stack of the running operator is a context variable, so the inference jobs dispatched deep down in the workers
+# can be attributed to their pipes, and the branches of PipeBatch and PipeParallel, which run as separate asyncio tasks,
+# each see their own stack
+_current_pipe_stack: ContextVar[tuple[str, ...]] = ContextVar("pipelex_current_pipe_stack", default=())
+
+
+def get_current_pipe_stack() -> tuple[str, ...]:
+    return _current_pipe_stack.get()
+
+
+@contextmanager
+def set_current_pipe_stack(pipe_stack: list[str]) -> Generator[None, None, None]:
+    token = _current_pipe_stack.set(tuple(pipe_stack))
+    try:
+        yield
+    finally:
+        _current_pipe_stack.reset(token)
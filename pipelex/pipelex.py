@@ -33,11 +33,17 @@ from pipelex.core.validation import report_validation_error
 from pipelex.exceptions import PipelexConfigError, PipelexSetupError
 from pipelex.hub import PipelexHub, set_pipelex_hub
 from pipelex.libraries.library_manager_factory import LibraryManagerFactory
+from pipelex.metrics.metrics_protocol import MetricsNoOp, MetricsProtocol
+from pipelex.metrics.pipelex_metrics import PipelexMetrics
 from pipelex.observer.local_observer import LocalObserver
 from pipelex.observer.multi_observer import MultiObserver
 from pipelex.observer.observer_protocol import ObserverProtocol
 from pipelex.pipe_run.pipe_router import PipeRouter
 from pipelex.pipe_run.pipe_router_protocol import PipeRouterProtocol
+from pipelex.pipeline.branch_executor.branch_executor_factory import BranchExecutorFactory
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorProtocol
+from pipelex.pipeline.checkpoint.checkpoint_store_factory import CheckpointStoreFactory
+from pipelex.pipeline.checkpoint.checkpoint_store_protocol import CheckpointStoreNoOp, CheckpointStoreProtocol
 from pipelex.pipeline.pipeline_manager import PipelineManager
 from pipelex.pipeline.track.pipeline_tracker import PipelineTracker
 from pipelex.pipeline.track.pipeline_tracker_protocol import (
@@ -45,6 +51,8 @@ from pipelex.pipeline.track.pipeline_tracker_protocol import (
     PipelineTrackerProtocol,
 )
 from pipelex.plugins.plugin_manager import PluginManager
+from pipelex.profiling.profiler_protocol import ProfilerNoOp, ProfilerProtocol
+from pipelex.profiling.sampling_profiler import SamplingProfiler
 from pipelex.reporting.reporting_manager import ReportingManager
 from pipelex.reporting.reporting_protocol import ReportingNoOp, ReportingProtocol
 from pipelex.system.configuration.config_loader import config_manager
@@ -62,6 +70,8 @@ from pipelex.tools.misc.toml_utils import load_toml_from_path
 from pipelex.tools.secrets.env_secrets_provider import EnvSecretsProvider
 from pipelex.tools.secrets.secrets_provider_abstract import SecretsProviderAbstract
 from pipelex.tools.storage.storage_provider_abstract import StorageProviderAbstract
+from pipelex.tracing.tracer import Tracer
+from pipelex.tracing.tracer_protocol import TracerNoOp, TracerProtocol
 from pipelex.types import Self
 from pipelex.urls import URLs
 
@@ -112,6 +122,11 @@ class Pipelex(metaclass=MetaSingleton):
         self.pipelex_hub.set_library_manager(library_manager=self.library_manager)
 
         self.reporting_delegate: ReportingProtocol | None = None
+        self.tracer: TracerProtocol | None = None
+        self.metrics: MetricsProtocol | None = None
+        self.profiler: ProfilerProtocol | None = None
+        self.checkpoint_store: CheckpointStoreProtocol | None = None
+        self.branch_executor: BranchExecutorProtocol | None = None
         self.telemetry_manager: TelemetryManagerAbstract | None = None
         # pipeline
         self.pipeline_tracker: PipelineTrackerProtocol | None = None
@@ -157,6 +172,12 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         pipeline_tracker: PipelineTracker | None = None,
         pipe_router: PipeRouterProtocol | None = None,
         reporting_delegate: ReportingProtocol | None = None,
+        tracer: TracerProtocol | None = None,
+        metrics: MetricsProtocol | None = None,
+        profiler: ProfilerProtocol | None = None,
+        force_enable_profiling: bool = False,
+        checkpoint_store: CheckpointStoreProtocol | None = None,
+        branch_executor: BranchExecutorProtocol | None = None,
         force_enable_telemetry: bool = False,
         telemetry_config: TelemetryConfig | None = None,
         telemetry_manager: TelemetryManagerAbstract | None = None,
@@ -235,6 +256,36 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         self.pipelex_hub.set_report_delegate(self.reporting_delegate)
         self.reporting_delegate.setup()
 
+        # tracing
+        if tracer:
+            self.tracer = tracer
+        elif get_config().pipelex.feature_config.is_tracing_enabled:
+            self.tracer = Tracer.make_from_config(tracing_config=get_config().pipelex.tracing_config)
+        else:
+            self.tracer = TracerNoOp()
+        self.pipelex_hub.set_tracer(tracer=self.tracer)
+        self.tracer.setup()
+
+        # metrics
+        if metrics:
+            self.metrics = metrics
+        elif get_config().pipelex.feature_config.is_metrics_enabled:
+            self.metrics = PipelexMetrics.make_from_config(metrics_config=get_config().pipelex.metrics_config)
+        else:
+            self.metrics = MetricsNoOp()
+        self.pipelex_hub.set_metrics(metrics=self.metrics)
+        self.metrics.setup()
+
+        # profiling
+        if profiler:
+            self.profiler = profiler
+        elif force_enable_profiling or get_config().pipelex.feature_config.is_profiling_enabled:
+            self.profiler = SamplingProfiler.make_from_config(profiling_config=get_config().pipelex.profiling_config)
+        else:
+            self.profiler = ProfilerNoOp()
+        self.pipelex_hub.set_profiler(profiler=self.profiler)
+        self.profiler.setup()
+
         # pipeline
         if pipeline_tracker:
             self.pipeline_tracker = pipeline_tracker
@@ -245,6 +296,19 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         self.pipelex_hub.set_pipeline_tracker(pipeline_tracker=self.pipeline_tracker)
         self.pipeline_manager = pipeline_manager or PipelineManager()
         self.pipelex_hub.set_pipeline_manager(pipeline_manager=self.pipeline_manager)
+        if checkpoint_store:
+            self.checkpoint_store = checkpoint_store
+        elif get_config().pipelex.feature_config.is_checkpointing_enabled:
+            self.checkpoint_store = CheckpointStoreFactory.make_from_config(checkpoint_config=get_config().pipelex.checkpoint_config)
+        else:
+            self.checkpoint_store = CheckpointStoreNoOp()
+        self.pipelex_hub.set_checkpoint_store(checkpoint_store=self.checkpoint_store)
+        self.checkpoint_store.setup()
+        self.branch_executor = branch_executor or BranchExecutorFactory.make_from_config(
+            branch_executor_config=get_config().pipelex.branch_executor_config
+        )
+        self.pipelex_hub.set_branch_executor(branch_executor=self.branch_executor)
+        self.branch_executor.setup()
 
         self.class_registry.register_classes(CoreRegistryModels.get_all_models())
         if runtime_manager.is_unit_testing:
@@ -302,6 +366,10 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         self.pipeline_manager.teardown()
         if self.pipeline_tracker:
             self.pipeline_tracker.teardown()
+        if self.checkpoint_store:
+            self.checkpoint_store.teardown()
+        if self.branch_executor:
+            self.branch_executor.teardown()
         if self.telemetry_manager:
             self.telemetry_manager.teardown()
         self.library_manager.teardown()
@@ -310,6 +378,12 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         self.inference_manager.teardown()
         if self.reporting_delegate:
             self.reporting_delegate.teardown()
+        if self.tracer:
+            self.tracer.teardown()
+        if self.metrics:
+            self.metrics.teardown()
+        if self.profiler:
+            self.profiler.teardown()
         self.plugin_manager.teardown()
 
         # tools
@@ -338,6 +412,12 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
         pipeline_tracker: PipelineTracker | None = None,
         pipe_router: PipeRouterProtocol | None = None,
         reporting_delegate: ReportingProtocol | None = None,
+        tracer: TracerProtocol | None = None,
+        metrics: MetricsProtocol | None = None,
+        profiler: ProfilerProtocol | None = None,
+        force_enable_profiling: bool = False,
+        checkpoint_store: CheckpointStoreProtocol | None = None,
+        branch_executor: BranchExecutorProtocol | None = None,
         force_enable_telemetry: bool = False,
         telemetry_config: TelemetryConfig | None = None,
         telemetry_manager: TelemetryManagerAbstract | None = None,
@@ -362,6 +442,12 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
             pipeline_tracker: Custom pipeline tracking/logging
             pipe_router: Custom pipe routing logic
             reporting_delegate: Custom reporting handler
+            tracer: Custom tracer for spans of pipe runs, content generation, worker calls and template renders
+            metrics: Custom live metrics of pipe runs and inference calls, e.g. a PipelexMetrics with your own registry listeners
+            profiler: Custom profiler of pipeline runs
+            force_enable_profiling: Force enable the sampling profiler even if it is disabled in the feature config
+            checkpoint_store: Custom durable store of the checkpoints of pipeline runs
+            branch_executor: Custom executor of the offloaded branches of PipeBatch and PipeParallel, e.g. on a distributed queue
             force_enable_telemetry: Force enable telemetry even if the integration mode does not allow it
             telemetry_config: Custom telemetry configuration
             telemetry_manager: Custom telemetry manager
@@ -392,6 +478,12 @@ If you need help, drop by our Discord: we're happy to assist: {URLs.discord}.
             pipeline_tracker=pipeline_tracker,
             pipe_router=pipe_router,
             reporting_delegate=reporting_delegate,
+            tracer=tracer,
+            metrics=metrics,
+            profiler=profiler,
+            force_enable_profiling=force_enable_profiling,
+            checkpoint_store=checkpoint_store,
+            branch_executor=branch_executor,
             force_enable_telemetry=force_enable_telemetry,
             telemetry_config=telemetry_config,
             telemetry_manager=telemetry_manager,
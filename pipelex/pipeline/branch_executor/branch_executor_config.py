@@ -0,0 +1,29 @@
+from pydantic import Field, field_validator
+
+from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.types import StrEnum
+
+
+class BranchExecutorType(StrEnum):
+    # The branches run on the event loop of the pipeline, nothing is offloaded
+    IN_PROCESS = "in_process"
+    # The offloaded branches run in a pool of local worker processes
+    PROCESS_POOL = "process_pool"
+    # The offloaded branches are queued as files, for workers on any host sharing the queue directory
+    FILESYSTEM_QUEUE = "filesystem_queue"
+
+
+class BranchExecutorConfig(ConfigModel):
+    executor_type: BranchExecutorType
+    # Number of worker processes of the process pool, 0 for one per CPU
+    max_workers: int = Field(ge=0)
+    # Dotted path of the function setting up Pipelex in a worker process, called with the worker bundle paths
+    worker_setup_function: str
+    worker_bundle_paths: list[str]
+    queue_dir: str
+    queue_poll_interval: float = Field(gt=0)
+
+    @field_validator("executor_type", mode="before")
+    @classmethod
+    def validate_executor_type(cls, value: str) -> BranchExecutorType:
+        return BranchExecutorType(value)
@@ -0,0 +1,23 @@
+from pipelex.pipeline.branch_executor.branch_executor_config import BranchExecutorConfig, BranchExecutorType
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorNoOp, BranchExecutorProtocol
+from pipelex.pipeline.branch_executor.filesystem_queue_branch_executor import FilesystemQueueBranchExecutor
+from pipelex.pipeline.branch_executor.process_pool_branch_executor import ProcessPoolBranchExecutor
+
+
+class BranchExecutorFactory:
+    @classmethod
+    def make_from_config(cls, branch_executor_config: BranchExecutorConfig) -> BranchExecutorProtocol:
+        match branch_executor_config.executor_type:
+            case BranchExecutorType.IN_PROCESS:
+                return BranchExecutorNoOp()
+            case BranchExecutorType.PROCESS_POOL:
+                return ProcessPoolBranchExecutor(
+                    max_workers=branch_executor_config.max_workers,
+                    worker_setup_function=branch_executor_config.worker_setup_function,
+                    worker_bundle_paths=branch_executor_config.worker_bundle_paths,
+                )
+            case BranchExecutorType.FILESYSTEM_QUEUE:
+                return FilesystemQueueBranchExecutor(
+                    queue_dir=branch_executor_config.queue_dir,
+                    poll_interval=branch_executor_config.queue_poll_interval,
+                )
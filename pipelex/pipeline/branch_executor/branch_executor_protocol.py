@@ -0,0 +1,41 @@
+from typing import Protocol
+
+from typing_extensions import override
+
+from pipelex.exceptions import BranchExecutorError
+
+
+class BranchExecutorProtocol(Protocol):
+    """Runs the offloaded branches of PipeBatch and PipeParallel out of the event loop of the pipeline.
+
+    The branch jobs and their results are serialized payloads, so that they can be sent to worker processes and hosts.
+    """
+
+    @property
+    def is_offloading(self) -> bool: ...
+
+    async def run_branch_job(self, job_id: str, job_payload: str) -> str: ...
+
+    def setup(self) -> None: ...
+
+    def teardown(self) -> None: ...
+
+
+class BranchExecutorNoOp(BranchExecutorProtocol):
+    @property
+    @override
+    def is_offloading(self) -> bool:
+        return False
+
+    @override
+    async def run_branch_job(self, job_id: str, job_payload: str) -> str:
+        msg = f"Cannot run offloaded branch job '{job_id}': no branch executor is set up"
+        raise BranchExecutorError(msg)
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+from pipelex.cogt.usage.usage_registry import UsageRegistry
+from pipelex.pipeline.checkpoint.checkpoint_models import StuffCheckpoint, WorkingMemoryCheckpoint
+
+
+class BranchJob(BaseModel):
+    """A branch offloaded to a worker: the pipe to run and its serialized working memory."""
+
+    job_id: str
+    pipe_code: str
+    inputs: WorkingMemoryCheckpoint
+    output_name: str | None = None
+
+
+class BranchJobResult(BaseModel):
+    """The serialized main output stuff of an offloaded branch, or the error it failed with, and the usage of its run."""
+
+    job_id: str
+    output: StuffCheckpoint | None = None
+    error_type: str | None = None
+    error_message: str | None = None
+    usage: UsageRegistry | None = None
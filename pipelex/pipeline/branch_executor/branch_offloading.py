@@ -0,0 +1,84 @@
+import shortuuid
+
+from pipelex import log
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.exceptions import PipeRunError
+from pipelex.hub import get_branch_executor, get_pipe_library, get_report_delegate
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipe_run.pipe_run_params import PipeRunParams
+from pipelex.pipeline.branch_executor.branch_job import BranchJob, BranchJobResult
+from pipelex.pipeline.checkpoint.checkpoint_models import StuffCheckpoint, WorkingMemoryCheckpoint
+from pipelex.pipeline.job_metadata import JobMetadata
+
+
+def _can_offload_branch(pipeline_run_id: str, pipe_run_params: PipeRunParams) -> bool:
+    # The offloaded branch runs as a pipeline of its own, which only takes its inputs and output name,
+    # and the budget of a run is only enforced on the inference jobs it dispatches itself
+    return (
+        pipe_run_params.run_mode == PipeRunMode.LIVE
+        and get_branch_executor().is_offloading
+        and pipe_run_params.output_multiplicity is None
+        and pipe_run_params.dynamic_output_concept_code is None
+        and not get_report_delegate().is_budgeted(pipeline_run_id=pipeline_run_id)
+    )
+
+
+async def run_branch_pipe(
+    sub_pipe: PipeAbstract,
+    job_metadata: JobMetadata,
+    working_memory: WorkingMemory,
+    pipe_run_params: PipeRunParams,
+    output_name: str | None,
+    is_offloaded: bool,
+) -> PipeOutput:
+    """Run the pipe of a branch, on the event loop, or offloaded to the branch executor if the branch is and can be.
+
+    An offloaded branch is sent its required inputs, runs as a pipeline of its own in a worker, and sends back its main
+    output stuff, which is set as the main stuff of the branch working memory. The steps of the offloaded pipeline are
+    tracked by the worker, which also sends back its usage, added to the usage of the pipeline run. The branches of a
+    run with a budget are not offloaded, they run on the event loop.
+    """
+    if not is_offloaded or not _can_offload_branch(pipeline_run_id=job_metadata.pipeline_run_id, pipe_run_params=pipe_run_params):
+        return await sub_pipe.run_pipe(
+            job_metadata=job_metadata,
+            working_memory=working_memory,
+            pipe_run_params=pipe_run_params,
+            output_name=output_name,
+        )
+
+    required_names = get_pipe_library().get_needed_inputs(pipe=sub_pipe).required_names
+    branch_job = BranchJob(
+        job_id=shortuuid.uuid(),
+        pipe_code=sub_pipe.code,
+        inputs=WorkingMemoryCheckpoint(
+            stuffs={
+                name: StuffCheckpoint.make_from_stuff(stuff=stuff)
+                for name in required_names
+                if (stuff := working_memory.get_optional_stuff(name=name)) is not None
+            }
+        ),
+        output_name=output_name,
+    )
+    log.verbose(f"Offloading branch job '{branch_job.job_id}' of pipe '{sub_pipe.code}'")
+    result_payload = await get_branch_executor().run_branch_job(job_id=branch_job.job_id, job_payload=branch_job.model_dump_json())
+    branch_job_result = BranchJobResult.model_validate_json(result_payload)
+    if branch_job_result.usage:
+        get_report_delegate().report_offloaded_usage(pipeline_run_id=job_metadata.pipeline_run_id, usage_registry=branch_job_result.usage)
+    if branch_job_result.output is None:
+        msg = (
+            f"Offloaded branch of pipe '{sub_pipe.code}' failed in its worker with {branch_job_result.error_type}: {branch_job_result.error_message}"
+        )
+        raise PipeRunError(msg)
+
+    offloaded_output_stuff = branch_job_result.output.make_stuff()
+    output_stuff = StuffFactory.make_stuff(
+        name=output_name,
+        concept=offloaded_output_stuff.concept,
+        content=offloaded_output_stuff.content,
+        code=pipe_run_params.final_stuff_code,
+    )
+    working_memory.set_new_main_stuff(stuff=output_stuff, name=output_name)
+    return PipeOutput(working_memory=working_memory, pipeline_run_id=job_metadata.pipeline_run_id)
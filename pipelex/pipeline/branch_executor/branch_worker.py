@@ -0,0 +1,113 @@
+import asyncio
+import importlib
+from pathlib import Path
+
+from pipelex import log
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.exceptions import BranchExecutorError
+from pipelex.hub import get_library_manager, get_report_delegate
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipeline.branch_executor.branch_job import BranchJob, BranchJobResult
+from pipelex.pipeline.branch_executor.filesystem_branch_queue import FilesystemBranchQueue
+from pipelex.pipeline.checkpoint.checkpoint_models import StuffCheckpoint
+from pipelex.pipeline.start import start_pipeline
+
+# The event loop of a worker process of the process pool, which runs all its jobs, as the inference workers set up
+# by the first job keep clients bound to it, e.g. the connection pools of their HTTP clients
+_worker_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def load_worker_bundles(bundle_paths: list[str]) -> None:
+    """Load the bundles defining the offloaded pipes which are not in the libraries loaded by the worker's Pipelex."""
+    for bundle_path in bundle_paths:
+        get_library_manager().reload_bundle(plx_path=Path(bundle_path))
+
+
+def init_branch_worker_process(worker_setup_function: str, bundle_paths: list[str]) -> None:
+    """Set up a worker process of the process pool with the worker setup function, given by its dotted path."""
+    global _worker_event_loop  # noqa: PLW0603 - the initializer of the process pool sets up the worker process through its globals
+    _worker_event_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_event_loop)
+    module_name, _, function_name = worker_setup_function.rpartition(".")
+    setup_worker = getattr(importlib.import_module(module_name), function_name)
+    setup_worker(bundle_paths)
+
+
+async def execute_branch_job(branch_job: BranchJob) -> BranchJobResult:
+    """Run an offloaded branch as a pipeline of its own, returning its error rather than raising it, along with its usage."""
+    pipeline_run_id: str | None = None
+    try:
+        working_memory = WorkingMemoryFactory.make_empty()
+        branch_job.inputs.apply_to(working_memory=working_memory)
+        pipeline_run_id, pipe_task = await start_pipeline(
+            pipe_code=branch_job.pipe_code,
+            inputs=working_memory,
+            output_name=branch_job.output_name,
+            pipe_run_mode=PipeRunMode.LIVE,
+        )
+        pipe_output = await pipe_task
+    except Exception as exc:
+        log.error(f"Offloaded branch job '{branch_job.job_id}' of pipe '{branch_job.pipe_code}' failed with {type(exc).__name__}: {exc}")
+        return BranchJobResult(
+            job_id=branch_job.job_id,
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+            usage=get_report_delegate().get_usage_registry(pipeline_run_id=pipeline_run_id) if pipeline_run_id else None,
+        )
+    return BranchJobResult(
+        job_id=branch_job.job_id,
+        output=StuffCheckpoint.make_from_stuff(stuff=pipe_output.main_stuff),
+        usage=get_report_delegate().get_usage_registry(pipeline_run_id=pipeline_run_id),
+    )
+
+
+async def execute_branch_job_payload(job_payload: str) -> str:
+    """Run a serialized branch job, and return its serialized result."""
+    branch_job = BranchJob.model_validate_json(job_payload)
+    branch_job_result = await execute_branch_job(branch_job=branch_job)
+    return branch_job_result.model_dump_json()
+
+
+def run_branch_job_payload(job_payload: str) -> str:
+    """Run a serialized branch job in a worker process of the process pool, and return its serialized result."""
+    if _worker_event_loop is None:
+        msg = "The worker process of the process pool is not set up"
+        raise BranchExecutorError(msg)
+    return _worker_event_loop.run_until_complete(execute_branch_job_payload(job_payload=job_payload))
+
+
+async def _run_claimed_job(branch_queue: FilesystemBranchQueue, job_id: str, job_payload: str, poll_interval: float) -> str | None:
+    """Run a job claimed from the queue, and return its result payload, or None if its pipeline run cancelled it meanwhile."""
+    job_task = asyncio.create_task(execute_branch_job_payload(job_payload=job_payload))
+    while not job_task.done():
+        await asyncio.wait({job_task}, timeout=poll_interval)
+        if not job_task.done() and branch_queue.is_job_cancellation_requested(job_id=job_id):
+            log.info(f"Cancelling branch job '{job_id}', its pipeline run was cancelled")
+            job_task.cancel()
+            await asyncio.gather(job_task, return_exceptions=True)
+            return None
+    return job_task.result()
+
+
+async def run_branch_queue_worker(queue_dir: str, poll_interval: float, max_nb_jobs: int | None = None) -> int:
+    """Run the jobs of a filesystem branch queue one after the other, in a process where Pipelex is set up.
+
+    Start one such worker per core on each host sharing the queue directory. Returns the number of jobs run,
+    once max_nb_jobs is reached if set, otherwise it runs until cancelled.
+    """
+    branch_queue = FilesystemBranchQueue(queue_dir=queue_dir)
+    branch_queue.setup()
+    nb_jobs = 0
+    while max_nb_jobs is None or nb_jobs < max_nb_jobs:
+        claimed_job = branch_queue.claim_next_job()
+        if claimed_job is None:
+            await asyncio.sleep(poll_interval)
+            continue
+        job_id, job_payload = claimed_job
+        result_payload = await _run_claimed_job(branch_queue=branch_queue, job_id=job_id, job_payload=job_payload, poll_interval=poll_interval)
+        if result_payload is None:
+            branch_queue.discard_job(job_id=job_id)
+        else:
+            branch_queue.complete_job(job_id=job_id, result_payload=result_payload)
+        nb_jobs += 1
+    return nb_jobs
@@ -0,0 +1,14 @@
+from pipelex.pipelex import Pipelex
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorNoOp
+from pipelex.pipeline.branch_executor.branch_worker import load_worker_bundles
+from pipelex.system.runtime import IntegrationMode
+
+
+def setup_branch_worker(bundle_paths: list[str]) -> None:
+    """Default setup of a worker process: Pipelex with the configuration and libraries of the current directory, and the given bundles.
+
+    Use your own setup function, set as worker_setup_function in the branch executor config, to inject custom components, e.g. a secrets provider.
+    """
+    # The worker runs the branches itself, it doesn't offload them again
+    Pipelex.make(integration_mode=IntegrationMode.PYTHON, branch_executor=BranchExecutorNoOp())
+    load_worker_bundles(bundle_paths=bundle_paths)
@@ -0,0 +1,91 @@
+from pathlib import Path
+
+PENDING_DIR_NAME = "pending"
+RUNNING_DIR_NAME = "running"
+DONE_DIR_NAME = "done"
+CANCELLED_DIR_NAME = "cancelled"
+
+
+def _write_file_atomically(file_path: Path, payload: str) -> None:
+    temporary_path = file_path.with_suffix(".tmp")
+    temporary_path.write_text(payload, encoding="utf-8")
+    temporary_path.replace(file_path)
+
+
+def _get_modification_time(file_path: Path) -> float:
+    try:
+        return file_path.stat().st_mtime
+    except FileNotFoundError:
+        return 0
+
+
+class FilesystemBranchQueue:
+    """Queue of offloaded branch jobs as JSON files in a directory, shared by the hosts running the pipelines and the workers.
+
+    A job file moves from pending/ to running/ when a worker claims it. The move is a rename, which is atomic,
+    so each job is claimed by a single worker. The result of the job is then written to done/, where the pipeline
+    that submitted the job picks it up. If that pipeline is cancelled meanwhile, it leaves a marker in cancelled/,
+    so that the worker cancels the job and drops its result.
+    """
+
+    def __init__(self, queue_dir: str):
+        self.pending_dir = Path(queue_dir) / PENDING_DIR_NAME
+        self.running_dir = Path(queue_dir) / RUNNING_DIR_NAME
+        self.done_dir = Path(queue_dir) / DONE_DIR_NAME
+        self.cancelled_dir = Path(queue_dir) / CANCELLED_DIR_NAME
+
+    def setup(self) -> None:
+        for directory in (self.pending_dir, self.running_dir, self.done_dir, self.cancelled_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def submit_job(self, job_id: str, job_payload: str) -> None:
+        _write_file_atomically(file_path=self.pending_dir / f"{job_id}.json", payload=job_payload)
+
+    def withdraw_job(self, job_id: str) -> bool:
+        """Remove a job that no worker has claimed yet, returns whether it was still pending."""
+        try:
+            (self.pending_dir / f"{job_id}.json").unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def pop_job_result(self, job_id: str) -> str | None:
+        result_path = self.done_dir / f"{job_id}.json"
+        if not result_path.is_file():
+            return None
+        result_payload = result_path.read_text(encoding="utf-8")
+        result_path.unlink()
+        return result_payload
+
+    def claim_next_job(self) -> tuple[str, str] | None:
+        """Claim the oldest pending job, returns its id and payload, or None if there is none."""
+        for pending_path in sorted(self.pending_dir.glob("*.json"), key=_get_modification_time):
+            running_path = self.running_dir / pending_path.name
+            try:
+                pending_path.rename(running_path)
+            except FileNotFoundError:
+                # Claimed by another worker, or withdrawn, in the meantime
+                continue
+            return running_path.stem, running_path.read_text(encoding="utf-8")
+        return None
+
+    def complete_job(self, job_id: str, result_payload: str) -> None:
+        if self.is_job_cancellation_requested(job_id=job_id):
+            self.discard_job(job_id=job_id)
+            return
+        _write_file_atomically(file_path=self.done_dir / f"{job_id}.json", payload=result_payload)
+        (self.running_dir / f"{job_id}.json").unlink(missing_ok=True)
+
+    def request_job_cancellation(self, job_id: str) -> None:
+        """Ask the worker running a claimed job to cancel it, or drop its result if it is already done."""
+        if self.pop_job_result(job_id=job_id) is not None:
+            return
+        (self.cancelled_dir / job_id).touch()
+
+    def is_job_cancellation_requested(self, job_id: str) -> bool:
+        return (self.cancelled_dir / job_id).is_file()
+
+    def discard_job(self, job_id: str) -> None:
+        """Remove a cancelled job claimed by a worker, with its cancellation marker."""
+        (self.running_dir / f"{job_id}.json").unlink(missing_ok=True)
+        (self.cancelled_dir / job_id).unlink(missing_ok=True)
@@ -0,0 +1,44 @@
+import asyncio
+
+from typing_extensions import override
+
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorProtocol
+from pipelex.pipeline.branch_executor.filesystem_branch_queue import FilesystemBranchQueue
+
+
+class FilesystemQueueBranchExecutor(BranchExecutorProtocol):
+    """Branch executor queuing the offloaded branches in a directory, for the workers run by `pipelex worker` on any host sharing it.
+
+    It stands in for a distributed queue: another queue can be plugged in with a branch executor of your own.
+    """
+
+    def __init__(self, queue_dir: str, poll_interval: float):
+        self.branch_queue = FilesystemBranchQueue(queue_dir=queue_dir)
+        self.poll_interval = poll_interval
+
+    @property
+    @override
+    def is_offloading(self) -> bool:
+        return True
+
+    @override
+    async def run_branch_job(self, job_id: str, job_payload: str) -> str:
+        self.branch_queue.submit_job(job_id=job_id, job_payload=job_payload)
+        try:
+            while True:
+                if (result_payload := self.branch_queue.pop_job_result(job_id=job_id)) is not None:
+                    return result_payload
+                await asyncio.sleep(self.poll_interval)
+        except BaseException:
+            # A job already claimed by a worker is cancelled by that worker
+            if not self.branch_queue.withdraw_job(job_id=job_id):
+                self.branch_queue.request_job_cancellation(job_id=job_id)
+            raise
+
+    @override
+    def setup(self) -> None:
+        self.branch_queue.setup()
+
+    @override
+    def teardown(self) -> None:
+        pass
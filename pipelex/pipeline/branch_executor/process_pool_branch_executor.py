@@ -0,0 +1,59 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from typing_extensions import override
+
+from pipelex.exceptions import BranchExecutorError
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorProtocol
+from pipelex.pipeline.branch_executor.branch_worker import init_branch_worker_process, run_branch_job_payload
+
+
+class ProcessPoolBranchExecutor(BranchExecutorProtocol):
+    """Branch executor running the offloaded branches in a pool of local worker processes, to use all the cores.
+
+    The worker processes are spawned rather than forked, and each one sets up its own Pipelex with the worker setup
+    function, so the pipes they run must be in the libraries or bundles it loads.
+    """
+
+    def __init__(self, max_workers: int, worker_setup_function: str, worker_bundle_paths: list[str]):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.worker_setup_function = worker_setup_function
+        self.worker_bundle_paths = worker_bundle_paths
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    @property
+    @override
+    def is_offloading(self) -> bool:
+        return True
+
+    @override
+    async def run_branch_job(self, job_id: str, job_payload: str) -> str:
+        if self._process_pool is None:
+            msg = "The process pool branch executor is not set up"
+            raise BranchExecutorError(msg)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._process_pool, run_branch_job_payload, job_payload)
+        except BrokenProcessPool as exc:
+            msg = (
+                f"Branch job '{job_id}' failed because the worker processes died, "
+                f"check the worker setup function '{self.worker_setup_function}': {exc}"
+            )
+            raise BranchExecutorError(msg) from exc
+
+    @override
+    def setup(self) -> None:
+        self._process_pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_branch_worker_process,
+            initargs=(self.worker_setup_function, self.worker_bundle_paths),
+        )
+
+    @override
+    def teardown(self) -> None:
+        if self._process_pool:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
@@ -0,0 +1,71 @@
+import asyncio
+
+from pipelex import log
+from pipelex.cogt.usage.usage_registry import ModelUsage
+from pipelex.config import get_config
+from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.exceptions import PipelineCancelledError
+from pipelex.hub import get_pipe_router, get_pipeline_manager, get_report_delegate
+from pipelex.pipe_run.pipe_job import PipeJob
+from pipelex.pipe_run.pipe_run_cancellation import make_pipeline_cancelled_error, set_current_cancellation_token
+
+
+def cancel_pipeline(pipeline_run_id: str, reason: str = "cancelled by the caller") -> bool:
+    """Cancel a running pipeline, e.g. started by *start_pipeline*.
+
+    The pipes of the run are torn down, with their branches and their inference calls in flight, and the run raises
+    a ``PipelineCancelledError`` carrying its usage up to the cancellation.
+
+    Returns False if the run was already cancelled, or is no longer running.
+    """
+    pipeline = get_pipeline_manager().get_optional_pipeline(pipeline_run_id=pipeline_run_id)
+    if pipeline is None:
+        return False
+    return pipeline.cancellation_token.cancel(reason=reason)
+
+
+def _report_cancelled_run(pipeline_run_id: str, reason: str) -> ModelUsage | None:
+    partial_usage = get_report_delegate().get_run_usage(pipeline_run_id=pipeline_run_id)
+    if partial_usage is not None:
+        log.warning(f"Pipeline run '{pipeline_run_id}' was cancelled ({reason}) after {partial_usage.nb_calls} inference call(s)")
+        get_report_delegate().generate_report(pipeline_run_id=pipeline_run_id)
+    return partial_usage
+
+
+async def run_cancellable_pipe_job(pipe_job: PipeJob, run_timeout: float | None = None) -> PipeOutput:
+    """Run the pipe job of a pipeline run in a task that cancel_pipeline and the run timeout cancel.
+
+    The run timeout, in seconds, defaults to the run_timeout of the pipe run config. If the run is cancelled, a
+    PipelineCancelledError is raised, with the partial usage of the run. If the caller is cancelled, the run is too.
+    """
+    pipeline_run_id = pipe_job.job_metadata.pipeline_run_id
+    cancellation_token = get_pipeline_manager().get_pipeline(pipeline_run_id=pipeline_run_id).cancellation_token
+    applied_timeout = run_timeout if run_timeout is not None else get_config().pipelex.pipe_run_config.run_timeout
+
+    with set_current_cancellation_token(cancellation_token=cancellation_token):
+        run_task = asyncio.create_task(get_pipe_router().run(pipe_job))
+    cancellation_token.attach_task(run_task)
+    timeout_handle: asyncio.TimerHandle | None = None
+    if applied_timeout is not None:
+        timeout_handle = asyncio.get_running_loop().call_later(
+            applied_timeout, cancellation_token.cancel, f"the run timed out after {applied_timeout}s"
+        )
+
+    try:
+        return await run_task
+    except asyncio.CancelledError:
+        if not cancellation_token.is_cancelled:
+            # The caller was cancelled, which cancelled the run task it awaited
+            cancellation_token.cancel(reason="the task awaiting the run was cancelled")
+            _report_cancelled_run(pipeline_run_id=pipeline_run_id, reason="the task awaiting the run was cancelled")
+            raise
+        cancelled_error = make_pipeline_cancelled_error(pipeline_run_id=pipeline_run_id, reason=cancellation_token.reason)
+        cancelled_error.partial_usage = _report_cancelled_run(pipeline_run_id=pipeline_run_id, reason=cancelled_error.reason)
+        raise cancelled_error from None
+    except PipelineCancelledError as exc:
+        # Raised by a pipe that started after the run was cancelled
+        exc.partial_usage = _report_cancelled_run(pipeline_run_id=pipeline_run_id, reason=exc.reason)
+        raise
+    finally:
+        if timeout_handle is not None:
+            timeout_handle.cancel()
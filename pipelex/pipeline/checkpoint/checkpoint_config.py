@@ -0,0 +1,21 @@
+from pydantic import field_validator
+
+from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.types import StrEnum
+
+
+class CheckpointStoreType(StrEnum):
+    SQLITE = "sqlite"
+    FILESYSTEM = "filesystem"
+
+
+class CheckpointConfig(ConfigModel):
+    store_type: CheckpointStoreType
+    sqlite_file_path: str
+    filesystem_dir: str
+    is_cleared_on_success: bool
+
+    @field_validator("store_type", mode="before")
+    @classmethod
+    def validate_store_type(cls, value: str) -> CheckpointStoreType:
+        return CheckpointStoreType(value)
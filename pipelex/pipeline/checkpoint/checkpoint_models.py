@@ -0,0 +1,110 @@
+import importlib
+from typing import Any, cast
+
+from pydantic import BaseModel, Field
+
+from pipelex.core.memory.working_memory import StuffDict, WorkingMemory
+from pipelex.core.stuffs.list_content import ListContent
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_content import StuffContent
+from pipelex.exceptions import PipelineCheckpointError
+from pipelex.hub import get_class_registry, get_required_concept
+from pipelex.types import Self
+
+
+class ContentCheckpoint(BaseModel):
+    """A serialized stuff content, with the name of its class or the serialized items of a list content.
+
+    The classes of structured concepts are generated at runtime, so they are resolved by name in the class registry
+    rather than by their module.
+    """
+
+    class_name: str | None = None
+    module_name: str | None = None
+    data: dict[str, Any] | None = None
+    items: list["ContentCheckpoint"] | None = None
+
+    @classmethod
+    def make_from_content(cls, content: StuffContent) -> Self:
+        if isinstance(content, ListContent):
+            list_content = cast("ListContent[StuffContent]", content)
+            return cls(items=[cls.make_from_content(content=item) for item in list_content.items])
+        return cls(
+            class_name=content.__class__.__name__,
+            module_name=content.__class__.__module__,
+            data=content.model_dump(serialize_as_any=True),
+        )
+
+    def make_content(self) -> StuffContent:
+        if self.items is not None:
+            return ListContent(items=[item.make_content() for item in self.items])
+        if self.class_name is None or self.data is None:
+            msg = "Content checkpoint has neither a content class nor items"
+            raise PipelineCheckpointError(msg)
+        return self._get_content_class(class_name=self.class_name, module_name=self.module_name).model_validate(self.data)
+
+    @staticmethod
+    def _get_content_class(class_name: str, module_name: str | None) -> type[StuffContent]:
+        content_class = get_class_registry().get_class(name=class_name)
+        if content_class is None and module_name:
+            content_class = getattr(importlib.import_module(module_name), class_name, None)
+        if not isinstance(content_class, type) or not issubclass(content_class, StuffContent):
+            msg = f"Content class '{class_name}' of a checkpoint is not a StuffContent found in the class registry or in module '{module_name}'"
+            raise PipelineCheckpointError(msg)
+        return content_class
+
+
+class StuffCheckpoint(BaseModel):
+    stuff_code: str
+    stuff_name: str | None
+    concept_string: str
+    content: ContentCheckpoint
+
+    @classmethod
+    def make_from_stuff(cls, stuff: Stuff) -> Self:
+        return cls(
+            stuff_code=stuff.stuff_code,
+            stuff_name=stuff.stuff_name,
+            concept_string=stuff.concept.concept_string,
+            content=ContentCheckpoint.make_from_content(content=stuff.content),
+        )
+
+    def make_stuff(self) -> Stuff:
+        return Stuff(
+            stuff_code=self.stuff_code,
+            stuff_name=self.stuff_name,
+            concept=get_required_concept(concept_string=self.concept_string),
+            content=self.content.make_content(),
+        )
+
+
+class WorkingMemoryCheckpoint(BaseModel):
+    """The changes made to a working memory by a step, replayed on resume instead of running the step again."""
+
+    stuffs: dict[str, StuffCheckpoint] = Field(default_factory=dict)
+    removed_names: list[str] = Field(default_factory=list)
+    aliases: dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def make_from_changes(cls, stuffs_before: StuffDict, working_memory: WorkingMemory) -> Self:
+        """Record the stuffs added or replaced since `stuffs_before`, a copy of the stuff dict taken before the step."""
+        return cls(
+            stuffs={
+                name: StuffCheckpoint.make_from_stuff(stuff=stuff)
+                for name, stuff in working_memory.root.items()
+                if stuffs_before.get(name) is not stuff
+            },
+            removed_names=[name for name in stuffs_before if name not in working_memory.root],
+            aliases=dict(working_memory.aliases),
+        )
+
+    @classmethod
+    def make_from_working_memory(cls, working_memory: WorkingMemory) -> Self:
+        return cls.make_from_changes(stuffs_before={}, working_memory=working_memory)
+
+    def apply_to(self, working_memory: WorkingMemory) -> None:
+        for name in self.removed_names:
+            working_memory.remove_stuff(name=name)
+        for name, stuff_checkpoint in self.stuffs.items():
+            working_memory.set_stuff(name=name, stuff=stuff_checkpoint.make_stuff())
+        working_memory.aliases = dict(self.aliases)
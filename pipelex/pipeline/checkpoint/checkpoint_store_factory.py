@@ -0,0 +1,14 @@
+from pipelex.pipeline.checkpoint.checkpoint_config import CheckpointConfig, CheckpointStoreType
+from pipelex.pipeline.checkpoint.checkpoint_store_protocol import CheckpointStoreProtocol
+from pipelex.pipeline.checkpoint.filesystem_checkpoint_store import FilesystemCheckpointStore
+from pipelex.pipeline.checkpoint.sqlite_checkpoint_store import SqliteCheckpointStore
+
+
+class CheckpointStoreFactory:
+    @classmethod
+    def make_from_config(cls, checkpoint_config: CheckpointConfig) -> CheckpointStoreProtocol:
+        match checkpoint_config.store_type:
+            case CheckpointStoreType.SQLITE:
+                return SqliteCheckpointStore(file_path=checkpoint_config.sqlite_file_path)
+            case CheckpointStoreType.FILESYSTEM:
+                return FilesystemCheckpointStore(directory=checkpoint_config.filesystem_dir)
@@ -0,0 +1,47 @@
+from typing import Protocol
+
+from typing_extensions import override
+
+
+class CheckpointStoreProtocol(Protocol):
+    """Durable store of the checkpoints of pipeline runs, as serialized payloads keyed by pipeline run and checkpoint key."""
+
+    @property
+    def is_enabled(self) -> bool: ...
+
+    def save_checkpoint(self, pipeline_run_id: str, checkpoint_key: str, payload: str) -> None: ...
+
+    def load_checkpoint(self, pipeline_run_id: str, checkpoint_key: str) -> str | None: ...
+
+    def clear_checkpoints(self, pipeline_run_id: str) -> None: ...
+
+    def setup(self) -> None: ...
+
+    def teardown(self) -> None: ...
+
+
+class CheckpointStoreNoOp(CheckpointStoreProtocol):
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return False
+
+    @override
+    def save_checkpoint(self, pipeline_run_id: str, checkpoint_key: str, payload: str) -> None:
+        pass
+
+    @override
+    def load_checkpoint(self, pipeline_run_id: str, checkpoint_key: str) -> str | None:
+        return None
+
+    @override
+    def clear_checkpoints(self, pipeline_run_id: str) -> None:
+        pass
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
@@ -0,0 +1,87 @@
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from pipelex import log
+from pipelex.config import get_config
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.exceptions import PipelineCheckpointError
+from pipelex.hub import get_checkpoint_store
+from pipelex.pipe_run.pipe_run_params import PipeRunMode, PipeRunParams
+from pipelex.pipeline.checkpoint.checkpoint_models import WorkingMemoryCheckpoint
+
+INPUTS_CHECKPOINT_KEY = "inputs"
+
+CheckpointModelType = TypeVar("CheckpointModelType", bound=BaseModel)
+
+
+def is_checkpointing_active(pipe_run_params: PipeRunParams) -> bool:
+    return pipe_run_params.run_mode == PipeRunMode.LIVE and get_checkpoint_store().is_enabled
+
+
+def make_checkpoint_key(pipe_run_params: PipeRunParams, step_name: str) -> str:
+    """Identify a step within a pipeline run by the pipe stack and the controller branches it runs in.
+
+    The same pipe stack is run once per branch of each enclosing PipeBatch, and once per step or branch of the enclosing
+    PipeSequence and PipeParallel pipes that run the same pipe more than once, so the indexes of all the enclosing batch
+    branches and the names of all the enclosing steps are part of the key, not only the innermost ones.
+    """
+    batch_path = ".".join(str(batch_index) for batch_index in pipe_run_params.batch_path)
+    step_path = "/".join((*pipe_run_params.step_path, step_name))
+    return f"{pipe_run_params.pipe_stack_str}[{batch_path}]/{step_path}"
+
+
+def save_checkpoint(pipeline_run_id: str, checkpoint_key: str, checkpoint: BaseModel) -> None:
+    get_checkpoint_store().save_checkpoint(
+        pipeline_run_id=pipeline_run_id,
+        checkpoint_key=checkpoint_key,
+        payload=checkpoint.model_dump_json(),
+    )
+
+
+def load_checkpoint(pipeline_run_id: str, checkpoint_key: str, checkpoint_class: type[CheckpointModelType]) -> CheckpointModelType | None:
+    payload = get_checkpoint_store().load_checkpoint(pipeline_run_id=pipeline_run_id, checkpoint_key=checkpoint_key)
+    if payload is None:
+        return None
+    return checkpoint_class.model_validate_json(payload)
+
+
+def prepare_run_checkpoints(
+    pipeline_run_id: str,
+    pipe_run_params: PipeRunParams,
+    working_memory: WorkingMemory | None,
+) -> WorkingMemory | None:
+    """Save the inputs of a pipeline run, or restore those of a resumed run when no inputs are given again.
+
+    A run can be resumed under the pipeline run id of a previous attempt, or under an id of your choice from its
+    first attempt on, e.g. to rerun the same command after a crash. Returns the working memory to start the run with.
+    """
+    if not is_checkpointing_active(pipe_run_params=pipe_run_params):
+        if pipe_run_params.is_resumed:
+            msg = f"Cannot resume pipeline run '{pipeline_run_id}': checkpointing is only available for live runs with is_checkpointing_enabled"
+            raise PipelineCheckpointError(msg)
+        return working_memory
+
+    if pipe_run_params.is_resumed and working_memory is None:
+        if inputs_checkpoint := load_checkpoint(
+            pipeline_run_id=pipeline_run_id,
+            checkpoint_key=INPUTS_CHECKPOINT_KEY,
+            checkpoint_class=WorkingMemoryCheckpoint,
+        ):
+            working_memory = WorkingMemoryFactory.make_empty()
+            inputs_checkpoint.apply_to(working_memory=working_memory)
+    elif working_memory is not None:
+        save_checkpoint(
+            pipeline_run_id=pipeline_run_id,
+            checkpoint_key=INPUTS_CHECKPOINT_KEY,
+            checkpoint=WorkingMemoryCheckpoint.make_from_working_memory(working_memory=working_memory),
+        )
+    log.info(f"Pipeline run '{pipeline_run_id}' is checkpointed, if it fails resume it with resume_run_id='{pipeline_run_id}'")
+    return working_memory
+
+
+def complete_run_checkpoints(pipeline_run_id: str) -> None:
+    """Clear the checkpoints of a pipeline run that completed, they are only needed to resume failed runs."""
+    if get_config().pipelex.checkpoint_config.is_cleared_on_success:
+        get_checkpoint_store().clear_checkpoints(pipeline_run_id=pipeline_run_id)
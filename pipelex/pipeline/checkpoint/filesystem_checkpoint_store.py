@@ -0,0 +1,57 @@
+import hashlib
+import shutil
+from pathlib import Path
+
+from typing_extensions import override
+
+from pipelex.pipeline.checkpoint.checkpoint_store_protocol import CheckpointStoreProtocol
+
+
+class FilesystemCheckpointStore(CheckpointStoreProtocol):
+    """Checkpoint store with one JSON file per checkpoint, in a directory per pipeline run.
+
+    Each file is written to a temporary path and then renamed, so a crash never leaves a truncated checkpoint behind.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return True
+
+    def _get_run_directory(self, pipeline_run_id: str) -> Path:
+        return Path(self.directory) / pipeline_run_id
+
+    def _get_checkpoint_path(self, pipeline_run_id: str, checkpoint_key: str) -> Path:
+        # checkpoint keys contain pipe codes and separators, hash them into safe and bounded file names
+        file_name = hashlib.sha256(checkpoint_key.encode("utf-8")).hexdigest() + ".json"
+        return self._get_run_directory(pipeline_run_id=pipeline_run_id) / file_name
+
+    @override
+    def save_checkpoint(self, pipeline_run_id: str, checkpoint_key: str, payload: str) -> None:
+        self._get_run_directory(pipeline_run_id=pipeline_run_id).mkdir(parents=True, exist_ok=True)
+        checkpoint_path = self._get_checkpoint_path(pipeline_run_id=pipeline_run_id, checkpoint_key=checkpoint_key)
+        temporary_path = checkpoint_path.with_suffix(".tmp")
+        temporary_path.write_text(payload, encoding="utf-8")
+        temporary_path.replace(checkpoint_path)
+
+    @override
+    def load_checkpoint(self, pipeline_run_id: str, checkpoint_key: str) -> str | None:
+        checkpoint_path = self._get_checkpoint_path(pipeline_run_id=pipeline_run_id, checkpoint_key=checkpoint_key)
+        if not checkpoint_path.is_file():
+            return None
+        return checkpoint_path.read_text(encoding="utf-8")
+
+    @override
+    def clear_checkpoints(self, pipeline_run_id: str) -> None:
+        shutil.rmtree(self._get_run_directory(pipeline_run_id=pipeline_run_id), ignore_errors=True)
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
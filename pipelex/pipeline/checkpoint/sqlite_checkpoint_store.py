@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import threading
+
+from typing_extensions import override
+
+from pipelex.pipeline.checkpoint.checkpoint_store_protocol import CheckpointStoreProtocol
+from pipelex.tools.misc.file_utils import ensure_path
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    pipeline_run_id TEXT NOT NULL,
+    checkpoint_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (pipeline_run_id, checkpoint_key)
+)
+"""
+
+
+class SqliteCheckpointStore(CheckpointStoreProtocol):
+    """Checkpoint store in a local SQLite database, committed after each checkpoint so it survives a crash of the process."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return True
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if directory := os.path.dirname(self.file_path):
+                ensure_path(directory)
+            self._connection = sqlite3.connect(self.file_path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(CREATE_TABLE_SQL)
+            self._connection.commit()
+        return self._connection
+
+    @override
+    def save_checkpoint(self, pipeline_run_id: str, checkpoint_key: str, payload: str) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (pipeline_run_id, checkpoint_key, payload) VALUES (?, ?, ?)",
+                (pipeline_run_id, checkpoint_key, payload),
+            )
+            connection.commit()
+
+    @override
+    def load_checkpoint(self, pipeline_run_id: str, checkpoint_key: str) -> str | None:
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT payload FROM checkpoints WHERE pipeline_run_id = ? AND checkpoint_key = ?",
+                    (pipeline_run_id, checkpoint_key),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        payload: str = row[0]
+        return payload
+
+    @override
+    def clear_checkpoints(self, pipeline_run_id: str) -> None:
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute("DELETE FROM checkpoints WHERE pipeline_run_id = ?", (pipeline_run_id,))
+            connection.commit()
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from pipelex.cogt.usage.usage_registry import ModelUsage
+from pipelex.pipeline.pipeline_models import PipelineRunStatus
+
+
+class CompletedPipelineRun(BaseModel):
+    """Record of a finalized pipeline run, kept in the bounded history of the pipeline manager."""
+
+    pipeline_run_id: str
+    status: PipelineRunStatus
+    started_at: datetime
+    completed_at: datetime
+    error_message: str | None = None
+    usage: ModelUsage | None = None
+
+    @property
+    def duration(self) -> float:
+        return (self.completed_at - self.started_at).total_seconds()
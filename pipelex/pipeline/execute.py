@@ -1,27 +1,33 @@
 from typing import TYPE_CHECKING
 
 from pipelex.client.protocol import PipelineInputs
+from pipelex.config import get_config
 from pipelex.core.memory.working_memory import WorkingMemory
 from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
 from pipelex.core.pipes.pipe_output import PipeOutput
 from pipelex.exceptions import PipeExecutionError, PipelineExecutionError, PipeRouterError
 from pipelex.hub import (
     get_library_manager,
-    get_pipe_router,
     get_pipeline_manager,
+    get_profiler,
     get_report_delegate,
     get_required_pipe,
     get_telemetry_manager,
 )
 from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
+from pipelex.pipe_run.pipe_run_dedup import deduplicate_pipe_runs
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.pipe_run.pipe_run_params import (
     FORCE_DRY_RUN_MODE_ENV_KEY,
     VariableMultiplicity,
 )
 from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.pipeline.cancel import run_cancellable_pipe_job
+from pipelex.pipeline.checkpoint.checkpointing import complete_run_checkpoints, prepare_run_checkpoints
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.run_lifecycle import evict_abandoned_pipeline_runs, finalize_pipeline_run_on_exit
 from pipelex.pipeline.validate_plx import validate_plx
+from pipelex.reporting.budget_config import BudgetLimits
 from pipelex.system.environment import get_optional_env
 from pipelex.system.telemetry.events import EventName, EventProperty, Outcome
 
@@ -39,6 +45,9 @@ async def execute_pipeline(
     dynamic_output_concept_code: str | None = None,
     pipe_run_mode: PipeRunMode | None = None,
     search_domains: list[str] | None = None,
+    budget_limits: BudgetLimits | None = None,
+    resume_run_id: str | None = None,
+    run_timeout: float | None = None,
 ) -> PipeOutput:
     """Execute a pipeline and wait for its completion.
 
@@ -67,6 +76,16 @@ async def execute_pipeline(
         the pipe run mode is ``PipeRunMode.LIVE``.
     search_domains:
         List of domains to search for pipes.
+    budget_limits:
+        Max cost, tokens or calls of this run, overriding the run limits of the budget config.
+        The run is aborted with a ``RunBudgetExceededError`` before dispatching an LLM job that could exceed them.
+    resume_run_id:
+        The ``pipeline_run_id`` of a failed run to resume, with checkpointing enabled. The PipeSequence steps and
+        PipeBatch items it completed are restored from their checkpoints instead of being run again.
+        Its inputs are restored too, unless other inputs are given.
+    run_timeout:
+        Max duration of the run in seconds, overriding the run_timeout of the pipe run config. Once elapsed, the run
+        is cancelled, as by *cancel_pipeline*, and raises a ``PipelineCancelledError``.
 
     Returns:
     -------
@@ -118,43 +137,63 @@ async def execute_pipeline(
         else:
             pipe_run_mode = PipeRunMode.LIVE
 
-    pipeline = get_pipeline_manager().add_new_pipeline()
-    get_report_delegate().open_registry(pipeline_run_id=pipeline.pipeline_run_id)
+    evict_abandoned_pipeline_runs()
+    pipeline = get_pipeline_manager().add_new_pipeline(pipeline_run_id=resume_run_id)
+    get_report_delegate().open_registry(
+        pipeline_run_id=pipeline.pipeline_run_id,
+        budget_limits=budget_limits,
+        is_resumed=resume_run_id is not None,
+    )
 
     job_metadata = JobMetadata(
         pipeline_run_id=pipeline.pipeline_run_id,
     )
 
-    pipe_run_params = PipeRunParamsFactory.make_run_params(
-        output_multiplicity=output_multiplicity,
-        dynamic_output_concept_code=dynamic_output_concept_code,
-        pipe_run_mode=pipe_run_mode,
-    )
+    try:
+        # the run is finalized as soon as it is registered, so that it can't leak if preparing its pipe job fails
+        with finalize_pipeline_run_on_exit(pipeline_run_id=job_metadata.pipeline_run_id):
+            pipe_run_params = PipeRunParamsFactory.make_run_params(
+                output_multiplicity=output_multiplicity,
+                dynamic_output_concept_code=dynamic_output_concept_code,
+                pipe_run_mode=pipe_run_mode,
+                is_resumed=resume_run_id is not None,
+            )
 
-    pipe_job = PipeJobFactory.make_pipe_job(
-        pipe=pipe,
-        pipe_run_params=pipe_run_params,
-        job_metadata=job_metadata,
-        working_memory=working_memory,
-        output_name=output_name,
-    )
+            working_memory = prepare_run_checkpoints(
+                pipeline_run_id=pipeline.pipeline_run_id,
+                pipe_run_params=pipe_run_params,
+                working_memory=working_memory,
+            )
 
-    properties = {
-        EventProperty.PIPELINE_RUN_ID: job_metadata.pipeline_run_id,
-        EventProperty.PIPE_TYPE: pipe.pipe_type,
-    }
-    get_telemetry_manager().track_event(event_name=EventName.PIPELINE_EXECUTE, properties=properties)
+            pipe_job = PipeJobFactory.make_pipe_job(
+                pipe=pipe,
+                pipe_run_params=pipe_run_params,
+                job_metadata=job_metadata,
+                working_memory=working_memory,
+                output_name=output_name,
+            )
 
-    try:
-        pipe_output = await get_pipe_router().run(pipe_job)
-    except PipeRouterError as exc:
-        raise PipelineExecutionError(
-            message=exc.message,
-            run_mode=pipe_job.pipe_run_params.run_mode,
-            pipe_code=pipe_job.pipe.code,
-            output_name=pipe_job.output_name,
-            pipe_stack=pipe_job.pipe_run_params.pipe_stack,
-        ) from exc
+            properties = {
+                EventProperty.PIPELINE_RUN_ID: job_metadata.pipeline_run_id,
+                EventProperty.PIPE_TYPE: pipe.pipe_type,
+            }
+            get_telemetry_manager().track_event(event_name=EventName.PIPELINE_EXECUTE, properties=properties)
+
+            try:
+                with (
+                    get_profiler().profile_run(pipeline_run_id=job_metadata.pipeline_run_id),
+                    deduplicate_pipe_runs(is_enabled=get_config().pipelex.feature_config.is_pipe_run_deduplication_enabled),
+                ):
+                    pipe_output = await run_cancellable_pipe_job(pipe_job=pipe_job, run_timeout=run_timeout)
+                    complete_run_checkpoints(pipeline_run_id=job_metadata.pipeline_run_id)
+            except PipeRouterError as exc:
+                raise PipelineExecutionError(
+                    message=exc.message,
+                    run_mode=pipe_job.pipe_run_params.run_mode,
+                    pipe_code=pipe_job.pipe.code,
+                    output_name=pipe_job.output_name,
+                    pipe_stack=pipe_job.pipe_run_params.pipe_stack,
+                ) from exc
     finally:
         if plx_content and blueprint is not None:
             get_library_manager().remove_from_blueprint(blueprint=blueprint)
@@ -0,0 +1,96 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from pipelex.client.protocol import PipelineInputs
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.exceptions import PipeExecutionError
+from pipelex.hub import get_required_pipe
+from pipelex.pipe_controllers.batch.batch_item_stream import BatchItemOutput, BatchItemStream, BatchStreamOrder, set_current_batch_item_stream
+from pipelex.pipe_controllers.batch.pipe_batch import PipeBatch
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipeline.execute import execute_pipeline
+from pipelex.reporting.budget_config import BudgetLimits
+
+
+async def execute_pipeline_stream(
+    pipe_code: str,
+    inputs: PipelineInputs | WorkingMemory | None = None,
+    output_name: str | None = None,
+    pipe_run_mode: PipeRunMode | None = None,
+    search_domains: list[str] | None = None,
+    budget_limits: BudgetLimits | None = None,
+    resume_run_id: str | None = None,
+    run_timeout: float | None = None,
+    stream_order: BatchStreamOrder = BatchStreamOrder.COMPLETION,
+    max_reordered_items: int = 16,
+) -> AsyncIterator[BatchItemOutput]:
+    """Execute a PipeBatch pipeline and yield the output of each item as soon as it completes.
+
+    The pipeline is run as by *execute_pipeline*, in a task of its own. If it fails, the error is raised
+    once the items completed before the failure have been yielded. If the iteration is stopped early,
+    the pipeline is cancelled.
+
+    Parameters
+    ----------
+    pipe_code:
+        The code of the PipeBatch to execute.
+    inputs:
+        Inputs passed to the pipeline.
+    output_name:
+        Name of the output slot to write to.
+    pipe_run_mode:
+        Pipe run mode, as for *execute_pipeline*.
+    search_domains:
+        List of domains to search for pipes.
+    budget_limits:
+        Max cost, tokens or calls of this run, overriding the run limits of the budget config.
+    resume_run_id:
+        The ``pipeline_run_id`` of a failed run to resume, with checkpointing enabled.
+    run_timeout:
+        Max duration of the run in seconds, as for *execute_pipeline*.
+    stream_order:
+        ``BatchStreamOrder.COMPLETION`` to yield the items as they complete, or ``BatchStreamOrder.INPUT``
+        to yield them in the order of the input list.
+    max_reordered_items:
+        In input order, how many items can run ahead of the next item to yield.
+
+    Yields:
+    ------
+    BatchItemOutput
+        The index of each item in the input list, with its output stuff. The failed items of a batch that
+        collects its errors are skipped.
+
+    """
+    pipe = get_required_pipe(pipe_code=pipe_code)
+    if not isinstance(pipe, PipeBatch):
+        msg = f"Pipe '{pipe_code}' is a {pipe.pipe_type}, only the items of a PipeBatch can be streamed by the API execute_pipeline_stream."
+        raise PipeExecutionError(message=msg)
+
+    batch_item_stream = BatchItemStream(pipe_code=pipe_code, stream_order=stream_order, max_reordered_items=max_reordered_items)
+
+    async def run_pipeline() -> PipeOutput:
+        try:
+            with set_current_batch_item_stream(batch_item_stream=batch_item_stream):
+                return await execute_pipeline(
+                    pipe_code=pipe_code,
+                    inputs=inputs,
+                    output_name=output_name,
+                    pipe_run_mode=pipe_run_mode,
+                    search_domains=search_domains,
+                    budget_limits=budget_limits,
+                    resume_run_id=resume_run_id,
+                    run_timeout=run_timeout,
+                )
+        finally:
+            batch_item_stream.close()
+
+    pipeline_task = asyncio.create_task(run_pipeline())
+    try:
+        async for batch_item_output in batch_item_stream:
+            yield batch_item_output
+        await pipeline_task
+    finally:
+        if not pipeline_task.done():
+            pipeline_task.cancel()
+            await asyncio.gather(pipeline_task, return_exceptions=True)
@@ -54,6 +54,13 @@ class JobMetadata(BaseModel):
         if updated_metadata.completed_at:
             self.completed_at = updated_metadata.completed_at
 
+    def add_pipe_job_id(self, pipe_job_id: str):
+        """Record a pipe job in place, without building an intermediate JobMetadata."""
+        if self.pipe_job_ids is None:
+            self.pipe_job_ids = [pipe_job_id]
+        else:
+            self.pipe_job_ids.append(pipe_job_id)
+
     def copy_with_update(self, updated_metadata: "JobMetadata") -> "JobMetadata":
         new_metadata = self.model_copy()
         new_metadata.update(updated_metadata=updated_metadata)
@@ -1,5 +1,13 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pipelex.pipe_run.pipe_run_cancellation import CancellationToken
 
 
 class Pipeline(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     pipeline_run_id: str
+    started_at: datetime = Field(default_factory=datetime.now)
+    cancellation_token: CancellationToken = Field(default_factory=CancellationToken, exclude=True)
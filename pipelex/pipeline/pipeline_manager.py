@@ -1,16 +1,30 @@
-from pydantic import Field, RootModel
+from collections import OrderedDict
+from datetime import datetime
+
+from pydantic import Field, PrivateAttr, RootModel
 from typing_extensions import override
 
+from pipelex.cogt.usage.usage_registry import ModelUsage
+from pipelex.config import get_config
 from pipelex.exceptions import PipelineManagerNotFoundError
+from pipelex.pipeline.completed_pipeline_run import CompletedPipelineRun
 from pipelex.pipeline.pipeline import Pipeline
 from pipelex.pipeline.pipeline_factory import PipelineFactory
 from pipelex.pipeline.pipeline_manager_abstract import PipelineManagerAbstract
+from pipelex.pipeline.pipeline_models import PipelineRunStatus
 
 PipelineManagerRoot = dict[str, Pipeline]
 
 
 class PipelineManager(PipelineManagerAbstract, RootModel[PipelineManagerRoot]):
+    """Holds the pipelines of the runs in progress, and the bounded history of the completed runs.
+
+    A pipeline is removed when its run is finalized, so that the manager only grows with the runs in progress.
+    """
+
     root: PipelineManagerRoot = Field(default_factory=dict)
+    _completed_runs: "OrderedDict[str, CompletedPipelineRun]" = PrivateAttr(default_factory=OrderedDict)
+    _last_sweep_at: datetime | None = PrivateAttr(default=None)
 
     @override
     def setup(self):
@@ -19,6 +33,8 @@ class PipelineManager(PipelineManagerAbstract, RootModel[PipelineManagerRoot]):
     @override
     def teardown(self):
         self.root.clear()
+        self._completed_runs.clear()
+        self._last_sweep_at = None
 
     @override
     def get_optional_pipeline(self, pipeline_run_id: str) -> Pipeline | None:
@@ -37,7 +53,62 @@ class PipelineManager(PipelineManagerAbstract, RootModel[PipelineManagerRoot]):
         return pipeline
 
     @override
-    def add_new_pipeline(self) -> Pipeline:
-        pipeline = PipelineFactory.make_pipeline()
+    def add_new_pipeline(self, pipeline_run_id: str | None = None) -> Pipeline:
+        pipeline = PipelineFactory.make_pipeline(pipeline_run_id=pipeline_run_id)
         self._set_pipeline(pipeline_run_id=pipeline.pipeline_run_id, pipeline=pipeline)
         return pipeline
+
+    @override
+    def finalize_pipeline(
+        self,
+        pipeline_run_id: str,
+        status: PipelineRunStatus,
+        error_message: str | None = None,
+        usage: ModelUsage | None = None,
+    ) -> CompletedPipelineRun:
+        """Remove the pipeline of a completed run, and add the record of that run to the history of completed runs."""
+        pipeline = self.get_pipeline(pipeline_run_id=pipeline_run_id)
+        del self.root[pipeline_run_id]
+        completed_run = CompletedPipelineRun(
+            pipeline_run_id=pipeline_run_id,
+            status=status,
+            started_at=pipeline.started_at,
+            completed_at=datetime.now(),
+            error_message=error_message,
+            usage=usage,
+        )
+        # a resumed run moves to the end of the history
+        self._completed_runs.pop(pipeline_run_id, None)
+        self._completed_runs[pipeline_run_id] = completed_run
+        nb_completed_runs_kept = get_config().pipelex.run_lifecycle_config.nb_completed_runs_kept
+        while len(self._completed_runs) > nb_completed_runs_kept:
+            self._completed_runs.popitem(last=False)
+        return completed_run
+
+    @override
+    def sweep_abandoned_pipelines(self) -> list[Pipeline]:
+        """Return the pipelines of the runs abandoned for longer than the abandoned run TTL.
+
+        A run is abandoned if it was never finalized, and has no task left running. As the sweep goes through all the
+        pipelines, it only happens once per sweep interval, and returns no pipeline otherwise.
+        """
+        run_lifecycle_config = get_config().pipelex.run_lifecycle_config
+        now = datetime.now()
+        if self._last_sweep_at is not None and (now - self._last_sweep_at).total_seconds() < run_lifecycle_config.abandoned_runs_sweep_interval:
+            return []
+        self._last_sweep_at = now
+        return [
+            pipeline
+            for pipeline in self.root.values()
+            if (now - pipeline.started_at).total_seconds() > run_lifecycle_config.abandoned_run_ttl
+            and not pipeline.cancellation_token.has_running_tasks
+        ]
+
+    @override
+    def get_optional_completed_run(self, pipeline_run_id: str) -> CompletedPipelineRun | None:
+        return self._completed_runs.get(pipeline_run_id)
+
+    @override
+    def get_completed_runs(self) -> list[CompletedPipelineRun]:
+        """Return the records of the most recently completed runs, from the oldest to the latest."""
+        return list(self._completed_runs.values())
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 
+from pipelex.cogt.usage.usage_registry import ModelUsage
+from pipelex.pipeline.completed_pipeline_run import CompletedPipelineRun
 from pipelex.pipeline.pipeline import Pipeline
+from pipelex.pipeline.pipeline_models import PipelineRunStatus
 
 
 class PipelineManagerAbstract(ABC):
@@ -21,5 +24,27 @@ class PipelineManagerAbstract(ABC):
         pass
 
     @abstractmethod
-    def add_new_pipeline(self) -> Pipeline:
+    def add_new_pipeline(self, pipeline_run_id: str | None = None) -> Pipeline:
+        pass
+
+    @abstractmethod
+    def finalize_pipeline(
+        self,
+        pipeline_run_id: str,
+        status: PipelineRunStatus,
+        error_message: str | None = None,
+        usage: ModelUsage | None = None,
+    ) -> CompletedPipelineRun:
+        pass
+
+    @abstractmethod
+    def sweep_abandoned_pipelines(self) -> list[Pipeline]:
+        pass
+
+    @abstractmethod
+    def get_optional_completed_run(self, pipeline_run_id: str) -> CompletedPipelineRun | None:
+        pass
+
+    @abstractmethod
+    def get_completed_runs(self) -> list[CompletedPipelineRun]:
         pass
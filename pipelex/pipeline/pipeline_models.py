@@ -3,3 +3,11 @@ from pipelex.types import StrEnum
 
 class SpecialPipelineId(StrEnum):
     UNTITLED = "untitled"
+
+
+class PipelineRunStatus(StrEnum):
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    # started but never finalized, evicted after the abandoned run TTL
+    ABANDONED = "abandoned"
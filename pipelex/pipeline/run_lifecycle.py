@@ -0,0 +1,54 @@
+import asyncio
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from pipelex import log
+from pipelex.exceptions import PipelineCancelledError
+from pipelex.hub import get_pipeline_manager, get_report_delegate
+from pipelex.pipeline.completed_pipeline_run import CompletedPipelineRun
+from pipelex.pipeline.pipeline_models import PipelineRunStatus
+
+ABANDONED_RUN_REASON = "the run was abandoned"
+
+
+def finalize_pipeline_run(pipeline_run_id: str, status: PipelineRunStatus, error_message: str | None = None) -> CompletedPipelineRun | None:
+    """Finalize a pipeline run: close its usage registry, flushing its usage records, and move it to the history of completed runs.
+
+    Returns None if the run was already finalized.
+    """
+    pipeline_manager = get_pipeline_manager()
+    if pipeline_manager.get_optional_pipeline(pipeline_run_id=pipeline_run_id) is None:
+        return None
+    report_delegate = get_report_delegate()
+    usage = report_delegate.get_run_usage(pipeline_run_id=pipeline_run_id)
+    report_delegate.close_registry(pipeline_run_id=pipeline_run_id)
+    return pipeline_manager.finalize_pipeline(pipeline_run_id=pipeline_run_id, status=status, error_message=error_message, usage=usage)
+
+
+def evict_abandoned_pipeline_runs() -> list[CompletedPipelineRun]:
+    """Finalize the runs abandoned for longer than the abandoned run TTL of the run lifecycle config.
+
+    A run is abandoned if it was never finalized and has no task left running, e.g. if it failed before running its pipe.
+    """
+    evicted_runs: list[CompletedPipelineRun] = []
+    for pipeline in get_pipeline_manager().sweep_abandoned_pipelines():
+        pipeline.cancellation_token.cancel(reason=ABANDONED_RUN_REASON)
+        if completed_run := finalize_pipeline_run(pipeline_run_id=pipeline.pipeline_run_id, status=PipelineRunStatus.ABANDONED):
+            evicted_runs.append(completed_run)
+    if evicted_runs:
+        log.warning(f"Evicted {len(evicted_runs)} abandoned pipeline run(s)")
+    return evicted_runs
+
+
+@contextmanager
+def finalize_pipeline_run_on_exit(pipeline_run_id: str) -> Generator[None, None, None]:
+    """Finalize a pipeline run when this context exits, with the status of its outcome."""
+    try:
+        yield
+    except (PipelineCancelledError, asyncio.CancelledError) as exc:
+        finalize_pipeline_run(pipeline_run_id=pipeline_run_id, status=PipelineRunStatus.CANCELLED, error_message=str(exc) or None)
+        raise
+    except Exception as exc:
+        finalize_pipeline_run(pipeline_run_id=pipeline_run_id, status=PipelineRunStatus.FAILED, error_message=str(exc))
+        raise
+    finalize_pipeline_run(pipeline_run_id=pipeline_run_id, status=PipelineRunStatus.SUCCEEDED)
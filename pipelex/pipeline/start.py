@@ -1,20 +1,39 @@
 import asyncio
+from contextlib import ExitStack
 
 from pipelex.client.protocol import PipelineInputs
+from pipelex.config import get_config
 from pipelex.core.memory.working_memory import WorkingMemory
 from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
 from pipelex.core.pipes.pipe_output import PipeOutput
 from pipelex.hub import (
-    get_pipe_router,
     get_pipeline_manager,
+    get_profiler,
     get_report_delegate,
     get_required_pipe,
 )
+from pipelex.pipe_run.pipe_job import PipeJob
 from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
+from pipelex.pipe_run.pipe_run_dedup import deduplicate_pipe_runs
 from pipelex.pipe_run.pipe_run_mode import PipeRunMode
 from pipelex.pipe_run.pipe_run_params import VariableMultiplicity
 from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.pipeline.cancel import run_cancellable_pipe_job
+from pipelex.pipeline.checkpoint.checkpointing import complete_run_checkpoints, prepare_run_checkpoints
 from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.run_lifecycle import evict_abandoned_pipeline_runs, finalize_pipeline_run_on_exit
+from pipelex.reporting.budget_config import BudgetLimits
+
+
+async def _run_profiled_pipe_job(pipe_job: PipeJob, run_timeout: float | None, run_finalization: ExitStack) -> PipeOutput:
+    with run_finalization:
+        with (
+            get_profiler().profile_run(pipeline_run_id=pipe_job.job_metadata.pipeline_run_id),
+            deduplicate_pipe_runs(is_enabled=get_config().pipelex.feature_config.is_pipe_run_deduplication_enabled),
+        ):
+            pipe_output = await run_cancellable_pipe_job(pipe_job=pipe_job, run_timeout=run_timeout)
+        complete_run_checkpoints(pipeline_run_id=pipe_job.job_metadata.pipeline_run_id)
+    return pipe_output
 
 
 async def start_pipeline(
@@ -25,6 +44,9 @@ async def start_pipeline(
     dynamic_output_concept_code: str | None = None,
     pipe_run_mode: PipeRunMode = PipeRunMode.LIVE,
     search_domains: list[str] | None = None,
+    budget_limits: BudgetLimits | None = None,
+    resume_run_id: str | None = None,
+    run_timeout: float | None = None,
 ) -> tuple[str, asyncio.Task[PipeOutput]]:
     """Start a pipeline in the background.
 
@@ -49,12 +71,23 @@ async def start_pipeline(
         Pipe run mode: ``PipeRunMode.LIVE`` or ``PipeRunMode.DRY``.
     search_domains:
         List of domains to search for pipes.
+    budget_limits:
+        Max cost, tokens or calls of this run, overriding the run limits of the budget config.
+        The run is aborted with a ``RunBudgetExceededError`` before dispatching an LLM job that could exceed them.
+    resume_run_id:
+        The ``pipeline_run_id`` of a failed run to resume, with checkpointing enabled. The PipeSequence steps and
+        PipeBatch items it completed are restored from their checkpoints instead of being run again.
+        Its inputs are restored too, unless other inputs are given.
+    run_timeout:
+        Max duration of the run in seconds, overriding the run_timeout of the pipe run config. Once elapsed, the run
+        is cancelled, as by *cancel_pipeline*, and raises a ``PipelineCancelledError``.
 
     Returns:
     -------
     Tuple[str, asyncio.Task[PipeOutput]]
         The ``pipeline_run_id`` of the newly started pipeline and a task that
-        can be awaited to get the pipe output.
+        can be awaited to get the pipe output. The run can be cancelled with
+        *cancel_pipeline* and its ``pipeline_run_id``.
 
     """
     pipe = get_required_pipe(pipe_code=pipe_code)
@@ -74,31 +107,50 @@ async def start_pipeline(
                 search_domains=search_domains,
             )
 
-    pipeline = get_pipeline_manager().add_new_pipeline()
-    get_report_delegate().open_registry(pipeline_run_id=pipeline.pipeline_run_id)
-
-    job_metadata = JobMetadata(
+    evict_abandoned_pipeline_runs()
+    pipeline = get_pipeline_manager().add_new_pipeline(pipeline_run_id=resume_run_id)
+    get_report_delegate().open_registry(
         pipeline_run_id=pipeline.pipeline_run_id,
+        budget_limits=budget_limits,
+        is_resumed=resume_run_id is not None,
     )
 
-    pipe_run_params = PipeRunParamsFactory.make_run_params(
-        output_multiplicity=output_multiplicity,
-        dynamic_output_concept_code=dynamic_output_concept_code,
-        pipe_run_mode=pipe_run_mode,
-    )
-
-    if working_memory:
-        working_memory.pretty_print_summary()
-
-    pipe_job = PipeJobFactory.make_pipe_job(
-        pipe=pipe,
-        pipe_run_params=pipe_run_params,
-        job_metadata=job_metadata,
-        working_memory=working_memory,
-        output_name=output_name,
+    job_metadata = JobMetadata(
+        pipeline_run_id=pipeline.pipeline_run_id,
     )
 
-    # Launch execution without awaiting the result.
-    task: asyncio.Task[PipeOutput] = asyncio.create_task(get_pipe_router().run(pipe_job))
+    with ExitStack() as run_finalization:
+        # the run is finalized as soon as it is registered, so that it can't leak if preparing its pipe job fails,
+        # and once prepared its finalization is handed over to its task
+        run_finalization.enter_context(finalize_pipeline_run_on_exit(pipeline_run_id=pipeline.pipeline_run_id))
+
+        pipe_run_params = PipeRunParamsFactory.make_run_params(
+            output_multiplicity=output_multiplicity,
+            dynamic_output_concept_code=dynamic_output_concept_code,
+            pipe_run_mode=pipe_run_mode,
+            is_resumed=resume_run_id is not None,
+        )
+
+        working_memory = prepare_run_checkpoints(
+            pipeline_run_id=pipeline.pipeline_run_id,
+            pipe_run_params=pipe_run_params,
+            working_memory=working_memory,
+        )
+
+        if working_memory:
+            working_memory.pretty_print_summary()
+
+        pipe_job = PipeJobFactory.make_pipe_job(
+            pipe=pipe,
+            pipe_run_params=pipe_run_params,
+            job_metadata=job_metadata,
+            working_memory=working_memory,
+            output_name=output_name,
+        )
+
+        # Launch execution without awaiting the result.
+        task: asyncio.Task[PipeOutput] = asyncio.create_task(
+            _run_profiled_pipe_job(pipe_job=pipe_job, run_timeout=run_timeout, run_finalization=run_finalization.pop_all())
+        )
 
     return pipeline.pipeline_run_id, task
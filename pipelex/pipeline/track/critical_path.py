@@ -0,0 +1,291 @@
+# pyright: reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false
+# pyright: reportUnknownParameterType=false
+# pyright: reportMissingTypeArgument=false
+import bisect
+from datetime import datetime
+
+import networkx as nx
+from pydantic import BaseModel, Field
+from rich import box
+from rich.table import Table
+
+from pipelex.pipeline.track.step_timing import StepTiming
+from pipelex.pipeline.track.tracker_models import NodeAttributeKey
+from pipelex.tools.typing.pydantic_utils import empty_list_factory_of
+from pipelex.types import StrEnum
+
+
+class TimedStep(BaseModel):
+    pipe_code: str
+    from_nodes: list[str]
+    to_node: str
+    timing: StepTiming
+
+
+class CriticalLink(StrEnum):
+    """How a step of the critical path was held up by the previous one."""
+
+    FIRST = "first"
+    # the step waited for its input, produced by the previous step
+    DATA = "data"
+    # the step's inputs were ready but it waited for the previous step of its sequence to end
+    ORDER = "order"
+
+
+class StepReport(BaseModel):
+    pipe_code: str
+    output_name: str
+    start_offset: float
+    duration: float
+    input_wait: float
+    critical_link: CriticalLink | None = None
+
+
+class CriticalPathReport(BaseModel):
+    wall_time: float
+    total_work: float
+    # the longest chain of data dependencies, the minimal latency with unlimited concurrency
+    data_span: float
+    peak_concurrency: int
+    steps: list[StepReport] = Field(default_factory=empty_list_factory_of(StepReport))
+    critical_edges: list[tuple[str, str]] = Field(default_factory=list)
+    order_edges: list[tuple[str, str]] = Field(default_factory=list)
+
+    @property
+    def critical_steps(self) -> list[StepReport]:
+        return [step for step in self.steps if step.critical_link is not None]
+
+    @property
+    def achieved_parallelism(self) -> float:
+        return self.total_work / self.wall_time if self.wall_time > 0 else 1.0
+
+    @property
+    def available_parallelism(self) -> float:
+        return self.total_work / self.data_span if self.data_span > 0 else 1.0
+
+    @property
+    def total_input_wait(self) -> float:
+        return sum(step.input_wait for step in self.steps)
+
+    def make_table(self, title: str | None = None) -> Table:
+        table = Table(title=title or "Critical path", box=box.ROUNDED)
+        table.add_column("Pipe", style="cyan")
+        table.add_column("Output", style="green")
+        table.add_column("Start (s)", justify="right")
+        table.add_column("Duration (s)", justify="right", style="magenta")
+        table.add_column("Input wait (s)", justify="right", style="yellow")
+        table.add_column("Critical", justify="center", style="bold red")
+        for step in self.steps:
+            table.add_row(
+                step.pipe_code,
+                step.output_name,
+                f"{step.start_offset:.2f}",
+                f"{step.duration:.2f}",
+                f"{step.input_wait:.2f}",
+                step.critical_link or "",
+            )
+        table.caption = (
+            f"Wall time {self.wall_time:.2f}s, work {self.total_work:.2f}s, data span {self.data_span:.2f}s, "
+            f"parallelism achieved {self.achieved_parallelism:.1f} of {self.available_parallelism:.1f} available, "
+            f"peak concurrency {self.peak_concurrency}"
+        )
+        return table
+
+
+class CriticalPathAnalyzer:
+    """Computes the critical path of the steps recorded by the PipelineTracker.
+
+    Only the innermost steps are considered: a step running a controller spans the steps it runs.
+    The readiness of a stuff which was not produced by a timed step, such as a batch item or an aggregated list,
+    comes from its predecessors in the tracker graph.
+    """
+
+    def __init__(self, nx_graph: nx.DiGraph, timed_steps: list[TimedStep]):
+        self.nx_graph = nx_graph
+        # the steps nested in each controller, identified by the stack it was called from and its code
+        nested_timings: dict[tuple[tuple[str, ...], str], list[StepTiming]] = {}
+        for timed_step in timed_steps:
+            pipe_stack = timed_step.timing.pipe_stack
+            for depth in range(len(pipe_stack)):
+                nested_timings.setdefault((tuple(pipe_stack[:depth]), pipe_stack[depth]), []).append(timed_step.timing)
+        for step_timings in nested_timings.values():
+            step_timings.sort(key=lambda step_timing: step_timing.started_at)
+        self.leaf_steps = [timed_step for timed_step in timed_steps if not self._is_controller_step(timed_step, nested_timings)]
+        self.leaf_steps.sort(key=lambda timed_step: timed_step.timing.started_at)
+        self._producers: dict[str, TimedStep] = {}
+        for leaf_step in self.leaf_steps:
+            existing_producer = self._producers.get(leaf_step.to_node)
+            if existing_producer is None or leaf_step.timing.ended_at > existing_producer.timing.ended_at:
+                self._producers[leaf_step.to_node] = leaf_step
+        self._ready_at: dict[str, datetime] = {}
+        self._ready_driver: dict[str, str | None] = {}
+        self._data_finish: dict[str, float] = {}
+
+    @staticmethod
+    def _is_controller_step(timed_step: TimedStep, nested_timings: dict[tuple[tuple[str, ...], str], list[StepTiming]]) -> bool:
+        # a batch made by a SubPipe bears the code of its branch pipe, so the steps it runs are told apart from it by their times
+        step_timings = nested_timings.get((tuple(timed_step.timing.pipe_stack), timed_step.pipe_code))
+        if not step_timings:
+            return False
+        starts = [step_timing.started_at for step_timing in step_timings]
+        for step_timing in step_timings[bisect.bisect_left(starts, timed_step.timing.started_at) :]:
+            if step_timing.started_at > timed_step.timing.ended_at:
+                break
+            if step_timing.ended_at <= timed_step.timing.ended_at:
+                return True
+        return False
+
+    def _get_run_bounds(self) -> tuple[datetime, datetime]:
+        started_at = min(leaf_step.timing.started_at for leaf_step in self.leaf_steps)
+        ended_at = max(leaf_step.timing.ended_at for leaf_step in self.leaf_steps)
+        return started_at, ended_at
+
+    def _get_node_ready_at(self, node: str, run_started_at: datetime, visiting: set[str] | None = None) -> datetime:
+        if (ready_at := self._ready_at.get(node)) is not None:
+            return ready_at
+        ready_driver: str | None = None
+        if producer := self._producers.get(node):
+            ready_at = producer.timing.ended_at
+        else:
+            ready_at = run_started_at
+            visiting = visiting or set()
+            visiting.add(node)
+            predecessors = list(self.nx_graph.predecessors(node)) if self.nx_graph.has_node(node) else []
+            for predecessor in predecessors:
+                if predecessor in visiting:
+                    continue
+                predecessor_ready_at = self._get_node_ready_at(node=predecessor, run_started_at=run_started_at, visiting=visiting)
+                if predecessor_ready_at > ready_at:
+                    ready_at = predecessor_ready_at
+                    ready_driver = predecessor
+        self._ready_at[node] = ready_at
+        self._ready_driver[node] = ready_driver
+        return ready_at
+
+    def _get_input_ready_at(self, timed_step: TimedStep, run_started_at: datetime) -> tuple[datetime, str | None]:
+        input_ready_at = run_started_at
+        input_driver: str | None = None
+        for from_node in timed_step.from_nodes:
+            node_ready_at = self._get_node_ready_at(node=from_node, run_started_at=run_started_at)
+            if node_ready_at > input_ready_at:
+                input_ready_at = node_ready_at
+                input_driver = from_node
+        return input_ready_at, input_driver
+
+    def _trace_data_producer(self, node: str) -> tuple[list[str], TimedStep | None]:
+        """Follow the stuffs which made a node ready, back to the step that produced the last of them."""
+        nodes = [node]
+        while (producer := self._producers.get(nodes[-1])) is None:
+            driver = self._ready_driver.get(nodes[-1])
+            if driver is None or driver in nodes:
+                return list(reversed(nodes)), None
+            nodes.append(driver)
+        return list(reversed(nodes)), producer
+
+    def _get_data_finish(self, node: str, visiting: set[str] | None = None) -> float:
+        """Duration of the longest chain of timed steps leading to a node, ignoring the time spent waiting between them."""
+        if (data_finish := self._data_finish.get(node)) is not None:
+            return data_finish
+        visiting = visiting or set()
+        visiting.add(node)
+        if producer := self._producers.get(node):
+            inputs_finish = [
+                self._get_data_finish(node=from_node, visiting=visiting) for from_node in producer.from_nodes if from_node not in visiting
+            ]
+            data_finish = producer.timing.duration + max(inputs_finish, default=0.0)
+        else:
+            predecessors = list(self.nx_graph.predecessors(node)) if self.nx_graph.has_node(node) else []
+            data_finish = max(
+                (self._get_data_finish(node=predecessor, visiting=visiting) for predecessor in predecessors if predecessor not in visiting),
+                default=0.0,
+            )
+        self._data_finish[node] = data_finish
+        return data_finish
+
+    def _get_peak_concurrency(self) -> int:
+        # at equal times, ends are counted before starts so that back-to-back steps do not overlap
+        events = sorted(
+            [(leaf_step.timing.started_at, 1) for leaf_step in self.leaf_steps] + [(leaf_step.timing.ended_at, -1) for leaf_step in self.leaf_steps]
+        )
+        peak_concurrency = 0
+        concurrency = 0
+        for _, delta in events:
+            concurrency += delta
+            peak_concurrency = max(peak_concurrency, concurrency)
+        return peak_concurrency
+
+    def _get_output_name(self, node: str) -> str:
+        if self.nx_graph.has_node(node) and (node_name := self.nx_graph.nodes[node].get(NodeAttributeKey.NAME)):
+            return str(node_name)
+        return node
+
+    def analyze(self) -> CriticalPathReport | None:
+        if not self.leaf_steps:
+            return None
+        run_started_at, run_ended_at = self._get_run_bounds()
+
+        input_waits: dict[int, float] = {}
+        input_drivers: dict[int, str | None] = {}
+        for leaf_step in self.leaf_steps:
+            input_ready_at, input_driver = self._get_input_ready_at(timed_step=leaf_step, run_started_at=run_started_at)
+            input_waits[id(leaf_step)] = max(0.0, (leaf_step.timing.started_at - input_ready_at).total_seconds())
+            input_drivers[id(leaf_step)] = input_driver
+
+        # Walk back from the last step: each step was held up either by its last input or by the step which ended right before it started
+        steps_by_end = sorted(self.leaf_steps, key=lambda leaf_step: leaf_step.timing.ended_at)
+        ends = [leaf_step.timing.ended_at for leaf_step in steps_by_end]
+        critical_links: dict[int, CriticalLink] = {}
+        critical_edges: list[tuple[str, str]] = []
+        order_edges: list[tuple[str, str]] = []
+        current_step = steps_by_end[-1]
+        while id(current_step) not in critical_links:
+            previous_step: TimedStep | None = None
+            link = CriticalLink.FIRST
+            data_nodes: list[str] = []
+            if input_driver := input_drivers[id(current_step)]:
+                data_nodes, previous_step = self._trace_data_producer(node=input_driver)
+                link = CriticalLink.DATA
+            blocker_index = bisect.bisect_right(ends, current_step.timing.started_at) - 1
+            while blocker_index >= 0 and steps_by_end[blocker_index] is current_step:
+                blocker_index -= 1
+            if blocker_index >= 0:
+                blocker = steps_by_end[blocker_index]
+                data_ready_at = self._ready_at.get(input_driver, run_started_at) if input_driver else run_started_at
+                if blocker.timing.ended_at > data_ready_at:
+                    previous_step = blocker
+                    link = CriticalLink.ORDER
+            if link == CriticalLink.DATA:
+                critical_edges.extend(zip(data_nodes, [*data_nodes[1:], current_step.to_node], strict=True))
+            elif link == CriticalLink.ORDER and previous_step is not None:
+                order_edges.append((previous_step.to_node, current_step.to_node))
+            if previous_step is None:
+                link = CriticalLink.FIRST
+            critical_links[id(current_step)] = link
+            if previous_step is None:
+                break
+            current_step = previous_step
+
+        # in the order of their ends, the inputs of each step have already been computed, which keeps the recursion shallow
+        data_span = max(self._get_data_finish(node=leaf_step.to_node) for leaf_step in steps_by_end)
+        step_reports = [
+            StepReport(
+                pipe_code=leaf_step.pipe_code,
+                output_name=self._get_output_name(node=leaf_step.to_node),
+                start_offset=(leaf_step.timing.started_at - run_started_at).total_seconds(),
+                duration=leaf_step.timing.duration,
+                input_wait=input_waits[id(leaf_step)],
+                critical_link=critical_links.get(id(leaf_step)),
+            )
+            for leaf_step in self.leaf_steps
+        ]
+        return CriticalPathReport(
+            wall_time=(run_ended_at - run_started_at).total_seconds(),
+            total_work=sum(leaf_step.timing.duration for leaf_step in self.leaf_steps),
+            data_span=data_span,
+            peak_concurrency=self._get_peak_concurrency(),
+            steps=step_reports,
+            critical_edges=critical_edges,
+            order_edges=order_edges,
+        )
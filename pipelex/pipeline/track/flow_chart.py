@@ -10,6 +10,7 @@ import yaml
 
 from pipelex import log
 from pipelex.exceptions import JobHistoryError
+from pipelex.pipeline.track.critical_path import CriticalPathReport
 from pipelex.pipeline.track.tracker_config import TrackerConfig
 from pipelex.pipeline.track.tracker_models import (
     EdgeAttributeKey,
@@ -47,7 +48,12 @@ class PipelineFlowChart:
         self,
         title: str | None = None,
         subtitle: str | None = None,
+        critical_path_report: CriticalPathReport | None = None,
     ) -> tuple[str, str]:
+        """Generate the mermaid code of the flowchart and its URL.
+
+        With a critical path report, the pipe edges are annotated with their durations and the critical path is highlighted.
+        """
         nb_nodes = len(self.nx_graph.nodes)
         if nb_nodes == 0:
             msg = "Graph has no nodes"
@@ -117,14 +123,24 @@ class PipelineFlowChart:
 """
 
         # Generate edges
+        # mermaid styles the links by their index, in the order in which they are declared
+        link_index = 1 if subtitle else 0
+        critical_edges = set(critical_path_report.critical_edges) if critical_path_report else set()
+        critical_link_indexes: list[int] = []
+
         for edge in self.nx_graph.edges(data=True):
             source, target, edge_data = edge
             edge_tag: str
             edge_type = EdgeCategory(edge_data[EdgeAttributeKey.EDGE_CATEGORY])
+            if (source, target) in critical_edges:
+                critical_link_indexes.append(link_index)
+            link_index += 1
             match edge_type:
                 case EdgeCategory.PIPE:
                     if pipe_code := edge_data.get(EdgeAttributeKey.PIPE_CODE):
                         edge_tag = nice_edge_tag(pipe_code)
+                        if critical_path_report and (duration := edge_data.get(EdgeAttributeKey.DURATION)) is not None:
+                            edge_tag = nice_edge_tag(f"{pipe_code} {duration:.2f}s")
                         mermaid_code += f"    {source} -- {edge_tag} {self._tracker_config.pipe_edge_style} {target}\n"
                     else:
                         msg = f"Pipe edge missing pipe code: {edge_data}"
@@ -146,8 +162,20 @@ class PipelineFlowChart:
                         msg = f"No chosen pipe code set for edge {source} --- {target}"
                         raise JobHistoryError(msg)
                     edge_tag = nice_edge_tag(chosen_pipe_code)
+                    if critical_path_report and (duration := edge_data.get(EdgeAttributeKey.DURATION)) is not None:
+                        edge_tag = nice_edge_tag(f"{chosen_pipe_code} {duration:.2f}s")
                     mermaid_code += f"    {source} -- {edge_tag} {self._tracker_config.choice_edge_style} {target}\n"
 
+        if critical_path_report:
+            # steps whose inputs were ready but which waited for the previous step of their sequence
+            for source, target in critical_path_report.order_edges:
+                mermaid_code += f"    {source} -. {nice_edge_tag('waited_in_sequence')} .-> {target}\n"
+                critical_link_indexes.append(link_index)
+                link_index += 1
+            if critical_link_indexes:
+                link_indexes_str = ",".join(str(critical_link_index) for critical_link_index in critical_link_indexes)
+                mermaid_code += f"    linkStyle {link_indexes_str} {self._tracker_config.critical_path_link_style}\n"
+
         url = make_mermaid_url(mermaid_code)
         return mermaid_code, url
 
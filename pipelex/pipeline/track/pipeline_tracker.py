@@ -5,6 +5,7 @@
 from typing import Any
 
 import networkx as nx
+from rich.console import Console
 from typing_extensions import override
 
 from pipelex import log
@@ -12,8 +13,10 @@ from pipelex.core.concepts.concept import Concept
 from pipelex.core.stuffs.stuff import Stuff
 from pipelex.exceptions import JobHistoryError
 from pipelex.pipe_controllers.condition.pipe_condition_details import PipeConditionDetails
+from pipelex.pipeline.track.critical_path import CriticalPathAnalyzer, CriticalPathReport, TimedStep
 from pipelex.pipeline.track.flow_chart import PipelineFlowChart
 from pipelex.pipeline.track.pipeline_tracker_protocol import PipelineTrackerProtocol
+from pipelex.pipeline.track.step_timing import StepTiming
 from pipelex.pipeline.track.tracker_config import TrackerConfig
 from pipelex.pipeline.track.tracker_models import (
     EdgeAttributeKey,
@@ -22,6 +25,7 @@ from pipelex.pipeline.track.tracker_models import (
     NodeCategory,
     SpecialNodeName,
 )
+from pipelex.tools.misc.memory_size_utils import format_size
 from pipelex.tools.misc.mermaid_utils import print_mermaid_url
 
 
@@ -34,6 +38,7 @@ class PipelineTracker(PipelineTrackerProtocol):
         self.is_active: bool = False
         self.nx_graph: nx.DiGraph = nx.DiGraph()
         self.start_node: str | None = None
+        self.timed_steps: dict[str, TimedStep] = {}
 
     @override
     def setup(self):
@@ -44,6 +49,7 @@ class PipelineTracker(PipelineTrackerProtocol):
         self.is_active = False
         self.nx_graph = nx.DiGraph()
         self.start_node = None
+        self.timed_steps = {}
 
     @override
     def reset(self):
@@ -115,6 +121,8 @@ class PipelineTracker(PipelineTrackerProtocol):
         )
         if stuff.is_text and self._tracker_config.is_include_text_preview:
             node_tag += f"<br/>{stuff_content_rendered[:100]}"
+        if self._tracker_config.is_include_stuff_size:
+            node_tag += f"<br/>~{format_size(stuff.estimate_retained_size())}"
         pipe_layer_str = self._pipe_layer_to_subgraph_name(pipe_layer)
         node_attributes: dict[str, Any] = {
             NodeAttributeKey.CATEGORY: NodeCategory.STUFF,
@@ -156,6 +164,15 @@ class PipelineTracker(PipelineTrackerProtocol):
             edge_attributes.update(attributes)
         self.nx_graph.add_edge(from_node, to_node, **edge_attributes)
 
+    def _add_timed_step(self, pipe_code: str, from_node: str, to_node: str, step_timing: StepTiming):
+        # a step with several inputs is added once for each of them
+        step_key = f"{pipe_code}-{to_node}"
+        if timed_step := self.timed_steps.get(step_key):
+            if from_node not in timed_step.from_nodes:
+                timed_step.from_nodes.append(from_node)
+            return
+        self.timed_steps[step_key] = TimedStep(pipe_code=pipe_code, from_nodes=[from_node], to_node=to_node, timing=step_timing)
+
     @override
     def add_pipe_step(
         self,
@@ -166,6 +183,7 @@ class PipelineTracker(PipelineTrackerProtocol):
         pipe_layer: list[str],
         as_item_index: int | None = None,
         is_with_edge: bool = True,
+        step_timing: StepTiming | None = None,
     ):
         if not self.is_active:
             return
@@ -193,6 +211,9 @@ class PipelineTracker(PipelineTrackerProtocol):
         edge_attributes: dict[str, Any] = {
             EdgeAttributeKey.PIPE_CODE: edge_caption,
         }
+        if step_timing:
+            edge_attributes[EdgeAttributeKey.DURATION] = step_timing.duration
+            self._add_timed_step(pipe_code=pipe_code, from_node=from_node, to_node=to_node, step_timing=step_timing)
         if is_with_edge:
             self._add_edge(
                 from_node=from_node,
@@ -308,6 +329,7 @@ class PipelineTracker(PipelineTrackerProtocol):
         to_stuff: Stuff,
         pipe_layer: list[str],
         comment: str,
+        step_timing: StepTiming | None = None,
     ):
         if not self.is_active:
             return
@@ -319,6 +341,9 @@ class PipelineTracker(PipelineTrackerProtocol):
         edge_attributes: dict[str, Any] = {
             EdgeAttributeKey.CHOSEN_PIPE: from_condition.chosen_pipe_code,
         }
+        if step_timing:
+            edge_attributes[EdgeAttributeKey.DURATION] = step_timing.duration
+            self._add_timed_step(pipe_code=from_condition.chosen_pipe_code, from_node=from_condition.code, to_node=to_node, step_timing=step_timing)
         self._add_edge(
             from_node=from_condition.code,
             to_node=to_node,
@@ -368,3 +393,21 @@ class PipelineTracker(PipelineTrackerProtocol):
         else:
             return self._print_mermaid_flowchart_url(title=title, subtitle=subtitle)
         return None
+
+    @override
+    def output_critical_path_report(self, title: str | None = None) -> CriticalPathReport | None:
+        critical_path_report = CriticalPathAnalyzer(nx_graph=self.nx_graph, timed_steps=list(self.timed_steps.values())).analyze()
+        if critical_path_report is None:
+            log.verbose("No timed steps in the pipeline tracker")
+            return None
+        Console().print(critical_path_report.make_table(title=title))
+        if self.start_node is None:
+            msg = "Start node is not set"
+            raise JobHistoryError(msg)
+        flowchart = PipelineFlowChart(nx_graph=self.nx_graph, start_node=self.start_node, tracker_config=self._tracker_config)
+        _, url = flowchart.generate_mermaid_flowchart(title=title, critical_path_report=critical_path_report)
+        title_to_print = "Mermaid flowchart URL of the critical path"
+        if title:
+            title_to_print += f" for {title}"
+        print_mermaid_url(url=url, title=title_to_print)
+        return critical_path_report
@@ -8,6 +8,8 @@ from typing_extensions import override
 
 from pipelex.core.stuffs.stuff import Stuff
 from pipelex.pipe_controllers.condition.pipe_condition_details import PipeConditionDetails
+from pipelex.pipeline.track.critical_path import CriticalPathReport
+from pipelex.pipeline.track.step_timing import StepTiming
 
 
 class PipelineTrackerProtocol(Protocol):
@@ -26,6 +28,7 @@ class PipelineTrackerProtocol(Protocol):
         pipe_layer: list[str],
         as_item_index: int | None = None,
         is_with_edge: bool = True,
+        step_timing: StepTiming | None = None,
     ): ...
 
     def add_batch_step(
@@ -60,6 +63,7 @@ class PipelineTrackerProtocol(Protocol):
         to_stuff: Stuff,
         pipe_layer: list[str],
         comment: str,
+        step_timing: StepTiming | None = None,
     ): ...
 
     def output_flowchart(
@@ -69,6 +73,10 @@ class PipelineTrackerProtocol(Protocol):
         is_detailed: bool = False,
     ) -> str | None: ...
 
+    def output_critical_path_report(self, title: str | None = None) -> CriticalPathReport | None:
+        """Print the timed steps with the critical path, and the URL of a flowchart which highlights it."""
+        ...
+
 
 class PipelineTrackerNoOp(PipelineTrackerProtocol):
     """A no-operation implementation of PipelineTrackerProtocol that does nothing.
@@ -97,6 +105,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
         pipe_layer: list[str],
         as_item_index: int | None = None,
         is_with_edge: bool = True,
+        step_timing: StepTiming | None = None,
     ) -> None:
         pass
 
@@ -139,6 +148,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
         to_stuff: Stuff,
         pipe_layer: list[str],
         comment: str,
+        step_timing: StepTiming | None = None,
     ) -> None:
         pass
 
@@ -150,3 +160,7 @@ class PipelineTrackerNoOp(PipelineTrackerProtocol):
         is_detailed: bool = False,
     ) -> None:
         pass
+
+    @override
+    def output_critical_path_report(self, title: str | None = None) -> None:
+        pass
@@ -0,0 +1,25 @@
+from collections.abc import Awaitable
+from datetime import datetime
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+StepResultType = TypeVar("StepResultType")
+
+
+class StepTiming(BaseModel):
+    """When a pipe step ran, and within which stack of controllers, so that nested steps can be told apart."""
+
+    pipe_stack: list[str]
+    started_at: datetime
+    ended_at: datetime
+
+    @property
+    def duration(self) -> float:
+        return (self.ended_at - self.started_at).total_seconds()
+
+
+async def run_timed_step(step: Awaitable[StepResultType], pipe_stack: list[str]) -> tuple[StepResultType, StepTiming]:
+    started_at = datetime.now()
+    result = await step
+    return result, StepTiming(pipe_stack=pipe_stack, started_at=started_at, ended_at=datetime.now())
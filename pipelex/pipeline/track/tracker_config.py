@@ -6,6 +6,7 @@ from pipelex.system.configuration.config_model import ConfigModel
 class TrackerConfig(ConfigModel):
     is_debug_mode: bool
     is_include_text_preview: bool
+    is_include_stuff_size: bool = False
     is_include_interactivity: bool
     theme: str | Literal["auto"]
     layout: str | Literal["auto"]
@@ -17,6 +18,7 @@ class TrackerConfig(ConfigModel):
     aggregate_edge_style: str
     condition_edge_style: str
     choice_edge_style: str
+    critical_path_link_style: str = "stroke:#e4572e,stroke-width:3px"
 
     @property
     def applied_theme(self) -> str | None:
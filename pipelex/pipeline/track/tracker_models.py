@@ -36,6 +36,7 @@ class EdgeAttributeKey(StrEnum):
     PIPE_CODE = "pipe_code"
     CONDITION_EXPRESSION = "condition_expression"
     CHOSEN_PIPE = "chosen_pipe"
+    DURATION = "duration"
 
 
 class GraphTree(BaseModel):
@@ -0,0 +1,34 @@
+from contextlib import AbstractContextManager, nullcontext
+from typing import Protocol
+
+from typing_extensions import override
+
+
+class ProfilerProtocol(Protocol):
+    @property
+    def is_enabled(self) -> bool: ...
+
+    def profile_run(self, pipeline_run_id: str) -> AbstractContextManager[None]: ...
+
+    def setup(self) -> None: ...
+
+    def teardown(self) -> None: ...
+
+
+class ProfilerNoOp(ProfilerProtocol):
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return False
+
+    @override
+    def profile_run(self, pipeline_run_id: str) -> AbstractContextManager[None]:
+        return nullcontext()
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
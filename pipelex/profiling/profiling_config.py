@@ -0,0 +1,10 @@
+from pydantic import Field
+
+from pipelex.system.configuration.config_model import ConfigModel
+
+
+class ProfilingConfig(ConfigModel):
+    sampling_interval: float = Field(gt=0)
+    max_stack_depth: int = Field(ge=1)
+    is_idle_sampled: bool
+    output_dir: str
@@ -0,0 +1,143 @@
+import os
+import sysconfig
+from collections import Counter
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+SPEEDSCOPE_SCHEMA_URL = "https://www.speedscope.app/file-format-schema.json"
+PIPE_FRAME_PREFIX = "pipe:"
+STDLIB_DIR = sysconfig.get_paths()["stdlib"]
+
+
+class CodeFrame(NamedTuple):
+    function_name: str
+    file_path: str
+    line: int
+
+
+class SampleKey(NamedTuple):
+    pipe_stack: tuple[str, ...]
+    code_frames: tuple[CodeFrame, ...]
+
+
+class PipeSampleCount(NamedTuple):
+    pipe_code: str
+    total: int
+    self: int
+
+
+@lru_cache(maxsize=4096)
+def _shorten_file_path(file_path: str) -> str:
+    _, site_packages, after_site_packages = file_path.rpartition(f"site-packages{os.sep}")
+    if site_packages:
+        return after_site_packages
+    if file_path.startswith(STDLIB_DIR):
+        return os.path.relpath(file_path, STDLIB_DIR)
+    try:
+        relative_path = os.path.relpath(file_path)
+    except ValueError:
+        # on Windows, paths on another drive have no relative path
+        return file_path
+    return file_path if relative_path.startswith("..") else relative_path
+
+
+def _format_code_frame(code_frame: CodeFrame) -> str:
+    label = f"{code_frame.function_name} ({_shorten_file_path(code_frame.file_path)}:{code_frame.line})"
+    # semicolons separate the frames of collapsed stacks
+    return label.replace(";", ":")
+
+
+class RunProfile:
+    """Stack samples of one pipeline run, each tagged with the stack of pipes that was running.
+
+    The code frames of a sample are those below the innermost pipe, so the cost of the controllers that called it
+    is represented by the pipe frames instead of the code that runs them.
+    """
+
+    def __init__(self, pipeline_run_id: str, sampling_interval: float):
+        self.pipeline_run_id = pipeline_run_id
+        self.sampling_interval = sampling_interval
+        self.samples: Counter[SampleKey] = Counter()
+
+    @property
+    def nb_samples(self) -> int:
+        return sum(self.samples.values())
+
+    def add_sample(self, pipe_stack: tuple[str, ...], code_frames: tuple[CodeFrame, ...]):
+        self.samples[SampleKey(pipe_stack=pipe_stack, code_frames=code_frames)] += 1
+
+    def get_pipe_sample_counts(self) -> list[PipeSampleCount]:
+        """Number of samples taken while each pipe was running (total) and while it was the innermost pipe (self), most costly first."""
+        totals: Counter[str] = Counter()
+        selves: Counter[str] = Counter()
+        for sample_key, count in self.samples.items():
+            for pipe_code in set(sample_key.pipe_stack):
+                totals[pipe_code] += count
+            if sample_key.pipe_stack:
+                selves[sample_key.pipe_stack[-1]] += count
+        pipe_sample_counts = [PipeSampleCount(pipe_code=pipe_code, total=total, self=selves[pipe_code]) for pipe_code, total in totals.items()]
+        return sorted(pipe_sample_counts, key=lambda pipe_sample_count: (-pipe_sample_count.self, -pipe_sample_count.total))
+
+    @staticmethod
+    def _get_frame_labels(sample_key: SampleKey) -> list[str]:
+        return [f"{PIPE_FRAME_PREFIX}{pipe_code}" for pipe_code in sample_key.pipe_stack] + [
+            _format_code_frame(code_frame) for code_frame in sample_key.code_frames
+        ]
+
+    def to_collapsed_stacks(self) -> str:
+        """Render the samples in the collapsed stack format of flamegraph.pl, also read by speedscope and inferno."""
+        lines: list[str] = []
+        for sample_key, count in self.samples.items():
+            lines.append(f"{';'.join(self._get_frame_labels(sample_key))} {count}")
+        return "\n".join(sorted(lines)) + "\n"
+
+    def to_speedscope(self) -> dict[str, Any]:
+        """Render the samples as a speedscope file: one profile for the whole run, then one per pipe, rooted at that pipe."""
+        frames: list[dict[str, Any]] = []
+        frame_indexes: dict[str, int] = {}
+
+        def get_frame_index(label: str, code_frame: CodeFrame | None) -> int:
+            if label not in frame_indexes:
+                frame_indexes[label] = len(frames)
+                frame: dict[str, Any] = {"name": label}
+                if code_frame:
+                    frame["file"] = _shorten_file_path(code_frame.file_path)
+                    frame["line"] = code_frame.line
+                frames.append(frame)
+            return frame_indexes[label]
+
+        stacks: list[tuple[SampleKey, list[int], int]] = []
+        for sample_key, count in sorted(self.samples.items()):
+            stack = [get_frame_index(f"{PIPE_FRAME_PREFIX}{pipe_code}", None) for pipe_code in sample_key.pipe_stack]
+            stack += [get_frame_index(_format_code_frame(code_frame), code_frame) for code_frame in sample_key.code_frames]
+            stacks.append((sample_key, stack, count))
+
+        def make_profile(name: str, profile_stacks: list[tuple[list[int], int]]) -> dict[str, Any]:
+            weights = [count * self.sampling_interval for _, count in profile_stacks]
+            return {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": [stack for stack, _ in profile_stacks],
+                "weights": weights,
+            }
+
+        profiles = [make_profile(f"pipeline run {self.pipeline_run_id}", [(stack, count) for _, stack, count in stacks])]
+        for pipe_sample_count in self.get_pipe_sample_counts():
+            pipe_code = pipe_sample_count.pipe_code
+            pipe_stacks: list[tuple[list[int], int]] = []
+            for sample_key, stack, count in stacks:
+                if pipe_code in sample_key.pipe_stack:
+                    pipe_stacks.append((stack[sample_key.pipe_stack.index(pipe_code) :], count))
+            profiles.append(make_profile(f"pipe {pipe_code}", pipe_stacks))
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA_URL,
+            "name": f"Pipelex run {self.pipeline_run_id}",
+            "exporter": "pipelex",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
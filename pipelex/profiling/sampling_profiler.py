@@ -0,0 +1,192 @@
+import json
+import os
+import sys
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from types import FrameType
+
+from typing_extensions import override
+
+from pipelex import log
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.pipe_run.pipe_run_params import PipeRunParams
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.profiling.profiler_protocol import ProfilerProtocol
+from pipelex.profiling.profiling_config import ProfilingConfig
+from pipelex.profiling.run_profile import CodeFrame, RunProfile
+from pipelex.tools.misc.file_utils import save_text_to_path
+
+PIPE_RUN_FUNCTION_NAME = "run_pipe"
+# an event loop waiting for I/O, or a thread waiting on a lock, sits in one of these modules
+IDLE_FILE_SUFFIXES = (f"{os.sep}selectors.py", f"{os.sep}threading.py")
+NB_TOP_PIPES_LOGGED = 10
+
+
+class StackSample:
+    def __init__(self, pipeline_run_id: str | None, pipe_stack: tuple[str, ...], code_frames: tuple[CodeFrame, ...]):
+        self.pipeline_run_id = pipeline_run_id
+        self.pipe_stack = pipe_stack
+        self.code_frames = code_frames
+
+
+class SamplingProfiler(ProfilerProtocol):
+    """Sampling profiler attributing the CPU cost of the framework to the pipes being run.
+
+    A daemon thread periodically reads the Python stack of the threads running profiled pipelines. The innermost
+    run_pipe frame of a sample tells which pipe was running, with its pipe stack and its pipeline run, so worker calls and
+    template renders are attributed to the pipe that issued them. The thread only runs while a pipeline is profiled.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        sampling_interval: float = 0.005,
+        max_stack_depth: int = 64,
+        is_idle_sampled: bool = False,
+    ):
+        self.output_dir = output_dir
+        self.sampling_interval = sampling_interval
+        self.max_stack_depth = max_stack_depth
+        self.is_idle_sampled = is_idle_sampled
+        self._lock = threading.Lock()
+        self._run_profiles: dict[str, RunProfile] = {}
+        self._run_thread_ids: dict[str, int] = {}
+        self._sampler_thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def make_from_config(cls, profiling_config: ProfilingConfig) -> "SamplingProfiler":
+        return cls(
+            output_dir=profiling_config.output_dir,
+            sampling_interval=profiling_config.sampling_interval,
+            max_stack_depth=profiling_config.max_stack_depth,
+            is_idle_sampled=profiling_config.is_idle_sampled,
+        )
+
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return True
+
+    @override
+    @contextmanager
+    def profile_run(self, pipeline_run_id: str) -> Generator[None, None, None]:
+        run_profile = RunProfile(pipeline_run_id=pipeline_run_id, sampling_interval=self.sampling_interval)
+        with self._lock:
+            self._run_profiles[pipeline_run_id] = run_profile
+            self._run_thread_ids[pipeline_run_id] = threading.get_ident()
+        self._start_sampler()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._run_profiles.pop(pipeline_run_id, None)
+                self._run_thread_ids.pop(pipeline_run_id, None)
+                has_profiled_runs = bool(self._run_thread_ids)
+            if not has_profiled_runs:
+                self._stop_sampler()
+            self._export_run_profile(run_profile=run_profile)
+
+    def _start_sampler(self):
+        if self._sampler_thread and self._sampler_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._sampler_thread = threading.Thread(target=self._sample_loop, name="pipelex-profiler", daemon=True)
+        self._sampler_thread.start()
+
+    def _stop_sampler(self):
+        self._stop_event.set()
+        if self._sampler_thread and self._sampler_thread is not threading.current_thread():
+            self._sampler_thread.join()
+        self._sampler_thread = None
+
+    def _sample_loop(self):
+        while not self._stop_event.wait(self.sampling_interval):
+            self.take_samples()
+
+    def take_samples(self):
+        """Sample the stack of every thread running a profiled pipeline, and add the samples to their run profiles."""
+        with self._lock:
+            run_ids_per_thread: dict[int, list[str]] = {}
+            for tracked_run_id, thread_id in self._run_thread_ids.items():
+                run_ids_per_thread.setdefault(thread_id, []).append(tracked_run_id)
+        current_frames = sys._current_frames()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        for thread_id, thread_run_ids in run_ids_per_thread.items():
+            frame = current_frames.get(thread_id)
+            if frame is None:
+                continue
+            stack_sample = self.read_stack_sample(frame=frame)
+            if stack_sample is None:
+                continue
+            pipeline_run_id = stack_sample.pipeline_run_id
+            if pipeline_run_id is None:
+                # outside of any pipe, the sample can only be attributed if the thread runs a single pipeline
+                if len(thread_run_ids) != 1:
+                    continue
+                pipeline_run_id = thread_run_ids[0]
+            with self._lock:
+                run_profile = self._run_profiles.get(pipeline_run_id)
+                if run_profile:
+                    run_profile.add_sample(pipe_stack=stack_sample.pipe_stack, code_frames=stack_sample.code_frames)
+
+    def read_stack_sample(self, frame: FrameType) -> StackSample | None:
+        """Read the code frames of a thread's stack down to its innermost pipe run, or None if the thread is idle."""
+        if not self.is_idle_sampled and frame.f_code.co_filename.endswith(IDLE_FILE_SUFFIXES):
+            return None
+        code_frames: list[CodeFrame] = []
+        pipe_stack: tuple[str, ...] = ()
+        pipeline_run_id: str | None = None
+        current_frame: FrameType | None = frame
+        while current_frame is not None:
+            code = current_frame.f_code
+            if code.co_name == PIPE_RUN_FUNCTION_NAME:
+                frame_locals = current_frame.f_locals
+                pipe = frame_locals.get("self")
+                if isinstance(pipe, PipeAbstract):
+                    pipe_run_params = frame_locals.get("pipe_run_params")
+                    if isinstance(pipe_run_params, PipeRunParams):
+                        pipe_stack = tuple(pipe_run_params.pipe_stack)
+                    if not pipe_stack or pipe_stack[-1] != pipe.code:
+                        # the pipe has not pushed itself to the stack yet, or has already popped itself
+                        pipe_stack = (*pipe_stack, pipe.code)
+                    job_metadata = frame_locals.get("job_metadata")
+                    if isinstance(job_metadata, JobMetadata):
+                        pipeline_run_id = job_metadata.pipeline_run_id
+                    break
+            code_frames.append(CodeFrame(function_name=code.co_name, file_path=code.co_filename, line=code.co_firstlineno))
+            current_frame = current_frame.f_back
+        # keep the innermost frames, where the time is spent, rooted at the pipe
+        code_frames = code_frames[: self.max_stack_depth]
+        code_frames.reverse()
+        return StackSample(pipeline_run_id=pipeline_run_id, pipe_stack=pipe_stack, code_frames=tuple(code_frames))
+
+    def _export_run_profile(self, run_profile: RunProfile):
+        if not run_profile.nb_samples:
+            log.verbose(f"No profiling sample was taken during pipeline run {run_profile.pipeline_run_id}")
+            return
+        base_path = os.path.join(self.output_dir, f"profile_{run_profile.pipeline_run_id}")
+        collapsed_path = f"{base_path}.collapsed"
+        speedscope_path = f"{base_path}.speedscope.json"
+        save_text_to_path(text=run_profile.to_collapsed_stacks(), path=collapsed_path, create_directory=True)
+        save_text_to_path(text=json.dumps(run_profile.to_speedscope()), path=speedscope_path, create_directory=True)
+
+        top_pipes = ", ".join(
+            f"{pipe_sample_count.pipe_code}: {pipe_sample_count.self * self.sampling_interval:.3f}s"
+            for pipe_sample_count in run_profile.get_pipe_sample_counts()[:NB_TOP_PIPES_LOGGED]
+        )
+        log.info(
+            f"Profile of pipeline run {run_profile.pipeline_run_id}: {run_profile.nb_samples} samples saved to "
+            f"'{collapsed_path}' and '{speedscope_path}'. Self time of the top pipes: {top_pipes or 'none, all samples are outside pipes'}"
+        )
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        self._stop_sampler()
+        with self._lock:
+            self._run_profiles.clear()
+            self._run_thread_ids.clear()
@@ -0,0 +1,22 @@
+from pydantic import Field
+
+from pipelex.system.configuration.config_model import ConfigModel
+
+
+class BudgetLimits(ConfigModel):
+    max_cost_usd: float | None = Field(default=None, gt=0)
+    max_tokens: int | None = Field(default=None, gt=0)
+    max_calls: int | None = Field(default=None, gt=0)
+
+    @property
+    def is_limited(self) -> bool:
+        return self.max_cost_usd is not None or self.max_tokens is not None or self.max_calls is not None
+
+
+class BudgetConfig(ConfigModel):
+    run_limits: BudgetLimits
+    pipe_limits: dict[str, BudgetLimits]
+    nb_chars_per_token_estimate: float = Field(gt=0)
+    nb_tokens_per_image_estimate: int = Field(ge=0)
+    default_max_output_tokens: int = Field(gt=0)
+    nb_pages_per_extract_estimate: int = Field(gt=0)
@@ -0,0 +1,44 @@
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from pipelex.core.memory.memory_usage import RunMemoryUsage
+from pipelex.tools.misc.memory_size_utils import format_size
+
+
+def make_top_stuffs_table(run_memory_usage: RunMemoryUsage, nb_stuffs: int) -> Table:
+    table = Table(title=f"Largest stuffs of pipeline '{run_memory_usage.pipeline_run_id}'", box=box.ROUNDED)
+    table.add_column("Stuff", style="cyan")
+    table.add_column("Concept", style="cyan")
+    table.add_column("Content", style="cyan")
+    table.add_column("Items", justify="right", style="green")
+    table.add_column("Size", justify="right", style="bold yellow")
+    for stuff_usage in run_memory_usage.get_top_stuffs(nb_stuffs=nb_stuffs):
+        table.add_row(
+            stuff_usage.stuff_name or stuff_usage.stuff_code,
+            stuff_usage.concept_code,
+            stuff_usage.content_class,
+            "-" if stuff_usage.nb_items is None else f"{stuff_usage.nb_items:,}",
+            format_size(stuff_usage.size),
+        )
+    return table
+
+
+def make_top_pipes_table(run_memory_usage: RunMemoryUsage, nb_pipes: int) -> Table:
+    table = Table(title=f"Peak working memory by pipe for pipeline '{run_memory_usage.pipeline_run_id}'", box=box.ROUNDED)
+    table.add_column("Pipe", style="cyan")
+    table.add_column("Runs", justify="right", style="green")
+    table.add_column("Stuffs at peak", justify="right", style="green")
+    table.add_column("Peak size", justify="right", style="bold yellow")
+    for pipe_peak in run_memory_usage.get_top_pipes(nb_pipes=nb_pipes):
+        table.add_row(pipe_peak.pipe_code, f"{pipe_peak.nb_runs:,}", f"{pipe_peak.peak_nb_stuffs:,}", format_size(pipe_peak.peak_size))
+    table.caption = f"Peak of the run: {format_size(run_memory_usage.peak_size)}, at the end of pipe '{run_memory_usage.peak_pipe_code}'"
+    return table
+
+
+def print_memory_report(run_memory_usage: RunMemoryUsage, nb_top_consumers: int):
+    console = Console()
+    console.print(
+        make_top_stuffs_table(run_memory_usage=run_memory_usage, nb_stuffs=nb_top_consumers),
+        make_top_pipes_table(run_memory_usage=run_memory_usage, nb_pipes=nb_top_consumers),
+    )
@@ -1,35 +1,41 @@
-from pydantic import Field, RootModel
+from collections import OrderedDict
+
 from typing_extensions import override
 
 from pipelex import log
 from pipelex.cogt.exceptions import ReportingManagerError
+from pipelex.cogt.extract.extract_job import ExtractJob
+from pipelex.cogt.img_gen.img_gen_job import ImgGenJob
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
 from pipelex.cogt.llm.llm_job import LLMJob
-from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokensUsage
+from pipelex.cogt.usage.cost_category import CostsByCategoryDict
 from pipelex.cogt.usage.cost_registry import CostRegistry
+from pipelex.cogt.usage.unit_report import UnitCategory, UnitCostReportField, UnitUsage
+from pipelex.cogt.usage.usage_record_sink import RotatingCsvUsageRecordSink
+from pipelex.cogt.usage.usage_registry import ModelUsage, UsageRegistry
 from pipelex.config import get_config
+from pipelex.core.memory.memory_usage import RunMemoryUsage
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.pipe_run.pipe_stack_context import get_current_pipe_stack
 from pipelex.pipeline.pipeline_models import SpecialPipelineId
+from pipelex.reporting.budget_config import BudgetLimits
+from pipelex.reporting.memory_report import print_memory_report
 from pipelex.reporting.reporting_protocol import ReportingProtocol
+from pipelex.reporting.run_budget import BudgetUsage, RunBudget, estimate_llm_job_usage, estimate_unit_job_usage
 from pipelex.tools.misc.file_utils import ensure_path, get_incremental_file_path
-from pipelex.tools.typing.pydantic_utils import empty_list_factory_of
-
-LLMUsageRegistryRoot = list[LLMTokensUsage]
-
-
-class UsageRegistry(RootModel[LLMUsageRegistryRoot]):
-    root: LLMUsageRegistryRoot = Field(default_factory=empty_list_factory_of(LLMTokensUsage))
-
-    def get_current_tokens_usage(self) -> LLMUsageRegistryRoot:
-        return self.root
-
-    def add_tokens_usage(self, llm_tokens_usage: LLMTokensUsage):
-        self.root.append(llm_tokens_usage)
 
 
 class ReportingManager(ReportingProtocol):
     def __init__(self):
         self._reporting_config = get_config().pipelex.reporting_config
+        self._nb_completed_runs_kept = get_config().pipelex.run_lifecycle_config.nb_completed_runs_kept
         self._usage_registries: dict[str, UsageRegistry] = {}
+        # The registries of the most recently closed runs, kept for their reports, up to nb_completed_runs_kept
+        self._closed_usage_registries: OrderedDict[str, UsageRegistry] = OrderedDict()
+        self._closed_memory_usages: dict[str, RunMemoryUsage] = {}
+        self._usage_record_sink: RotatingCsvUsageRecordSink | None = None
+        self._memory_usages: dict[str, RunMemoryUsage] = {}
+        self._run_budgets: dict[str, RunBudget] = {}
 
     ############################################################
     # Manager lifecycle
@@ -39,59 +45,201 @@ class ReportingManager(ReportingProtocol):
     def setup(self):
         self._usage_registries.clear()
         self._usage_registries[SpecialPipelineId.UNTITLED] = UsageRegistry()
+        self._closed_usage_registries.clear()
+        self._closed_memory_usages.clear()
+        self._memory_usages.clear()
+        self._run_budgets.clear()
+        if self._reporting_config.is_stream_usage_records_enabled:
+            self._usage_record_sink = RotatingCsvUsageRecordSink(
+                dir_path=self._reporting_config.usage_records_dir_path,
+                base_name=self._reporting_config.usage_records_base_name,
+                max_rows_per_file=self._reporting_config.usage_records_max_rows_per_file,
+            )
 
     @override
     def teardown(self):
         self._usage_registries.clear()
+        self._closed_usage_registries.clear()
+        self._closed_memory_usages.clear()
+        self._memory_usages.clear()
+        self._run_budgets.clear()
+        if self._usage_record_sink:
+            self._usage_record_sink.close()
+            self._usage_record_sink = None
 
     ############################################################
     # Private methods
     ############################################################
 
+    def _get_optional_registry(self, pipeline_run_id: str) -> UsageRegistry | None:
+        if pipeline_run_id in self._usage_registries:
+            return self._usage_registries[pipeline_run_id]
+        # the usage of a job completing after its run was closed still counts, while the run is kept
+        return self._closed_usage_registries.get(pipeline_run_id)
+
     def _get_registry(self, pipeline_run_id: str) -> UsageRegistry:
-        if pipeline_run_id not in self._usage_registries:
+        usage_registry = self._get_optional_registry(pipeline_run_id=pipeline_run_id)
+        if usage_registry is None:
             msg = f"Registry for pipeline '{pipeline_run_id}' does not exist"
             raise ReportingManagerError(msg)
-        return self._usage_registries[pipeline_run_id]
+        return usage_registry
 
     def _report_llm_job(self, llm_job: LLMJob):
         llm_tokens_usage = llm_job.job_report.llm_tokens_usage
 
         if not llm_tokens_usage:
             log.warning("LLM job has no llm_tokens_usage")
+            self.release_budget(inference_job=llm_job)
             return
 
-        llm_token_cost_report: LLMTokenCostReport | None = None
-
-        if self._reporting_config.is_log_costs_to_console:
-            llm_token_cost_report = CostRegistry.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
+        llm_token_cost_report = CostRegistry.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
 
         pipeline_run_id = llm_job.job_metadata.pipeline_run_id
-        self._get_registry(pipeline_run_id).add_tokens_usage(llm_tokens_usage)
+        queue_wait_duration = llm_job.queue_wait_duration
+        self._get_registry(pipeline_run_id).add_cost_report(cost_report=llm_token_cost_report, queue_wait_duration=queue_wait_duration)
+        self._settle_budget(
+            pipeline_run_id=pipeline_run_id,
+            inference_job=llm_job,
+            usage=BudgetUsage.make_from_cost_report(cost_report=llm_token_cost_report),
+        )
+
+        if self._usage_record_sink:
+            record = llm_token_cost_report.as_flat_dictionary()
+            record[UnitCostReportField.DURATION] = llm_job.job_metadata.duration
+            record[UnitCostReportField.QUEUE_WAIT_DURATION] = queue_wait_duration
+            self._usage_record_sink.write_record(record=record)
 
         if self._reporting_config.is_log_costs_to_console:
             log.verbose(llm_token_cost_report, title="Token Cost report")
 
+    def _report_unit_usage(self, inference_job: InferenceJobAbstract, unit_usage: UnitUsage | None, job_desc: str):
+        if not unit_usage:
+            log.warning(f"{job_desc} has no unit_usage")
+            return
+
+        unit_cost_report = CostRegistry.compute_unit_cost_report(unit_usage=unit_usage)
+
+        pipeline_run_id = unit_usage.job_metadata.pipeline_run_id
+        self._get_registry(pipeline_run_id).add_unit_cost_report(unit_cost_report=unit_cost_report)
+        self._settle_budget(
+            pipeline_run_id=pipeline_run_id,
+            inference_job=inference_job,
+            usage=BudgetUsage.make_from_unit_cost_report(unit_cost_report=unit_cost_report),
+        )
+
+        if self._usage_record_sink:
+            self._usage_record_sink.write_record(record=unit_cost_report.as_flat_dictionary())
+
+        if self._reporting_config.is_log_costs_to_console:
+            log.verbose(unit_cost_report, title="Unit Cost report")
+
+    def _settle_budget(self, pipeline_run_id: str, inference_job: InferenceJobAbstract, usage: BudgetUsage):
+        if run_budget := self._run_budgets.get(pipeline_run_id):
+            was_aborted = run_budget.is_aborted
+            run_budget.settle(job_key=id(inference_job), pipe_stack=get_current_pipe_stack(), usage=usage)
+            if run_budget.abort_message and not was_aborted:
+                log.warning(f"{run_budget.abort_message}, no further inference job will be dispatched")
+
     ############################################################
     # ReportingProtocol
     ############################################################
 
     @override
-    def open_registry(self, pipeline_run_id: str):
+    def open_registry(self, pipeline_run_id: str, budget_limits: BudgetLimits | None = None, is_resumed: bool = False):
         if pipeline_run_id in self._usage_registries:
-            msg = f"Registry for pipeline '{pipeline_run_id}' already exists"
-            raise ReportingManagerError(msg)
-        self._usage_registries[pipeline_run_id] = UsageRegistry()
+            if not is_resumed:
+                msg = f"Registry for pipeline '{pipeline_run_id}' already exists"
+                raise ReportingManagerError(msg)
+            # a previous attempt of the resumed run in this process keeps its usage, but the budget applies to the new attempt
+            self._run_budgets.pop(pipeline_run_id, None)
+        elif is_resumed and pipeline_run_id in self._closed_usage_registries:
+            self._usage_registries[pipeline_run_id] = self._closed_usage_registries.pop(pipeline_run_id)
+            self._closed_memory_usages.pop(pipeline_run_id, None)
+        else:
+            self._usage_registries[pipeline_run_id] = UsageRegistry()
+        if self._reporting_config.is_memory_accounting_enabled:
+            self._memory_usages[pipeline_run_id] = RunMemoryUsage(pipeline_run_id=pipeline_run_id)
+        budget_config = self._reporting_config.budget_config
+        run_limits = budget_limits or budget_config.run_limits
+        if run_limits.is_limited or budget_config.pipe_limits:
+            self._run_budgets[pipeline_run_id] = RunBudget(
+                pipeline_run_id=pipeline_run_id,
+                run_limits=run_limits,
+                pipe_limits=budget_config.pipe_limits,
+            )
+
+    @override
+    async def reserve_budget(self, llm_job: LLMJob, unit_costs: CostsByCategoryDict, model_max_tokens: int | None):
+        if run_budget := self._run_budgets.get(llm_job.job_metadata.pipeline_run_id):
+            estimated_usage = estimate_llm_job_usage(
+                llm_job=llm_job,
+                unit_costs=unit_costs,
+                model_max_tokens=model_max_tokens,
+                budget_config=self._reporting_config.budget_config,
+            )
+            await run_budget.reserve(job_key=id(llm_job), pipe_stack=get_current_pipe_stack(), estimated_usage=estimated_usage)
+
+    @override
+    async def reserve_unit_budget(
+        self,
+        inference_job: InferenceJobAbstract,
+        unit_costs: CostsByCategoryDict,
+        unit_category: UnitCategory,
+        nb_units: int | None,
+    ):
+        if run_budget := self._run_budgets.get(inference_job.job_metadata.pipeline_run_id):
+            if nb_units is None:
+                # the number of pages of a document to extract is only known once extracted
+                nb_units = self._reporting_config.budget_config.nb_pages_per_extract_estimate
+            estimated_usage = estimate_unit_job_usage(unit_costs=unit_costs, unit_category=unit_category, nb_units=nb_units)
+            await run_budget.reserve(job_key=id(inference_job), pipe_stack=get_current_pipe_stack(), estimated_usage=estimated_usage)
+
+    @override
+    def release_budget(self, inference_job: InferenceJobAbstract):
+        if run_budget := self._run_budgets.get(inference_job.job_metadata.pipeline_run_id):
+            run_budget.release(job_key=id(inference_job))
 
     @override
     def report_inference_job(self, inference_job: InferenceJobAbstract):
         log.verbose(f"Inference job '{inference_job.job_metadata.unit_job_id}' completed in {inference_job.job_metadata.duration:.2f} seconds")
-        if not isinstance(inference_job, LLMJob):
-            # ReportingManager does not support reporting for other types of inference jobs yet
-            # TODO: add support for other types of inference jobs
-            return
-        llm_job: LLMJob = inference_job
-        self._report_llm_job(llm_job=llm_job)
+        if isinstance(inference_job, LLMJob):
+            self._report_llm_job(llm_job=inference_job)
+        elif isinstance(inference_job, ImgGenJob):
+            self._report_unit_usage(inference_job=inference_job, unit_usage=inference_job.job_report.unit_usage, job_desc="ImgGen job")
+        elif isinstance(inference_job, ExtractJob):
+            self._report_unit_usage(inference_job=inference_job, unit_usage=inference_job.job_report.unit_usage, job_desc="Extract job")
+        else:
+            log.verbose(f"ReportingManager does not support reporting for inference jobs of type '{type(inference_job).__name__}'")
+
+    @override
+    def report_working_memory(self, pipeline_run_id: str, pipe_code: str, working_memory: WorkingMemory):
+        if run_memory_usage := self._memory_usages.get(pipeline_run_id):
+            run_memory_usage.record_stuffs(pipe_code=pipe_code, stuffs=working_memory.root.values())
+
+    @override
+    def get_memory_usage(self, pipeline_run_id: str) -> RunMemoryUsage | None:
+        if pipeline_run_id in self._memory_usages:
+            return self._memory_usages[pipeline_run_id]
+        return self._closed_memory_usages.get(pipeline_run_id)
+
+    @override
+    def get_run_usage(self, pipeline_run_id: str) -> ModelUsage | None:
+        if usage_registry := self._get_optional_registry(pipeline_run_id=pipeline_run_id):
+            return usage_registry.get_total_usage()
+        return None
+
+    @override
+    def get_usage_registry(self, pipeline_run_id: str) -> UsageRegistry | None:
+        return self._get_optional_registry(pipeline_run_id=pipeline_run_id)
+
+    @override
+    def report_offloaded_usage(self, pipeline_run_id: str, usage_registry: UsageRegistry):
+        """Add the usage of a branch run as a pipeline of its own by a worker to the usage of its pipeline run."""
+        self._get_registry(pipeline_run_id).add_usage_registry(usage_registry=usage_registry)
+
+    @override
+    def is_budgeted(self, pipeline_run_id: str) -> bool:
+        return pipeline_run_id in self._run_budgets
 
     @override
     def generate_report(self, pipeline_run_id: str | None = None):
@@ -108,16 +256,38 @@ class ReportingManager(ReportingProtocol):
         if pipeline_run_id:
             registries_to_process = {pipeline_run_id: self._get_registry(pipeline_run_id)}
         else:
-            registries_to_process = self._usage_registries
+            registries_to_process = {**self._closed_usage_registries, **self._usage_registries}
 
         for run_id, registry in registries_to_process.items():
-            CostRegistry.generate_report(
+            CostRegistry.generate_report_from_usage_registry(
                 pipeline_run_id=run_id,
-                llm_tokens_usages=registry.get_current_tokens_usage(),
+                usage_registry=registry,
                 unit_scale=self._reporting_config.cost_report_unit_scale,
                 cost_report_file_path=cost_report_file_path,
             )
+            run_memory_usage = self.get_memory_usage(pipeline_run_id=run_id)
+            if run_memory_usage and not run_memory_usage.is_empty:
+                print_memory_report(run_memory_usage=run_memory_usage, nb_top_consumers=self._reporting_config.memory_report_nb_top_consumers)
+        if self._usage_record_sink:
+            self._usage_record_sink.flush()
 
     @override
     def close_registry(self, pipeline_run_id: str):
-        self._usage_registries.pop(pipeline_run_id)
+        """Close the registry of a completed run, and flush its usage records.
+
+        The registries of the most recently closed runs are kept, bounded by nb_completed_runs_kept, so that their
+        reports can still be generated.
+        """
+        usage_registry = self._usage_registries.pop(pipeline_run_id, None)
+        run_memory_usage = self._memory_usages.pop(pipeline_run_id, None)
+        self._run_budgets.pop(pipeline_run_id, None)
+        if self._usage_record_sink:
+            self._usage_record_sink.flush()
+        if usage_registry is None or self._nb_completed_runs_kept == 0:
+            return
+        self._closed_usage_registries[pipeline_run_id] = usage_registry
+        if run_memory_usage:
+            self._closed_memory_usages[pipeline_run_id] = run_memory_usage
+        while len(self._closed_usage_registries) > self._nb_completed_runs_kept:
+            evicted_run_id, _ = self._closed_usage_registries.popitem(last=False)
+            self._closed_memory_usages.pop(evicted_run_id, None)
@@ -3,13 +3,44 @@ from typing import Protocol
 from typing_extensions import override
 
 from pipelex.cogt.inference.inference_job_abstract import InferenceJobAbstract
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.usage.cost_category import CostsByCategoryDict
+from pipelex.cogt.usage.unit_report import UnitCategory
+from pipelex.cogt.usage.usage_registry import ModelUsage, UsageRegistry
+from pipelex.core.memory.memory_usage import RunMemoryUsage
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.reporting.budget_config import BudgetLimits
 
 
 class ReportingProtocol(Protocol):
-    def open_registry(self, pipeline_run_id: str): ...
+    def open_registry(self, pipeline_run_id: str, budget_limits: BudgetLimits | None = None, is_resumed: bool = False): ...
+
+    async def reserve_budget(self, llm_job: LLMJob, unit_costs: CostsByCategoryDict, model_max_tokens: int | None): ...
+
+    async def reserve_unit_budget(
+        self,
+        inference_job: InferenceJobAbstract,
+        unit_costs: CostsByCategoryDict,
+        unit_category: UnitCategory,
+        nb_units: int | None,
+    ): ...
+
+    def release_budget(self, inference_job: InferenceJobAbstract): ...
 
     def report_inference_job(self, inference_job: InferenceJobAbstract): ...
 
+    def report_working_memory(self, pipeline_run_id: str, pipe_code: str, working_memory: WorkingMemory): ...
+
+    def get_memory_usage(self, pipeline_run_id: str) -> RunMemoryUsage | None: ...
+
+    def get_run_usage(self, pipeline_run_id: str) -> ModelUsage | None: ...
+
+    def get_usage_registry(self, pipeline_run_id: str) -> UsageRegistry | None: ...
+
+    def report_offloaded_usage(self, pipeline_run_id: str, usage_registry: UsageRegistry): ...
+
+    def is_budgeted(self, pipeline_run_id: str) -> bool: ...
+
     def generate_report(self, pipeline_run_id: str | None = None): ...
 
     def close_registry(self, pipeline_run_id: str): ...
@@ -21,13 +52,55 @@ class ReportingProtocol(Protocol):
 
 class ReportingNoOp(ReportingProtocol):
     @override
-    def open_registry(self, pipeline_run_id: str):
+    def open_registry(self, pipeline_run_id: str, budget_limits: BudgetLimits | None = None, is_resumed: bool = False):
+        pass
+
+    @override
+    async def reserve_budget(self, llm_job: LLMJob, unit_costs: CostsByCategoryDict, model_max_tokens: int | None):
+        pass
+
+    @override
+    async def reserve_unit_budget(
+        self,
+        inference_job: InferenceJobAbstract,
+        unit_costs: CostsByCategoryDict,
+        unit_category: UnitCategory,
+        nb_units: int | None,
+    ):
+        pass
+
+    @override
+    def release_budget(self, inference_job: InferenceJobAbstract):
         pass
 
     @override
     def report_inference_job(self, inference_job: InferenceJobAbstract):
         pass
 
+    @override
+    def report_working_memory(self, pipeline_run_id: str, pipe_code: str, working_memory: WorkingMemory):
+        pass
+
+    @override
+    def get_memory_usage(self, pipeline_run_id: str) -> RunMemoryUsage | None:
+        return None
+
+    @override
+    def get_run_usage(self, pipeline_run_id: str) -> ModelUsage | None:
+        return None
+
+    @override
+    def get_usage_registry(self, pipeline_run_id: str) -> UsageRegistry | None:
+        return None
+
+    @override
+    def report_offloaded_usage(self, pipeline_run_id: str, usage_registry: UsageRegistry):
+        pass
+
+    @override
+    def is_budgeted(self, pipeline_run_id: str) -> bool:
+        return False
+
     @override
     def generate_report(self, pipeline_run_id: str | None = None):
         pass
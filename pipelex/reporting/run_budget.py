@@ -0,0 +1,201 @@
+import asyncio
+import math
+from collections.abc import Sequence
+
+from pydantic import BaseModel
+
+from pipelex.cogt.exceptions import RunBudgetExceededError
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_report import LLMTokenCostReport
+from pipelex.cogt.usage.cost_category import CostCategory, CostsByCategoryDict
+from pipelex.cogt.usage.costs_per_token import model_cost_per_token
+from pipelex.cogt.usage.costs_per_unit import model_cost_per_unit
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.cogt.usage.unit_report import UnitCategory, UnitCostReport
+from pipelex.cogt.usage.usage_registry import TOTAL_COST_CATEGORIES
+from pipelex.reporting.budget_config import BudgetConfig, BudgetLimits
+
+# Token categories that are already counted in the joined input tokens
+SPLIT_INPUT_TOKEN_CATEGORIES = (TokenCategory.INPUT_CACHED, TokenCategory.INPUT_NON_CACHED)
+
+
+class BudgetUsage(BaseModel):
+    cost_usd: float = 0.0
+    nb_tokens: int = 0
+    nb_calls: int = 0
+
+    @classmethod
+    def make_from_cost_report(cls, cost_report: LLMTokenCostReport) -> "BudgetUsage":
+        return cls(
+            cost_usd=sum(cost_report.costs_by_token_category.get(cost_category, 0.0) for cost_category in TOTAL_COST_CATEGORIES),
+            nb_tokens=sum(
+                nb_tokens
+                for token_category, nb_tokens in cost_report.nb_tokens_by_category.items()
+                if token_category not in SPLIT_INPUT_TOKEN_CATEGORIES
+            ),
+            nb_calls=1,
+        )
+
+    @classmethod
+    def make_from_unit_cost_report(cls, unit_cost_report: UnitCostReport) -> "BudgetUsage":
+        return cls(cost_usd=sum(unit_cost_report.costs_by_unit_category.values()), nb_calls=1)
+
+    def add(self, other: "BudgetUsage"):
+        self.cost_usd += other.cost_usd
+        self.nb_tokens += other.nb_tokens
+        self.nb_calls += other.nb_calls
+
+    def subtract(self, other: "BudgetUsage"):
+        self.cost_usd -= other.cost_usd
+        self.nb_tokens -= other.nb_tokens
+        self.nb_calls -= other.nb_calls
+
+    def get_exceeded_limit_desc(self, limits: BudgetLimits) -> str | None:
+        """Describe the first of the limits exceeded by this usage, if any."""
+        if limits.max_cost_usd is not None and self.cost_usd > limits.max_cost_usd:
+            return f"cost would reach ${self.cost_usd:.4f}, over the limit of ${limits.max_cost_usd:.4f}"
+        if limits.max_tokens is not None and self.nb_tokens > limits.max_tokens:
+            return f"tokens would reach {self.nb_tokens:,}, over the limit of {limits.max_tokens:,}"
+        if limits.max_calls is not None and self.nb_calls > limits.max_calls:
+            return f"calls would reach {self.nb_calls:,}, over the limit of {limits.max_calls:,}"
+        return None
+
+
+def estimate_llm_job_usage(
+    llm_job: LLMJob,
+    unit_costs: CostsByCategoryDict,
+    model_max_tokens: int | None,
+    budget_config: BudgetConfig,
+) -> BudgetUsage:
+    """Estimate the usage of an LLM job before it is dispatched.
+
+    The input tokens are estimated from the size of the prompt, and the output is assumed to use all of max_tokens,
+    so the estimate is an upper bound of the cost unless the prompt is unusually dense.
+    """
+    llm_prompt = llm_job.llm_prompt
+    nb_prompt_chars = len(llm_prompt.system_text or "") + len(llm_prompt.user_text or "")
+    nb_input_tokens = math.ceil(nb_prompt_chars / budget_config.nb_chars_per_token_estimate)
+    nb_input_tokens += len(llm_prompt.user_images) * budget_config.nb_tokens_per_image_estimate
+    nb_output_tokens = llm_job.job_params.max_tokens or model_max_tokens or budget_config.default_max_output_tokens
+    cost_usd = nb_input_tokens * model_cost_per_token(costs=unit_costs, cost_category=CostCategory.INPUT)
+    cost_usd += nb_output_tokens * model_cost_per_token(costs=unit_costs, cost_category=CostCategory.OUTPUT)
+    return BudgetUsage(cost_usd=cost_usd, nb_tokens=nb_input_tokens + nb_output_tokens, nb_calls=1)
+
+
+def estimate_unit_job_usage(unit_costs: CostsByCategoryDict, unit_category: UnitCategory, nb_units: int) -> BudgetUsage:
+    """Estimate the usage of an inference job billed per unit, e.g. per image or per page, before it is dispatched."""
+    return BudgetUsage(cost_usd=nb_units * model_cost_per_unit(costs=unit_costs, unit_category=unit_category), nb_calls=1)
+
+
+class RunBudget:
+    """Usage of a pipeline run checked against the limits of the run and of its pipes.
+
+    An inference job reserves its estimated usage before being dispatched, and the reservation is replaced by the actual usage
+    once the job completes, so the branches of a batch can't all pass the check while nothing has been spent yet.
+    A job that only the reservations of the jobs in flight would push over a limit waits for them to settle.
+    The usage of a pipe includes the usage of its sub-pipes.
+    Once a limit is hit by the usage spent, or by a job on top of it, the run is aborted: any later job is refused
+    right away, which quickly stops the remaining branches.
+    """
+
+    def __init__(self, pipeline_run_id: str, run_limits: BudgetLimits, pipe_limits: dict[str, BudgetLimits]):
+        self.pipeline_run_id = pipeline_run_id
+        self.run_limits = run_limits
+        self.pipe_limits = pipe_limits
+        self.spent = BudgetUsage()
+        self.reserved = BudgetUsage()
+        self.pipe_spent: dict[str, BudgetUsage] = {pipe_code: BudgetUsage() for pipe_code in pipe_limits}
+        self.pipe_reserved: dict[str, BudgetUsage] = {pipe_code: BudgetUsage() for pipe_code in pipe_limits}
+        self.abort_message: str | None = None
+        self._reservations: dict[int, tuple[tuple[str, ...], BudgetUsage]] = {}
+        # The jobs waiting for reservations to be released, woken up by each release
+        self._release_waiters: list[asyncio.Event] = []
+
+    @property
+    def is_aborted(self) -> bool:
+        return self.abort_message is not None
+
+    def _get_budgeted_pipe_codes(self, pipe_stack: Sequence[str]) -> set[str]:
+        return {pipe_code for pipe_code in pipe_stack if pipe_code in self.pipe_limits}
+
+    def _abort(self, exceeded_limit_desc: str, pipe_code: str | None) -> RunBudgetExceededError:
+        if pipe_code:
+            self.abort_message = f"Budget of pipe '{pipe_code}' exceeded in pipeline run '{self.pipeline_run_id}': {exceeded_limit_desc}"
+        else:
+            self.abort_message = f"Budget of pipeline run '{self.pipeline_run_id}' exceeded: {exceeded_limit_desc}"
+        for release_waiter in self._release_waiters:
+            release_waiter.set()
+        return RunBudgetExceededError(message=self.abort_message, pipeline_run_id=self.pipeline_run_id, pipe_code=pipe_code)
+
+    def _get_exceeded_limit(
+        self,
+        pipe_stack: Sequence[str],
+        extra_usage: BudgetUsage,
+        is_reserved_included: bool,
+    ) -> tuple[str, str | None] | None:
+        run_usage = self.spent.model_copy()
+        if is_reserved_included:
+            run_usage.add(self.reserved)
+        run_usage.add(extra_usage)
+        if exceeded_limit_desc := run_usage.get_exceeded_limit_desc(limits=self.run_limits):
+            return exceeded_limit_desc, None
+        for pipe_code in self._get_budgeted_pipe_codes(pipe_stack=pipe_stack):
+            pipe_usage = self.pipe_spent[pipe_code].model_copy()
+            if is_reserved_included:
+                pipe_usage.add(self.pipe_reserved[pipe_code])
+            pipe_usage.add(extra_usage)
+            if exceeded_limit_desc := pipe_usage.get_exceeded_limit_desc(limits=self.pipe_limits[pipe_code]):
+                return exceeded_limit_desc, pipe_code
+        return None
+
+    async def reserve(self, job_key: int, pipe_stack: Sequence[str], estimated_usage: BudgetUsage):
+        """Reserve the estimated usage of a job about to be dispatched.
+
+        The run is aborted if the job could exceed a limit on top of the usage spent. If it could only exceed it on top
+        of the reservations of the jobs in flight, it waits for them to settle before checking again.
+        """
+        while True:
+            if self.abort_message:
+                raise RunBudgetExceededError(message=self.abort_message, pipeline_run_id=self.pipeline_run_id)
+            if exceeded_limit := self._get_exceeded_limit(pipe_stack=pipe_stack, extra_usage=estimated_usage, is_reserved_included=False):
+                exceeded_limit_desc, pipe_code = exceeded_limit
+                raise self._abort(exceeded_limit_desc=exceeded_limit_desc, pipe_code=pipe_code)
+            if not self._get_exceeded_limit(pipe_stack=pipe_stack, extra_usage=estimated_usage, is_reserved_included=True):
+                break
+            release_waiter = asyncio.Event()
+            self._release_waiters.append(release_waiter)
+            try:
+                await release_waiter.wait()
+            finally:
+                if release_waiter in self._release_waiters:
+                    self._release_waiters.remove(release_waiter)
+        budgeted_pipe_codes = tuple(self._get_budgeted_pipe_codes(pipe_stack=pipe_stack))
+        self._reservations[job_key] = (budgeted_pipe_codes, estimated_usage)
+        self.reserved.add(estimated_usage)
+        for pipe_code in budgeted_pipe_codes:
+            self.pipe_reserved[pipe_code].add(estimated_usage)
+
+    def release(self, job_key: int):
+        """Release the reservation of a job, if it still holds one."""
+        reservation = self._reservations.pop(job_key, None)
+        if reservation is None:
+            return
+        budgeted_pipe_codes, estimated_usage = reservation
+        self.reserved.subtract(estimated_usage)
+        for pipe_code in budgeted_pipe_codes:
+            self.pipe_reserved[pipe_code].subtract(estimated_usage)
+        for release_waiter in self._release_waiters:
+            release_waiter.set()
+        self._release_waiters.clear()
+
+    def settle(self, job_key: int, pipe_stack: Sequence[str], usage: BudgetUsage):
+        """Replace the reservation of a completed job by its actual usage, and abort the run if a limit was hit."""
+        self.release(job_key=job_key)
+        self.spent.add(usage)
+        for budgeted_pipe_code in self._get_budgeted_pipe_codes(pipe_stack=pipe_stack):
+            self.pipe_spent[budgeted_pipe_code].add(usage)
+        if not self.abort_message and (
+            exceeded_limit := self._get_exceeded_limit(pipe_stack=pipe_stack, extra_usage=BudgetUsage(), is_reserved_included=False)
+        ):
+            exceeded_limit_desc, pipe_code = exceeded_limit
+            self._abort(exceeded_limit_desc=exceeded_limit_desc, pipe_code=pipe_code)
@@ -32,3 +32,10 @@ class TelemetryConfig(ConfigModel):
     dry_mode_enabled: bool
     verbose_enabled: bool
     user_id: str
+    # Events are flushed in batches from a background thread, see TelemetryDispatcher
+    remote_sink_enabled: bool = True
+    local_sink_path: str = ""
+    dispatch_queue_size: int = Field(default=1000, gt=0)
+    dispatch_batch_size: int = Field(default=50, gt=0)
+    dispatch_flush_interval: float = Field(default=1.0, gt=0)
+    dispatch_teardown_timeout: float = Field(default=2.0, ge=0)
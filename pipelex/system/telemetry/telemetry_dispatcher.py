@@ -0,0 +1,155 @@
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from pipelex.system.telemetry.events import EventName, EventProperty
+from pipelex.tools.log.log import log
+from pipelex.tools.misc.file_utils import ensure_directory_for_file_path
+
+
+class TelemetryEvent(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    event_name: EventName
+    properties: dict[EventProperty, Any] | None
+    timestamp: datetime
+    # the PostHog context tags are contextvars: they are snapshotted on the thread which tracks the event
+    context_tags: dict[str, Any] = Field(default_factory=dict)
+
+
+TelemetrySink = Callable[[list[TelemetryEvent]], None]
+
+
+class TelemetryDispatcher:
+    """Hands telemetry events over to a sink in batches, from a background thread.
+
+    Enqueueing an event never blocks: when the bounded queue is full, the event is dropped and counted,
+    so a slow or unreachable telemetry backend can never add latency to the pipe runs which emit the events.
+    The worker flushes a batch as soon as it is full, or when flush_interval seconds have passed since the first event of the batch.
+    """
+
+    def __init__(
+        self,
+        sink: TelemetrySink,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # None is only enqueued by stop(), to wake the worker up
+        self._queue: queue.Queue[TelemetryEvent | None] = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._counts_lock = threading.Lock()
+        self._nb_dropped_events = 0
+        self._nb_dispatched_events = 0
+
+    @property
+    def nb_dropped_events(self) -> int:
+        return self._nb_dropped_events
+
+    @property
+    def nb_dispatched_events(self) -> int:
+        return self._nb_dispatched_events
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def enqueue(self, event: TelemetryEvent):
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._counts_lock:
+                self._nb_dropped_events += 1
+                is_first_drop = self._nb_dropped_events == 1
+            if is_first_drop:
+                log.warning(f"Telemetry queue is full ({self._queue.maxsize} events), dropping events until it drains")
+
+    def start(self):
+        if self._thread:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="pipelex-telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float):
+        """Stop the worker, flushing the events still queued, waiting at most timeout seconds."""
+        if not self._thread:
+            return
+        self._stop_event.set()
+        with suppress(queue.Full):
+            self._queue.put_nowait(None)
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            log.warning(f"Telemetry worker did not flush within {timeout}s, the events still queued are lost")
+        self._thread = None
+        if self._nb_dropped_events:
+            log.warning(f"Telemetry dropped {self._nb_dropped_events} events because its queue was full")
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._flush(batch=self._collect_batch())
+        # drain what was enqueued before stopping
+        while not self._queue.empty():
+            self._flush(batch=self._collect_batch(wait=False))
+
+    def _collect_batch(self, wait: bool = True) -> list[TelemetryEvent]:
+        batch: list[TelemetryEvent] = []
+        # waiting for the first event also wakes the worker up regularly to check whether it should stop
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                event = self._queue.get(timeout=max(deadline - time.monotonic(), 0.0)) if wait else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if event is None:
+                break
+            batch.append(event)
+            if len(batch) == 1:
+                deadline = time.monotonic() + self.flush_interval
+        return batch
+
+    def _flush(self, batch: list[TelemetryEvent]):
+        if not batch:
+            return
+        try:
+            self.sink(batch)
+        except Exception as exc:
+            # telemetry must never break the app
+            log.error(f"Telemetry sink failed to flush {len(batch)} events: {exc}")
+        with self._counts_lock:
+            self._nb_dispatched_events += len(batch)
+
+
+class JsonlFileTelemetrySink:
+    """Appends telemetry events to a local JSON Lines file, for deployments without access to the telemetry backend."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        ensure_directory_for_file_path(file_path=file_path)
+
+    def __call__(self, events: list[TelemetryEvent]):
+        lines = [
+            json.dumps(
+                {
+                    "event": event.event_name,
+                    "timestamp": event.timestamp.isoformat(),
+                    "properties": event.properties or {},
+                    "context_tags": event.context_tags,
+                },
+                default=str,
+            )
+            for event in events
+        ]
+        with open(self.file_path, "a", encoding="utf-8") as jsonl_file:
+            jsonl_file.write("\n".join(lines) + "\n")
@@ -1,7 +1,8 @@
+from datetime import datetime, timezone
 from typing import Any, Callable
 
 import posthog
-from posthog import Posthog, new_context, tag
+from posthog import Posthog, get_tags, new_context, tag
 from posthog.args import ExceptionArg, OptionalCaptureArgs
 from typing_extensions import Unpack, override
 
@@ -9,6 +10,7 @@ from pipelex.system.exceptions import RootException
 from pipelex.system.runtime import IntegrationMode
 from pipelex.system.telemetry.events import EventName, EventProperty, Setting
 from pipelex.system.telemetry.telemetry_config import TelemetryConfig, TelemetryMode
+from pipelex.system.telemetry.telemetry_dispatcher import JsonlFileTelemetrySink, TelemetryDispatcher, TelemetryEvent
 from pipelex.system.telemetry.telemetry_manager_abstract import TelemetryManagerAbstract
 from pipelex.tools.log.log import log
 from pipelex.tools.misc.package_utils import get_package_version
@@ -40,6 +42,14 @@ class TelemetryManager(TelemetryManagerAbstract):
         posthog.privacy_mode = True
         posthog.default_client = self.posthog
 
+        self.local_sink = JsonlFileTelemetrySink(file_path=telemetry_config.local_sink_path) if telemetry_config.local_sink_path else None
+        self.dispatcher = TelemetryDispatcher(
+            sink=self._flush_events,
+            max_queue_size=telemetry_config.dispatch_queue_size,
+            batch_size=telemetry_config.dispatch_batch_size,
+            flush_interval=telemetry_config.dispatch_flush_interval,
+        )
+
     def _handle_transmission_error(self, error: Exception | None, _items: list[dict[str, Any]]) -> None:
         """Handle errors that occur during telemetry transmission.
 
@@ -86,13 +96,14 @@ class TelemetryManager(TelemetryManagerAbstract):
 
     @override
     def setup(self, integration_mode: IntegrationMode):
+        self.dispatcher.start()
         if telemetry_mode := TelemetryManagerAbstract.telemetry_was_just_enabled():
             package_version = get_package_version()
             with new_context():
                 tag(name=EventProperty.INTEGRATION, value=integration_mode)
                 tag(name=EventProperty.PIPELEX_VERSION, value=package_version)
                 tag(name=EventProperty.SETTING, value=Setting.TELEMETRY_MODE)
-            self.posthog.capture(
+            self.track_event(
                 EventName.TELEMETRY_JUST_ENABLED,
                 properties={
                     EventProperty.TELEMETRY_MODE: telemetry_mode,
@@ -102,31 +113,71 @@ class TelemetryManager(TelemetryManagerAbstract):
 
     @override
     def teardown(self):
-        pass
+        self.dispatcher.stop(timeout=self.telemetry_config.dispatch_teardown_timeout)
+
+    @property
+    def nb_dropped_events(self) -> int:
+        return self.dispatcher.nb_dropped_events
 
     @override
     def track_event(self, event_name: EventName, properties: dict[EventProperty, Any] | None = None):
+        # This is called on the code path of the pipe runs: we only enqueue the event,
+        # it will be prepared and sent in a batch by the dispatcher's worker thread
+        if self.telemetry_config.telemetry_mode == TelemetryMode.OFF:
+            log.verbose(f"Telemetry is off, skipping event '{event_name}'")
+            return
+        # the context tags must be read here: the worker thread does not see the caller's PostHog context
+        self.dispatcher.enqueue(
+            TelemetryEvent(
+                event_name=event_name,
+                properties=properties,
+                # an aware timestamp, as posthog takes a naive one older than a few seconds for a UTC one
+                timestamp=datetime.now(timezone.utc),  # noqa: UP017 - datetime.UTC is not available on Python 3.10
+                context_tags=get_tags(),
+            ),
+        )
+
+    def _flush_events(self, events: list[TelemetryEvent]):
+        redacted_events = [self._redact_event(event) for event in events]
+        if self.local_sink:
+            self.local_sink(redacted_events)
+        if self.telemetry_config.remote_sink_enabled:
+            for event in redacted_events:
+                self._send_event(event=event)
+
+    def _redact_event(self, event: TelemetryEvent) -> TelemetryEvent:
         # We copy the incoming properties to avoid modifying the original dictionary
-        # and to convert the keys to str
         # and to remove the properties that are in the redact list
-        tracked_properties: dict[str, Any]
-        if properties:
-            tracked_properties = {key: value for key, value in properties.items() if key not in self.telemetry_config.redact}
-        else:
-            tracked_properties = {}
+        if not event.properties and not event.context_tags:
+            return event
+        redacted_properties = {key: value for key, value in (event.properties or {}).items() if key not in self.telemetry_config.redact}
+        redacted_tags = {key: value for key, value in event.context_tags.items() if key not in self.telemetry_config.redact}
+        return event.model_copy(update={"properties": redacted_properties, "context_tags": redacted_tags})
+
+    def _send_event(self, event: TelemetryEvent):
+        # the keys are converted to str for PostHog, the explicit properties take precedence over the context tags
+        tracked_properties: dict[str, Any] = {
+            **event.context_tags,
+            **{str(key): value for key, value in (event.properties or {}).items()},
+        }
         match self.telemetry_config.telemetry_mode:
             case TelemetryMode.ANONYMOUS:
-                self._track_anonymous_event(event_name=event_name, properties=tracked_properties)
+                self._track_anonymous_event(event_name=event.event_name, properties=tracked_properties, timestamp=event.timestamp)
             case TelemetryMode.IDENTIFIED:
                 if not self.telemetry_config.user_id:
-                    log.error(f"Could not track event '{event_name}' as identified because user_id is not set, tracking as anonymous")
-                    self._track_anonymous_event(event_name=event_name, properties=tracked_properties)
+                    log.error(f"Could not track event '{event.event_name}' as identified because user_id is not set, tracking as anonymous")
+                    self._track_anonymous_event(event_name=event.event_name, properties=tracked_properties, timestamp=event.timestamp)
                 else:
-                    self._track_identified_event(event_name=event_name, properties=tracked_properties, user_id=self.telemetry_config.user_id)
+                    self._track_identified_event(
+                        event_name=event.event_name,
+                        properties=tracked_properties,
+                        user_id=self.telemetry_config.user_id,
+                        timestamp=event.timestamp,
+                    )
             case TelemetryMode.OFF:
-                log.verbose(f"Telemetry is off, skipping event '{event_name}'")
+                log.verbose(f"Telemetry is off, skipping event '{event.event_name}'")
 
-    def _track_anonymous_event(self, event_name: str, properties: dict[str, Any]):
+    def _track_anonymous_event(self, event_name: str, properties: dict[str, Any], timestamp: datetime):
         if not self.posthog:
             return
         if self.telemetry_config.dry_mode_enabled:
@@ -136,10 +187,10 @@ class TelemetryManager(TelemetryManagerAbstract):
                 log.debug(f"Tracking anonymous event '{event_name}'. No properties.")
         else:
             properties["$process_person_profile"] = False
-            self.posthog.capture(event_name, properties=properties)
+            self.posthog.capture(event_name, properties=properties, timestamp=timestamp)
             log.verbose(f"Tracked anonymous event '{event_name}' with properties: {properties}")
 
-    def _track_identified_event(self, event_name: str, properties: dict[str, Any], user_id: str):
+    def _track_identified_event(self, event_name: str, properties: dict[str, Any], user_id: str, timestamp: datetime):
         if not self.posthog:
             return
         if self.telemetry_config.dry_mode_enabled:
@@ -148,5 +199,5 @@ class TelemetryManager(TelemetryManagerAbstract):
             else:
                 log.debug(f"Tracking identified event '{event_name}'. No properties.")
         else:
-            self.posthog.capture(event_name, distinct_id=user_id, properties=properties)
+            self.posthog.capture(event_name, distinct_id=user_id, properties=properties, timestamp=timestamp)
             log.verbose(f"Tracked identified event '{event_name}' with properties: {properties}")
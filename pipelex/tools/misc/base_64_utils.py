@@ -40,6 +40,13 @@ def strip_base_64_str_if_needed(base64_str: str) -> str:
     return base64_str
 
 
+def get_base_64_str_decoded_size(base_64_str: str) -> int:
+    """Compute the number of bytes encoded by a base64 string, or a data URL, without decoding it."""
+    stripped_base_64_str = strip_base_64_str_if_needed(base_64_str).rstrip()
+    nb_padding_chars = len(stripped_base_64_str) - len(stripped_base_64_str.rstrip("="))
+    return max(len(stripped_base_64_str) * 3 // 4 - nb_padding_chars, 0)
+
+
 def prefixed_base64_str_from_base64_bytes(b64_bytes: bytes) -> str:
     file_type = detect_file_type_from_base64(b64_bytes)
     return f"data:{file_type.mime};base64,{base64.b64encode(b64_bytes).decode('utf-8')}"
@@ -0,0 +1,49 @@
+import sys
+from enum import Enum
+from types import FunctionType, MethodType, ModuleType
+from typing import Any
+
+from pydantic import BaseModel
+
+# objects that are shared rather than owned by whoever references them
+SHARED_OBJECT_TYPES = (type, ModuleType, FunctionType, MethodType, Enum, bool, type(None))
+CONTAINER_TYPES = (list, tuple, set, frozenset)
+
+
+def get_deep_size(obj: Any, seen: set[int] | None = None) -> int:
+    """Estimate the bytes retained by an object, following its items, its attributes and the fields of pydantic models.
+
+    Each object is counted once, so the size of a structure holding the same string twice only counts it once.
+    Pass the same `seen` set to several calls to measure what a group of objects retains altogether.
+    """
+    if seen is None:
+        seen = set()
+    total_size = 0
+    objects_to_visit: list[Any] = [obj]
+    while objects_to_visit:
+        current = objects_to_visit.pop()
+        if isinstance(current, SHARED_OBJECT_TYPES) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        total_size += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray, int, float)):
+            continue
+        if isinstance(current, dict):
+            objects_to_visit.extend(current.keys())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            objects_to_visit.extend(current.values())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        elif isinstance(current, CONTAINER_TYPES):
+            objects_to_visit.extend(current)  # pyright: ignore[reportUnknownArgumentType]
+        elif isinstance(current, BaseModel):
+            objects_to_visit.append(current.__dict__)
+            if current.__pydantic_extra__:
+                objects_to_visit.append(current.__pydantic_extra__)
+        elif hasattr(current, "__dict__"):
+            objects_to_visit.append(vars(current))
+    return total_size
+
+
+def format_size(size: int) -> str:
+    for unit, unit_size in (("GB", 1_000_000_000), ("MB", 1_000_000), ("kB", 1_000)):
+        if size >= unit_size:
+            return f"{size / unit_size:.1f} {unit}"
+    return f"{size} B"
@@ -0,0 +1,100 @@
+import os
+import time
+
+from pydantic import BaseModel, Field
+
+from pipelex.types import StrEnum
+
+SpanAttributeValue = str | int | float | bool | list[str]
+
+
+class SpanKind(StrEnum):
+    PIPE = "pipe"
+    CONTENT_GENERATION = "content_generation"
+    WORKER = "worker"
+    TEMPLATE = "template"
+
+
+class SpanStatus(StrEnum):
+    UNSET = "unset"
+    OK = "ok"
+    ERROR = "error"
+
+
+class SpanAttribute(StrEnum):
+    PIPE_CODE = "pipelex.pipe.code"
+    PIPE_TYPE = "pipelex.pipe.type"
+    PIPE_STACK = "pipelex.pipe.stack"
+    BATCH_INDEX = "pipelex.batch.index"
+    PIPELINE_RUN_ID = "pipelex.pipeline.run_id"
+    RUN_MODE = "pipelex.run_mode"
+    MODEL_HANDLE = "pipelex.model.handle"
+    MODEL_NAME = "pipelex.model.name"
+    IS_CACHE_HIT = "pipelex.llm.is_cache_hit"
+    TEMPLATE_CATEGORY = "pipelex.template.category"
+    EXCEPTION_TYPE = "exception.type"
+
+    @staticmethod
+    def for_nb_tokens(token_category: str) -> str:
+        return f"pipelex.llm.nb_tokens.{token_category}"
+
+
+def make_trace_id() -> str:
+    return os.urandom(16).hex()
+
+
+def make_span_id() -> str:
+    return os.urandom(8).hex()
+
+
+class Span(BaseModel):
+    """A timed operation of a pipeline run, with timestamps in nanoseconds since the epoch like OpenTelemetry."""
+
+    name: str
+    kind: SpanKind
+    trace_id: str
+    span_id: str = Field(default_factory=make_span_id)
+    parent_span_id: str | None = None
+    start_time_ns: int = Field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    attributes: dict[str, SpanAttributeValue] = Field(default_factory=dict)
+    status: SpanStatus = SpanStatus.UNSET
+    status_message: str | None = None
+    is_recording: bool = Field(default=True, exclude=True)
+
+    @classmethod
+    def make_non_recording(cls) -> "Span":
+        return Span(name="non_recording", kind=SpanKind.PIPE, trace_id="", span_id="", start_time_ns=0, is_recording=False)
+
+    @property
+    def duration_seconds(self) -> float | None:
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def set_attribute(self, key: str, value: SpanAttributeValue | None) -> None:
+        if not self.is_recording or value is None:
+            return
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: dict[str, SpanAttributeValue | None]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key=key, value=value)
+
+    def record_error(self, exc: BaseException) -> None:
+        if not self.is_recording:
+            return
+        self.status = SpanStatus.ERROR
+        self.status_message = str(exc)
+        self.attributes[SpanAttribute.EXCEPTION_TYPE] = type(exc).__name__
+
+    def end(self) -> None:
+        if not self.is_recording:
+            return
+        self.end_time_ns = time.time_ns()
+        if self.status == SpanStatus.UNSET:
+            self.status = SpanStatus.OK
+
+
+# Shared by the tracer that doesn't record anything: it ignores every update
+NON_RECORDING_SPAN = Span.make_non_recording()
@@ -0,0 +1,187 @@
+import queue
+import threading
+from typing import Any, Protocol
+
+import httpx
+from typing_extensions import override
+
+from pipelex import log
+from pipelex.tools.misc.file_utils import ensure_directory_for_file_path
+from pipelex.tracing.span import Span, SpanAttributeValue, SpanStatus
+
+# OpenTelemetry numeric codes, see opentelemetry/proto/trace/v1/trace.proto
+_OTLP_SPAN_KIND_INTERNAL = 1
+_OTLP_STATUS_CODES: dict[SpanStatus, int] = {
+    SpanStatus.UNSET: 0,
+    SpanStatus.OK: 1,
+    SpanStatus.ERROR: 2,
+}
+_OTLP_SPAN_KIND_ATTRIBUTE = "pipelex.span.kind"
+
+
+class SpanExporterProtocol(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class InMemorySpanExporter(SpanExporterProtocol):
+    """Keeps the exported spans in a list, mostly useful for tests."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    @override
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+    @override
+    def shutdown(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        self.spans = []
+
+
+class JsonlSpanExporter(SpanExporterProtocol):
+    """Appends the exported spans to a JSON Lines file, one span per line."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    @override
+    def export(self, spans: list[Span]) -> None:
+        ensure_directory_for_file_path(file_path=self.file_path)
+        with open(self.file_path, "a", encoding="utf-8") as file:
+            file.writelines(span.model_dump_json() + "\n" for span in spans)
+
+    @override
+    def shutdown(self) -> None:
+        pass
+
+
+def _make_otlp_attribute_value(value: SpanAttributeValue) -> dict[str, Any]:
+    # bool must be checked before int, because it's a subclass of int
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, list):
+        return {"arrayValue": {"values": [{"stringValue": item} for item in value]}}
+    return {"stringValue": value}
+
+
+def _make_otlp_attributes(attributes: dict[str, SpanAttributeValue]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _make_otlp_attribute_value(value)} for key, value in attributes.items()]
+
+
+def make_otlp_payload(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """Encode spans as an OTLP/HTTP JSON export request, accepted by OpenTelemetry collectors on /v1/traces."""
+    otlp_spans: list[dict[str, Any]] = []
+    for span in spans:
+        otlp_span: dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": _OTLP_SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(span.start_time_ns),
+            "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+            "attributes": _make_otlp_attributes({_OTLP_SPAN_KIND_ATTRIBUTE: span.kind, **span.attributes}),
+            "status": {"code": _OTLP_STATUS_CODES[span.status]},
+        }
+        if span.parent_span_id:
+            otlp_span["parentSpanId"] = span.parent_span_id
+        if span.status_message:
+            otlp_span["status"]["message"] = span.status_message
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _make_otlp_attributes({"service.name": service_name})},
+                "scopeSpans": [{"scope": {"name": "pipelex"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+class OtlpHttpSpanExporter(SpanExporterProtocol):
+    """Posts the exported spans to an OTLP/HTTP endpoint (e.g. an OpenTelemetry collector) using the JSON encoding."""
+
+    def __init__(self, endpoint: str, service_name: str, headers: dict[str, str] | None = None, timeout: float = 10.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.client = httpx.Client(headers=headers, timeout=timeout)
+
+    @override
+    def export(self, spans: list[Span]) -> None:
+        response = self.client.post(self.endpoint, json=make_otlp_payload(spans=spans, service_name=self.service_name))
+        response.raise_for_status()
+
+    @override
+    def shutdown(self) -> None:
+        self.client.close()
+
+
+class BackgroundSpanExporter(SpanExporterProtocol):
+    """Exports the spans with the wrapped exporters from a background thread.
+
+    The exporters writing to files or posting over HTTP would otherwise block the event loop, and every running pipeline with it,
+    each time a trace ends. Exporting only enqueues the batch: when the bounded queue is full, the batch is dropped and counted.
+    Shutting down exports the batches still queued, then shuts the wrapped exporters down.
+    """
+
+    def __init__(self, exporters: list[SpanExporterProtocol], max_queued_batches: int = 256, shutdown_timeout: float = 10.0):
+        self.exporters = exporters
+        self.shutdown_timeout = shutdown_timeout
+        # None is only enqueued by shutdown(), to stop the worker
+        self._queue: queue.Queue[list[Span] | None] = queue.Queue(maxsize=max_queued_batches)
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self.nb_dropped_spans = 0
+
+    @override
+    def export(self, spans: list[Span]) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pipelex-span-exporter", daemon=True)
+                self._thread.start()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.nb_dropped_spans += len(spans)
+            log.warning(f"Span export queue is full, dropped {len(spans)} spans")
+
+    def wait_until_exported(self) -> None:
+        """Block until the batches enqueued so far are exported."""
+        if self._thread is not None:
+            self._queue.join()
+
+    @override
+    def shutdown(self) -> None:
+        with self._thread_lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout=self.shutdown_timeout)
+            if thread.is_alive():
+                log.warning(f"Span exporter did not export the queued spans within {self.shutdown_timeout}s, they are lost")
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def _run(self) -> None:
+        while True:
+            spans = self._queue.get()
+            try:
+                if spans is None:
+                    return
+                for exporter in self.exporters:
+                    try:
+                        exporter.export(spans=spans)
+                    except Exception as exc:
+                        # Tracing must never break a pipeline run
+                        log.error(f"Could not export {len(spans)} spans with {exporter.__class__.__name__}: {exc}")
+            finally:
+                self._queue.task_done()
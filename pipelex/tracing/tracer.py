@@ -0,0 +1,115 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from typing_extensions import override
+
+from pipelex import log
+from pipelex.tracing.span import Span, SpanAttributeValue, SpanKind, make_trace_id
+from pipelex.tracing.span_exporter import (
+    BackgroundSpanExporter,
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    OtlpHttpSpanExporter,
+    SpanExporterProtocol,
+)
+from pipelex.tracing.tracer_protocol import TracerProtocol
+from pipelex.tracing.tracing_config import SpanExporterType, TracingConfig
+
+# The current span is a context variable, so the branches of PipeBatch and PipeParallel, which run as separate asyncio tasks,
+# each get their own current span, with the span of the controller that started them as parent
+_current_span: ContextVar[Span | None] = ContextVar("pipelex_current_span", default=None)
+
+
+def get_current_span() -> Span | None:
+    return _current_span.get()
+
+
+class Tracer(TracerProtocol):
+    """Records a span for each traced operation and hands the finished spans over to the exporters.
+
+    Finished spans are buffered and handed over to the exporters when the root span of a trace ends, when the buffer is full,
+    or on flush. The exporters must not block: the ones doing IO are wrapped in a BackgroundSpanExporter.
+    """
+
+    def __init__(self, exporters: list[SpanExporterProtocol], max_buffered_spans: int = 512):
+        self.exporters = exporters
+        self.max_buffered_spans = max_buffered_spans
+        self._finished_spans: list[Span] = []
+
+    @classmethod
+    def make_from_config(cls, tracing_config: TracingConfig) -> "Tracer":
+        exporters: list[SpanExporterProtocol] = []
+        # The exporters doing IO run in a background thread, so that exporting never blocks the event loop
+        background_exporters: list[SpanExporterProtocol] = []
+        for exporter_type in tracing_config.exporters:
+            match exporter_type:
+                case SpanExporterType.IN_MEMORY:
+                    exporters.append(InMemorySpanExporter())
+                case SpanExporterType.JSONL:
+                    background_exporters.append(JsonlSpanExporter(file_path=tracing_config.jsonl_file_path))
+                case SpanExporterType.OTLP:
+                    background_exporters.append(
+                        OtlpHttpSpanExporter(endpoint=tracing_config.otlp_endpoint, service_name=tracing_config.otlp_service_name)
+                    )
+        if background_exporters:
+            exporters.append(BackgroundSpanExporter(exporters=background_exporters))
+        return cls(exporters=exporters, max_buffered_spans=tracing_config.max_buffered_spans)
+
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return True
+
+    @override
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind,
+        attributes: dict[str, SpanAttributeValue | None] | None = None,
+    ) -> Generator[Span, None, None]:
+        parent_span = _current_span.get()
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=parent_span.trace_id if parent_span else make_trace_id(),
+            parent_span_id=parent_span.span_id if parent_span else None,
+        )
+        if attributes:
+            span.set_attributes(attributes=attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc=exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self._finished_spans.append(span)
+            if span.parent_span_id is None or len(self._finished_spans) >= self.max_buffered_spans:
+                self.flush()
+
+    @override
+    def flush(self) -> None:
+        if not self._finished_spans:
+            return
+        spans = self._finished_spans
+        self._finished_spans = []
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans=spans)
+            except Exception as exc:
+                # Tracing must never break a pipeline run
+                log.error(f"Could not export {len(spans)} spans with {exporter.__class__.__name__}: {exc}")
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        self.flush()
+        for exporter in self.exporters:
+            exporter.shutdown()
@@ -0,0 +1,52 @@
+from contextlib import AbstractContextManager, nullcontext
+from typing import Protocol
+
+from typing_extensions import override
+
+from pipelex.tracing.span import NON_RECORDING_SPAN, Span, SpanAttributeValue, SpanKind
+
+
+class TracerProtocol(Protocol):
+    @property
+    def is_enabled(self) -> bool: ...
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind,
+        attributes: dict[str, SpanAttributeValue | None] | None = None,
+    ) -> AbstractContextManager[Span]: ...
+
+    def flush(self) -> None: ...
+
+    def setup(self) -> None: ...
+
+    def teardown(self) -> None: ...
+
+
+class TracerNoOp(TracerProtocol):
+    @property
+    @override
+    def is_enabled(self) -> bool:
+        return False
+
+    @override
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind,
+        attributes: dict[str, SpanAttributeValue | None] | None = None,
+    ) -> AbstractContextManager[Span]:
+        return nullcontext(NON_RECORDING_SPAN)
+
+    @override
+    def flush(self) -> None:
+        pass
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
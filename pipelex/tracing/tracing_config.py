@@ -0,0 +1,23 @@
+from pydantic import field_validator
+
+from pipelex.system.configuration.config_model import ConfigModel
+from pipelex.types import StrEnum
+
+
+class SpanExporterType(StrEnum):
+    IN_MEMORY = "in_memory"
+    JSONL = "jsonl"
+    OTLP = "otlp"
+
+
+class TracingConfig(ConfigModel):
+    exporters: list[SpanExporterType]
+    max_buffered_spans: int
+    jsonl_file_path: str
+    otlp_endpoint: str
+    otlp_service_name: str
+
+    @field_validator("exporters", mode="before")
+    @classmethod
+    def validate_exporters(cls, value: list[str]) -> list[SpanExporterType]:
+        return [SpanExporterType(exporter_type) for exporter_type in value]
@@ -0,0 +1,51 @@
+from collections.abc import Callable, Coroutine
+from contextlib import AbstractContextManager
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from pipelex.hub import get_tracer
+from pipelex.pipe_run.pipe_run_params import PipeRunParams
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tracing.span import Span, SpanAttribute, SpanKind
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def traced(kind: SpanKind) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """Open a span named after the decorated coroutine function for each of its calls."""
+
+    def decorator(func: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, Coroutine[Any, Any, R]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            tracer = get_tracer()
+            if not tracer.is_enabled:
+                return await func(*args, **kwargs)
+            with tracer.start_span(name=func.__name__, kind=kind) as span:
+                job_metadata = kwargs.get("job_metadata")
+                if isinstance(job_metadata, JobMetadata):
+                    span.set_attribute(key=SpanAttribute.PIPELINE_RUN_ID, value=job_metadata.pipeline_run_id)
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_pipe_span(pipe_code: str, pipe_type: str, job_metadata: JobMetadata, pipe_run_params: PipeRunParams) -> AbstractContextManager[Span]:
+    """Open the span of a pipe run, to be entered after the pipe was pushed to the pipe stack."""
+    tracer = get_tracer()
+    if not tracer.is_enabled:
+        return tracer.start_span(name=pipe_code, kind=SpanKind.PIPE)
+    return tracer.start_span(
+        name=pipe_code,
+        kind=SpanKind.PIPE,
+        attributes={
+            SpanAttribute.PIPE_CODE: pipe_code,
+            SpanAttribute.PIPE_TYPE: pipe_type,
+            SpanAttribute.PIPE_STACK: pipe_run_params.pipe_stack,
+            SpanAttribute.BATCH_INDEX: pipe_run_params.batch_index,
+            SpanAttribute.PIPELINE_RUN_ID: job_metadata.pipeline_run_id,
+            SpanAttribute.RUN_MODE: pipe_run_params.run_mode,
+        },
+    )
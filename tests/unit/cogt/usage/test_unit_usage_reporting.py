@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.extract.extract_input import ExtractInput
+from pipelex.cogt.extract.extract_job_factory import ExtractJobFactory
+from pipelex.cogt.extract.extract_output import ExtractedImageFromPage, ExtractOutput, Page
+from pipelex.cogt.image.generated_image import GeneratedImage
+from pipelex.cogt.img_gen.img_gen_job_factory import ImgGenJobFactory
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.model_backends.model_type import ModelType
+from pipelex.cogt.usage.cost_category import CostCategory, CostsByCategoryDict
+from pipelex.cogt.usage.cost_registry import CostRegistry
+from pipelex.cogt.usage.latency_histogram import LatencyHistogram
+from pipelex.cogt.usage.unit_report import UnitCategory
+from pipelex.pipeline.job_metadata import JobCategory, JobMetadata
+from pipelex.reporting.reporting_manager import ReportingManager
+from pipelex.tools.misc.toml_utils import load_toml_from_path
+
+PIPELINE_RUN_ID = "test-unit-usage"
+KIT_BACKENDS_DIR_PATH = Path("pipelex/kit/configs/inference/backends")
+
+
+def _make_model_spec(name: str, model_type: ModelType, costs: CostsByCategoryDict) -> InferenceModelSpec:
+    return InferenceModelSpec(
+        backend_name="test_backend",
+        name=name,
+        sdk="test_sdk",
+        model_type=model_type,
+        model_id=f"{name}-id",
+        costs=costs,
+        max_tokens=None,
+        max_prompt_images=None,
+    )
+
+
+class TestLatencyHistogram:
+    def test_quantiles_are_estimated_within_bucket_width(self):
+        histogram = LatencyHistogram()
+        for duration in range(1, 101):
+            histogram.record(float(duration))
+
+        assert histogram.nb_samples == 100
+        assert histogram.mean_duration == pytest.approx(50.5)
+        for quantile, expected in ((0.5, 50), (0.95, 95), (0.99, 99)):
+            estimate = histogram.get_quantile(quantile)
+            assert estimate is not None
+            assert expected <= estimate <= expected * 1.1
+
+    def test_merge(self):
+        fast_histogram = LatencyHistogram()
+        slow_histogram = LatencyHistogram()
+        for _ in range(90):
+            fast_histogram.record(0.1)
+        for _ in range(10):
+            slow_histogram.record(10.0)
+
+        fast_histogram.merge(slow_histogram)
+        assert fast_histogram.nb_samples == 100
+        assert fast_histogram.get_quantile(0.5) == pytest.approx(0.1, rel=0.1)
+        assert fast_histogram.get_quantile(0.99) == pytest.approx(10.0)
+        assert LatencyHistogram().get_quantile(0.5) is None
+
+
+class TestUnitUsageReporting:
+    def test_img_gen_and_extract_jobs_are_reported(self, mocker: MockerFixture):
+        img_gen_model = _make_model_spec(name="img-model", model_type=ModelType.IMG_GEN, costs={CostCategory.IMAGE: 0.04})
+        extract_model = _make_model_spec(name="extract-model", model_type=ModelType.TEXT_EXTRACTOR, costs={CostCategory.PAGE: 0.001})
+        mock_generate_report = mocker.patch.object(CostRegistry, "generate_report_from_usage_registry")
+
+        reporting_manager = ReportingManager()
+        reporting_manager.setup()
+        reporting_manager.open_registry(pipeline_run_id=PIPELINE_RUN_ID)
+        try:
+            img_gen_job = ImgGenJobFactory.make_img_gen_job_from_prompt_contents(
+                positive_text="a cat",
+                job_metadata=JobMetadata(pipeline_run_id=PIPELINE_RUN_ID, job_category=JobCategory.IMG_GEN_JOB),
+            )
+            img_gen_job.img_gen_job_before_start(inference_model=img_gen_model)
+            img_gen_job.img_gen_job_after_complete(
+                generated_images=[
+                    GeneratedImage(url="data:image/png;base64,AAAAAA==", width=1, height=1),
+                    GeneratedImage(url="https://example.com/image.png", width=1, height=1),
+                ]
+            )
+            reporting_manager.report_inference_job(inference_job=img_gen_job)
+
+            extract_job = ExtractJobFactory.make_extract_job(
+                extract_input=ExtractInput(pdf_uri="document.pdf"),
+                job_metadata=JobMetadata(pipeline_run_id=PIPELINE_RUN_ID, job_category=JobCategory.EXTRACT_JOB),
+            )
+            extract_job.extract_job_before_start(inference_model=extract_model)
+            extract_job.extract_job_after_complete(
+                extract_output=ExtractOutput(
+                    pages={
+                        1: Page(text="hello", page_view=ExtractedImageFromPage(image_id="view", base_64="AAAA")),
+                        2: Page(text="world"),
+                    }
+                )
+            )
+            reporting_manager.report_inference_job(inference_job=extract_job)
+
+            reporting_manager.generate_report(pipeline_run_id=PIPELINE_RUN_ID)
+        finally:
+            reporting_manager.close_registry(pipeline_run_id=PIPELINE_RUN_ID)
+            reporting_manager.teardown()
+
+        usage_registry = mock_generate_report.call_args.kwargs["usage_registry"]
+        img_gen_usage = usage_registry.usages_by_model["img-model"]
+        assert img_gen_usage.nb_calls == 1
+        assert img_gen_usage.get_nb_units(UnitCategory.IMAGE) == 2
+        assert img_gen_usage.nb_bytes == 4
+        assert img_gen_usage.get_cost(CostCategory.IMAGE) == pytest.approx(0.08)
+        assert img_gen_usage.duration_histogram.nb_samples == 1
+        assert img_gen_usage.queue_wait_histogram.nb_samples == 1
+
+        extract_usage = usage_registry.usages_by_model["extract-model"]
+        assert extract_usage.get_nb_units(UnitCategory.PAGE) == 2
+        assert extract_usage.nb_bytes == len("hello") + len("world") + 3
+        assert extract_usage.get_cost(CostCategory.PAGE) == pytest.approx(0.002)
+
+        total_usage = usage_registry.get_total_usage()
+        assert total_usage.get_total_cost() == pytest.approx(0.082)
+        assert total_usage.duration_histogram.nb_samples == 2
+        record = img_gen_usage.as_flat_dictionary()
+        assert record["nb_images"] == 2
+        assert "duration_p95" in record
+
+    @pytest.mark.parametrize("backend_file_path", sorted(KIT_BACKENDS_DIR_PATH.glob("*.toml")), ids=lambda path: path.stem)
+    def test_models_billed_per_unit_declare_their_unit_cost(self, backend_file_path: Path):
+        model_specs_dict = load_toml_from_path(str(backend_file_path))
+        defaults_dict: dict[str, Any] = model_specs_dict.pop("defaults", {})
+        unit_cost_categories = {ModelType.IMG_GEN: CostCategory.IMAGE, ModelType.TEXT_EXTRACTOR: CostCategory.PAGE}
+        for model_name, model_spec_dict in model_specs_dict.items():
+            if not isinstance(model_spec_dict, dict):
+                continue
+            model_spec_blueprint_dict: dict[str, Any] = {**defaults_dict, **model_spec_dict}
+            model_type = ModelType(model_spec_blueprint_dict.get("model_type", ModelType.LLM))
+            if unit_cost_category := unit_cost_categories.get(model_type):
+                assert unit_cost_category in model_spec_blueprint_dict["costs"], f"Model '{model_name}' has no '{unit_cost_category}' cost"
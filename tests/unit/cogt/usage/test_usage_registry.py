@@ -0,0 +1,101 @@
+import csv
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.cogt.llm.llm_report import LLMTokenCostReport, LLMTokenCostReportField, LLMTokensUsage
+from pipelex.cogt.usage.cost_category import CostCategory
+from pipelex.cogt.usage.cost_registry import CostRegistry
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.cogt.usage.usage_record_sink import RotatingCsvUsageRecordSink
+from pipelex.cogt.usage.usage_registry import USAGE_NB_CALLS_FIELD, UsageRegistry
+from pipelex.pipeline.job_metadata import JobMetadata
+
+
+def _make_cost_report(model_name: str, nb_tokens_input: int, nb_tokens_input_cached: int, nb_tokens_output: int) -> LLMTokenCostReport:
+    llm_tokens_usage = LLMTokensUsage(
+        job_metadata=JobMetadata(pipeline_run_id="test-pipeline"),
+        inference_model_name=model_name,
+        inference_model_id=f"{model_name}-id",
+        nb_tokens_by_category={
+            TokenCategory.INPUT: nb_tokens_input,
+            TokenCategory.INPUT_CACHED: nb_tokens_input_cached,
+            TokenCategory.OUTPUT: nb_tokens_output,
+        },
+        unit_costs={
+            CostCategory.INPUT: 1000,  # $1 per million tokens
+            CostCategory.INPUT_CACHED: 500,  # $0.50 per million tokens
+            CostCategory.OUTPUT: 2000,  # $2 per million tokens
+        },
+    )
+    return CostRegistry.complete_cost_report(llm_tokens_usage=llm_tokens_usage)
+
+
+@pytest.fixture
+def cost_reports() -> list[LLMTokenCostReport]:
+    return [
+        _make_cost_report(model_name="model-a", nb_tokens_input=100, nb_tokens_input_cached=20, nb_tokens_output=50),
+        _make_cost_report(model_name="model-a", nb_tokens_input=200, nb_tokens_input_cached=50, nb_tokens_output=100),
+        _make_cost_report(model_name="model-b", nb_tokens_input=150, nb_tokens_input_cached=30, nb_tokens_output=75),
+    ]
+
+
+class TestUsageRegistry:
+    def test_aggregates_by_model(self, cost_reports: list[LLMTokenCostReport]):
+        usage_registry = UsageRegistry.make_from_cost_reports(cost_reports=cost_reports)
+
+        model_a_usage = usage_registry.usages_by_model["model-a"]
+        assert model_a_usage.nb_calls == 2
+        assert model_a_usage.get_nb_tokens(TokenCategory.INPUT_NON_CACHED) == 230
+        assert model_a_usage.get_nb_tokens(TokenCategory.INPUT_CACHED) == 70
+        assert model_a_usage.get_nb_tokens(TokenCategory.INPUT_JOINED) == 300
+        assert model_a_usage.get_nb_tokens(TokenCategory.OUTPUT) == 150
+        assert model_a_usage.get_cost(CostCategory.INPUT_NON_CACHED) == pytest.approx(0.23)
+        assert model_a_usage.get_cost(CostCategory.INPUT_CACHED) == pytest.approx(0.035)
+        assert model_a_usage.get_cost(CostCategory.OUTPUT) == pytest.approx(0.3)
+
+        total_usage = usage_registry.get_total_usage()
+        assert total_usage.nb_calls == 3
+        assert total_usage.get_nb_tokens(TokenCategory.INPUT_JOINED) == 450
+        assert total_usage.get_cost(CostCategory.INPUT_JOINED) == pytest.approx(0.265 + 0.135)
+
+    def test_generate_report_from_usage_registry(self, cost_reports: list[LLMTokenCostReport], tmp_path: Path, mocker: MockerFixture):
+        mock_console = mocker.patch("pipelex.cogt.usage.cost_registry.Console")
+        usage_registry = UsageRegistry.make_from_cost_reports(cost_reports=cost_reports)
+        csv_file = tmp_path / "cost_report.csv"
+
+        CostRegistry.generate_report_from_usage_registry(
+            pipeline_run_id="test-pipeline",
+            usage_registry=usage_registry,
+            unit_scale=1.0,
+            cost_report_file_path=str(csv_file),
+        )
+
+        mock_console.return_value.print.assert_called_once()
+        with open(csv_file, encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+        assert [row[LLMTokenCostReportField.LLM_NAME] for row in rows] == ["model-a", "model-b"]
+        assert int(rows[0][USAGE_NB_CALLS_FIELD]) == 2
+        assert int(rows[0][LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED]) == 230
+
+    def test_rotating_csv_sink(self, cost_reports: list[LLMTokenCostReport], tmp_path: Path):
+        sink = RotatingCsvUsageRecordSink(dir_path=str(tmp_path), base_name="usage_records", max_rows_per_file=2)
+        for cost_report in cost_reports * 2:
+            sink.write_record(record=cost_report.as_flat_dictionary())
+        sink.close()
+
+        assert len(sink.file_paths) == 3
+        nb_rows_per_file: list[int] = []
+        for file_path in sink.file_paths:
+            with open(file_path, encoding="utf-8") as file:
+                reader = csv.DictReader(file)
+                rows = list(reader)
+            assert reader.fieldnames == sink.fieldnames
+            nb_rows_per_file.append(len(rows))
+        assert nb_rows_per_file == [2, 2, 2]
+        with open(sink.file_paths[0], encoding="utf-8") as file:
+            first_row = next(csv.DictReader(file))
+        assert first_row[LLMTokenCostReportField.LLM_NAME] == "model-a"
+        assert int(first_row[LLMTokenCostReportField.NB_TOKENS_INPUT_NON_CACHED]) == 80
+        assert first_row[LLMTokenCostReportField.report_field_for_nb_tokens_by_category(TokenCategory.OUTPUT_REASONING)] == ""
@@ -40,3 +40,12 @@ class TestWorkingMemoryBasic:
         empty_memory = WorkingMemoryFactory.make_empty()
         assert len(empty_memory.root) == 0
         assert len(empty_memory.aliases) == 0
+
+    def test_working_memory_shallow_copy(self, single_text_memory: WorkingMemory):
+        """Test that a shallow copy shares the stuffs but not the keys."""
+        shallow_copy = single_text_memory.make_shallow_copy()
+        shallow_copy.set_stuff(name="other_text", stuff=shallow_copy.get_stuff("sample_text"))
+        shallow_copy.set_alias(alias="alias_text", target="other_text")
+        assert shallow_copy.get_stuff("sample_text") is single_text_memory.get_stuff("sample_text")
+        assert "other_text" not in single_text_memory.root
+        assert "alias_text" not in single_text_memory.aliases
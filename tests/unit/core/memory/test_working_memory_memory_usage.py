@@ -0,0 +1,80 @@
+import base64
+
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.core.memory.memory_usage import RunMemoryUsage
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.image_content import ImageContent
+from pipelex.core.stuffs.list_content import ListContent
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.tools.misc.memory_size_utils import format_size, get_deep_size
+
+IMAGE_PAYLOAD_SIZE = 300_000
+
+
+def _make_image_stuff() -> Stuff:
+    base_64 = base64.b64encode(b"\x89PNG" + b"\x00" * IMAGE_PAYLOAD_SIZE).decode("ascii")
+    return StuffFactory.make_stuff(
+        concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.IMAGE),
+        name="photo",
+        content=ImageContent(url=f"data:image/png;base64,{base_64}", base_64=base_64),
+    )
+
+
+def _make_text_list_stuff(nb_items: int) -> Stuff:
+    return StuffFactory.make_stuff(
+        concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT),
+        name="paragraphs",
+        content=ListContent[TextContent](items=[TextContent(text=f"Paragraph number {index}") for index in range(nb_items)]),
+    )
+
+
+class TestWorkingMemoryMemoryUsage:
+    def test_deep_size_counts_shared_objects_once(self):
+        payload = "x" * 10_000
+        assert get_deep_size([payload, payload]) < 2 * len(payload)
+        assert get_deep_size([payload, "y" * 10_000]) > 2 * len(payload)
+
+    def test_estimate_memory_usage_includes_base64_payloads_and_list_items(self, single_text_memory: WorkingMemory):
+        image_stuff = _make_image_stuff()
+        list_stuff = _make_text_list_stuff(nb_items=100)
+        single_text_memory.add_new_stuff(name="photo", stuff=image_stuff)
+        single_text_memory.add_new_stuff(name="paragraphs", stuff=list_stuff)
+
+        stuff_usages = single_text_memory.estimate_memory_usage()
+
+        assert [stuff_usage.stuff_name for stuff_usage in stuff_usages] == ["photo", "paragraphs", "sample_text"]
+        # the data url and the base 64 field are both retained
+        assert stuff_usages[0].size > 2 * IMAGE_PAYLOAD_SIZE
+        assert stuff_usages[0].content_class == "ImageContent"
+        assert stuff_usages[1].nb_items == 100
+        assert stuff_usages[1].size > _make_text_list_stuff(nb_items=10).estimate_retained_size()
+        # the concept belongs to the library, not to the stuff
+        assert stuff_usages[2].size < 2_000
+
+    def test_run_memory_usage_records_peaks_per_pipe(self):
+        run_memory_usage = RunMemoryUsage(pipeline_run_id="run")
+        list_stuff = _make_text_list_stuff(nb_items=10)
+        image_stuff = _make_image_stuff()
+
+        small_size = run_memory_usage.record_stuffs(pipe_code="write", stuffs=[list_stuff])
+        large_size = run_memory_usage.record_stuffs(pipe_code="draw", stuffs=[list_stuff, image_stuff])
+        run_memory_usage.record_stuffs(pipe_code="write", stuffs=[])
+
+        assert large_size == small_size + image_stuff.estimate_retained_size()
+        assert run_memory_usage.peak_size == large_size
+        assert run_memory_usage.peak_pipe_code == "draw"
+        assert [pipe_peak.pipe_code for pipe_peak in run_memory_usage.get_top_pipes(nb_pipes=5)] == ["draw", "write"]
+        write_peak = run_memory_usage.pipe_peaks["write"]
+        assert (write_peak.nb_runs, write_peak.peak_size, write_peak.peak_nb_stuffs) == (2, small_size, 1)
+        assert [stuff_usage.stuff_name for stuff_usage in run_memory_usage.get_top_stuffs(nb_stuffs=1)] == ["photo"]
+
+    def test_empty_run_memory_usage(self):
+        run_memory_usage = RunMemoryUsage(pipeline_run_id="run")
+        assert run_memory_usage.is_empty
+        assert WorkingMemoryFactory.make_empty().estimate_memory_usage() == []
+        assert format_size(999) == "999 B"
+        assert format_size(1_500_000) == "1.5 MB"
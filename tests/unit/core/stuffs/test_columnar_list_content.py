@@ -0,0 +1,98 @@
+import copy
+
+import kajson
+import pytest
+
+from pipelex.client.api_serializer import ApiSerializer
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.list_content import ListContent
+from pipelex.core.stuffs.number_content import NumberContent
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_factory import COLUMNAR_LIST_MIN_NB_ITEMS, StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.exceptions import StuffContentTypeError
+
+TEXTS = ["first", "second", "third"]
+
+
+class TestColumnarListContent:
+    def test_make_columnar_from_records(self):
+        list_content = ListContent[TextContent].make_columnar(item_class=TextContent, records=[{"text": text} for text in TEXTS])
+
+        assert list_content.is_columnar
+        assert list_content.nb_items == 3
+        assert list_content.items[1] == TextContent(text="second")
+        assert list_content.items[-1] == TextContent(text="third")
+        assert list_content.items[:2] == [TextContent(text="first"), TextContent(text="second")]
+        assert [item.text for item in list_content.items] == TEXTS
+        with pytest.raises(IndexError):
+            list_content.items[3]
+
+    def test_compacted_round_trip_and_dump(self):
+        list_content = ListContent[TextContent](items=[TextContent(text=text) for text in TEXTS])
+        compacted = list_content.compacted()
+
+        assert compacted.is_columnar
+        assert compacted.items == list_content.items
+        assert compacted.model_dump() == list_content.model_dump()
+        assert compacted.rendered_plain() == list_content.rendered_plain()
+        materialized = compacted.materialized()
+        assert not materialized.is_columnar
+        assert materialized.items == list_content.items
+
+    def test_deep_copy_shares_the_columns(self):
+        list_content = ListContent[TextContent](items=[TextContent(text=text) for text in TEXTS]).compacted()
+        copied = copy.deepcopy(list_content)
+
+        assert copied is not list_content
+        assert copied.items is list_content.items
+
+    def test_compacted_rejects_heterogeneous_items(self):
+        list_content = ListContent[TextContent | NumberContent](items=[TextContent(text="text"), NumberContent(number=1)])
+        with pytest.raises(StuffContentTypeError):
+            list_content.compacted()
+
+    def test_api_serialization_matches_normal_form(self):
+        list_content = ListContent[TextContent](items=[TextContent(text=text) for text in TEXTS])
+        concept = ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT)
+        pipeline_inputs = ApiSerializer.serialize_working_memory_for_api(
+            WorkingMemoryFactory.make_from_single_stuff(stuff=StuffFactory.make_stuff(concept=concept, name="texts", content=list_content))
+        )
+        columnar_pipeline_inputs = ApiSerializer.serialize_working_memory_for_api(
+            WorkingMemoryFactory.make_from_single_stuff(
+                stuff=StuffFactory.make_stuff(concept=concept, name="texts", content=list_content.compacted())
+            )
+        )
+
+        assert columnar_pipeline_inputs == pipeline_inputs
+
+    def test_columnar_list_in_a_stuff_is_serialized_in_normal_form(self):
+        list_content = ListContent[TextContent](items=[TextContent(text=text) for text in TEXTS])
+        concept = ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT)
+        stuff = StuffFactory.make_stuff(concept=concept, name="texts", content=list_content)
+        columnar_stuff = StuffFactory.make_stuff(concept=concept, name="texts", content=list_content.compacted(), code=stuff.stuff_code)
+
+        assert columnar_stuff.model_dump_json() == stuff.model_dump_json()
+        decoded_stuff = kajson.loads(kajson.dumps(columnar_stuff))
+        assert isinstance(decoded_stuff, Stuff)
+        decoded_content = decoded_stuff.as_list_of_fixed_content_type(item_type=TextContent)
+        assert not decoded_content.is_columnar
+        assert decoded_content.items == list_content.items
+
+    def test_large_list_of_records_input_is_columnar(self):
+        numbers = list(range(COLUMNAR_LIST_MIN_NB_ITEMS))
+        stuff = StuffFactory.make_stuff_from_stuff_content_or_data(
+            stuff_content_or_data={"concept": "native.Number", "content": [{"number": number} for number in numbers]},
+            name="numbers",
+        )
+
+        list_content = stuff.as_list_of_fixed_content_type(item_type=NumberContent)
+        assert list_content.is_columnar
+        assert list_content.items[5] == NumberContent(number=5)
+        small_stuff = StuffFactory.make_stuff_from_stuff_content_or_data(
+            stuff_content_or_data={"concept": "native.Number", "content": [{"number": number} for number in numbers[:3]]},
+            name="numbers",
+        )
+        assert not small_stuff.as_list_of_fixed_content_type(item_type=NumberContent).is_columnar
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pytest
+
+from pipelex.exceptions import LibraryLoadingError
+from pipelex.hub import get_library_manager, get_optional_pipe, get_required_pipe
+from pipelex.libraries.library_watcher import LibraryWatcher
+
+HOT_RELOAD_BUNDLE = """domain = "hot_reload_tests"
+description = "Bundle used to test hot-reload"
+
+[concept]
+Greeting = "A greeting"
+
+[pipe.hot_reload_sequence]
+type = "PipeSequence"
+description = "Sequence calling the greeting pipe"
+output = "Greeting"
+steps = [{{ pipe = "{step_pipe_code}", result = "greeting" }}]
+
+[pipe.hot_reload_greet]
+type = "PipeLLM"
+description = "{description}"
+output = "Greeting"
+prompt = "Say hello"
+"""
+
+
+def _write_bundle(plx_path: Path, description: str, step_pipe_code: str = "hot_reload_greet") -> None:
+    plx_path.write_text(HOT_RELOAD_BUNDLE.format(description=description, step_pipe_code=step_pipe_code), encoding="utf-8")
+
+
+class TestLibraryHotReload:
+    def test_reload_bundle_swaps_pipes(self, tmp_path: Path):
+        plx_path = tmp_path / "hot_reload.plx"
+        library_manager = get_library_manager()
+        _write_bundle(plx_path, description="First version")
+        try:
+            library_manager.reload_bundle(plx_path=plx_path)
+            old_pipe = get_required_pipe(pipe_code="hot_reload_greet")
+            assert old_pipe.description == "First version"
+
+            _write_bundle(plx_path, description="Second version")
+            library_manager.reload_bundle(plx_path=plx_path)
+            new_pipe = get_required_pipe(pipe_code="hot_reload_greet")
+            assert new_pipe.description == "Second version"
+            # Runs holding the old pipe object are not affected
+            assert old_pipe.description == "First version"
+        finally:
+            library_manager.unload_bundle(plx_path=plx_path)
+        assert get_optional_pipe(pipe_code="hot_reload_greet") is None
+        assert get_optional_pipe(pipe_code="hot_reload_sequence") is None
+
+    def test_reload_invalid_bundle_keeps_previous_version(self, tmp_path: Path):
+        plx_path = tmp_path / "hot_reload.plx"
+        library_manager = get_library_manager()
+        _write_bundle(plx_path, description="Valid version")
+        try:
+            library_manager.reload_bundle(plx_path=plx_path)
+
+            _write_bundle(plx_path, description="Broken version", step_pipe_code="missing_pipe_for_hot_reload")
+            with pytest.raises(LibraryLoadingError):
+                library_manager.reload_bundle(plx_path=plx_path)
+            assert get_required_pipe(pipe_code="hot_reload_greet").description == "Valid version"
+
+            plx_path.write_text("domain = [not valid toml", encoding="utf-8")
+            with pytest.raises(LibraryLoadingError):
+                library_manager.reload_bundle(plx_path=plx_path)
+            assert get_required_pipe(pipe_code="hot_reload_greet").description == "Valid version"
+        finally:
+            library_manager.unload_bundle(plx_path=plx_path)
+
+    def test_watcher_reloads_changed_bundles(self, tmp_path: Path):
+        plx_path = tmp_path / "hot_reload.plx"
+        library_manager = get_library_manager()
+        watcher = LibraryWatcher(library_manager=library_manager, watched_dirs=[tmp_path])
+        assert watcher.check_for_changes() == []
+
+        _write_bundle(plx_path, description="Watched version")
+        try:
+            assert watcher.check_for_changes() == [plx_path.resolve()]
+            assert get_required_pipe(pipe_code="hot_reload_greet").description == "Watched version"
+            assert watcher.check_for_changes() == []
+        finally:
+            plx_path.unlink()
+            assert watcher.check_for_changes() == [plx_path.resolve()]
+        assert get_optional_pipe(pipe_code="hot_reload_greet") is None
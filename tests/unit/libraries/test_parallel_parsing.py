@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from pipelex.core.interpreter import PipelexInterpreter
+from pipelex.libraries.library_utils import parse_plx_files_in_process_pool
+
+TEST_PLX_DIR = Path("tests/test_pipelines/misc_tests")
+
+
+class TestParallelParsing:
+    def test_parse_plx_files_in_process_pool_matches_sequential(self):
+        plx_file_paths = sorted(TEST_PLX_DIR.glob("*.plx"))
+        assert len(plx_file_paths) > 1
+
+        parsed_blueprints = parse_plx_files_in_process_pool(plx_file_paths=plx_file_paths, max_workers=2)
+
+        assert len(parsed_blueprints) == len(plx_file_paths)
+        for plx_file_path, parsed_blueprint in zip(plx_file_paths, parsed_blueprints, strict=True):
+            expected_blueprint = PipelexInterpreter(file_path=plx_file_path).make_pipelex_bundle_blueprint()
+            assert parsed_blueprint == expected_blueprint
+
+    def test_parse_plx_files_in_process_pool_returns_none_for_invalid_files(self, tmp_path: Path):
+        invalid_plx_path = tmp_path / "invalid.plx"
+        invalid_plx_path.write_text("domain = [not valid toml", encoding="utf-8")
+        valid_plx_path = min(TEST_PLX_DIR.glob("*.plx"))
+
+        parsed_blueprints = parse_plx_files_in_process_pool(plx_file_paths=[invalid_plx_path, valid_plx_path], max_workers=2)
+
+        assert parsed_blueprints[0] is None
+        assert parsed_blueprints[1] is not None
@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.core.pipes.input_requirements import InputRequirements
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.core.pipes.pipe_dependency_index import PipeDependencyIndex
+from pipelex.core.pipes.pipe_library import PipeLibrary
+from pipelex.exceptions import LibraryLoadingError
+from pipelex.hub import get_library_manager, get_pipe_library, get_required_pipe
+from pipelex.pipe_operators.llm.pipe_llm import PipeLLM
+
+SEQUENCE_BUNDLE = """domain = "dependency_index_sequence"
+description = "Bundle with a sequence depending on a pipe from another bundle"
+
+[pipe.dependency_index_sequence]
+type = "PipeSequence"
+description = "Sequence calling the step pipe"
+inputs = {{ {input_name} = "Text" }}
+output = "Text"
+steps = [{{ pipe = "dependency_index_step", result = "result" }}]
+"""
+
+STEP_BUNDLE = """domain = "dependency_index_step"
+description = "Bundle with the step pipe"
+
+[pipe.dependency_index_step]
+type = "PipeLLM"
+description = "Step pipe"
+inputs = {{ {input_name} = "Text" }}
+output = "Text"
+prompt = "Summarize @{input_name}"
+"""
+
+
+class TestPipeDependencyIndex:
+    def test_needed_inputs_are_memoized_and_invalidated_on_reload(self, tmp_path: Path):
+        library_manager = get_library_manager()
+        pipe_library = get_pipe_library()
+        step_plx_path = tmp_path / "step.plx"
+        sequence_plx_path = tmp_path / "sequence.plx"
+        step_plx_path.write_text(STEP_BUNDLE.format(input_name="topic"), encoding="utf-8")
+        sequence_plx_path.write_text(SEQUENCE_BUNDLE.format(input_name="topic"), encoding="utf-8")
+        try:
+            library_manager.reload_bundle(plx_path=step_plx_path)
+            library_manager.reload_bundle(plx_path=sequence_plx_path)
+            pipe_library.build_dependency_index()
+
+            sequence_pipe = get_required_pipe(pipe_code="dependency_index_sequence")
+            needed_inputs = pipe_library.get_needed_inputs(pipe=sequence_pipe)
+            assert needed_inputs.variables == ["topic"]
+            assert pipe_library.get_needed_inputs(pipe=sequence_pipe) is needed_inputs
+            assert pipe_library.get_required_variables(pipe=get_required_pipe(pipe_code="dependency_index_step")) == {"topic"}
+
+            # Reloading the step bundle invalidates the sequence from the other bundle, which depends on it
+            step_plx_path.write_text(STEP_BUNDLE.format(input_name="topic").replace("Step pipe", "Reworded step pipe"), encoding="utf-8")
+            library_manager.reload_bundle(plx_path=step_plx_path)
+            reindexed_needed_inputs = pipe_library.get_needed_inputs(pipe=sequence_pipe)
+            assert reindexed_needed_inputs is not needed_inputs
+            assert reindexed_needed_inputs.variables == ["topic"]
+
+            # A change that breaks the dependents is rejected and the index still matches the kept version
+            sequence_plx_path.write_text(SEQUENCE_BUNDLE.format(input_name="subject"), encoding="utf-8")
+            with pytest.raises(LibraryLoadingError):
+                library_manager.reload_bundle(plx_path=sequence_plx_path)
+            assert pipe_library.get_needed_inputs(pipe=get_required_pipe(pipe_code="dependency_index_sequence")).variables == ["topic"]
+        finally:
+            library_manager.unload_bundle(plx_path=sequence_plx_path)
+            library_manager.unload_bundle(plx_path=step_plx_path)
+
+    def test_controllers_read_the_needed_inputs_of_their_sub_pipes_from_the_index(self, tmp_path: Path, mocker: MockerFixture):
+        library_manager = get_library_manager()
+        pipe_library = get_pipe_library()
+        step_plx_path = tmp_path / "step.plx"
+        sequence_plx_path = tmp_path / "sequence.plx"
+        step_plx_path.write_text(STEP_BUNDLE.format(input_name="topic"), encoding="utf-8")
+        sequence_plx_path.write_text(SEQUENCE_BUNDLE.format(input_name="topic"), encoding="utf-8")
+        try:
+            library_manager.reload_bundle(plx_path=step_plx_path)
+            library_manager.reload_bundle(plx_path=sequence_plx_path)
+            pipe_library.build_dependency_index()
+            pipe_library.invalidate_dependency_index(pipe_codes={"dependency_index_step"})
+            step_needed_inputs_spy = mocker.spy(PipeLLM, "needed_inputs")
+
+            # dependencies first, as the index is built: the sequence reuses the entry of its step
+            step_needed_inputs = pipe_library.get_needed_inputs(pipe=get_required_pipe(pipe_code="dependency_index_step"))
+            assert pipe_library.get_needed_inputs(pipe=get_required_pipe(pipe_code="dependency_index_sequence")).variables == ["topic"]
+            assert step_needed_inputs.variables == ["topic"]
+            assert step_needed_inputs_spy.call_count == 1
+        finally:
+            library_manager.unload_bundle(plx_path=sequence_plx_path)
+            library_manager.unload_bundle(plx_path=step_plx_path)
+
+    def test_adding_pipes_invalidates_the_index_once(self, mocker: MockerFixture):
+        pipes = get_pipe_library().get_pipes()[:6]
+        assert len(pipes) == 6
+        pipe_library = PipeLibrary.make_empty()
+        pipe_library.add_new_pipe(pipe=pipes[0])
+        pipe_library.build_dependency_index()
+        get_dependent_pipes_spy = mocker.spy(PipeLibrary, "get_dependent_pipes")
+
+        pipe_library.add_pipes(pipes=pipes[1:])
+
+        # a single scan of the library for the whole load, rather than one per added pipe
+        assert get_dependent_pipes_spy.call_count == 1
+        assert len(pipe_library.get_pipes()) == 6
+
+    def test_pipes_calling_themselves_are_not_memoized(self, mocker: MockerFixture):
+        dependency_index = PipeDependencyIndex()
+        pipes = {pipe_code: mocker.Mock(spec=PipeAbstract, code=pipe_code) for pipe_code in ("loop_start", "loop_back")}
+
+        def make_needed_inputs(sub_pipe_code: str) -> InputRequirements:
+            return dependency_index.get_needed_inputs(pipe=pipes[sub_pipe_code])
+
+        pipes["loop_start"].needed_inputs.side_effect = lambda: make_needed_inputs(sub_pipe_code="loop_back")
+        pipes["loop_back"].needed_inputs.side_effect = lambda: make_needed_inputs(sub_pipe_code="loop_start")
+
+        assert not dependency_index.get_needed_inputs(pipe=pipes["loop_start"]).root
+        assert dependency_index.is_empty
@@ -0,0 +1,108 @@
+from pathlib import Path
+from urllib.request import urlopen
+
+import pytest
+
+from pipelex.exceptions import MetricsRegistryError
+from pipelex.hub import get_library_manager, get_metrics, get_pipelex_hub, get_required_pipe
+from pipelex.metrics.metrics_registry import MetricSample, MetricsRegistry
+from pipelex.metrics.pipelex_metrics import PipelexMetrics
+from pipelex.pipe_run.dry_run import dry_run_pipe
+from pipelex.pipeline.job_metadata import JobCategory
+
+METRICS_BUNDLE = """domain = "metrics_test"
+description = "Bundle measured in unit tests"
+
+[pipe.metrics_test_sequence]
+type = "PipeSequence"
+description = "Sequence batching a PipeLLM"
+inputs = { topic = "Text" }
+output = "Text"
+steps = [
+    { pipe = "metrics_test_list_ideas", result = "ideas" },
+    { pipe = "metrics_test_develop_idea", batch_over = "ideas", batch_as = "idea", result = "developed_ideas" },
+]
+
+[pipe.metrics_test_list_ideas]
+type = "PipeLLM"
+description = "List ideas"
+inputs = { topic = "Text" }
+output = "Text[]"
+prompt = "List ideas about @topic"
+
+[pipe.metrics_test_develop_idea]
+type = "PipeLLM"
+description = "Develop an idea"
+inputs = { idea = "Text" }
+output = "Text"
+prompt = "Develop @idea"
+"""
+
+
+def _fail_in_inference(metrics: PipelexMetrics):
+    with metrics.track_inference(job_category=JobCategory.LLM_JOB, model_handle="gpt"):
+        msg = "boom"
+        raise ValueError(msg)
+
+
+class TestPipelexMetrics:
+    def test_registry_renders_prometheus_text(self):
+        samples: list[MetricSample] = []
+        registry = MetricsRegistry(listeners=[samples.append])
+        counter = registry.counter("test_calls_total", "Calls")
+        counter.inc(labels={"model": 'say "hi"'})
+        counter.inc(labels={"model": 'say "hi"'}, amount=2)
+        histogram = registry.histogram("test_duration_seconds", "Durations", buckets=[0.1, 1.0])
+        histogram.observe(0.5)
+
+        text = registry.render_prometheus_text()
+        assert "# TYPE test_calls_total counter" in text
+        assert 'test_calls_total{model="say \\"hi\\""} 3' in text
+        assert 'test_duration_seconds_bucket{le="0.1"} 0' in text
+        assert 'test_duration_seconds_bucket{le="1"} 1' in text
+        assert 'test_duration_seconds_bucket{le="+Inf"} 1' in text
+        assert "test_duration_seconds_count 1" in text
+        assert [sample.value for sample in samples] == [1.0, 3.0, 0.5]
+        assert registry.counter("test_calls_total", "Calls") is counter
+        with pytest.raises(MetricsRegistryError, match="already registered as a counter"):
+            registry.gauge("test_calls_total", "Calls")
+
+    def test_inference_tracking_and_http_endpoint(self):
+        metrics = PipelexMetrics(http_server_address=("127.0.0.1", 0))
+        metrics.setup()
+        try:
+            with metrics.track_inference(job_category=JobCategory.LLM_JOB, model_handle="gpt"):
+                assert metrics.inference_calls_in_flight.get_value(labels={"job_category": "llm_job", "model": "gpt"}) == 1
+            with pytest.raises(ValueError, match="boom"):
+                _fail_in_inference(metrics=metrics)
+
+            assert metrics.http_server is not None
+            with urlopen(metrics.http_server.url, timeout=5) as response:  # noqa: S310
+                body = response.read().decode("utf-8")
+        finally:
+            metrics.teardown()
+
+        assert metrics.inference_calls_in_flight.get_value(labels={"job_category": "llm_job", "model": "gpt"}) == 0
+        assert 'pipelex_inference_calls_total{job_category="llm_job",model="gpt",status="success"} 1' in body
+        assert 'pipelex_inference_calls_total{job_category="llm_job",model="gpt",status="error"} 1' in body
+
+    @pytest.mark.asyncio
+    async def test_dry_run_counts_pipe_runs(self, tmp_path: Path):
+        plx_path = tmp_path / "metrics.plx"
+        plx_path.write_text(METRICS_BUNDLE, encoding="utf-8")
+        library_manager = get_library_manager()
+        pipelex_hub = get_pipelex_hub()
+        previous_metrics = get_metrics()
+        metrics = PipelexMetrics()
+        pipelex_hub.set_metrics(metrics=metrics)
+        try:
+            library_manager.reload_bundle(plx_path=plx_path)
+            await dry_run_pipe(pipe=get_required_pipe(pipe_code="metrics_test_sequence"), raise_on_failure=True)
+        finally:
+            pipelex_hub.set_metrics(metrics=previous_metrics)
+            library_manager.unload_bundle(plx_path=plx_path)
+
+        assert metrics.pipe_runs.get_value(labels={"pipe_type": "PipeSequence", "status": "success"}) == 1
+        assert metrics.pipe_runs.get_value(labels={"pipe_type": "PipeBatch", "status": "success"}) == 1
+        assert metrics.pipe_runs.get_value(labels={"pipe_type": "PipeLLM", "status": "success"}) == 4
+        assert metrics.pipes_in_flight.get_value(labels={"pipe_type": "PipeLLM"}) == 0
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from pipelex.cogt.exceptions import RunBudgetExceededError
+from pipelex.core.pipe_errors import PipeDefinitionError
+from pipelex.pipe_controllers.batch.batch_error_handling import (
+    BatchItemError,
+    collect_batch_item_error,
+    gather_batch_items,
+    make_batch_errors_stuff_name,
+    run_batch_item_with_retries,
+)
+from pipelex.pipe_controllers.sub_pipe_blueprint import SubPipeBlueprint
+from pipelex.pipe_controllers.sub_pipe_factory import SubPipeFactory
+from pipelex.pipe_run.batch_error_mode import BatchErrorMode
+
+
+class FlakyItem:
+    def __init__(self, nb_failures: int):
+        self.nb_failures = nb_failures
+        self.nb_attempts = 0
+
+    async def run(self) -> str:
+        self.nb_attempts += 1
+        if self.nb_attempts <= self.nb_failures:
+            msg = f"failure {self.nb_attempts}"
+            raise ValueError(msg)
+        return "done"
+
+
+class TestBatchErrorHandling:
+    @pytest.mark.asyncio
+    async def test_item_is_retried_until_it_succeeds(self):
+        flaky_item = FlakyItem(nb_failures=2)
+        result = await run_batch_item_with_retries(run_item_attempt=flaky_item.run, item_index=0, nb_retries=2, retry_delay=0)
+        assert result == "done"
+        assert flaky_item.nb_attempts == 3
+
+    @pytest.mark.asyncio
+    async def test_item_error_is_collected_after_the_last_retry(self):
+        flaky_item = FlakyItem(nb_failures=5)
+        item_result = await collect_batch_item_error(
+            item_run=run_batch_item_with_retries(run_item_attempt=flaky_item.run, item_index=3, nb_retries=1, retry_delay=0),
+            item_index=3,
+            nb_attempts=2,
+        )
+        assert item_result == BatchItemError(item_index=3, error_type="ValueError", error_message="failure 2", nb_attempts=2)
+        assert flaky_item.nb_attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_run_aborting_errors_are_neither_retried_nor_collected(self):
+        nb_attempts = 0
+
+        async def exceed_budget() -> str:
+            nonlocal nb_attempts
+            nb_attempts += 1
+            raise RunBudgetExceededError(message="budget exceeded", pipeline_run_id="run")
+
+        with pytest.raises(RunBudgetExceededError):
+            await collect_batch_item_error(
+                item_run=run_batch_item_with_retries(run_item_attempt=exceed_budget, item_index=0, nb_retries=3, retry_delay=0),
+                item_index=0,
+                nb_attempts=4,
+            )
+        assert nb_attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_item_cancels_the_items_still_running(self):
+        cancelled_items: list[int] = []
+
+        async def run_slow_item(item_index: int) -> int:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled_items.append(item_index)
+                raise
+            return item_index
+
+        async def run_failing_item() -> int:
+            msg = "item failed"
+            raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="item failed"):
+            await gather_batch_items(item_runs=[run_slow_item(0), run_failing_item(), run_slow_item(2)])
+        assert sorted(cancelled_items) == [0, 2]
+
+    def test_error_handling_options_of_sub_pipe(self):
+        sub_pipe = SubPipeFactory.make_from_blueprint(
+            blueprint=SubPipeBlueprint(
+                pipe="summarize",
+                result="summaries",
+                batch_over="articles",
+                batch_as="article",
+                batch_error_mode=BatchErrorMode.COLLECT_ERRORS,
+                batch_nb_item_retries=2,
+            )
+        )
+        assert sub_pipe.batch_params is not None
+        assert sub_pipe.batch_params.error_mode == BatchErrorMode.COLLECT_ERRORS
+        assert sub_pipe.batch_params.nb_item_retries == 2
+        assert sub_pipe.batch_params.item_retry_delay == 1.0
+        assert make_batch_errors_stuff_name(output_name="summaries") == "summaries_errors"
+
+        with pytest.raises(PipeDefinitionError):
+            SubPipeBlueprint(pipe="summarize", result="summary", batch_nb_item_retries=2)
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.pipe_controllers.batch.batch_item_stream import BatchItemStream, BatchStreamOrder
+
+
+def _make_item_stuff(item_index: int) -> Stuff:
+    return StuffFactory.make_from_str(str_value=f"item {item_index}", name="item")
+
+
+async def _run_items(batch_item_stream: BatchItemStream, item_delays: list[float], failed_items: set[int], started_items: list[int]):
+    async def run_item(item_index: int, delay: float):
+        await batch_item_stream.wait_for_turn(item_index=item_index)
+        started_items.append(item_index)
+        await asyncio.sleep(delay)
+        batch_item_stream.add_item(item_index=item_index, stuff=None if item_index in failed_items else _make_item_stuff(item_index))
+
+    try:
+        await asyncio.gather(*(run_item(item_index, delay) for item_index, delay in enumerate(item_delays)))
+    finally:
+        batch_item_stream.close()
+
+
+class TestBatchItemStream:
+    @pytest.mark.asyncio
+    async def test_items_are_yielded_in_completion_order(self):
+        batch_item_stream = BatchItemStream(pipe_code="batch", stream_order=BatchStreamOrder.COMPLETION, max_reordered_items=1)
+        started_items: list[int] = []
+        items_task = asyncio.create_task(
+            _run_items(batch_item_stream, item_delays=[0.03, 0.01, 0.02, 0], failed_items={2}, started_items=started_items)
+        )
+
+        yielded_items = [batch_item_output.item_index async for batch_item_output in batch_item_stream]
+        await items_task
+
+        assert yielded_items == [3, 1, 0]
+        # in completion order, the items are not held back
+        assert started_items == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_items_are_yielded_in_input_order_with_bounded_reordering(self):
+        batch_item_stream = BatchItemStream(pipe_code="batch", stream_order=BatchStreamOrder.INPUT, max_reordered_items=2)
+        started_items: list[int] = []
+        items_task = asyncio.create_task(
+            _run_items(batch_item_stream, item_delays=[0.03, 0, 0, 0, 0.01], failed_items={3}, started_items=started_items)
+        )
+
+        await asyncio.sleep(0.02)
+        # item 0 is still running, so only items 0 and 1 could start
+        assert sorted(started_items) == [0, 1]
+
+        yielded_items = [batch_item_output.item_index async for batch_item_output in batch_item_stream]
+        await items_task
+
+        assert yielded_items == [0, 1, 2, 4]
+        assert batch_item_stream.is_streamed_batch(pipe_code="batch", batch_path=())
+        assert not batch_item_stream.is_streamed_batch(pipe_code="batch", batch_path=(0,))
+
+    def test_reordering_bound_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_reordered_items"):
+            BatchItemStream(pipe_code="batch", stream_order=BatchStreamOrder.INPUT, max_reordered_items=0)
@@ -0,0 +1,224 @@
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.pipe_errors import PipeDefinitionError
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.core.pipes.pipe_output import PipeOutput
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.hub import get_pipe_library, get_pipe_router, get_pipeline_manager, get_report_delegate
+from pipelex.pipe_controllers.condition.condition_speculation import (
+    ConditionSpeculation,
+    SpeculativeBranch,
+    set_pending_condition_speculation,
+    take_pending_condition_speculation,
+)
+from pipelex.pipe_controllers.condition.pipe_condition import PipeCondition
+from pipelex.pipe_controllers.condition.pipe_condition_blueprint import PipeConditionBlueprint
+from pipelex.pipe_controllers.condition.pipe_condition_factory import PipeConditionFactory
+from pipelex.pipe_controllers.sequence.pipe_sequence_blueprint import PipeSequenceBlueprint
+from pipelex.pipe_controllers.sequence.pipe_sequence_factory import PipeSequenceFactory
+from pipelex.pipe_controllers.sub_pipe_blueprint import SubPipeBlueprint
+from pipelex.pipe_operators.func.pipe_func_blueprint import PipeFuncBlueprint
+from pipelex.pipe_operators.func.pipe_func_factory import PipeFuncFactory
+from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.pipeline.track.step_timing import StepTiming
+from pipelex.system.registries.func_registry import func_registry
+
+
+def _make_pipe_condition(speculative_branches: int | None = 1, branch_priors: dict[str, float] | None = None) -> PipeCondition:
+    return PipeConditionFactory.make_from_blueprint(
+        domain="test_domain",
+        pipe_code="route_ticket",
+        blueprint=PipeConditionBlueprint(
+            description="Route a ticket by category",
+            inputs={"category": "native.Text"},
+            output="native.Text",
+            expression="category",
+            outcomes={"urgent": "handle_urgent", "normal": "handle_normal", "spam": "handle_spam"},
+            default_outcome="fail",
+            speculative_branches=speculative_branches,
+            branch_priors=branch_priors,
+        ),
+    )
+
+
+async def _run_branch(base_memory: WorkingMemory, text: str, duration: float = 0) -> tuple[PipeOutput, StepTiming]:
+    started_at = datetime.now()
+    await asyncio.sleep(duration)
+    branch_memory = base_memory.make_shallow_copy()
+    branch_memory.set_new_main_stuff(stuff=StuffFactory.make_from_str(str_value=text, name="answer"), name="answer")
+    return PipeOutput(working_memory=branch_memory, pipeline_run_id="speculation_run"), StepTiming(
+        pipe_stack=["branch"], started_at=started_at, ended_at=datetime.now()
+    )
+
+
+def _make_speculation(working_memory: WorkingMemory, read_stuff_names: set[str]) -> ConditionSpeculation:
+    base_memory = working_memory.make_shallow_copy()
+    branches = {
+        pipe_code: SpeculativeBranch(
+            pipe_code=pipe_code,
+            read_stuff_names=read_stuff_names,
+            task=asyncio.create_task(_run_branch(base_memory=base_memory, text=pipe_code, duration=duration)),
+        )
+        for pipe_code, duration in (("handle_urgent", 0), ("handle_normal", 10))
+    }
+    return ConditionSpeculation(condition_code="route_ticket", base_memory=base_memory, branches=branches)
+
+
+async def refine_ticket(working_memory: WorkingMemory) -> TextContent:
+    return TextContent(text=f"{working_memory.get_stuff_as_str('ticket')} (refined)")
+
+
+async def answer_ticket(working_memory: WorkingMemory) -> TextContent:
+    return TextContent(text=f"answer to {working_memory.get_stuff_as_str('ticket')}")
+
+
+@pytest.fixture
+def speculative_ticket_sequence() -> Iterator[PipeAbstract]:
+    func_pipes: list[PipeAbstract] = []
+    for function in (refine_ticket, answer_ticket):
+        func_registry.register_function(function, name=f"speculation_{function.__name__}")
+        func_pipes.append(
+            PipeFuncFactory.make_from_blueprint(
+                domain="speculation_test",
+                pipe_code=f"speculation_{function.__name__}",
+                blueprint=PipeFuncBlueprint(inputs={"ticket": "Text"}, output="Text", function_name=f"speculation_{function.__name__}"),
+            )
+        )
+    pipe_condition = PipeConditionFactory.make_from_blueprint(
+        domain="speculation_test",
+        pipe_code="speculation_route_ticket",
+        blueprint=PipeConditionBlueprint(
+            description="Route a ticket by category",
+            inputs={"category": "Text", "ticket": "Text"},
+            output="Text",
+            expression="category.text",
+            outcomes={"urgent": "speculation_answer_ticket"},
+            default_outcome="fail",
+            speculative_branches=1,
+            branch_priors={"speculation_answer_ticket": 1},
+        ),
+    )
+    pipe_sequence = PipeSequenceFactory.make_from_blueprint(
+        domain="speculation_test",
+        pipe_code="speculation_ticket_sequence",
+        blueprint=PipeSequenceBlueprint(
+            inputs={"category": "Text", "ticket": "Text"},
+            output="Text",
+            steps=[
+                SubPipeBlueprint(pipe="speculation_refine_ticket", result="ticket"),
+                SubPipeBlueprint(pipe="speculation_route_ticket", result="answer"),
+            ],
+        ),
+    )
+    pipes: list[PipeAbstract] = [*func_pipes, pipe_condition, pipe_sequence]
+    get_pipe_library().add_pipes(pipes=pipes)
+    yield pipe_sequence
+    get_pipe_library().remove_pipes_by_codes(pipe_codes=[pipe.code for pipe in pipes])
+    for function in (refine_ticket, answer_ticket):
+        func_registry.unregister_function_by_name(f"speculation_{function.__name__}")
+
+
+class TestConditionSpeculation:
+    def test_likely_branches_from_priors(self):
+        pipe_condition = _make_pipe_condition(speculative_branches=2, branch_priors={"handle_urgent": 6, "handle_normal": 3, "handle_spam": 1})
+
+        assert pipe_condition.estimate_branch_probabilities() == pytest.approx({"handle_urgent": 0.6, "handle_normal": 0.3, "handle_spam": 0.1})
+        # handle_spam is below the min branch probability, and at most 2 branches are started
+        assert pipe_condition.get_likely_branch_codes() == ["handle_urgent", "handle_normal"]
+        assert _make_pipe_condition(speculative_branches=None, branch_priors={"handle_urgent": 1}).get_likely_branch_codes() == []
+        assert _make_pipe_condition(branch_priors=None).get_likely_branch_codes() == []
+
+    def test_tracked_outcomes_override_priors(self):
+        pipe_condition = _make_pipe_condition(branch_priors={"handle_urgent": 1})
+        for _ in range(3):
+            pipe_condition.record_outcome("handle_spam")
+        # too few outcomes tracked yet
+        assert pipe_condition.get_likely_branch_codes() == ["handle_urgent"]
+
+        for _ in range(20):
+            pipe_condition.record_outcome("handle_spam")
+        assert pipe_condition.get_likely_branch_codes() == ["handle_spam"]
+
+    @pytest.mark.parametrize(
+        ("speculative_branches", "branch_priors", "expected_error_message_fragment"),
+        [
+            (0, None, "speculative_branches"),
+            (1, {"handle_unknown": 1}, "handle_unknown"),
+            (1, {"handle_urgent": -1}, "handle_urgent"),
+        ],
+    )
+    def test_invalid_speculation_settings(
+        self, speculative_branches: int, branch_priors: dict[str, float] | None, expected_error_message_fragment: str
+    ):
+        with pytest.raises(PipeDefinitionError) as exc_info:
+            _make_pipe_condition(speculative_branches=speculative_branches, branch_priors=branch_priors)
+        assert expected_error_message_fragment in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_claim_merges_chosen_branch_and_cancels_the_others(self):
+        working_memory = WorkingMemoryFactory.make_from_text(text="printer on fire", name="ticket")
+        condition_speculation = _make_speculation(working_memory=working_memory, read_stuff_names={"ticket"})
+        normal_task = condition_speculation.branches["handle_normal"].task
+        # the step before the condition adds a stuff that the branches did not read
+        working_memory.add_new_stuff(name="category", stuff=StuffFactory.make_from_str(str_value="urgent", name="category"))
+
+        with set_pending_condition_speculation(condition_speculation):
+            assert take_pending_condition_speculation(condition_code="other_condition") is None
+            pending_speculation = take_pending_condition_speculation(condition_code="route_ticket")
+            assert pending_speculation is condition_speculation
+            claimed = await condition_speculation.claim(chosen_pipe_code="handle_urgent", working_memory=working_memory)
+
+        assert claimed is not None
+        pipe_output, _ = claimed
+        assert pipe_output.working_memory is working_memory
+        assert working_memory.get_main_stuff().content.model_dump()["text"] == "handle_urgent"
+        assert set(working_memory.root) == {"ticket", "category", "answer"}
+        await asyncio.sleep(0)
+        assert normal_task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_claim_of_stale_branch_returns_none(self):
+        working_memory = WorkingMemoryFactory.make_from_text(text="printer on fire", name="ticket")
+        condition_speculation = _make_speculation(working_memory=working_memory, read_stuff_names={"ticket"})
+        urgent_task = condition_speculation.branches["handle_urgent"].task
+        # the step before the condition sets the ticket again: the branches read an outdated one
+        working_memory.set_stuff(name="ticket", stuff=StuffFactory.make_from_str(str_value="printer fixed", name="ticket"))
+
+        assert await condition_speculation.claim(chosen_pipe_code="handle_urgent", working_memory=working_memory) is None
+        assert await condition_speculation.claim(chosen_pipe_code="handle_spam", working_memory=working_memory) is None
+        await asyncio.sleep(0)
+        assert urgent_task.cancelled() or urgent_task.done()
+        assert "answer" not in working_memory.root
+
+    @pytest.mark.asyncio
+    async def test_branch_reading_a_stuff_overwritten_by_the_step_before_is_run_again(
+        self, speculative_ticket_sequence: PipeAbstract, mocker: MockerFixture
+    ):
+        start_speculative_branches_spy = mocker.spy(PipeCondition, "start_speculative_branches")
+        pipeline = get_pipeline_manager().add_new_pipeline()
+        get_report_delegate().open_registry(pipeline_run_id=pipeline.pipeline_run_id)
+        pipe_job = PipeJobFactory.make_pipe_job(
+            pipe=speculative_ticket_sequence,
+            working_memory=WorkingMemoryFactory.make_from_multiple_stuffs(
+                stuff_list=[
+                    StuffFactory.make_from_str(str_value="urgent", name="category"),
+                    StuffFactory.make_from_str(str_value="printer on fire", name="ticket"),
+                ]
+            ),
+            job_metadata=JobMetadata(pipeline_run_id=pipeline.pipeline_run_id),
+        )
+
+        pipe_output = await get_pipe_router().run(pipe_job)
+
+        # the branch started along with the step refining the ticket, so it read the ticket before it was refined
+        assert start_speculative_branches_spy.spy_return is not None
+        assert pipe_output.working_memory.get_stuff_as_str("answer") == "answer to printer on fire (refined)"
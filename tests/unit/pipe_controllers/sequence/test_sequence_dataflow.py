@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+
+import pytest
+
+from pipelex.core.memory.working_memory import MAIN_STUFF_NAME, WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.hub import get_pipe_library, get_pipe_router, get_pipeline_manager, get_report_delegate
+from pipelex.pipe_controllers.sequence.pipe_sequence_blueprint import PipeSequenceBlueprint
+from pipelex.pipe_controllers.sequence.pipe_sequence_factory import PipeSequenceFactory
+from pipelex.pipe_controllers.sequence.sequence_dataflow import get_critical_chain_length, make_step_dependencies
+from pipelex.pipe_controllers.sub_pipe_blueprint import SubPipeBlueprint
+from pipelex.pipe_operators.func.pipe_func_blueprint import PipeFuncBlueprint
+from pipelex.pipe_operators.func.pipe_func_factory import PipeFuncFactory
+from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.system.registries.func_registry import func_registry
+
+ACTIVE_STEPS: list[str] = []
+MAX_CONCURRENT_STEPS: list[int] = []
+
+
+async def _track_concurrency(step_name: str):
+    ACTIVE_STEPS.append(step_name)
+    MAX_CONCURRENT_STEPS.append(len(ACTIVE_STEPS))
+    await asyncio.sleep(0.05)
+    ACTIVE_STEPS.remove(step_name)
+
+
+async def write_outline(working_memory: WorkingMemory) -> TextContent:
+    await _track_concurrency(step_name="outline")
+    return TextContent(text=f"outline of {working_memory.get_stuff_as_str('topic')}")
+
+
+async def write_facts(working_memory: WorkingMemory) -> TextContent:
+    await _track_concurrency(step_name="facts")
+    return TextContent(text=f"facts about {working_memory.get_stuff_as_str('topic')}")
+
+
+async def refine_topic(working_memory: WorkingMemory) -> TextContent:
+    await _track_concurrency(step_name="topic")
+    return TextContent(text=f"topic refined from {working_memory.get_stuff_as_str('outline')}")
+
+
+async def write_draft(working_memory: WorkingMemory) -> TextContent:
+    await _track_concurrency(step_name="draft")
+    return TextContent(text=f"draft on {working_memory.get_stuff_as_str('topic')} with {working_memory.get_stuff_as_str('facts')}")
+
+
+# (function, pipe code, inputs, result)
+DATAFLOW_STEPS: list[tuple[Callable[[WorkingMemory], Awaitable[TextContent]], str, dict[str, str], str]] = [
+    (write_outline, "dataflow_write_outline", {"topic": "Text"}, "outline"),
+    (write_facts, "dataflow_write_facts", {"topic": "Text"}, "facts"),
+    # overwrites the input read by the two steps before
+    (refine_topic, "dataflow_refine_topic", {"outline": "Text"}, "topic"),
+    (write_draft, "dataflow_write_draft", {"topic": "Text", "facts": "Text"}, "draft"),
+]
+
+
+@pytest.fixture
+def dataflow_pipes() -> Iterator[dict[bool, PipeAbstract]]:
+    pipes: list[PipeAbstract] = []
+    for function, pipe_code, inputs, _ in DATAFLOW_STEPS:
+        func_registry.register_function(function, name=pipe_code)
+        pipes.append(
+            PipeFuncFactory.make_from_blueprint(
+                domain="dataflow_test",
+                pipe_code=pipe_code,
+                blueprint=PipeFuncBlueprint(inputs=inputs, output="Text", function_name=pipe_code),
+            )
+        )
+    sequences: dict[bool, PipeAbstract] = {
+        parallelize_independent_steps: PipeSequenceFactory.make_from_blueprint(
+            domain="dataflow_test",
+            pipe_code="dataflow_parallel_sequence" if parallelize_independent_steps else "dataflow_sequence",
+            blueprint=PipeSequenceBlueprint(
+                inputs={"topic": "Text"},
+                output="Text",
+                steps=[SubPipeBlueprint(pipe=pipe_code, result=result) for _, pipe_code, _, result in DATAFLOW_STEPS],
+                parallelize_independent_steps=parallelize_independent_steps,
+            ),
+        )
+        for parallelize_independent_steps in (False, True)
+    }
+    get_pipe_library().add_pipes(pipes=[*pipes, *sequences.values()])
+    yield sequences
+    get_pipe_library().remove_pipes_by_codes(pipe_codes=[pipe.code for pipe in [*pipes, *sequences.values()]])
+    for _, pipe_code, _, _ in DATAFLOW_STEPS:
+        func_registry.unregister_function_by_name(pipe_code)
+
+
+async def _run_sequence(pipe_sequence: PipeAbstract) -> WorkingMemory:
+    ACTIVE_STEPS.clear()
+    MAX_CONCURRENT_STEPS.clear()
+    pipeline = get_pipeline_manager().add_new_pipeline()
+    get_report_delegate().open_registry(pipeline_run_id=pipeline.pipeline_run_id)
+    pipe_job = PipeJobFactory.make_pipe_job(
+        pipe=pipe_sequence,
+        working_memory=WorkingMemoryFactory.make_from_text(text="bees", name="topic"),
+        job_metadata=JobMetadata(pipeline_run_id=pipeline.pipeline_run_id),
+    )
+    pipe_output = await get_pipe_router().run(pipe_job)
+    return pipe_output.working_memory
+
+
+def _get_texts(working_memory: WorkingMemory) -> dict[str, str]:
+    return {name: working_memory.get_stuff_as_str(name) for name in working_memory.root}
+
+
+class TestSequenceDataflow:
+    def test_independent_steps_only_wait_for_what_they_read(self):
+        step_dependencies = make_step_dependencies(
+            step_reads=[{"topic"}, {"topic"}, {"outline", "facts"}],
+            step_writes=[{"outline"}, {"facts"}, {"draft"}],
+            input_names={"topic"},
+        )
+        assert step_dependencies == [frozenset(), frozenset(), frozenset({0, 1})]
+        assert get_critical_chain_length(step_dependencies) == 2
+
+    def test_overwriting_a_name_waits_for_its_readers_and_writer(self):
+        step_dependencies = make_step_dependencies(
+            step_reads=[{"text"}, {"text"}, {"summary"}],
+            step_writes=[{"summary"}, {"text"}, {"summary"}],
+            input_names={"text"},
+        )
+        assert step_dependencies == [frozenset(), frozenset({0}), frozenset({0})]
+
+    def test_unknown_read_waits_for_all_earlier_steps(self):
+        step_dependencies = make_step_dependencies(
+            step_reads=[{"text"}, {"text"}, {"nested_result"}],
+            step_writes=[{"a"}, {"b"}, {"c"}],
+            input_names={"text"},
+        )
+        assert step_dependencies[2] == frozenset({0, 1})
+        assert get_critical_chain_length(step_dependencies) == 2
+        assert get_critical_chain_length([]) == 0
+
+
+class TestSequenceDataflowRun:
+    @pytest.mark.asyncio
+    async def test_dataflow_run_matches_sequential_run(self, dataflow_pipes: dict[bool, PipeAbstract]):
+        sequential_memory = await _run_sequence(pipe_sequence=dataflow_pipes[False])
+        assert max(MAX_CONCURRENT_STEPS) == 1
+
+        dataflow_memory = await _run_sequence(pipe_sequence=dataflow_pipes[True])
+        # the outline and the facts only read the input topic
+        assert max(MAX_CONCURRENT_STEPS) == 2
+
+        assert _get_texts(dataflow_memory) == _get_texts(sequential_memory)
+        assert dataflow_memory.get_stuff_as_str("topic") == "topic refined from outline of bees"
+        assert dataflow_memory.get_stuff_as_str("draft") == "draft on topic refined from outline of bees with facts about bees"
+        assert dataflow_memory.aliases == sequential_memory.aliases
+        assert dataflow_memory.aliases[MAIN_STUFF_NAME] == "draft"
+        assert dataflow_memory.get_main_stuff() is dataflow_memory.get_stuff("draft")
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Any
+
+import pytest
+from typing_extensions import override
+
+from pipelex.cogt.content_generation.content_generator_dry import ContentGeneratorDry
+from pipelex.cogt.exceptions import LLMCompletionError
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.llm.llm_setting import LLMSetting
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.pipe_operators.llm.llm_call_packing import LLMCallPacker, get_current_llm_call_packer, make_packed_llm_prompt, pack_llm_calls
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.tools.typing.pydantic_utils import BaseModelTypeVar
+
+LLM_SETTING = LLMSetting(model="packing_model", temperature=0.1)
+
+
+class PackedListGenerator(ContentGeneratorDry):
+    """Generates the list of a packed prompt, with one item per task, or with a wrong number of items."""
+
+    def __init__(self, nb_missing_items: int = 0, is_failing: bool = False):
+        self.nb_missing_items = nb_missing_items
+        self.is_failing = is_failing
+        self.packed_prompts: list[LLMPrompt] = []
+
+    @override
+    async def make_object_list_direct(
+        self,
+        job_metadata: JobMetadata,
+        object_class: type[BaseModelTypeVar],
+        llm_setting_for_object_list: LLMSetting,
+        llm_prompt_for_object_list: LLMPrompt,
+        nb_items: int | None = None,
+    ) -> list[BaseModelTypeVar]:
+        self.packed_prompts.append(llm_prompt_for_object_list)
+        await asyncio.sleep(0)
+        if self.is_failing:
+            msg = "invalid list"
+            raise LLMCompletionError(msg)
+        assert nb_items is not None
+        return [object_class.model_validate({"text": f"result {item_index + 1}"}) for item_index in range(nb_items - self.nb_missing_items)]
+
+
+async def _pack_calls(llm_call_packer: LLMCallPacker, content_generator: PackedListGenerator, nb_calls: int) -> list[Any]:
+    return await asyncio.gather(
+        *(
+            llm_call_packer.make_object_direct(
+                pack_key="classify",
+                job_metadata=JobMetadata(pipeline_run_id="packed_run"),
+                object_class=TextContent,
+                llm_setting=LLM_SETTING,
+                llm_prompt=LLMPrompt(system_text="You classify sentences.", user_text=f"sentence {call_index + 1}"),
+                content_generator=content_generator,
+            )
+            for call_index in range(nb_calls)
+        )
+    )
+
+
+class TestLLMCallPacking:
+    def test_packed_prompt_lists_the_tasks_in_order(self):
+        packed_prompt = make_packed_llm_prompt(
+            llm_prompts=[LLMPrompt(system_text="You classify sentences.", user_text=f"sentence {index}") for index in (1, 2)]
+        )
+        assert packed_prompt.system_text == "You classify sentences."
+        assert packed_prompt.user_text is not None
+        assert "following 2 independent tasks" in packed_prompt.user_text
+        assert packed_prompt.user_text.index("# Task 1\n\nsentence 1") < packed_prompt.user_text.index("# Task 2\n\nsentence 2")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_packed_by_pack_size(self):
+        llm_call_packer = LLMCallPacker(pack_size=3)
+        content_generator = PackedListGenerator()
+
+        generated_objects = await _pack_calls(llm_call_packer=llm_call_packer, content_generator=content_generator, nb_calls=7)
+
+        # 2 full packs, and a last pack of a single call, which runs on its own
+        assert len(content_generator.packed_prompts) == 2
+        assert llm_call_packer.nb_packed_llm_calls == 2
+        assert [generated_object.text for generated_object in generated_objects[:6]] == ["result 1", "result 2", "result 3"] * 2
+        assert generated_objects[6] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content_generator",
+        [PackedListGenerator(nb_missing_items=1), PackedListGenerator(is_failing=True)],
+    )
+    async def test_mismatched_or_failed_pack_falls_back_to_single_calls(self, content_generator: PackedListGenerator):
+        llm_call_packer = LLMCallPacker(pack_size=4)
+
+        generated_objects = await _pack_calls(llm_call_packer=llm_call_packer, content_generator=content_generator, nb_calls=4)
+
+        assert generated_objects == [None] * 4
+        assert llm_call_packer.nb_fallbacks == 4
+
+    def test_packing_is_scoped_to_its_context(self):
+        with pack_llm_calls(pack_size=None):
+            assert get_current_llm_call_packer() is None
+        with pack_llm_calls(pack_size=5):
+            llm_call_packer = get_current_llm_call_packer()
+            assert llm_call_packer is not None
+            assert llm_call_packer.pack_size == 5
+        assert get_current_llm_call_packer() is None
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.stuff import Stuff
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.hub import get_pipeline_manager, get_pipeline_tracker, get_report_delegate
+from pipelex.pipe_operators.compose.pipe_compose import PipeCompose
+from pipelex.pipe_operators.compose.pipe_compose_blueprint import PipeComposeBlueprint
+from pipelex.pipe_operators.compose.pipe_compose_factory import PipeComposeFactory
+from pipelex.pipe_run.pipe_run_dedup import (
+    PipeRunDeduplicator,
+    deduplicate_pipe_runs,
+    get_current_pipe_run_deduplicator,
+    make_pipe_run_dedup_key,
+)
+from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.pipeline.job_metadata import JobMetadata
+
+
+class CountingPipe:
+    def __init__(self, nb_failures: int = 0):
+        self.nb_failures = nb_failures
+        self.nb_runs = 0
+
+    async def run(self) -> Stuff:
+        self.nb_runs += 1
+        await asyncio.sleep(0.01)
+        if self.nb_runs <= self.nb_failures:
+            msg = "pipe failed"
+            raise ValueError(msg)
+        return StuffFactory.make_from_str(str_value=f"run {self.nb_runs}", name="output")
+
+
+class TestPipeRunDedup:
+    def test_dedup_key_depends_on_input_contents_and_run_params(self):
+        pipe_run_params = PipeRunParamsFactory.make_run_params()
+        key = make_pipe_run_dedup_key(
+            pipe_code="summarize",
+            input_stuffs={"text": StuffFactory.make_from_str(str_value="same text", name="text")},
+            pipe_run_params=pipe_run_params,
+        )
+        # the stuff code differs, the content is the same
+        assert key == make_pipe_run_dedup_key(
+            pipe_code="summarize",
+            input_stuffs={"text": StuffFactory.make_from_str(str_value="same text", name="text")},
+            pipe_run_params=pipe_run_params,
+        )
+        assert key != make_pipe_run_dedup_key(
+            pipe_code="summarize",
+            input_stuffs={"text": StuffFactory.make_from_str(str_value="other text", name="text")},
+            pipe_run_params=pipe_run_params,
+        )
+        assert key != make_pipe_run_dedup_key(
+            pipe_code="translate",
+            input_stuffs={"text": StuffFactory.make_from_str(str_value="same text", name="text")},
+            pipe_run_params=pipe_run_params,
+        )
+        pipe_run_params.output_multiplicity = 3
+        assert key != make_pipe_run_dedup_key(
+            pipe_code="summarize",
+            input_stuffs={"text": StuffFactory.make_from_str(str_value="same text", name="text")},
+            pipe_run_params=pipe_run_params,
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_of_a_key_share_one_run(self):
+        pipe_run_deduplicator = PipeRunDeduplicator()
+        counting_pipe = CountingPipe()
+
+        output_stuffs = await asyncio.gather(*(pipe_run_deduplicator.run_once(dedup_key="key", run_pipe=counting_pipe.run) for _ in range(5)))
+        later_output_stuff = await pipe_run_deduplicator.run_once(dedup_key="key", run_pipe=counting_pipe.run)
+
+        assert counting_pipe.nb_runs == 1
+        assert all(output_stuff is output_stuffs[0] for output_stuff in [*output_stuffs, later_output_stuff])
+        assert pipe_run_deduplicator.nb_deduplicated_runs == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_not_shared(self):
+        pipe_run_deduplicator = PipeRunDeduplicator()
+        counting_pipe = CountingPipe(nb_failures=1)
+
+        results = await asyncio.gather(
+            *(pipe_run_deduplicator.run_once(dedup_key="key", run_pipe=counting_pipe.run) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        # the first run failed, one of the waiting runs ran the pipe again and shared its output with the last one
+        assert isinstance(results[0], ValueError)
+        assert results[1] is results[2]
+        assert counting_pipe.nb_runs == 2
+
+    def test_deduplication_is_scoped_to_its_context(self):
+        with deduplicate_pipe_runs(is_enabled=False):
+            assert get_current_pipe_run_deduplicator() is None
+        with deduplicate_pipe_runs(is_enabled=True):
+            assert get_current_pipe_run_deduplicator() is not None
+        assert get_current_pipe_run_deduplicator() is None
+
+    @pytest.mark.asyncio
+    async def test_shared_output_is_tracked(self, mocker: MockerFixture):
+        pipe_compose = PipeComposeFactory.make_from_blueprint(
+            domain="dedup_test",
+            pipe_code="dedup_test_greet",
+            blueprint=PipeComposeBlueprint(inputs={"text": "Text"}, output="Text", template="Hello $text"),
+        )
+        run_operator_pipe_spy = mocker.spy(PipeCompose, "_run_operator_pipe")
+        add_pipe_step_mock = mocker.patch.object(get_pipeline_tracker(), "add_pipe_step")
+        pipeline_run_id = get_pipeline_manager().add_new_pipeline().pipeline_run_id
+        get_report_delegate().open_registry(pipeline_run_id=pipeline_run_id)
+        with deduplicate_pipe_runs(is_enabled=True):
+            pipe_outputs = [
+                await pipe_compose.run_pipe(
+                    job_metadata=JobMetadata(pipeline_run_id=pipeline_run_id),
+                    working_memory=WorkingMemoryFactory.make_from_text(text="world", name="text"),
+                    pipe_run_params=PipeRunParamsFactory.make_run_params(),
+                    output_name="greeting",
+                )
+                for _ in range(2)
+            ]
+
+        assert run_operator_pipe_spy.call_count == 1
+        first_output_stuff, shared_output_stuff = (pipe_output.main_stuff for pipe_output in pipe_outputs)
+        assert shared_output_stuff.content == first_output_stuff.content
+        assert shared_output_stuff.stuff_code != first_output_stuff.stuff_code
+        add_pipe_step_mock.assert_called_once()
+        assert add_pipe_step_mock.call_args.kwargs["from_stuff"] is first_output_stuff
+        assert add_pipe_step_mock.call_args.kwargs["to_stuff"] is shared_output_stuff
@@ -1,7 +1,10 @@
+import kajson
 import pytest
 
 from pipelex.core.pipes.variable_multiplicity import VariableMultiplicity, VariableMultiplicityResolution
 from pipelex.pipe_run.pipe_run_params import (
+    PipeRunParamKey,
+    PipeRunParams,
     output_multiplicity_to_apply,
 )
 from tests.unit.pipe_run.data import OUTPUT_MULTIPLICITY_TO_APPLY_TEST_CASES
@@ -211,3 +214,59 @@ class TestOutputMultiplicityToApply:
         assert result.resolved_multiplicity == 4  # Preserves base count
         assert result.is_multiple_outputs_enabled is True
         assert result.specific_output_count == 4
+
+
+class TestPipeRunParamsBranching:
+    """Test cases for deriving branch run params with shared pipe stacks."""
+
+    def test_branch_pipe_stack_is_independent(self):
+        pipe_run_params = PipeRunParams(pipe_stack_limit=10)
+        pipe_run_params.push_pipe_to_stack(pipe_code="parent")
+        pipe_run_params.push_pipe_layer(pipe_code="parent")
+
+        branch_params = pipe_run_params.make_branch_params_with_final_stuff_code(final_stuff_code="branch-0")
+        branch_params.push_pipe_to_stack(pipe_code="child")
+        branch_params.push_pipe_layer(pipe_code="child")
+
+        assert branch_params.final_stuff_code == "branch-0"
+        assert branch_params.pipe_stack == ["parent", "child"]
+        assert branch_params.pipe_layers == ["parent", "child"]
+        assert branch_params.pipe_stack_depth == 2
+        assert pipe_run_params.pipe_stack == ["parent"]
+        assert pipe_run_params.pipe_layers == ["parent"]
+
+        branch_params.pop_pipe_from_stack(pipe_code="child")
+        assert branch_params.pipe_stack == ["parent"]
+        assert branch_params.pop_pipe_code() == "child"
+        assert branch_params.pipe_layers == ["parent"]
+
+    def test_push_same_pipe_layer_twice_is_ignored(self):
+        pipe_run_params = PipeRunParams(pipe_stack_limit=10)
+        pipe_run_params.push_pipe_layer(pipe_code="layer")
+        pipe_run_params.push_pipe_layer(pipe_code="layer")
+        assert pipe_run_params.pipe_layers == ["layer"]
+
+    def test_injecting_multiplicity_does_not_mutate_shared_params(self):
+        pipe_run_params = PipeRunParams(pipe_stack_limit=10, params={"_existing": 1})
+        branch_params = pipe_run_params.make_branch_params()
+
+        new_run_params = PipeRunParams.copy_by_injecting_multiplicity(pipe_run_params=branch_params, applied_output_multiplicity=3)
+
+        assert new_run_params.params == {"_existing": 1, PipeRunParamKey.NB_OUTPUT: 3}
+        assert pipe_run_params.params == {"_existing": 1}
+        assert branch_params.params == {"_existing": 1}
+
+    def test_pipe_stack_and_layers_are_serialized_and_validated(self):
+        pipe_run_params = PipeRunParams.model_validate({"pipe_stack_limit": 10, "pipe_stack": ["parent", "child"], "pipe_layers": ["parent"]})
+        assert pipe_run_params.pipe_stack == ["parent", "child"]
+        assert pipe_run_params.pipe_stack_depth == 2
+
+        dumped_params = pipe_run_params.model_dump()
+        assert dumped_params["pipe_stack"] == ["parent", "child"]
+        assert dumped_params["pipe_layers"] == ["parent"]
+        assert PipeRunParams.model_validate_json(pipe_run_params.model_dump_json()).pipe_stack == ["parent", "child"]
+
+        decoded_params = kajson.loads(kajson.dumps(pipe_run_params))
+        assert isinstance(decoded_params, PipeRunParams)
+        assert decoded_params.pipe_stack == ["parent", "child"]
+        assert decoded_params.pipe_layers == ["parent"]
@@ -0,0 +1,94 @@
+import pytest
+from typing_extensions import override
+
+from pipelex.cogt.usage.usage_registry import ModelUsage, UsageRegistry
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.hub import get_branch_executor, get_pipelex_hub, get_pipeline_manager, get_report_delegate
+from pipelex.pipe_operators.compose.pipe_compose_blueprint import PipeComposeBlueprint
+from pipelex.pipe_operators.compose.pipe_compose_factory import PipeComposeFactory
+from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorProtocol
+from pipelex.pipeline.branch_executor.branch_job import BranchJob, BranchJobResult
+from pipelex.pipeline.branch_executor.branch_offloading import run_branch_pipe
+from pipelex.pipeline.checkpoint.checkpoint_models import StuffCheckpoint
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.reporting.budget_config import BudgetLimits
+
+
+class InProcessBranchExecutor(BranchExecutorProtocol):
+    """Answers the branch jobs as a worker would, with the usage of two calls to a model."""
+
+    def __init__(self):
+        self.branch_jobs: list[BranchJob] = []
+
+    @property
+    @override
+    def is_offloading(self) -> bool:
+        return True
+
+    @override
+    async def run_branch_job(self, job_id: str, job_payload: str) -> str:
+        branch_job = BranchJob.model_validate_json(job_payload)
+        self.branch_jobs.append(branch_job)
+        return BranchJobResult(
+            job_id=job_id,
+            output=StuffCheckpoint.make_from_stuff(stuff=StuffFactory.make_from_str(str_value="Hello from the worker", name="greeting")),
+            usage=UsageRegistry(usages_by_model={"llm-model": ModelUsage(inference_model_name="llm-model", nb_calls=2)}),
+        ).model_dump_json()
+
+    @override
+    def setup(self) -> None:
+        pass
+
+    @override
+    def teardown(self) -> None:
+        pass
+
+
+class TestBranchOffloading:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("budget_limits", "is_offloaded"),
+        [
+            (None, True),
+            (BudgetLimits(max_calls=10), False),
+        ],
+    )
+    async def test_offloaded_branch_usage_is_added_to_its_run(self, budget_limits: BudgetLimits | None, is_offloaded: bool):
+        original_branch_executor = get_branch_executor()
+        branch_executor = InProcessBranchExecutor()
+        get_pipelex_hub().set_branch_executor(branch_executor=branch_executor)
+        pipe_compose = PipeComposeFactory.make_from_blueprint(
+            domain="offloading_test",
+            pipe_code="offloading_test_greet",
+            blueprint=PipeComposeBlueprint(inputs={"text": "Text"}, output="Text", template="Hello $text"),
+        )
+        pipeline_run_id = get_pipeline_manager().add_new_pipeline().pipeline_run_id
+        get_report_delegate().open_registry(pipeline_run_id=pipeline_run_id, budget_limits=budget_limits)
+        try:
+            pipe_output = await run_branch_pipe(
+                sub_pipe=pipe_compose,
+                job_metadata=JobMetadata(pipeline_run_id=pipeline_run_id),
+                working_memory=WorkingMemoryFactory.make_from_single_stuff(stuff=StuffFactory.make_from_str(str_value="world", name="text")),
+                pipe_run_params=PipeRunParamsFactory.make_run_params(),
+                output_name="greeting",
+                is_offloaded=True,
+            )
+            run_usage = get_report_delegate().get_run_usage(pipeline_run_id=pipeline_run_id)
+        finally:
+            get_report_delegate().close_registry(pipeline_run_id=pipeline_run_id)
+            get_pipelex_hub().set_branch_executor(branch_executor=original_branch_executor)
+
+        assert isinstance(pipe_output.main_stuff.content, TextContent)
+        assert run_usage is not None
+        if is_offloaded:
+            assert [list(branch_job.inputs.stuffs) for branch_job in branch_executor.branch_jobs] == [["text"]]
+            assert pipe_output.main_stuff.content.text == "Hello from the worker"
+            assert run_usage.nb_calls == 2
+        else:
+            # the budget of the run is only enforced on its own inference jobs, so its branches are not offloaded
+            assert not branch_executor.branch_jobs
+            assert pipe_output.main_stuff.content.text == "Hello world"
+            assert run_usage.nb_calls == 0
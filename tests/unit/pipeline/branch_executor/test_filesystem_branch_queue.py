@@ -0,0 +1,72 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pipelex.pipeline.branch_executor.branch_job import BranchJob, BranchJobResult
+from pipelex.pipeline.branch_executor.filesystem_branch_queue import FilesystemBranchQueue
+from pipelex.pipeline.branch_executor.filesystem_queue_branch_executor import FilesystemQueueBranchExecutor
+from pipelex.pipeline.checkpoint.checkpoint_models import WorkingMemoryCheckpoint
+
+
+def _make_job_payload(job_id: str) -> str:
+    return BranchJob(job_id=job_id, pipe_code="render_pdf", inputs=WorkingMemoryCheckpoint(), output_name="pdf").model_dump_json()
+
+
+def _make_result_payload(job_id: str, error_message: str) -> str:
+    return BranchJobResult(job_id=job_id, error_type="ValueError", error_message=error_message).model_dump_json()
+
+
+class TestFilesystemBranchQueue:
+    def test_jobs_are_claimed_once_and_their_results_popped_once(self, tmp_path: Path):
+        branch_queue = FilesystemBranchQueue(queue_dir=str(tmp_path))
+        other_worker_queue = FilesystemBranchQueue(queue_dir=str(tmp_path))
+        branch_queue.setup()
+        branch_queue.submit_job(job_id="job_1", job_payload=_make_job_payload(job_id="job_1"))
+
+        claimed_job = other_worker_queue.claim_next_job()
+        assert claimed_job is not None
+        job_id, job_payload = claimed_job
+        assert job_id == "job_1"
+        assert BranchJob.model_validate_json(job_payload).pipe_code == "render_pdf"
+        assert branch_queue.claim_next_job() is None
+        # a claimed job can't be withdrawn anymore
+        assert not branch_queue.withdraw_job(job_id="job_1")
+
+        assert branch_queue.pop_job_result(job_id="job_1") is None
+        other_worker_queue.complete_job(job_id="job_1", result_payload=_make_result_payload(job_id="job_1", error_message="bad page"))
+        result_payload = branch_queue.pop_job_result(job_id="job_1")
+        assert result_payload is not None
+        assert BranchJobResult.model_validate_json(result_payload).error_message == "bad page"
+        assert branch_queue.pop_job_result(job_id="job_1") is None
+        assert not any(tmp_path.rglob("*.json"))
+
+    @pytest.mark.asyncio
+    async def test_executor_waits_for_the_result_of_its_job(self, tmp_path: Path):
+        branch_executor = FilesystemQueueBranchExecutor(queue_dir=str(tmp_path), poll_interval=0.01)
+        branch_executor.setup()
+        worker_queue = FilesystemBranchQueue(queue_dir=str(tmp_path))
+
+        async def run_one_job():
+            while True:
+                if (claimed_job := worker_queue.claim_next_job()) is not None:
+                    break
+                await asyncio.sleep(0.01)
+            job_id, _ = claimed_job
+            worker_queue.complete_job(job_id=job_id, result_payload=_make_result_payload(job_id=job_id, error_message="done"))
+
+        result_payload, _ = await asyncio.gather(
+            branch_executor.run_branch_job(job_id="job_2", job_payload=_make_job_payload(job_id="job_2")),
+            run_one_job(),
+        )
+        assert BranchJobResult.model_validate_json(result_payload).job_id == "job_2"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_withdrawn_from_the_queue(self, tmp_path: Path):
+        branch_executor = FilesystemQueueBranchExecutor(queue_dir=str(tmp_path), poll_interval=0.01)
+        branch_executor.setup()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(branch_executor.run_branch_job(job_id="job_3", job_payload=_make_job_payload(job_id="job_3")), timeout=0.05)
+
+        assert FilesystemBranchQueue(queue_dir=str(tmp_path)).claim_next_job() is None
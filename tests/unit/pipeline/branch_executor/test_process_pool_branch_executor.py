@@ -0,0 +1,191 @@
+import sys
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+from typing_extensions import override
+
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.pipeline.branch_executor.branch_job import BranchJob, BranchJobResult
+from pipelex.pipeline.branch_executor.process_pool_branch_executor import ProcessPoolBranchExecutor
+from pipelex.pipeline.checkpoint.checkpoint_models import StuffCheckpoint, WorkingMemoryCheckpoint
+
+WORKER_BUNDLE = """\
+domain = "branch_worker_test"
+description = "Pipes run by the worker processes of the process pool branch executor"
+
+[pipe.greet_from_worker]
+type = "PipeCompose"
+description = "Greet someone"
+inputs = { name = "Text" }
+output = "Text"
+template = "Hello $name"
+
+[pipe.answer_from_worker]
+type = "PipeLLM"
+description = "Answer someone"
+inputs = { name = "Text" }
+output = "Text"
+prompt = "Say hello to @name"
+"""
+
+# The worker setup of the LLM tests, written to a module that the worker processes can import
+LLM_WORKER_SETUP_MODULE = """\
+import httpx
+
+from pipelex.cogt.inference.inference_manager import InferenceManager
+from pipelex.cogt.llm.llm_worker_internal_abstract import LLMWorkerInternalAbstract
+from pipelex.hub import get_report_delegate
+from pipelex.pipelex import Pipelex
+from pipelex.pipeline.branch_executor.branch_executor_protocol import BranchExecutorNoOp
+from pipelex.pipeline.branch_executor.branch_worker import load_worker_bundles
+from pipelex.system.runtime import IntegrationMode
+
+
+class HttpLLMWorker(LLMWorkerInternalAbstract):
+    # like the workers of the inference SDKs, it keeps its client and pooled connections from one job to the next
+    def __init__(self, inference_model, reporting_delegate):
+        super().__init__(inference_model=inference_model, reporting_delegate=reporting_delegate)
+        self.client = httpx.AsyncClient(base_url="SERVER_URL")
+
+    @property
+    def is_gen_object_supported(self):
+        return False
+
+    async def _gen_text(self, llm_job):
+        response = await self.client.post("/", content=llm_job.llm_prompt.user_text or "")
+        return response.text
+
+    async def _gen_object(self, llm_job, schema):
+        raise NotImplementedError
+
+
+class HttpInferenceManager(InferenceManager):
+    def _setup_one_internal_llm_worker(self, inference_model, llm_handle):
+        llm_worker = HttpLLMWorker(inference_model=inference_model, reporting_delegate=get_report_delegate())
+        self.llm_workers[llm_handle] = llm_worker
+        return llm_worker
+
+
+def setup_llm_branch_worker(bundle_paths):
+    Pipelex.make(integration_mode=IntegrationMode.PYTHON, branch_executor=BranchExecutorNoOp(), inference_manager=HttpInferenceManager())
+    load_worker_bundles(bundle_paths=bundle_paths)
+"""
+
+
+class _AnswerRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connections alive, so the client of the worker reuses them from one job to the next
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        prompt = self.rfile.read(int(self.headers["Content-Length"]))
+        answer = b"Answer to: " + prompt
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(answer)))
+        self.end_headers()
+        self.wfile.write(answer)
+
+    @override
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def process_pool_branch_executor(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ProcessPoolBranchExecutor]:
+    bundle_path = tmp_path_factory.mktemp("worker_bundles") / "branch_worker_test.plx"
+    bundle_path.write_text(WORKER_BUNDLE)
+    branch_executor = ProcessPoolBranchExecutor(
+        max_workers=1,
+        worker_setup_function="pipelex.pipeline.branch_executor.branch_worker_setup.setup_branch_worker",
+        worker_bundle_paths=[str(bundle_path)],
+    )
+    branch_executor.setup()
+    yield branch_executor
+    branch_executor.teardown()
+
+
+@pytest.fixture(scope="module")
+def llm_process_pool_branch_executor(tmp_path_factory: pytest.TempPathFactory) -> Iterator[ProcessPoolBranchExecutor]:
+    llm_server = ThreadingHTTPServer(("127.0.0.1", 0), _AnswerRequestHandler)
+    threading.Thread(target=llm_server.serve_forever, daemon=True).start()
+    setup_dir_path = tmp_path_factory.mktemp("worker_setup")
+    server_url = f"http://127.0.0.1:{llm_server.server_address[1]}"
+    (setup_dir_path / "llm_branch_worker_setup.py").write_text(LLM_WORKER_SETUP_MODULE.replace("SERVER_URL", server_url))
+    bundle_path = setup_dir_path / "branch_worker_test.plx"
+    bundle_path.write_text(WORKER_BUNDLE)
+    # the spawned worker processes start with the path of this one
+    sys.path.insert(0, str(setup_dir_path))
+    branch_executor = ProcessPoolBranchExecutor(
+        max_workers=1,
+        worker_setup_function="llm_branch_worker_setup.setup_llm_branch_worker",
+        worker_bundle_paths=[str(bundle_path)],
+    )
+    branch_executor.setup()
+    yield branch_executor
+    branch_executor.teardown()
+    sys.path.remove(str(setup_dir_path))
+    llm_server.shutdown()
+    llm_server.server_close()
+
+
+def _make_job_payload(job_id: str, pipe_code: str) -> str:
+    name_stuff = StuffFactory.make_from_str(str_value="world", name="name")
+    return BranchJob(
+        job_id=job_id,
+        pipe_code=pipe_code,
+        inputs=WorkingMemoryCheckpoint(stuffs={"name": StuffCheckpoint.make_from_stuff(stuff=name_stuff)}),
+        output_name="greeting",
+    ).model_dump_json()
+
+
+class TestProcessPoolBranchExecutor:
+    @pytest.mark.asyncio
+    async def test_worker_process_runs_the_branch_job(self, process_pool_branch_executor: ProcessPoolBranchExecutor):
+        result_payload = await process_pool_branch_executor.run_branch_job(
+            job_id="job_1",
+            job_payload=_make_job_payload(job_id="job_1", pipe_code="greet_from_worker"),
+        )
+
+        branch_job_result = BranchJobResult.model_validate_json(result_payload)
+        assert branch_job_result.job_id == "job_1"
+        assert branch_job_result.error_type is None
+        assert branch_job_result.output is not None
+        output_stuff = branch_job_result.output.make_stuff()
+        assert output_stuff.stuff_name == "greeting"
+        assert isinstance(output_stuff.content, TextContent)
+        assert output_stuff.content.text == "Hello world"
+        # the usage of the worker's run is sent back, even when it made no inference call
+        assert branch_job_result.usage is not None
+        assert branch_job_result.usage.is_empty
+
+    @pytest.mark.asyncio
+    async def test_worker_process_returns_the_error_of_the_branch_job(self, process_pool_branch_executor: ProcessPoolBranchExecutor):
+        result_payload = await process_pool_branch_executor.run_branch_job(
+            job_id="job_2",
+            job_payload=_make_job_payload(job_id="job_2", pipe_code="unknown_pipe"),
+        )
+
+        branch_job_result = BranchJobResult.model_validate_json(result_payload)
+        assert branch_job_result.output is None
+        assert branch_job_result.error_type is not None
+        assert "unknown_pipe" in (branch_job_result.error_message or "")
+
+    @pytest.mark.asyncio
+    async def test_worker_process_runs_successive_llm_jobs(self, llm_process_pool_branch_executor: ProcessPoolBranchExecutor):
+        # the single worker process runs both jobs, with the same LLM worker and its client
+        for job_id in ("llm_job_1", "llm_job_2"):
+            result_payload = await llm_process_pool_branch_executor.run_branch_job(
+                job_id=job_id,
+                job_payload=_make_job_payload(job_id=job_id, pipe_code="answer_from_worker"),
+            )
+
+            branch_job_result = BranchJobResult.model_validate_json(result_payload)
+            assert branch_job_result.error_type is None, branch_job_result.error_message
+            assert branch_job_result.output is not None
+            output_stuff = branch_job_result.output.make_stuff()
+            assert isinstance(output_stuff.content, TextContent)
+            assert output_stuff.content.text.startswith("Answer to: ")
+            assert "world" in output_stuff.content.text
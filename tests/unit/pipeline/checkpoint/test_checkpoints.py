@@ -0,0 +1,209 @@
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pipelex.core.concepts.concept_factory import ConceptFactory
+from pipelex.core.concepts.concept_native import NativeConceptCode
+from pipelex.core.memory.working_memory import MAIN_STUFF_NAME, WorkingMemory
+from pipelex.core.memory.working_memory_factory import WorkingMemoryFactory
+from pipelex.core.stuffs.list_content import ListContent
+from pipelex.core.stuffs.number_content import NumberContent
+from pipelex.core.stuffs.stuff_factory import StuffFactory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.hub import get_checkpoint_store, get_pipe_library, get_pipelex_hub
+from pipelex.pipe_controllers.sequence.pipe_sequence_blueprint import PipeSequenceBlueprint
+from pipelex.pipe_controllers.sequence.pipe_sequence_factory import PipeSequenceFactory
+from pipelex.pipe_controllers.sub_pipe_blueprint import SubPipeBlueprint
+from pipelex.pipe_operators.func.pipe_func_blueprint import PipeFuncBlueprint
+from pipelex.pipe_operators.func.pipe_func_factory import PipeFuncFactory
+from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.pipeline.checkpoint.checkpoint_models import WorkingMemoryCheckpoint
+from pipelex.pipeline.checkpoint.checkpoint_store_protocol import CheckpointStoreProtocol
+from pipelex.pipeline.checkpoint.checkpointing import make_checkpoint_key
+from pipelex.pipeline.checkpoint.filesystem_checkpoint_store import FilesystemCheckpointStore
+from pipelex.pipeline.checkpoint.sqlite_checkpoint_store import SqliteCheckpointStore
+from pipelex.pipeline.execute import execute_pipeline
+from pipelex.pipeline.start import start_pipeline
+from pipelex.system.registries.func_registry import func_registry
+
+if TYPE_CHECKING:
+    from pipelex.core.pipes.pipe_abstract import PipeAbstract
+
+EXCLAIMED_TEXTS: list[str] = []
+# texts whose exclamation fails once, to make the run fail
+FAILING_TEXTS: set[str] = set()
+
+
+def _make_sqlite_store(tmp_path: Path) -> CheckpointStoreProtocol:
+    return SqliteCheckpointStore(file_path=str(tmp_path / "checkpoints" / "checkpoints.sqlite"))
+
+
+def _make_filesystem_store(tmp_path: Path) -> CheckpointStoreProtocol:
+    return FilesystemCheckpointStore(directory=str(tmp_path / "checkpoints"))
+
+
+def checkpoint_exclaim(working_memory: WorkingMemory) -> TextContent:
+    text = working_memory.get_stuff_as_str("text")
+    EXCLAIMED_TEXTS.append(text)
+    if text in FAILING_TEXTS:
+        FAILING_TEXTS.discard(text)
+        msg = f"Failed to exclaim '{text}'"
+        raise ValueError(msg)
+    return TextContent(text=f"{text}!")
+
+
+def checkpoint_adopt(working_memory: WorkingMemory) -> TextContent:
+    return TextContent(text=working_memory.get_stuff_as_str("exclaimed"))
+
+
+@pytest.fixture
+def checkpointed_pipes() -> Iterator[None]:
+    func_registry.register_function(checkpoint_exclaim, name="checkpoint_exclaim")
+    func_registry.register_function(checkpoint_adopt, name="checkpoint_adopt")
+    pipes: list[PipeAbstract] = [
+        PipeFuncFactory.make_from_blueprint(
+            domain="checkpoint_test",
+            pipe_code="checkpoint_exclaim",
+            blueprint=PipeFuncBlueprint(inputs={"text": "Text"}, output="Text", function_name="checkpoint_exclaim"),
+        ),
+        PipeFuncFactory.make_from_blueprint(
+            domain="checkpoint_test",
+            pipe_code="checkpoint_adopt",
+            blueprint=PipeFuncBlueprint(inputs={"exclaimed": "Text"}, output="Text", function_name="checkpoint_adopt"),
+        ),
+        PipeSequenceFactory.make_from_blueprint(
+            domain="checkpoint_test",
+            pipe_code="checkpoint_exclaim_step",
+            blueprint=PipeSequenceBlueprint(
+                inputs={"text": "Text"}, output="Text", steps=[SubPipeBlueprint(pipe="checkpoint_exclaim", result="exclaimed")]
+            ),
+        ),
+        # the same sub-sequence is run by two steps, on different texts
+        PipeSequenceFactory.make_from_blueprint(
+            domain="checkpoint_test",
+            pipe_code="checkpoint_exclaim_twice",
+            blueprint=PipeSequenceBlueprint(
+                inputs={"text": "Text"},
+                output="Text",
+                steps=[
+                    SubPipeBlueprint(pipe="checkpoint_exclaim_step", result="exclaimed"),
+                    SubPipeBlueprint(pipe="checkpoint_adopt", result="text"),
+                    SubPipeBlueprint(pipe="checkpoint_exclaim_step", result="exclaimed"),
+                ],
+            ),
+        ),
+    ]
+    get_pipe_library().add_pipes(pipes=pipes)
+    yield
+    get_pipe_library().remove_pipes_by_codes(pipe_codes=[pipe.code for pipe in pipes])
+    func_registry.unregister_function_by_name("checkpoint_exclaim")
+    func_registry.unregister_function_by_name("checkpoint_adopt")
+    EXCLAIMED_TEXTS.clear()
+    FAILING_TEXTS.clear()
+
+
+class TestCheckpoints:
+    @pytest.mark.parametrize("make_store", [_make_sqlite_store, _make_filesystem_store])
+    def test_store_saves_loads_and_clears_checkpoints(self, tmp_path: Path, make_store: Callable[[Path], CheckpointStoreProtocol]):
+        store = make_store(tmp_path)
+        store.save_checkpoint(pipeline_run_id="run_a", checkpoint_key="seq[]/step-0", payload="first")
+        store.save_checkpoint(pipeline_run_id="run_a", checkpoint_key="seq[]/step-0", payload="second")
+        store.save_checkpoint(pipeline_run_id="run_b", checkpoint_key="seq[]/step-0", payload="other run")
+
+        assert store.load_checkpoint(pipeline_run_id="run_a", checkpoint_key="seq[]/step-0") == "second"
+        assert store.load_checkpoint(pipeline_run_id="run_a", checkpoint_key="seq[]/step-1") is None
+
+        store.clear_checkpoints(pipeline_run_id="run_a")
+        assert store.load_checkpoint(pipeline_run_id="run_a", checkpoint_key="seq[]/step-0") is None
+        assert store.load_checkpoint(pipeline_run_id="run_b", checkpoint_key="seq[]/step-0") == "other run"
+        store.teardown()
+
+    def test_working_memory_checkpoint_replays_the_changes_of_a_step(self):
+        text_concept = ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.TEXT)
+        working_memory = WorkingMemoryFactory.make_from_text(text="The topic", name="topic")
+        working_memory.set_new_main_stuff(stuff=working_memory.get_stuff("topic"))
+        stuffs_before = dict(working_memory.root)
+
+        ideas_stuff = StuffFactory.make_stuff(
+            concept=text_concept,
+            content=ListContent[TextContent](items=[TextContent(text="first idea"), TextContent(text="second idea")]),
+            name="ideas",
+        )
+        working_memory.set_new_main_stuff(stuff=ideas_stuff, name="ideas")
+        score_stuff = StuffFactory.make_stuff(
+            concept=ConceptFactory.make_native_concept(native_concept_code=NativeConceptCode.NUMBER),
+            content=NumberContent(number=0.5),
+            name="score",
+        )
+        working_memory.add_new_stuff(name="score", stuff=score_stuff)
+
+        checkpoint = WorkingMemoryCheckpoint.make_from_changes(stuffs_before=stuffs_before, working_memory=working_memory)
+        assert sorted(checkpoint.stuffs) == ["ideas", "score"]
+        assert checkpoint.removed_names == [MAIN_STUFF_NAME]
+
+        restored_memory = WorkingMemoryFactory.make_from_text(text="The topic", name="topic")
+        restored_memory.set_new_main_stuff(stuff=restored_memory.get_stuff("topic"))
+        WorkingMemoryCheckpoint.model_validate_json(checkpoint.model_dump_json()).apply_to(working_memory=restored_memory)
+
+        assert sorted(restored_memory.root) == ["ideas", "score", "topic"]
+        assert restored_memory.get_main_stuff().stuff_code == ideas_stuff.stuff_code
+        restored_ideas = restored_memory.get_stuff_as_list(name="ideas", item_type=TextContent)
+        assert [idea.text for idea in restored_ideas.items] == ["first idea", "second idea"]
+        assert restored_memory.get_stuff_as_number(name="score").number == 0.5
+
+    def test_checkpoint_key_includes_all_enclosing_batch_branches(self):
+        pipe_run_params = PipeRunParamsFactory.make_run_params()
+        pipe_run_params.push_pipe_to_stack(pipe_code="outer_batch")
+        first_branch_params = pipe_run_params.make_branch_params_with_final_stuff_code(final_stuff_code="a", batch_index=1)
+        second_branch_params = pipe_run_params.make_branch_params_with_final_stuff_code(final_stuff_code="b", batch_index=2)
+        first_branch_params.push_pipe_to_stack(pipe_code="inner_batch")
+        second_branch_params.push_pipe_to_stack(pipe_code="inner_batch")
+
+        first_key = make_checkpoint_key(
+            pipe_run_params=first_branch_params.make_branch_params_with_final_stuff_code(final_stuff_code="c", batch_index=2),
+            step_name="step-0",
+        )
+        second_key = make_checkpoint_key(
+            pipe_run_params=second_branch_params.make_branch_params_with_final_stuff_code(final_stuff_code="d", batch_index=1),
+            step_name="step-0",
+        )
+        assert first_key == "outer_batch.inner_batch[1.2]/step-0"
+        assert second_key == "outer_batch.inner_batch[2.1]/step-0"
+
+    def test_checkpoint_key_includes_all_enclosing_steps(self):
+        pipe_run_params = PipeRunParamsFactory.make_run_params()
+        pipe_run_params.push_pipe_to_stack(pipe_code="parallel")
+        first_branch_params = pipe_run_params.make_step_params(step_name="branch-first")
+        second_branch_params = pipe_run_params.make_step_params(step_name="branch-second")
+        first_branch_params.push_pipe_to_stack(pipe_code="sequence")
+        second_branch_params.push_pipe_to_stack(pipe_code="sequence")
+
+        assert make_checkpoint_key(pipe_run_params=first_branch_params, step_name="step-0") == "parallel.sequence[]/branch-first/step-0"
+        assert make_checkpoint_key(pipe_run_params=second_branch_params, step_name="step-0") == "parallel.sequence[]/branch-second/step-0"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("checkpointed_pipes")
+    async def test_resumed_run_only_restores_the_steps_it_completed(self, tmp_path: Path):
+        pipelex_hub = get_pipelex_hub()
+        previous_checkpoint_store = get_checkpoint_store()
+        pipelex_hub.set_checkpoint_store(checkpoint_store=FilesystemCheckpointStore(directory=str(tmp_path / "checkpoints")))
+        try:
+            FAILING_TEXTS.add("hello!")
+            pipeline_run_id, run_task = await start_pipeline(
+                pipe_code="checkpoint_exclaim_twice",
+                inputs=WorkingMemoryFactory.make_from_text(text="hello", name="text"),
+            )
+            with pytest.raises(ValueError, match="Failed to exclaim 'hello!'"):
+                await run_task
+            assert EXCLAIMED_TEXTS == ["hello", "hello!"]
+
+            pipe_output = await execute_pipeline(pipe_code="checkpoint_exclaim_twice", resume_run_id=pipeline_run_id)
+        finally:
+            pipelex_hub.set_checkpoint_store(checkpoint_store=previous_checkpoint_store)
+
+        # the first run of the sub-sequence is restored, the second one failed so it runs again
+        assert EXCLAIMED_TEXTS == ["hello", "hello!", "hello!"]
+        assert pipe_output.working_memory.get_stuff_as_str("text") == "hello!"
+        assert pipe_output.working_memory.get_stuff_as_str("exclaimed") == "hello!!"
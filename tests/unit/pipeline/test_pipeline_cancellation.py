@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from pipelex.core.memory.working_memory import WorkingMemory
+from pipelex.core.stuffs.text_content import TextContent
+from pipelex.exceptions import PipelineCancelledError, PipeRouterError, PipeRunTimeoutError
+from pipelex.hub import get_pipeline_manager, get_report_delegate
+from pipelex.pipe_operators.func.pipe_func_blueprint import PipeFuncBlueprint
+from pipelex.pipe_operators.func.pipe_func_factory import PipeFuncFactory
+from pipelex.pipe_run.pipe_job import PipeJob
+from pipelex.pipe_run.pipe_job_factory import PipeJobFactory
+from pipelex.pipe_run.pipe_run_cancellation import CancellationToken, check_run_cancellation, set_current_cancellation_token
+from pipelex.pipeline.cancel import cancel_pipeline, run_cancellable_pipe_job
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.system.registries.func_registry import func_registry
+
+SLOW_FUNCTION_NAME = "cancellation_test_slow_function"
+
+
+async def slow_function(working_memory: WorkingMemory) -> TextContent:  # noqa: ARG001  # pyright: ignore[reportUnusedParameter]
+    await asyncio.sleep(10)
+    return TextContent(text="done")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def register_slow_function():
+    func_registry.register_function(slow_function, name=SLOW_FUNCTION_NAME)
+    yield
+    func_registry.unregister_function_by_name(SLOW_FUNCTION_NAME)
+
+
+def _make_slow_pipe_job(pipe_timeout: float | None = None) -> PipeJob:
+    pipe = PipeFuncFactory.make_from_blueprint(
+        domain="cancellation_test",
+        pipe_code="slow_pipe",
+        blueprint=PipeFuncBlueprint(description="Slow pipe", output="Text", function_name=SLOW_FUNCTION_NAME, timeout=pipe_timeout),
+    )
+    pipeline = get_pipeline_manager().add_new_pipeline()
+    get_report_delegate().open_registry(pipeline_run_id=pipeline.pipeline_run_id)
+    return PipeJobFactory.make_pipe_job(pipe=pipe, job_metadata=JobMetadata(pipeline_run_id=pipeline.pipeline_run_id))
+
+
+class TestPipelineCancellation:
+    @pytest.mark.asyncio
+    async def test_token_cancels_the_tasks_of_the_run(self):
+        cancellation_token = CancellationToken()
+        run_task = asyncio.create_task(asyncio.sleep(10))
+        cancellation_token.attach_task(run_task)
+
+        assert cancellation_token.cancel(reason="stopped")
+        assert not cancellation_token.cancel(reason="stopped again")
+        await asyncio.gather(run_task, return_exceptions=True)
+        assert run_task.cancelled()
+
+        # a task attached after the cancellation is cancelled right away
+        late_task = asyncio.create_task(asyncio.sleep(10))
+        cancellation_token.attach_task(late_task)
+        await asyncio.gather(late_task, return_exceptions=True)
+        assert late_task.cancelled()
+
+    def test_pipes_check_the_token_of_their_run(self):
+        cancellation_token = CancellationToken()
+        with set_current_cancellation_token(cancellation_token=cancellation_token):
+            check_run_cancellation(pipeline_run_id="run", pipe_code="my_pipe")
+            cancellation_token.cancel(reason="stopped")
+            with pytest.raises(PipelineCancelledError, match="in pipe 'my_pipe': stopped"):
+                check_run_cancellation(pipeline_run_id="run", pipe_code="my_pipe")
+        check_run_cancellation(pipeline_run_id="run", pipe_code="my_pipe")
+
+    @pytest.mark.asyncio
+    async def test_cancel_pipeline_cancels_the_run(self):
+        pipe_job = _make_slow_pipe_job()
+        pipeline_run_id = pipe_job.job_metadata.pipeline_run_id
+        run_task = asyncio.create_task(run_cancellable_pipe_job(pipe_job=pipe_job))
+        await asyncio.sleep(0.05)
+
+        assert cancel_pipeline(pipeline_run_id=pipeline_run_id, reason="stopped by the user")
+        with pytest.raises(PipelineCancelledError) as exc_info:
+            await run_task
+        assert exc_info.value.pipeline_run_id == pipeline_run_id
+        assert exc_info.value.reason == "stopped by the user"
+        assert not cancel_pipeline(pipeline_run_id=pipeline_run_id)
+
+    @pytest.mark.asyncio
+    async def test_run_timeout_cancels_the_run(self):
+        with pytest.raises(PipelineCancelledError, match=r"timed out after 0\.05s"):
+            await run_cancellable_pipe_job(pipe_job=_make_slow_pipe_job(), run_timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_pipe_timeout_fails_the_pipe(self):
+        with pytest.raises(PipeRouterError, match=r"timed out after 0\.05s") as exc_info:
+            await run_cancellable_pipe_job(pipe_job=_make_slow_pipe_job(pipe_timeout=0.05))
+        assert isinstance(exc_info.value.__cause__, PipeRunTimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_caller_cancels_the_run(self):
+        pipe_job = _make_slow_pipe_job()
+        caller_task = asyncio.create_task(run_cancellable_pipe_job(pipe_job=pipe_job))
+        await asyncio.sleep(0.05)
+
+        caller_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller_task
+        pipeline = get_pipeline_manager().get_pipeline(pipeline_run_id=pipe_job.job_metadata.pipeline_run_id)
+        assert pipeline.cancellation_token.is_cancelled
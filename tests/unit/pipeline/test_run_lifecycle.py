@@ -0,0 +1,121 @@
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pipelex.config import get_config
+from pipelex.exceptions import PipelineCheckpointError
+from pipelex.hub import get_pipe_library, get_pipeline_manager, get_report_delegate
+from pipelex.pipe_operators.compose.pipe_compose_blueprint import PipeComposeBlueprint
+from pipelex.pipe_operators.compose.pipe_compose_factory import PipeComposeFactory
+from pipelex.pipe_run.pipe_run_mode import PipeRunMode
+from pipelex.pipeline.execute import execute_pipeline
+from pipelex.pipeline.pipeline_manager import PipelineManager
+from pipelex.pipeline.pipeline_models import PipelineRunStatus
+from pipelex.pipeline.run_lifecycle import finalize_pipeline_run, finalize_pipeline_run_on_exit
+from pipelex.pipeline.start import start_pipeline
+from pipelex.reporting.reporting_manager import ReportingManager
+
+
+def _fail_run(pipeline_run_id: str):
+    with finalize_pipeline_run_on_exit(pipeline_run_id=pipeline_run_id):
+        msg = "pipe failed"
+        raise ValueError(msg)
+
+
+@pytest.fixture
+def lifecycle_greet_pipe() -> Iterator[str]:
+    pipe_compose = PipeComposeFactory.make_from_blueprint(
+        domain="lifecycle_test",
+        pipe_code="lifecycle_test_greet",
+        blueprint=PipeComposeBlueprint(inputs={"text": "Text"}, output="Text", template="Hello $text"),
+    )
+    get_pipe_library().add_pipes(pipes=[pipe_compose])
+    yield pipe_compose.code
+    get_pipe_library().remove_pipes_by_codes(pipe_codes=[pipe_compose.code])
+
+
+class TestRunLifecycle:
+    def test_finalized_run_moves_to_the_history_of_completed_runs(self):
+        pipeline_run_id = get_pipeline_manager().add_new_pipeline().pipeline_run_id
+        get_report_delegate().open_registry(pipeline_run_id=pipeline_run_id)
+
+        with pytest.raises(ValueError, match="pipe failed"):
+            _fail_run(pipeline_run_id=pipeline_run_id)
+
+        assert get_pipeline_manager().get_optional_pipeline(pipeline_run_id=pipeline_run_id) is None
+        completed_run = get_pipeline_manager().get_optional_completed_run(pipeline_run_id=pipeline_run_id)
+        assert completed_run is not None
+        assert completed_run.status == PipelineRunStatus.FAILED
+        assert completed_run.error_message == "pipe failed"
+        assert completed_run.usage is not None
+        assert completed_run.usage.nb_calls == 0
+        # a run is finalized once
+        assert finalize_pipeline_run(pipeline_run_id=pipeline_run_id, status=PipelineRunStatus.SUCCEEDED) is None
+
+    def test_history_of_completed_runs_is_bounded(self, mocker: MockerFixture):
+        mocker.patch.object(get_config().pipelex.run_lifecycle_config, "nb_completed_runs_kept", 2)
+        pipeline_manager = PipelineManager()
+        pipeline_run_ids = [pipeline_manager.add_new_pipeline().pipeline_run_id for _ in range(3)]
+
+        for pipeline_run_id in pipeline_run_ids:
+            pipeline_manager.finalize_pipeline(pipeline_run_id=pipeline_run_id, status=PipelineRunStatus.SUCCEEDED)
+
+        assert not pipeline_manager.root
+        assert [completed_run.pipeline_run_id for completed_run in pipeline_manager.get_completed_runs()] == pipeline_run_ids[1:]
+
+    @pytest.mark.asyncio
+    async def test_abandoned_pipelines_are_swept_once_per_interval(self):
+        pipeline_manager = PipelineManager()
+        abandoned_pipeline = pipeline_manager.add_new_pipeline()
+        running_pipeline = pipeline_manager.add_new_pipeline()
+        recent_pipeline = pipeline_manager.add_new_pipeline()
+        run_task = asyncio.create_task(asyncio.sleep(10))
+        running_pipeline.cancellation_token.attach_task(run_task)
+        for old_pipeline in (abandoned_pipeline, running_pipeline):
+            old_pipeline.started_at = datetime.now() - timedelta(hours=2)
+
+        try:
+            assert pipeline_manager.sweep_abandoned_pipelines() == [abandoned_pipeline]
+            assert pipeline_manager.sweep_abandoned_pipelines() == []
+        finally:
+            run_task.cancel()
+        assert recent_pipeline.pipeline_run_id in pipeline_manager.root
+
+    def test_closed_registries_are_kept_for_reports_and_resumed_runs(self, mocker: MockerFixture):
+        mocker.patch.object(get_config().pipelex.run_lifecycle_config, "nb_completed_runs_kept", 1)
+        reporting_manager = ReportingManager()
+        reporting_manager.setup()
+        try:
+            reporting_manager.open_registry(pipeline_run_id="first_run")
+            reporting_manager.close_registry(pipeline_run_id="first_run")
+            assert reporting_manager.get_run_usage(pipeline_run_id="first_run") is not None
+
+            # a resumed run gets its registry back
+            reporting_manager.open_registry(pipeline_run_id="first_run", is_resumed=True)
+            reporting_manager.close_registry(pipeline_run_id="first_run")
+
+            reporting_manager.open_registry(pipeline_run_id="second_run")
+            reporting_manager.close_registry(pipeline_run_id="second_run")
+            assert reporting_manager.get_run_usage(pipeline_run_id="first_run") is None
+            assert reporting_manager.get_run_usage(pipeline_run_id="second_run") is not None
+        finally:
+            reporting_manager.teardown()
+
+    @pytest.mark.asyncio
+    async def test_run_failing_before_its_pipe_job_is_finalized(self, lifecycle_greet_pipe: str):
+        # a dry run can't be resumed, so preparing the checkpoints of these runs fails
+        with pytest.raises(PipelineCheckpointError):
+            await execute_pipeline(pipe_code=lifecycle_greet_pipe, pipe_run_mode=PipeRunMode.DRY, resume_run_id="lifecycle-execute-run")
+        with pytest.raises(PipelineCheckpointError):
+            await start_pipeline(pipe_code=lifecycle_greet_pipe, pipe_run_mode=PipeRunMode.DRY, resume_run_id="lifecycle-start-run")
+
+        for pipeline_run_id in ("lifecycle-execute-run", "lifecycle-start-run"):
+            assert get_pipeline_manager().get_optional_pipeline(pipeline_run_id=pipeline_run_id) is None
+            completed_run = get_pipeline_manager().get_optional_completed_run(pipeline_run_id=pipeline_run_id)
+            assert completed_run is not None
+            assert completed_run.status == PipelineRunStatus.FAILED
+            assert completed_run.error_message is not None
+            assert "Cannot resume pipeline run" in completed_run.error_message
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+import networkx as nx
+import pytest
+
+from pipelex.pipeline.track.critical_path import CriticalLink, CriticalPathAnalyzer, CriticalPathReport, TimedStep
+from pipelex.pipeline.track.step_timing import StepTiming
+
+RUN_STARTED_AT = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _make_timed_step(
+    *,
+    pipe_code: str,
+    from_nodes: list[str],
+    to_node: str,
+    start: float,
+    end: float,
+    pipe_stack: list[str] | None = None,
+) -> TimedStep:
+    return TimedStep(
+        pipe_code=pipe_code,
+        from_nodes=from_nodes,
+        to_node=to_node,
+        timing=StepTiming(
+            pipe_stack=pipe_stack or ["main"],
+            started_at=RUN_STARTED_AT + timedelta(seconds=start),
+            ended_at=RUN_STARTED_AT + timedelta(seconds=end),
+        ),
+    )
+
+
+def _analyze(nx_graph: nx.DiGraph, timed_steps: list[TimedStep]) -> CriticalPathReport:  # pyright: ignore[reportMissingTypeArgument, reportUnknownParameterType]
+    report = CriticalPathAnalyzer(nx_graph=nx_graph, timed_steps=timed_steps).analyze()
+    assert report is not None
+    return report
+
+
+class TestCriticalPath:
+    def test_independent_steps_of_a_sequence_wait_in_order(self):
+        # both steps only need the input, the second one waited for the first to end
+        report = _analyze(
+            nx_graph=nx.DiGraph(),
+            timed_steps=[
+                _make_timed_step(pipe_code="summarize", from_nodes=["input"], to_node="summary", start=0, end=2),
+                _make_timed_step(pipe_code="translate", from_nodes=["input"], to_node="translation", start=2, end=5),
+            ],
+        )
+        assert [step.critical_link for step in report.steps] == [CriticalLink.FIRST, CriticalLink.ORDER]
+        assert report.steps[1].input_wait == pytest.approx(2)
+        assert report.order_edges == [("summary", "translation")]
+        assert report.wall_time == pytest.approx(5)
+        assert report.data_span == pytest.approx(3)
+        assert report.achieved_parallelism == pytest.approx(1)
+        assert report.available_parallelism == pytest.approx(5 / 3)
+        assert report.peak_concurrency == 1
+
+    def test_chained_steps_follow_their_data(self):
+        report = _analyze(
+            nx_graph=nx.DiGraph([("input", "draft"), ("draft", "final")]),
+            timed_steps=[
+                _make_timed_step(pipe_code="write", from_nodes=["input"], to_node="draft", start=0, end=1),
+                _make_timed_step(pipe_code="review", from_nodes=["input"], to_node="notes", start=0, end=3),
+                _make_timed_step(pipe_code="rewrite", from_nodes=["draft"], to_node="final", start=1, end=4),
+            ],
+        )
+        critical_links = {step.pipe_code: step.critical_link for step in report.steps}
+        assert critical_links == {"write": CriticalLink.FIRST, "review": None, "rewrite": CriticalLink.DATA}
+        assert report.critical_edges == [("draft", "final")]
+        assert report.total_input_wait == pytest.approx(0)
+        assert report.peak_concurrency == 2
+        assert report.data_span == pytest.approx(4)
+
+    def test_batch_items_are_ready_when_their_list_is(self):
+        # the list is produced by a step, the items are split from it by the batch without being timed
+        nx_graph: nx.DiGraph[str] = nx.DiGraph([("list", "item-0"), ("list", "item-1")])
+        report = _analyze(
+            nx_graph=nx_graph,
+            timed_steps=[
+                _make_timed_step(pipe_code="make_list", from_nodes=["input"], to_node="list", start=0, end=1),
+                _make_timed_step(pipe_code="process", from_nodes=["item-0"], to_node="result-0", start=1, end=3, pipe_stack=["main", "batch"]),
+                _make_timed_step(pipe_code="process", from_nodes=["item-1"], to_node="result-1", start=1.5, end=2, pipe_stack=["main", "batch"]),
+            ],
+        )
+        assert [step.input_wait for step in report.steps] == pytest.approx([0, 0, 0.5])
+        assert report.steps[1].critical_link == CriticalLink.DATA
+        assert report.critical_edges == [("list", "item-0"), ("item-0", "result-0")]
+
+    def test_controller_steps_are_not_counted_as_work(self):
+        report = _analyze(
+            nx_graph=nx.DiGraph(),
+            timed_steps=[
+                _make_timed_step(pipe_code="inner", from_nodes=["input"], to_node="output", start=0.5, end=2, pipe_stack=["main", "nested"]),
+                _make_timed_step(pipe_code="nested", from_nodes=["input"], to_node="output", start=0, end=2),
+            ],
+        )
+        assert [step.pipe_code for step in report.steps] == ["inner"]
+        assert report.total_work == pytest.approx(1.5)
+
+    def test_no_timed_steps(self):
+        assert CriticalPathAnalyzer(nx_graph=nx.DiGraph(), timed_steps=[]).analyze() is None
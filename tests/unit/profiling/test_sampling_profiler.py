@@ -0,0 +1,123 @@
+import inspect
+import json
+import time
+from pathlib import Path
+
+from pipelex.core.pipes.pipe_abstract import PipeAbstract
+from pipelex.hub import get_library_manager, get_required_pipe
+from pipelex.pipe_run.pipe_run_params import PipeRunParams
+from pipelex.pipe_run.pipe_run_params_factory import PipeRunParamsFactory
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.profiling.run_profile import CodeFrame, PipeSampleCount, RunProfile
+from pipelex.profiling.sampling_profiler import SamplingProfiler, StackSample
+
+PROFILING_BUNDLE = """domain = "profiling_test"
+description = "Bundle profiled in unit tests"
+
+[pipe.profiling_test_write]
+type = "PipeLLM"
+description = "Write about a topic"
+inputs = { topic = "Text" }
+output = "Text"
+prompt = "Write about @topic"
+"""
+
+
+def _read_stack_sample_below(profiler: SamplingProfiler) -> StackSample | None:
+    frame = inspect.currentframe()
+    assert frame is not None
+    return profiler.read_stack_sample(frame=frame)
+
+
+def run_pipe(
+    self: PipeAbstract,  # noqa: ARG001
+    pipe_run_params: PipeRunParams,  # noqa: ARG001
+    job_metadata: JobMetadata,  # noqa: ARG001
+    profiler: SamplingProfiler,
+) -> StackSample | None:
+    # stands for the run_pipe method of a pipe, the profiler reads the pipe stack from its locals
+    return _read_stack_sample_below(profiler=profiler)
+
+
+def _busy_wait(duration: float):
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def _make_code_frame(function_name: str) -> CodeFrame:
+    return CodeFrame(function_name=function_name, file_path="pipelex/some_module.py", line=1)
+
+
+class TestSamplingProfiler:
+    def test_pipe_sample_counts_and_exports(self):
+        run_profile = RunProfile(pipeline_run_id="run", sampling_interval=0.01)
+        validate = _make_code_frame("validate")
+        render = _make_code_frame("render")
+        for _ in range(3):
+            run_profile.add_sample(pipe_stack=("main", "step"), code_frames=(validate,))
+        run_profile.add_sample(pipe_stack=("main",), code_frames=(render,))
+        run_profile.add_sample(pipe_stack=(), code_frames=(render,))
+
+        assert run_profile.nb_samples == 5
+        assert run_profile.get_pipe_sample_counts() == [
+            PipeSampleCount(pipe_code="step", total=3, self=3),
+            PipeSampleCount(pipe_code="main", total=4, self=1),
+        ]
+        assert run_profile.to_collapsed_stacks().splitlines() == [
+            "pipe:main;pipe:step;validate (pipelex/some_module.py:1) 3",
+            "pipe:main;render (pipelex/some_module.py:1) 1",
+            "render (pipelex/some_module.py:1) 1",
+        ]
+
+        speedscope = run_profile.to_speedscope()
+        frame_names = [frame["name"] for frame in speedscope["shared"]["frames"]]
+        profiles = {profile["name"]: profile for profile in speedscope["profiles"]}
+        assert list(profiles) == ["pipeline run run", "pipe step", "pipe main"]
+        assert profiles["pipeline run run"]["endValue"] == 0.05
+        # the profile of a pipe is rooted at that pipe
+        assert [[frame_names[index] for index in stack] for stack in profiles["pipe step"]["samples"]] == [
+            ["pipe:step", "validate (pipelex/some_module.py:1)"],
+        ]
+        assert profiles["pipe step"]["weights"] == [0.03]
+        assert len(profiles["pipe main"]["samples"]) == 2
+
+    def test_stack_sample_is_tagged_with_the_innermost_pipe(self, tmp_path: Path):
+        plx_path = tmp_path / "profiling.plx"
+        plx_path.write_text(PROFILING_BUNDLE, encoding="utf-8")
+        library_manager = get_library_manager()
+        try:
+            library_manager.reload_bundle(plx_path=plx_path)
+            pipe = get_required_pipe(pipe_code="profiling_test_write")
+        finally:
+            library_manager.unload_bundle(plx_path=plx_path)
+        pipe_run_params = PipeRunParamsFactory.make_run_params()
+        pipe_run_params.push_pipe_to_stack(pipe_code="profiling_test_sequence")
+        profiler = SamplingProfiler(output_dir=str(tmp_path))
+
+        stack_sample = run_pipe(
+            self=pipe,
+            pipe_run_params=pipe_run_params,
+            job_metadata=JobMetadata(pipeline_run_id="profiled_run"),
+            profiler=profiler,
+        )
+
+        assert stack_sample is not None
+        assert stack_sample.pipeline_run_id == "profiled_run"
+        assert stack_sample.pipe_stack == ("profiling_test_sequence", "profiling_test_write")
+        assert [code_frame.function_name for code_frame in stack_sample.code_frames] == ["_read_stack_sample_below"]
+
+    def test_profile_run_saves_samples_outside_pipes(self, tmp_path: Path):
+        profiler = SamplingProfiler(output_dir=str(tmp_path), sampling_interval=0.002)
+        try:
+            with profiler.profile_run(pipeline_run_id="busy_run"):
+                _busy_wait(duration=0.2)
+        finally:
+            profiler.teardown()
+
+        collapsed_stacks = (tmp_path / "profile_busy_run.collapsed").read_text(encoding="utf-8")
+        assert "_busy_wait (" in collapsed_stacks
+        assert "pipe:" not in collapsed_stacks
+        speedscope = json.loads((tmp_path / "profile_busy_run.speedscope.json").read_text(encoding="utf-8"))
+        assert speedscope["profiles"][0]["name"] == "pipeline run busy_run"
+        assert speedscope["profiles"][0]["samples"]
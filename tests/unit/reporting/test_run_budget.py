@@ -0,0 +1,256 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+from typing_extensions import override
+
+from pipelex.cogt.exceptions import RunBudgetExceededError
+from pipelex.cogt.extract.extract_input import ExtractInput
+from pipelex.cogt.extract.extract_job import ExtractJob
+from pipelex.cogt.extract.extract_job_factory import ExtractJobFactory
+from pipelex.cogt.extract.extract_output import ExtractOutput, Page
+from pipelex.cogt.extract.extract_worker_abstract import ExtractWorkerAbstract
+from pipelex.cogt.image.generated_image import GeneratedImage
+from pipelex.cogt.img_gen.img_gen_job import ImgGenJob
+from pipelex.cogt.img_gen.img_gen_job_factory import ImgGenJobFactory
+from pipelex.cogt.img_gen.img_gen_worker_abstract import ImgGenWorkerAbstract
+from pipelex.cogt.llm.llm_job import LLMJob
+from pipelex.cogt.llm.llm_job_components import LLMJobParams
+from pipelex.cogt.llm.llm_job_factory import LLMJobFactory
+from pipelex.cogt.llm.llm_prompt import LLMPrompt
+from pipelex.cogt.model_backends.model_spec import InferenceModelSpec
+from pipelex.cogt.model_backends.model_type import ModelType
+from pipelex.cogt.usage.cost_category import CostCategory, CostsByCategoryDict
+from pipelex.cogt.usage.token_category import TokenCategory
+from pipelex.config import get_config
+from pipelex.pipe_run.pipe_stack_context import set_current_pipe_stack
+from pipelex.pipeline.job_metadata import JobMetadata
+from pipelex.reporting.budget_config import BudgetLimits
+from pipelex.reporting.reporting_manager import ReportingManager
+from pipelex.reporting.run_budget import BudgetUsage, RunBudget, estimate_llm_job_usage
+
+PIPELINE_RUN_ID = "test-run-budget"
+
+# $1 per million input tokens and $2 per million output tokens
+LLM_MODEL = InferenceModelSpec(
+    backend_name="test_backend",
+    name="llm-model",
+    sdk="test_sdk",
+    model_type=ModelType.LLM,
+    model_id="llm-model-id",
+    costs={CostCategory.INPUT: 1.0, CostCategory.OUTPUT: 2.0},
+    max_tokens=None,
+    max_prompt_images=None,
+)
+
+
+class _ImgGenWorker(ImgGenWorkerAbstract):
+    @override
+    async def _gen_image(self, img_gen_job: ImgGenJob) -> GeneratedImage:
+        return GeneratedImage(url="https://example.com/image.png", width=1, height=1)
+
+    @override
+    async def _gen_image_list(self, img_gen_job: ImgGenJob, nb_images: int) -> list[GeneratedImage]:
+        return [GeneratedImage(url="https://example.com/image.png", width=1, height=1) for _ in range(nb_images)]
+
+
+class _ExtractWorker(ExtractWorkerAbstract):
+    @override
+    async def _extract_pages(self, extract_job: ExtractJob) -> ExtractOutput:
+        return ExtractOutput(pages={1: Page(text="hello")})
+
+
+def _make_model_spec(name: str, model_type: ModelType, costs: CostsByCategoryDict) -> InferenceModelSpec:
+    return InferenceModelSpec(
+        backend_name="test_backend",
+        name=name,
+        sdk="test_sdk",
+        model_type=model_type,
+        model_id=f"{name}-id",
+        costs=costs,
+        max_tokens=None,
+        max_prompt_images=None,
+    )
+
+
+def _make_llm_job(user_text: str, max_tokens: int | None) -> LLMJob:
+    return LLMJobFactory.make_llm_job(
+        llm_prompt=LLMPrompt(user_text=user_text),
+        llm_job_params=LLMJobParams(temperature=0.5, max_tokens=max_tokens, seed=None),
+        job_metadata=JobMetadata(pipeline_run_id=PIPELINE_RUN_ID),
+    )
+
+
+def _complete_llm_job(llm_job: LLMJob, nb_input_tokens: int, nb_output_tokens: int):
+    llm_job.llm_job_before_start(inference_model=LLM_MODEL)
+    assert llm_job.job_report.llm_tokens_usage is not None
+    llm_job.job_report.llm_tokens_usage.nb_tokens_by_category = {TokenCategory.INPUT: nb_input_tokens, TokenCategory.OUTPUT: nb_output_tokens}
+    llm_job.llm_job_after_complete()
+
+
+class TestRunBudget:
+    def test_estimate_llm_job_usage(self):
+        budget_config = get_config().pipelex.reporting_config.budget_config
+        llm_job = _make_llm_job(user_text="x" * 4000, max_tokens=500)
+
+        estimated_usage = estimate_llm_job_usage(llm_job=llm_job, unit_costs=LLM_MODEL.costs, model_max_tokens=None, budget_config=budget_config)
+
+        nb_input_tokens = round(4000 / budget_config.nb_chars_per_token_estimate)
+        assert estimated_usage.nb_calls == 1
+        assert estimated_usage.nb_tokens == nb_input_tokens + 500
+        assert estimated_usage.cost_usd == pytest.approx((nb_input_tokens * 1.0 + 500 * 2.0) / 1_000_000)
+
+        llm_job_without_max_tokens = _make_llm_job(user_text="hello", max_tokens=None)
+        for model_max_tokens, expected_nb_output_tokens in ((1000, 1000), (None, budget_config.default_max_output_tokens)):
+            estimated_usage = estimate_llm_job_usage(
+                llm_job=llm_job_without_max_tokens,
+                unit_costs={},
+                model_max_tokens=model_max_tokens,
+                budget_config=budget_config,
+            )
+            assert estimated_usage.cost_usd == 0
+            assert estimated_usage.nb_tokens == expected_nb_output_tokens + 2
+
+    @pytest.mark.asyncio
+    async def test_reservations_of_concurrent_jobs_count_against_the_limits(self):
+        run_budget = RunBudget(pipeline_run_id=PIPELINE_RUN_ID, run_limits=BudgetLimits(max_calls=2), pipe_limits={})
+        estimated_usage = BudgetUsage(nb_tokens=10, nb_calls=1)
+        await run_budget.reserve(job_key=1, pipe_stack=(), estimated_usage=estimated_usage)
+        await run_budget.reserve(job_key=2, pipe_stack=(), estimated_usage=estimated_usage)
+        # a failed job gives its reservation back
+        run_budget.release(job_key=2)
+        await run_budget.reserve(job_key=3, pipe_stack=(), estimated_usage=estimated_usage)
+
+        # only the reservations of the jobs in flight could exceed the limit, so the job waits for them to settle
+        reserve_task = asyncio.create_task(run_budget.reserve(job_key=4, pipe_stack=(), estimated_usage=estimated_usage))
+        await asyncio.sleep(0)
+        assert not reserve_task.done()
+        run_budget.settle(job_key=1, pipe_stack=(), usage=BudgetUsage(nb_tokens=5, nb_calls=1))
+        await asyncio.sleep(0)
+        assert not reserve_task.done()
+        assert not run_budget.is_aborted
+
+        # once the spent usage leaves no room for it, the run is aborted
+        run_budget.settle(job_key=3, pipe_stack=(), usage=BudgetUsage(nb_tokens=5, nb_calls=1))
+        with pytest.raises(RunBudgetExceededError, match="calls would reach 3, over the limit of 2"):
+            await reserve_task
+        assert run_budget.is_aborted
+        assert run_budget.spent == BudgetUsage(nb_tokens=10, nb_calls=2)
+        assert run_budget.reserved == BudgetUsage()
+        # once aborted, the run refuses any job
+        with pytest.raises(RunBudgetExceededError):
+            await run_budget.reserve(job_key=5, pipe_stack=(), estimated_usage=BudgetUsage())
+
+    @pytest.mark.asyncio
+    async def test_worst_case_reservations_do_not_abort_the_run(self):
+        run_budget = RunBudget(pipeline_run_id=PIPELINE_RUN_ID, run_limits=BudgetLimits(max_cost_usd=5.0), pipe_limits={})
+        # e.g. the estimate of an LLM job whose output is assumed to use all of the 64,000 max tokens of its model
+        estimated_usage = BudgetUsage(cost_usd=0.96, nb_tokens=64_000, nb_calls=1)
+        reserve_tasks = [
+            asyncio.create_task(run_budget.reserve(job_key=job_key, pipe_stack=(), estimated_usage=estimated_usage)) for job_key in range(6)
+        ]
+        await asyncio.sleep(0)
+        assert [reserve_task.done() for reserve_task in reserve_tasks] == [True] * 5 + [False]
+
+        run_budget.settle(job_key=0, pipe_stack=(), usage=BudgetUsage(cost_usd=0.01, nb_tokens=500, nb_calls=1))
+        await reserve_tasks[5]
+        assert not run_budget.is_aborted
+        assert run_budget.reserved.cost_usd == pytest.approx(5 * 0.96)
+
+    @pytest.mark.asyncio
+    async def test_pipe_limits_include_sub_pipes(self):
+        run_budget = RunBudget(
+            pipeline_run_id=PIPELINE_RUN_ID,
+            run_limits=BudgetLimits(),
+            pipe_limits={"summarize_all": BudgetLimits(max_cost_usd=1.0)},
+        )
+        estimated_usage = BudgetUsage(cost_usd=0.5, nb_calls=1)
+        await run_budget.reserve(job_key=1, pipe_stack=("main", "summarize_all", "summarize"), estimated_usage=estimated_usage)
+        run_budget.settle(job_key=1, pipe_stack=("main", "summarize_all", "summarize"), usage=BudgetUsage(cost_usd=0.6, nb_calls=1))
+        # other pipes are not limited
+        await run_budget.reserve(job_key=2, pipe_stack=("main", "translate"), estimated_usage=estimated_usage)
+        await run_budget.reserve(job_key=3, pipe_stack=("main", "translate"), estimated_usage=estimated_usage)
+
+        with pytest.raises(RunBudgetExceededError, match="Budget of pipe 'summarize_all' exceeded") as exc_info:
+            await run_budget.reserve(job_key=4, pipe_stack=("main", "summarize_all", "summarize"), estimated_usage=estimated_usage)
+        assert exc_info.value.pipe_code == "summarize_all"
+        assert exc_info.value.pipeline_run_id == PIPELINE_RUN_ID
+
+    @pytest.mark.asyncio
+    async def test_reporting_manager_settles_completed_llm_jobs(self):
+        reporting_manager = ReportingManager()
+        reporting_manager.setup()
+        reporting_manager.open_registry(pipeline_run_id=PIPELINE_RUN_ID, budget_limits=BudgetLimits(max_tokens=1000))
+        try:
+            with set_current_pipe_stack(pipe_stack=["main", "write"]):
+                first_llm_job = _make_llm_job(user_text="hello", max_tokens=300)
+                await reporting_manager.reserve_budget(llm_job=first_llm_job, unit_costs=LLM_MODEL.costs, model_max_tokens=None)
+                _complete_llm_job(llm_job=first_llm_job, nb_input_tokens=100, nb_output_tokens=500)
+                reporting_manager.report_inference_job(inference_job=first_llm_job)
+
+                # 600 tokens were spent, there is room for the estimate of the second job,
+                # and the third waits for the second to settle as its reservation leaves no room for both
+                second_llm_job = _make_llm_job(user_text="hello", max_tokens=300)
+                await reporting_manager.reserve_budget(llm_job=second_llm_job, unit_costs=LLM_MODEL.costs, model_max_tokens=None)
+                third_llm_job = _make_llm_job(user_text="hello", max_tokens=300)
+                reserve_task = asyncio.create_task(
+                    reporting_manager.reserve_budget(llm_job=third_llm_job, unit_costs=LLM_MODEL.costs, model_max_tokens=None)
+                )
+                await asyncio.sleep(0)
+                assert not reserve_task.done()
+
+                _complete_llm_job(llm_job=second_llm_job, nb_input_tokens=100, nb_output_tokens=250)
+                reporting_manager.report_inference_job(inference_job=second_llm_job)
+                with pytest.raises(RunBudgetExceededError, match="tokens would reach 1,252, over the limit of 1,000"):
+                    await reserve_task
+        finally:
+            reporting_manager.close_registry(pipeline_run_id=PIPELINE_RUN_ID)
+            reporting_manager.teardown()
+
+    @pytest.mark.asyncio
+    async def test_img_gen_and_extract_jobs_reserve_their_estimated_cost(self, mocker: MockerFixture):
+        reporting_manager = ReportingManager()
+        reporting_manager.setup()
+        reporting_manager.open_registry(pipeline_run_id=PIPELINE_RUN_ID, budget_limits=BudgetLimits(max_cost_usd=0.1))
+        img_gen_worker = _ImgGenWorker(
+            inference_model=_make_model_spec(name="img-model", model_type=ModelType.IMG_GEN, costs={CostCategory.IMAGE: 0.04}),
+            reporting_delegate=reporting_manager,
+        )
+        extract_worker = _ExtractWorker(
+            extra_config={},
+            inference_model=_make_model_spec(name="extract-model", model_type=ModelType.TEXT_EXTRACTOR, costs={CostCategory.PAGE: 0.001}),
+            reporting_delegate=reporting_manager,
+        )
+        spy_gen_image_list = mocker.spy(img_gen_worker, "_gen_image_list")
+        spy_extract_pages = mocker.spy(extract_worker, "_extract_pages")
+        try:
+            await img_gen_worker.gen_image(
+                img_gen_job=ImgGenJobFactory.make_img_gen_job_from_prompt_contents(
+                    positive_text="a cat",
+                    job_metadata=JobMetadata(pipeline_run_id=PIPELINE_RUN_ID),
+                )
+            )
+
+            # $0.04 was spent, and 2 more images would cost $0.08
+            with pytest.raises(RunBudgetExceededError, match=r"cost would reach \$0\.1200, over the limit of \$0\.1000"):
+                await img_gen_worker.gen_image_list(
+                    img_gen_job=ImgGenJobFactory.make_img_gen_job_from_prompt_contents(
+                        positive_text="a cat",
+                        job_metadata=JobMetadata(pipeline_run_id=PIPELINE_RUN_ID),
+                    ),
+                    nb_images=2,
+                )
+            spy_gen_image_list.assert_not_called()
+
+            # once aborted, the run refuses any job
+            with pytest.raises(RunBudgetExceededError):
+                await extract_worker.extract_pages(
+                    extract_job=ExtractJobFactory.make_extract_job(
+                        extract_input=ExtractInput(pdf_uri="document.pdf"),
+                        job_metadata=JobMetadata(pipeline_run_id=PIPELINE_RUN_ID),
+                    )
+                )
+            spy_extract_pages.assert_not_called()
+        finally:
+            reporting_manager.close_registry(pipeline_run_id=PIPELINE_RUN_ID)
+            reporting_manager.teardown()
@@ -0,0 +1,107 @@
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import posthog
+from posthog import new_context, tag
+from pytest_mock import MockerFixture
+
+from pipelex.system.runtime import IntegrationMode
+from pipelex.system.telemetry.events import EventName, EventProperty
+from pipelex.system.telemetry.telemetry_config import TelemetryConfig, TelemetryMode
+from pipelex.system.telemetry.telemetry_dispatcher import TelemetryDispatcher, TelemetryEvent
+from pipelex.system.telemetry.telemetry_manager import TelemetryManager
+
+
+def _make_event(pipe_type: str) -> TelemetryEvent:
+    return TelemetryEvent(
+        event_name=EventName.PIPE_RUN,
+        properties={EventProperty.PIPE_TYPE: pipe_type},
+        timestamp=datetime.now(timezone.utc),  # noqa: UP017 - datetime.UTC is not available on Python 3.10
+    )
+
+
+def _make_telemetry_config(local_sink_path: str, remote_sink_enabled: bool = False) -> TelemetryConfig:
+    return TelemetryConfig(
+        telemetry_mode=TelemetryMode.ANONYMOUS,
+        host="https://telemetry.invalid",
+        project_api_key="test_key",
+        respect_dnt=False,
+        redact=[EventProperty.PIPELINE_RUN_ID],
+        geoip_enabled=False,
+        dry_mode_enabled=False,
+        verbose_enabled=False,
+        user_id="",
+        remote_sink_enabled=remote_sink_enabled,
+        local_sink_path=local_sink_path,
+    )
+
+
+class TestTelemetryDispatch:
+    def test_enqueue_never_waits_for_a_blocked_sink(self):
+        sink_released = threading.Event()
+        flushed_batches: list[list[TelemetryEvent]] = []
+
+        def blocked_sink(events: list[TelemetryEvent]):
+            sink_released.wait(timeout=5)
+            flushed_batches.append(events)
+
+        dispatcher = TelemetryDispatcher(sink=blocked_sink, max_queue_size=5, batch_size=2, flush_interval=0.01)
+        dispatcher.start()
+        try:
+            start_time = time.monotonic()
+            for index in range(50):
+                dispatcher.enqueue(_make_event(pipe_type=f"Pipe{index}"))
+            assert time.monotonic() - start_time < 1
+            assert dispatcher.nb_dropped_events > 0
+        finally:
+            sink_released.set()
+            dispatcher.stop(timeout=5)
+
+        assert not dispatcher.is_running
+        assert all(len(batch) <= 2 for batch in flushed_batches)
+        assert dispatcher.nb_dispatched_events == sum(len(batch) for batch in flushed_batches)
+        assert dispatcher.nb_dispatched_events + dispatcher.nb_dropped_events == 50
+
+    def test_manager_flushes_redacted_events_to_local_sink(self, tmp_path: Path):
+        local_sink_path = tmp_path / "telemetry" / "events.jsonl"
+        previous_default_client = posthog.default_client
+        try:
+            telemetry_manager = TelemetryManager(telemetry_config=_make_telemetry_config(local_sink_path=str(local_sink_path)))
+            telemetry_manager.setup(integration_mode=IntegrationMode.PYTHON)
+            telemetry_manager.track_event(
+                event_name=EventName.PIPE_COMPLETE,
+                properties={EventProperty.PIPE_TYPE: "PipeLLM", EventProperty.PIPELINE_RUN_ID: "secret-run"},
+            )
+            telemetry_manager.teardown()
+        finally:
+            posthog.default_client = previous_default_client
+
+        records = [json.loads(line) for line in local_sink_path.read_text(encoding="utf-8").splitlines()]
+        assert records[-1]["event"] == EventName.PIPE_COMPLETE
+        assert records[-1]["properties"] == {EventProperty.PIPE_TYPE: "PipeLLM"}
+        assert telemetry_manager.nb_dropped_events == 0
+
+    def test_context_tags_are_sent_from_the_worker_thread(self, tmp_path: Path, mocker: MockerFixture):
+        previous_default_client = posthog.default_client
+        try:
+            telemetry_manager = TelemetryManager(
+                telemetry_config=_make_telemetry_config(local_sink_path=str(tmp_path / "events.jsonl"), remote_sink_enabled=True),
+            )
+            capture_mock = mocker.patch.object(telemetry_manager.posthog, "capture")
+            telemetry_manager.dispatcher.start()
+            with new_context():
+                tag(name=EventProperty.CLI_COMMAND, value="run")
+                tag(name=EventProperty.PIPELINE_RUN_ID, value="secret-run")
+                telemetry_manager.track_event(event_name=EventName.PIPE_COMPLETE, properties={EventProperty.PIPE_TYPE: "PipeLLM"})
+            telemetry_manager.teardown()
+        finally:
+            posthog.default_client = previous_default_client
+
+        capture_mock.assert_called_once()
+        sent_properties = capture_mock.call_args.kwargs["properties"]
+        assert sent_properties[EventProperty.CLI_COMMAND] == "run"
+        assert sent_properties[EventProperty.PIPE_TYPE] == "PipeLLM"
+        assert EventProperty.PIPELINE_RUN_ID not in sent_properties
@@ -0,0 +1,155 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+from typing_extensions import override
+
+from pipelex.hub import get_library_manager, get_pipelex_hub, get_required_pipe, get_tracer
+from pipelex.pipe_run.dry_run import dry_run_pipe
+from pipelex.tracing.span import Span, SpanAttribute, SpanKind, SpanStatus
+from pipelex.tracing.span_exporter import BackgroundSpanExporter, InMemorySpanExporter, JsonlSpanExporter, make_otlp_payload
+from pipelex.tracing.tracer import Tracer
+
+TRACED_BUNDLE = """domain = "tracing_test"
+description = "Bundle traced in unit tests"
+
+[pipe.tracing_test_sequence]
+type = "PipeSequence"
+description = "Sequence batching a PipeLLM"
+inputs = { topic = "Text" }
+output = "Text"
+steps = [
+    { pipe = "tracing_test_list_ideas", result = "ideas" },
+    { pipe = "tracing_test_develop_idea", batch_over = "ideas", batch_as = "idea", result = "developed_ideas" },
+]
+
+[pipe.tracing_test_list_ideas]
+type = "PipeLLM"
+description = "List ideas"
+inputs = { topic = "Text" }
+output = "Text[]"
+prompt = "List ideas about @topic"
+
+[pipe.tracing_test_develop_idea]
+type = "PipeLLM"
+description = "Develop an idea"
+inputs = { idea = "Text" }
+output = "Text"
+prompt = "Develop @idea"
+"""
+
+
+class SlowSpanExporter(InMemorySpanExporter):
+    def __init__(self, delay: float):
+        super().__init__()
+        self.delay = delay
+        self.is_shut_down = False
+
+    @override
+    def export(self, spans: list[Span]) -> None:
+        time.sleep(self.delay)
+        super().export(spans=spans)
+
+    @override
+    def shutdown(self) -> None:
+        self.is_shut_down = True
+
+
+def _fail_in_span(tracer: Tracer):
+    with tracer.start_span(name="failing", kind=SpanKind.TEMPLATE):
+        msg = "boom"
+        raise ValueError(msg)
+
+
+class TestTracer:
+    def test_nested_spans_share_the_trace_and_export_on_root_end(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporters=[exporter])
+
+        with tracer.start_span(name="root", kind=SpanKind.PIPE) as root_span:
+            with tracer.start_span(name="child", kind=SpanKind.WORKER, attributes={SpanAttribute.MODEL_HANDLE: "gpt", "ignored": None}):
+                pass
+            assert exporter.spans == []
+            with pytest.raises(ValueError, match="boom"):
+                _fail_in_span(tracer=tracer)
+
+        child_span, failing_span, exported_root_span = exporter.spans
+        assert exported_root_span is root_span
+        assert root_span.parent_span_id is None
+        assert child_span.parent_span_id == failing_span.parent_span_id == root_span.span_id
+        assert child_span.trace_id == failing_span.trace_id == root_span.trace_id
+        assert child_span.attributes == {SpanAttribute.MODEL_HANDLE: "gpt"}
+        assert child_span.status == SpanStatus.OK
+        assert failing_span.status == SpanStatus.ERROR
+        assert failing_span.attributes[SpanAttribute.EXCEPTION_TYPE] == "ValueError"
+        assert root_span.duration_seconds is not None
+
+    def test_exporters_encode_spans(self, tmp_path: Path):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporters=[exporter])
+        with tracer.start_span(name="root", kind=SpanKind.PIPE, attributes={SpanAttribute.BATCH_INDEX: 2, SpanAttribute.PIPE_STACK: ["a", "b"]}):
+            pass
+
+        payload = make_otlp_payload(spans=exporter.spans, service_name="tests")
+        otlp_span = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert otlp_span["name"] == "root"
+        assert otlp_span["status"] == {"code": 1}
+        assert {"key": SpanAttribute.BATCH_INDEX, "value": {"intValue": "2"}} in otlp_span["attributes"]
+        assert {"key": SpanAttribute.PIPE_STACK, "value": {"arrayValue": {"values": [{"stringValue": "a"}, {"stringValue": "b"}]}}} in otlp_span[
+            "attributes"
+        ]
+
+        jsonl_file_path = tmp_path / "traces" / "spans.jsonl"
+        JsonlSpanExporter(file_path=str(jsonl_file_path)).export(spans=exporter.spans)
+        lines = jsonl_file_path.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[0])["span_id"] == exporter.spans[0].span_id
+
+    @pytest.mark.asyncio
+    async def test_dry_run_traces_the_pipe_tree(self, tmp_path: Path):
+        plx_path = tmp_path / "traced.plx"
+        plx_path.write_text(TRACED_BUNDLE, encoding="utf-8")
+        library_manager = get_library_manager()
+        pipelex_hub = get_pipelex_hub()
+        previous_tracer = get_tracer()
+        exporter = InMemorySpanExporter()
+        pipelex_hub.set_tracer(tracer=Tracer(exporters=[exporter]))
+        try:
+            library_manager.reload_bundle(plx_path=plx_path)
+            await dry_run_pipe(pipe=get_required_pipe(pipe_code="tracing_test_sequence"), raise_on_failure=True)
+        finally:
+            pipelex_hub.set_tracer(tracer=previous_tracer)
+            library_manager.unload_bundle(plx_path=plx_path)
+
+        pipe_spans = [span for span in exporter.spans if span.kind == SpanKind.PIPE]
+        spans_by_id = {span.span_id: span for span in exporter.spans}
+        root_span = next(span for span in pipe_spans if span.parent_span_id is None)
+        assert root_span.name == "tracing_test_sequence"
+        assert root_span.attributes[SpanAttribute.PIPE_TYPE] == "PipeSequence"
+
+        branch_spans = [
+            span for span in pipe_spans if span.attributes[SpanAttribute.PIPE_TYPE] == "PipeLLM" and span.name == "tracing_test_develop_idea"
+        ]
+        assert sorted(span.attributes[SpanAttribute.BATCH_INDEX] for span in branch_spans) == [0, 1, 2]  # type: ignore[type-var]
+        for branch_span in branch_spans:
+            assert branch_span.trace_id == root_span.trace_id
+            assert branch_span.attributes[SpanAttribute.PIPE_STACK][-1] == "tracing_test_develop_idea"  # type: ignore[index]
+            parent_span = spans_by_id[branch_span.parent_span_id or ""]
+            assert parent_span.attributes[SpanAttribute.PIPE_TYPE] == "PipeBatch"
+
+    def test_background_exporter_does_not_block(self):
+        slow_exporter = SlowSpanExporter(delay=0.2)
+        background_exporter = BackgroundSpanExporter(exporters=[slow_exporter])
+        tracer = Tracer(exporters=[background_exporter])
+
+        started_at = time.perf_counter()
+        for _ in range(3):
+            with tracer.start_span(name="root", kind=SpanKind.PIPE):
+                pass
+        # the root spans ended without waiting for their export
+        assert time.perf_counter() - started_at < 0.2
+        assert slow_exporter.spans == []
+
+        tracer.teardown()
+        assert [span.name for span in slow_exporter.spans] == ["root"] * 3
+        assert slow_exporter.is_shut_down